@@ -25,16 +25,21 @@ def meta_compile_rlmeta():
         content = next_content
     fail("Unable to produce metacompiler.")
 
-def compile_rlmeta(rlmeta):
-    log("Compiling rlmeta using {}".format(rlmeta))
+def compile_rlmeta(rlmeta, backend=None):
+    if backend:
+        log("Compiling rlmeta using {} ({} backend)".format(rlmeta, backend))
+        compile_args = ["--compile-with", backend]
+    else:
+        log("Compiling rlmeta using {}".format(rlmeta))
+        compile_args = ["--compile"]
     return run_rlmeta(rlmeta, [
         "--support",
         "--embed", "SUPPORT", "src/support.py",
-        "--compile", "src/cli.rlmeta",
-        "--compile", "src/parser.rlmeta",
-        "--compile", "src/optimizer.rlmeta",
-        "--compile", "src/codegenerator.rlmeta",
-        "--compile", "src/stdlib.rlmeta",
+        *compile_args, "src/cli.rlmeta",
+        *compile_args, "src/parser.rlmeta",
+        *compile_args, "src/optimizer.rlmeta",
+        *compile_args, "src/codegenerator.rlmeta",
+        *compile_args, "src/stdlib.rlmeta",
         "--main",
     ])
 
@@ -47,16 +52,250 @@ def test(rlmeta):
     assert test_grammar(
         rlmeta,
         b"actor Grammar = % | .:x -> print(x)",
-        b"run_simulation(actors=[Grammar()], messages=[['foo']], extra={'print': print})"
-    ) == b"foo\n"
+        b"run_simulation(actors=[Grammar()], messages=[['foo'], [[1]]], extra={'print': print})"
+    ) == b"foo\n[1]\n"
+    log("Test: Resolves names in actions")
+    assert test_grammar(
+        rlmeta,
+        b"actor Grammar #n = .:x .*:xs -> [x ~xs ~~[xs] n]:y -> print(y join(xs \"\") increment(n))",
+        b"run_simulation(actors=[Grammar(5)], messages=[['a', 'b', 'c']], extra={'print': print})"
+    ) == b"['a', 'b', 'c', 'b', 'c', 5] bc 6\n"
+    log("Test: Extra natives shadow helpers")
+    assert test_grammar(
+        rlmeta,
+        b"actor Grammar = .:x -> print(join(x) lookup(x) bind(x) increment(x))",
+        b"run_simulation(actors=[Grammar()], messages=[[1]], extra={'print': print, 'join': str, 'lookup': abs, 'bind': float})"
+    ) == b"1 1 1.0 2\n"
+    log("Test: Matches values against rules in actions")
+    assert test_grammar(
+        rlmeta,
+        b"actor Grammar = .*:xs -> print(match(\"pairs\" xs)) where pairs = ([.:x .:y] -> [y x])*",
+        b"run_simulation(actors=[Grammar()], messages=[[[1, 2], 'ab']], extra={'print': print})"
+    ) == b"[[2, 1], ['b', 'a']]\n"
+    log("Test: Shares identical matchers")
+    compiled = run_rlmeta(rlmeta, ["--compile", "-"], b"actor Grammar = [. !.] [. !.] !.")
+    assert compiled.count(b"return stream.match(lambda item: True, 'any')") == 1
+    assert compiled.count(b"return stream.match_list(") == 1
+    log("Test: Routes messages on first item")
+    assert test_grammar(
+        rlmeta,
+        b"actor A = (\"a\" | \"c\") -> print(\"A\")\nactor B = .:x -> print(x)",
+        b"run_simulation(actors=[A(), B()], messages=[['b'], ['a'], ['c']], extra={'print': print})\n"
+        b"print(sorted(A._accepts), hasattr(B, '_accepts'))"
+    ) == b"b\nA\nA\n['a', 'c'] False\n"
+    log("Test: Delivers to spawned actors after kills")
+    assert test_grammar(
+        rlmeta,
+        b"actor Cell #n =\n"
+        b"    | \"inc\" -> kill() -> spawn(Cell(increment(n)))\n"
+        b"    | \"get\" -> print(n)",
+        b"run_simulation(actors=[Cell(0)], messages=[['inc'], ['inc'], ['get'], ['inc'], ['get']], extra={'print': print})"
+    ) == b"2\n3\n"
+    log("Test: Routes messages through per-actor mailboxes")
+    assert test_grammar(
+        rlmeta,
+        b"actor Ping #name = \"ping\" .:x -> print({name x})\n"
+        b"actor Router = \"to\" .:to .:x -> send(to [\"ping\" x])",
+        b"a = Ping('a')\n"
+        b"b = Ping('b')\n"
+        b"print(run_simulation(actors=[a, b, Router()], messages=[['ping', 1], ['to', b, 2], ['to', a, 3], ['ping', 4], ['x']], extra={'print': print}, fail=False, mailboxes=True))"
+    ) == b"a1\na4\nb2\na3\n[['x']]\n"
+    log("Test: Leaves messages sent to dead actors")
+    assert test_grammar(
+        rlmeta,
+        b"actor Ping #name = \"ping\" .:x -> print({name x})\n"
+        b"actor Router =\n"
+        b"    | \"to\" .:to .:x -> send(to [\"ping\" x])\n"
+        b"    | \"spawn\" .:x -> spawn(x)",
+        b"print(run_simulation(actors=[Router()], messages=[['to', Ping('a'), 1], ['spawn', Ping('b')]], extra={'print': print}, fail=False, mailboxes=True))"
+    ) == b"[['ping', 1]]\n"
+    log("Test: Runs actors in a process pool")
+    assert test_grammar(
+        rlmeta,
+        b"actor Cell #n =\n"
+        b"    | \"inc\" -> kill() -> spawn(Cell(increment(n)))\n"
+        b"    | \"get\" -> write({n \"\\n\"})\n"
+        b"actor Echo = \"echo\" .:x -> put([\"get\"]) -> write({x \"\\n\"})",
+        b"run_simulation(actors=[Cell(0), Echo()], messages=[['inc'], ['echo', 'a'], ['inc'], ['get'], ['echo', 'b']], processes=2)"
+    ) == b"a\n2\nb\n2\n2\n"
+    log("Test: Redelivers messages to actors killed in the same generation")
+    assert test_grammar(
+        rlmeta,
+        b"actor Cell #n =\n"
+        b"    | \"inc\" -> kill() -> spawn(Cell(increment(n)))\n"
+        b"    | \"get\" -> write({n \"\\n\"})",
+        b"for processes in [0, 2]:\n"
+        b"    run_simulation(actors=[Cell(0)], messages=[['inc'], ['get']], processes=processes)"
+    ) == b"1\n1\n"
+    log("Test: Evaluates actions in worker processes")
+    assert test_grammar(
+        rlmeta,
+        b"actor Where = \"where\" -> write(place())",
+        b"import os\n"
+        b"parent = os.getpid()\n"
+        b"place = lambda: 'parent\\n' if os.getpid() == parent else 'worker\\n'\n"
+        b"for processes in [0, 2]:\n"
+        b"    run_simulation(actors=[Where()], messages=[['where']], extra={'place': place}, processes=processes)"
+    ) == b"parent\nworker\n"
+    log("Test: Evaluates actors with fields in the parent process")
+    assert test_grammar(
+        rlmeta,
+        b"actor Tally #next = \"tick\" -> write({next() \"\\n\"})",
+        b"for processes in [0, 2]:\n"
+        b"    run_simulation(actors=[Tally(Counter())], messages=[['tick'], ['tick'], ['tick'], ['tick']], processes=processes)"
+    ) == b"0\n1\n2\n3\n0\n1\n2\n3\n"
+    log("Test: Reads stdin in the parent process")
+    assert test_grammar(
+        rlmeta,
+        b"actor Reader = \"read\" -> write(repr(read(\"-\")))",
+        b"import io\n"
+        b"for processes in [0, 2]:\n"
+        b"    sys.stdin = io.StringIO('hello\\n')\n"
+        b"    run_simulation(actors=[Reader()], messages=[['read']], processes=processes)"
+    ) == b"'hello\\n''hello\\n'"
+    log("Test: Parks messages until an actor is spawned")
+    assert test_grammar(
+        rlmeta,
+        b"actor Grammar = \"tick\" . .*:xs -> put([\"tick\" ~xs])\n"
+        b"actor Same #x = #x",
+        b"class Counting:\n"
+        b"    _state = {}\n"
+        b"    def __init__(self):\n"
+        b"        self.runs = 0\n"
+        b"    def run(self, stream):\n"
+        b"        self.runs += 1\n"
+        b"        raise MatchError('no match', stream.items, 0)\n"
+        b"class Parking(Counting):\n"
+        b"    _parks = True\n"
+        b"for actor in [Counting(), Parking()]:\n"
+        b"    print(run_simulation(actors=[Grammar(), actor], messages=[['tick', 1, 2, 3], ['x']], fail=False), actor.runs)\n"
+        b"print(Grammar._parks, hasattr(Same, '_parks'))"
+    ) == b"[['tick'], ['x']] 5\n[['tick'], ['x']] 2\nTrue False\n"
+    log("Test: VM backend does not recurse on rule calls")
+    assert test_grammar(
+        rlmeta,
+        b"actor Grammar = [x:y !.] -> print(y) where x = 'a' x | 'b'",
+        b"run_simulation(actors=[Grammar()], messages=[['a'*100000+'b']], extra={'print': print})",
+        backend="vm"
+    ) == b"b\n"
+    for backend in [None, "inline", "vm"]:
+        log(f"Test: Span captures consumed input ({backend or 'default'} backend)")
+        assert test_grammar(
+            rlmeta,
+            b"actor Grammar = [<'a'* 'b'*:xs>:x !.] <. .>:y -> print(x xs y)",
+            b"run_simulation(actors=[Grammar()], messages=[['aab', 1, 2]], extra={'print': print})",
+            backend=backend
+        ) == b"aab ['b'] [1, 2]\n"
+        log(f"Test: Literal reports mismatch position ({backend or 'default'} backend)")
+        assert test_grammar(
+            rlmeta,
+            b"actor Grammar = 'hex' | 'help'",
+            b"try: Grammar().run(Stream('hello'))\nexcept MatchError as e: print(e, e.index)",
+            backend=backend
+        ) == b"expected 'p' 3\n"
+        log(f"Test: Scans to stop literal ({backend or 'default'} backend)")
+        assert test_grammar(
+            rlmeta,
+            b"actor Grammar = [(!'*/' .)*:xs '*/' <(!('\\n' | ';') .)*>:y .*] -> print(xs y)",
+            b"run_simulation(actors=[Grammar()], messages=[['ab*/cd;e'], [list('ab*/cd;e')]], extra={'print': print})\n"
+            b"for items in ['ab*', list('ab*')]:\n"
+            b"    try: Grammar().run(Stream([items]))\n"
+            b"    except MatchError as e: print(e, e.index)",
+            backend=backend
+        ) == b"['a', 'b'] cd\n['a', 'b'] ['c', 'd']\nexpected '/' 3\nexpected '/' 3\n"
+        log(f"Test: Scans to stop class ({backend or 'default'} backend)")
+        assert test_grammar(
+            rlmeta,
+            b"actor Grammar = (!('b' | 'x') .)* 'q'",
+            b"for items in ['ax', list('ax'), 'ab']:\n"
+            b"    try: Grammar().run(Stream(items))\n"
+            b"    except MatchError as e: print(e, e.index)",
+            backend=backend
+        ) == b"expected 'b' 1\nexpected 'b' 1\nnot matched 1\n"
+        log(f"Test: Regular rules match like the grammar ({backend or 'default'} backend)")
+        assert test_grammar(
+            rlmeta,
+            b"""
+            actor Grammar = [number:x ^',' ^word:y ^',' ^letters:z ^',' ^last:w] -> print(x y z w)
+                where
+                    number  = <digit digit*>
+                    word    = <letter letter*>
+                    letters = letter*
+                    last    = 'x' | 'y' 'z'
+                    letter  = 'a'-'z'
+                    digit   = '0'-'9'
+                    space   = ' '*
+            """,
+            b"run_simulation(actors=[Grammar()], messages=[['12, ab, cd, yz'], [list('12, ab, cd, yz')]], extra={'print': print})\n"
+            b"try: Grammar().run(Stream(['12, ab, cd, yq']))\nexcept MatchError as e: print(e, e.index)",
+            backend=backend
+        ) == b"12 ab ['c', 'd'] z\n['1', '2'] ['a', 'b'] ['c', 'd'] z\nexpected 'z' 13\n"
+        log(f"Test: Character classes match any item ({backend or 'default'} backend)")
+        assert test_grammar(
+            rlmeta,
+            b"""
+            actor Grammar = [eq*:xs !.] [ranged*:ys !.] !. -> print(xs ys)
+                where
+                    eq =
+                        | ('a' | 'b'):x     -> x
+                        | .                 -> "other"
+                    ranged =
+                        | ('c'-'e' | 'x'):x -> x
+                        | .                 -> "other"
+            """,
+            b"run_simulation(actors=[Grammar()], messages=[[['a', [1], 'b'], ['dd', 'x', 'xy', 'f']]], extra={'print': print})",
+            backend=backend
+        ) == b"['a', 'other', 'b'] ['dd', 'x', 'other', 'other']\n"
+        log(f"Test: Character classes report the first alternative ({backend or 'default'} backend)")
+        assert test_grammar(
+            rlmeta,
+            b"actor Grammar = !('b' | 'x') 'q'",
+            b"for items in ['x', ['x']]:\n"
+            b"    try: Grammar().run(Stream(items))\n"
+            b"    except MatchError as e: print(e, e.index)",
+            backend=backend
+        ) == b"expected 'b' 0\nexpected 'b' 0\n"
+        log(f"Test: Dispatches on first item ({backend or 'default'} backend)")
+        assert test_grammar(
+            rlmeta,
+            b"""
+            actor Grammar = item*:xs !. -> print(xs)
+                where
+                    item =
+                        | ["add" .:x .:y] -> x
+                        | ["neg" .:x]     -> x
+                        | "end"           -> 0
+                        | .:x             -> x
+            actor Chars = 'ab' | 'xy'
+            """,
+            b"run_simulation(actors=[Grammar()], messages=[[['add', 1, 2], ['neg', 3], 'end', [], 5, ['x'], 'neg']], extra={'print': print})\n"
+            b"try: Chars().run(Stream('z'))\nexcept MatchError as e: print(e, e.index)",
+            backend=backend
+        ) == b"[1, 3, 0, [], 5, ['x'], 'neg']\nexpected 'a' 0\n"
+        log(f"Test: Actions without binds do not see outer scope ({backend or 'default'} backend)")
+        assert test_grammar(
+            rlmeta,
+            b"actor Grammar = .:x ('a' -> x):y !. -> print(x y)",
+            b"run_simulation(actors=[Grammar()], messages=[['b', 'a']], extra={'print': print, 'x': 'runtime'})",
+            backend=backend
+        ) == b"b runtime\n"
+    for backend in ["inline", "vm"]:
+        log(f"Test: Compiles itself with the {backend} backend")
+        backend_compiler = f"rlmeta_{backend}.py"
+        write(backend_compiler, compile_rlmeta(rlmeta, backend))
+        assert compile_rlmeta(backend_compiler) == read(rlmeta)
     log("Test: unittest")
     global rlmeta_module
     rlmeta_module = importlib.import_module(rlmeta[:-3])
     if not unittest.main(exit=False).result.wasSuccessful():
         sys.exit(1)
 
-def test_grammar(rlmeta, grammar, main_code):
-    compiled = run_rlmeta(rlmeta, ["--support", "--compile", "-"], grammar)
+def test_grammar(rlmeta, grammar, main_code, backend=None):
+    if backend:
+        compile_args = ["--compile-with", backend, "-"]
+    else:
+        compile_args = ["--compile", "-"]
+    compiled = run_rlmeta(rlmeta, ["--support", *compile_args], grammar)
     total = compiled + main_code
     process = subprocess.Popen(
         ["python"],
@@ -92,6 +331,8 @@ def cleanup():
         "rlmeta2.py",
         "rlmeta3.py",
         "rlmeta4.py",
+        "rlmeta_inline.py",
+        "rlmeta_vm.py",
     ]:
         if os.path.exists(path):
             log("Deleting {}".format(path))
@@ -129,6 +370,52 @@ class RlmetaTests(unittest.TestCase):
             fail=False
         )
 
+    def test_packrat_parse(self):
+        message = ["SourceCode", 0, "actor Grammar = 'a' 'b' | 'a' 'c'"]
+        log = []
+        self.assertEqual(
+            rlmeta_module.run_simulation(
+                actors=[rlmeta_module.Parser()],
+                messages=[list(message)],
+                debug=log.append,
+                fail=False,
+                packrat=1000
+            ),
+            self.run_simulation([rlmeta_module.Parser()], [list(message)])
+        )
+        self.assertIn("Packrat Parser.expr2 hits=", "\n".join(log))
+
+    def test_rule_tables_are_shared(self):
+        first = rlmeta_module.PartCollector(0, 0, [], ["Done"])
+        second = rlmeta_module.PartCollector(1, 1, [], ["Done"])
+        self.assertIs(first._rules, second._rules)
+        self.assertFalse(hasattr(first, "__dict__"))
+
+    def test_match_error_position(self):
+        with self.assertRaises(rlmeta_module.MatchError) as context:
+            rlmeta_module.Parser().run(rlmeta_module.Stream(
+                ["SourceCode", 0, "actor Grammar = [ 'a'\n"]
+            ))
+        self.assertEqual(str(context.exception), "expected ' '")
+        self.assertEqual(context.exception.index, 22)
+
+    def test_match_error_reruns_exact_on_access(self):
+        stream = rlmeta_module.Stream(
+            ["SourceCode", 0, "actor Grammar = [ 'a'\n"]
+        )
+        with self.assertRaises(rlmeta_module.MatchError) as context:
+            rlmeta_module.Parser().run(stream)
+        self.assertFalse(stream.exact)
+        self.assertEqual(context.exception.index, 22)
+        self.assertTrue(stream.exact)
+
+    def test_text_defers_indentation(self):
+        runtime = rlmeta_module.Runtime(None)
+        inner = runtime.indent(runtime.join(["b\n", [[], "c"]], "\n"))
+        text = runtime.join(["a:\n", runtime.indent(inner), "\nd"])
+        self.assertIsNone(inner.text)
+        self.assertEqual(str(text), "a:\n        b\n        \n        \n        c\nd")
+
     def test_parse_optimize_1(self):
         parsed_messages = self.run_simulation(
             [rlmeta_module.Parser()],
@@ -167,14 +454,11 @@ class RlmetaTests(unittest.TestCase):
                 [],
                 ['Rule',
                  '_main',
-                 ['Scope',
-                  ['And',
-                   ['MatchRule', 'space'],
-                   ['MatchObject', ['Eq', 'h']],
-                   ['MatchObject', ['Eq', 'e']],
-                   ['MatchObject', ['Eq', 'l']],
-                   ['MatchObject', ['Eq', 'l']],
-                   ['MatchObject', ['Eq', 'o']]]]],
+                 ['And',
+                  ['MatchRule', 'space'],
+                  ['MatchLiteral', 'hello']]],
+                ['Parks'],
+                ['Replicable'],
                 ]]]]
         )
 
@@ -191,11 +475,13 @@ class RlmetaTests(unittest.TestCase):
                 [],
                 ['Rule',
                  '_main',
-                 ['Scope',
+                 ['MatchRegex',
+                  '(?:[ab])*+',
+                  'chars',
                   ['Star',
-                   ['Or',
-                    ['Scope', ['MatchObject', ['Eq', 'a']]],
-                    ['Scope', ['MatchObject', ['Eq', 'b']]]]]]],
+                   ['MatchObject', ['Class', ['a', 'b'], "'a'", [], ['a', 'a']]]]]],
+                ['Parks'],
+                ['Replicable'],
                 ]]]]
         )
 
@@ -1,99 +1,224 @@
+import io
+import re
 import sys
 import unittest
-from collections import defaultdict
+from bisect import bisect_left
+from collections import defaultdict, deque
+from heapq import merge
+from itertools import islice, takewhile
+from types import MethodType
 
 class Stream:
 
-    def __init__(self, items):
+    def __init__(self, items, memo_size=0):
         self.items = items
         self.index = 0
         self.latest_error = None
         self.scope = None
+        self.exact = False
+        self.shortcut = False
+        self.memo = {} if memo_size else None
+        self.memo_size = memo_size
+        if memo_size:
+            self.memo_hits = defaultdict(int)
+            self.memo_misses = defaultdict(int)
 
     def operator_or(self, matchers):
         for matcher in matchers:
             backtrack_index = self.index
-            try:
-                return matcher(self)
-            except MatchError:
-                self.index = backtrack_index
-        self.error("no or match")
+            result = matcher(self)
+            if result is not FAIL:
+                return result
+            self.index = backtrack_index
+        return self.fail("no or match")
+
+    def operator_dispatch(self, dispatch, matchers):
+        return self.operator_or([
+            matchers[i] for i in dispatch.select(self, self.items, self.index)
+        ])
 
     def operator_and(self, matchers):
-        result = self.action()
+        result = None
         for matcher in matchers:
             result = matcher(self)
+            if result is FAIL:
+                break
         return result
 
     def operator_star(self, matcher):
         results = []
         while True:
             backtrack_index = self.index
-            try:
-                results.append(matcher(self))
-            except MatchError:
+            result = matcher(self)
+            if result is FAIL:
+                self.index = backtrack_index
+                return self.action_list(results)
+            results.append(result)
+
+    def operator_skip(self, matcher):
+        while True:
+            backtrack_index = self.index
+            if matcher(self) is FAIL:
                 self.index = backtrack_index
-                return self.action(lambda self: [x.eval(self.runtime) for x in results])
+                return None
+
+    def operator_span(self, matcher):
+        start_index = self.index
+        result = matcher(self)
+        if result is FAIL:
+            return result
+        return self.items[start_index:self.index]
+
+    def operator_star_until(self, until):
+        start_index = self.index
+        self.index = until.scan(self, self.items, self.index)
+        return list(self.items[start_index:self.index])
+
+    def operator_skip_until(self, until):
+        self.index = until.scan(self, self.items, self.index)
+        return None
 
     def operator_not(self, matcher):
         backtrack_index = self.index
-        try:
-            matcher(self)
-        except MatchError:
-            return self.action()
-        finally:
-            self.index = backtrack_index
-        self.error("not matched")
+        result = matcher(self)
+        self.index = backtrack_index
+        if result is FAIL:
+            return None
+        return self.fail("not matched")
 
-    def action(self, fn=lambda self: None):
+    def action(self, fn):
         return SemanticAction(self.scope, fn)
 
+    def action_list(self, results):
+        for result in results:
+            if isinstance(result, SemanticAction):
+                return self.action(lambda self: [
+                    x.eval(self.runtime) if isinstance(x, SemanticAction) else x
+                    for x in results
+                ])
+        return results
+
     def with_scope(self, matcher):
         current_scope = self.scope
         self.scope = {}
-        try:
-            return matcher(self)
-        finally:
-            self.scope = current_scope
+        result = matcher(self)
+        self.scope = current_scope
+        return result
 
-    def bind(self, name, semantic_action):
-        self.scope[name] = semantic_action
-        return semantic_action
+    def bind(self, name, result):
+        if result is not FAIL:
+            self.scope[name] = result
+        return result
 
     def match_list(self, matcher):
         if self.index < len(self.items):
             items, index = self.items, self.index
-            try:
-                self.items = self.items[self.index]
-                self.index = 0
-                result = matcher(self)
+            self.items = self.items[self.index]
+            self.index = 0
+            result = matcher(self)
+            if result is not FAIL:
                 index += 1
-            finally:
-                self.items, self.index = items, index
+            self.items, self.index = items, index
             return result
-        self.error("no list found")
+        return self.fail("no list found")
 
-    def match_call_rule(self, rules):
-        name = str(self.items[self.index])
-        if name in rules:
-            matcher = rules[name]
-            self.index += 1
+    def match_rule(self, matcher, name):
+        if self.memo is None:
             return matcher(self)
-        else:
-            self.error(f"Unknown rule {name}.")
+        key = (name, id(self.items), self.index)
+        if key in self.memo:
+            self.memo_hits[name] += 1
+            result, self.index = self.memo[key]
+            return result
+        self.memo_misses[name] += 1
+        if len(self.memo) >= self.memo_size:
+            del self.memo[next(iter(self.memo))]
+        result = matcher(self)
+        self.memo[key] = (result, self.index)
+        return result
+
+    def match_call_rule(self, rules, actor):
+        item = self.items[self.index]
+        try:
+            matcher = rules[item]
+        except (KeyError, TypeError):
+            return self.fail("Unknown rule {}.", item)
+        self.index += 1
+        return matcher(actor, self)
+
+    def match_literal(self, literal):
+        index = literal_end(self, self.items, self.index, literal)
+        if index is FAIL:
+            return FAIL
+        self.index = index
+        return self.items[index-1]
+
+    def match_regex(self, regex, matcher):
+        if self.exact or not ATOMIC_REGEX or not isinstance(self.items, str):
+            return matcher(self)
+        self.shortcut = True
+        match = regex.match(self.items, self.index)
+        if match is None:
+            return FAIL
+        self.index = match.end()
+        return regex.value(match)
 
     def match(self, fn, description):
         if self.index < len(self.items):
             item = self.items[self.index]
             if fn(item):
                 self.index += 1
-                return self.action(lambda self: item)
-        self.error(f"expected {description}")
+                return item
+        return self.fail("expected {}", description)
+
+    def fail(self, message, *args):
+        return self.fail_at(self.items, self.index, message, *args)
+
+    def fail_at(self, items, index, message, *args):
+        if not self.latest_error or index > self.latest_error[2]:
+            self.latest_error = (message.format(*args), items, index)
+        return FAIL
+
+    def run(self, matcher):
+        items, index = self.items, self.index
+        result = matcher(self)
+        if result is FAIL and self.shortcut and not self.exact:
+            raise ShortcutMatchError(self, matcher, items, index)
+        if result is FAIL:
+            raise MatchError(*self.latest_error)
+        return result
+
+    def rerun_exact(self, matcher, items, index):
+        self.items, self.index = items, index
+        self.latest_error = None
+        self.exact = True
+        if self.memo is not None:
+            self.memo.clear()
+        matcher(self)
+        return MatchError(*self.latest_error)
+
+FAIL = object()
+
+ATOMIC_REGEX = sys.version_info >= (3, 11)
+
+EMPTY_SCOPE = {}
+
+def in_ranges(item, ranges):
+    return isinstance(item, str) and any(lo <= item <= hi for lo, hi in ranges)
 
-    def error(self, name):
-        if not self.latest_error or self.index > self.latest_error[2]:
-            self.latest_error = (name, self.items, self.index)
-        raise MatchError(*self.latest_error)
+def expect_first(stream, items, index, description):
+    stream.fail_at(items, index, "expected {}", description)
+    return True
+
+def literal_end(stream, items, index, literal):
+    end = index+len(literal)
+    if items[index:end] == literal:
+        return end
+    for char in literal:
+        if index >= len(items) or items[index] != char:
+            return stream.fail_at(items, index, "expected {!r}", char)
+        index += 1
+    return index
 
 class MatchError(Exception):
 
@@ -102,6 +227,340 @@ class MatchError(Exception):
         self.items = items
         self.index = index
 
+class ShortcutMatchError(MatchError):
+
+    def __init__(self, stream, matcher, items, index):
+        Exception.__init__(self)
+        self.rerun = (stream, matcher, items, index)
+        self.error = None
+
+    def exact(self):
+        if self.error is None:
+            stream, matcher, items, index = self.rerun
+            self.error = stream.rerun_exact(matcher, items, index)
+        return self.error
+
+    @property
+    def items(self):
+        return self.exact().items
+
+    @property
+    def index(self):
+        return self.exact().index
+
+    def __str__(self):
+        return str(self.exact())
+
+class Until:
+
+    def __init__(self, stops, description, first):
+        self.stops = [list(stop) for stop in stops]
+        self.pattern = None
+        self.description = description
+        self.first = first
+
+    def scan(self, stream, items, index):
+        begin = index
+        if isinstance(items, str):
+            if self.pattern is None:
+                self.pattern = re.compile("|".join(
+                    re.escape("".join(stop)) for stop in self.stops
+                    if all(isinstance(x, str) and len(x) == 1 for x in stop)
+                ) or "(?!)")
+            match = self.pattern.search(items, index)
+            index = match.start() if match else len(items)
+        else:
+            while index < len(items) and not any(
+                items[index:index+len(stop)] == stop
+                for stop in self.stops
+            ):
+                index += 1
+        for start in range(max(begin, index-len(max(self.stops, key=len))+1), index):
+            for stop in self.stops:
+                end = start
+                while end < len(items) and items[end] == stop[end-start]:
+                    end += 1
+                stream.fail_at(items, end, "expected {!r}", stop[end-start])
+        if index < len(items):
+            if self.first and not self.first[0] <= items[index] <= self.first[1]:
+                stream.fail_at(items, index, "expected {}", self.description)
+            stream.fail_at(items, index, "not matched")
+        else:
+            stream.fail_at(items, index, "expected {}", self.description)
+        return index
+
+class Dispatch:
+
+    def __init__(self, head, table, default):
+        self.head = head
+        self.table = table
+        self.default = default
+        self.all = sorted(set(default).union(*table.values()))
+
+    def select(self, stream, items, index):
+        if stream.exact:
+            return self.all
+        stream.shortcut = True
+        try:
+            item = items[index]
+            if self.head:
+                item = item[0]
+            return self.table.get(item, self.default)
+        except (IndexError, KeyError, TypeError):
+            return self.default
+
+class Regex:
+
+    def __init__(self, pattern, kind):
+        self.pattern = pattern
+        self.kind = kind
+        self.compiled = None
+
+    def match(self, items, index):
+        if self.compiled is None:
+            self.compiled = re.compile(self.pattern, re.DOTALL)
+            self.group = min(self.compiled.groups, 1)
+        return self.compiled.match(items, index)
+
+    def value(self, match):
+        text = match.group(self.group)
+        if self.kind == "text":
+            return text
+        elif self.kind == "last":
+            return text[-1]
+        elif self.kind == "chars":
+            return list(text)
+        else:
+            return None
+
+class VmRule:
+
+    def __init__(self, program):
+        self.program = program
+
+    def __get__(self, actor, owner=None):
+        if actor is None:
+            return self
+        return MethodType(self, actor)
+
+    def __call__(self, actor, stream):
+        return vm(actor, self.program, stream)
+
+def assemble(instructions):
+    labels = {}
+    program = []
+    for instruction in instructions:
+        if instruction[0] == "LABEL":
+            labels[instruction[1]] = len(program)
+        else:
+            program.append((instruction+(None, None))[:3])
+    return [
+        (op, labels[arg1], arg2) if op in ("BACKTRACK", "COMMIT", "REGEX") else
+        (op, arg1, [labels[x] for x in arg2]) if op == "DISPATCH" else
+        (op, arg1, arg2)
+        for op, arg1, arg2 in program
+    ]
+
+def vm(actor, program, stream):
+    rules = actor._rules
+    memo = stream.memo
+    items = stream.items
+    index = stream.index
+    items_stack = []
+    scopes = [stream.scope]
+    pending = []
+    stack = []
+    result = None
+    pc = 0
+    while True:
+        op, arg1, arg2 = program[pc]
+        pc += 1
+        if op == "MATCH_EQ":
+            if index < len(items) and items[index] == arg1:
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected {!r}", arg1)
+        elif op == "MATCH_LITERAL":
+            end = literal_end(stream, items, index, arg1)
+            if end is not FAIL:
+                index = end
+                result = items[index-1]
+                continue
+            message = None
+        elif op == "BACKTRACK":
+            stack.append((program, arg1, index, items, len(items_stack), len(scopes), len(pending)))
+            continue
+        elif op == "COMMIT":
+            stack.pop()
+            pc = arg1
+            continue
+        elif op == "CALL":
+            if arg2 is None:
+                arg2 = rules[arg1].program
+                program[pc-1] = (op, arg1, arg2)
+            if memo is None:
+                stack.append((program, pc, None))
+                program = arg2
+                pc = 0
+                continue
+            key = (arg1, id(items), index)
+            if key not in memo:
+                stream.memo_misses[arg1] += 1
+                if len(memo) >= stream.memo_size:
+                    del memo[next(iter(memo))]
+                stack.append((program, pc, key))
+                program = arg2
+                pc = 0
+                continue
+            stream.memo_hits[arg1] += 1
+            result, index = memo[key]
+            if result is not FAIL:
+                continue
+            message = None
+        elif op == "RETURN":
+            if not stack:
+                stream.index = index
+                return result
+            program, pc, key = stack.pop()
+            if key is not None:
+                memo[key] = (result, index)
+            continue
+        elif op == "PUSH_SCOPE":
+            scopes.append({})
+            continue
+        elif op == "POP_SCOPE":
+            scopes.pop()
+            continue
+        elif op == "BIND":
+            scopes[-1][arg1] = result
+            continue
+        elif op == "ACTION":
+            result = SemanticAction(scopes[-1] if arg2 is None else arg2, arg1)
+            continue
+        elif op == "ACTION_LOOKUP":
+            result = lookup_action(scopes[-1] if arg2 is None else arg2, arg1)
+            continue
+        elif op == "VALUE":
+            result = arg1
+            continue
+        elif op == "MATCH_RANGE":
+            if index < len(items) and arg1 <= items[index] <= arg2:
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected {!r}-{!r}", arg1, arg2)
+        elif op == "MATCH_CLASS":
+            if index < len(items) and (
+                items[index] in arg1[0]
+                if isinstance(items[index], str) and len(items[index]) == 1
+                else in_ranges(items[index], arg1[1])
+            ):
+                if not arg1[2][0] <= items[index] <= arg1[2][1]:
+                    stream.fail_at(items, index, "expected {}", arg2)
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected {}", arg2)
+        elif op == "REGEX":
+            if stream.exact or not ATOMIC_REGEX or not isinstance(items, str):
+                continue
+            stream.shortcut = True
+            match = arg2.match(items, index)
+            if match is not None:
+                index = match.end()
+                result = arg2.value(match)
+                pc = arg1
+                continue
+            message = None
+        elif op == "DISPATCH":
+            selected = arg1.select(stream, items, index)
+            pc = arg2[selected[0] if selected else -1]
+            continue
+        elif op == "STAR_UNTIL":
+            start = index
+            index = arg1.scan(stream, items, index)
+            result = list(items[start:index])
+            continue
+        elif op == "SKIP_UNTIL":
+            index = arg1.scan(stream, items, index)
+            result = None
+            continue
+        elif op == "MATCH_ANY":
+            if index < len(items):
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected any",)
+        elif op == "MATCH_STATE":
+            if index < len(items) and items[index] == actor._state[arg1]:
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected state",)
+        elif op == "LIST_START":
+            pending.append([])
+            continue
+        elif op == "LIST_APPEND":
+            pending[-1].append(result)
+            continue
+        elif op == "LIST_END":
+            result = stream.action_list(pending.pop())
+            continue
+        elif op == "SPAN_START":
+            pending.append(index)
+            continue
+        elif op == "SPAN_END":
+            result = items[pending.pop():index]
+            continue
+        elif op == "PUSH_ITEMS":
+            if index < len(items):
+                items_stack.append((items, index))
+                items = items[index]
+                index = 0
+                continue
+            message = ("no list found",)
+        elif op == "POP_ITEMS":
+            items, index = items_stack.pop()
+            index += 1
+            continue
+        elif op == "CALL_ITEM":
+            try:
+                target = rules[items[index]]
+            except (KeyError, TypeError):
+                message = ("Unknown rule {}.", items[index])
+            else:
+                index += 1
+                stack.append((program, pc, None))
+                program = target.program
+                pc = 0
+                continue
+        elif op == "NONE":
+            result = None
+            continue
+        elif op == "COMMIT_FAIL":
+            index = stack.pop()[2]
+            message = (arg1,)
+        elif op == "FAIL":
+            message = (arg1,)
+        else:
+            raise ValueError(f"Unknown instruction {op}.")
+        if message is not None:
+            stream.fail_at(items, index, *message)
+        while stack:
+            entry = stack.pop()
+            if len(entry) == 3:
+                if entry[2] is not None:
+                    memo[entry[2]] = (FAIL, index)
+            else:
+                program, pc, index, items, items_depth, scopes_depth, pending_depth = entry
+                del items_stack[items_depth:]
+                del scopes[scopes_depth:]
+                del pending[pending_depth:]
+                break
+        else:
+            return FAIL
+
 class SemanticAction:
 
     def __init__(self, scope, fn):
@@ -118,22 +577,33 @@ class SemanticAction:
 
     def lookup(self, name):
         if name in self.scope:
-            return self.scope[name].eval(self.runtime)
+            value = self.scope[name]
+            if isinstance(value, SemanticAction):
+                return value.eval(self.runtime)
+            return value
         else:
             return self.runtime.lookup(name)
 
+def lookup_action(scope, name):
+    if name in scope:
+        return scope[name]
+    return SemanticAction(scope, lambda self: self.lookup(name))
+
 class Runtime:
 
-    def __init__(self, actor, extra={}):
-        self.vars = extra
+    def __init__(self, actor, extra={}, bound={}):
+        self.extra = extra
+        self.bound = bound
         self.actor = actor
 
     def bind(self, name, value):
-        return Runtime(self.actor, dict(self.vars, **{name: value}))
+        return Runtime(self.actor, self.extra, {**self.bound, name: value})
 
     def lookup(self, name):
-        if name in self.vars:
-            return self.vars[name]
+        if name in self.bound:
+            return self.bound[name]
+        elif name in self.extra:
+            return self.extra[name]
         elif self.actor and name in self.actor._state:
             return self.actor._state[name]
         else:
@@ -152,19 +622,13 @@ class Runtime:
         return collector()
 
     def join(self, items, delimiter=""):
-        return delimiter.join(
-            self.join(item, delimiter) if isinstance(item, list) else str(item)
-            for item in items
-        )
+        return Text(items, delimiter)
 
     def indent(self, text, prefix="    "):
-        return "".join(prefix+line for line in text.splitlines(True))
+        return Text([text], "", prefix)
 
     def splice(self, depth, item):
-        if depth == 0:
-            return [item]
-        else:
-            return self.concat([self.splice(depth-1, subitem) for subitem in item])
+        return list(splice_items(depth, item))
 
     def concat(self, lists):
         return [x for xs in lists for x in xs]
@@ -175,6 +639,93 @@ class Runtime:
             result[key].append(value)
         return result
 
+    def match(self, rule, items):
+        result = Stream(items).run(
+            lambda stream: self.actor._rules[rule](self.actor, stream)
+        )
+        if isinstance(result, SemanticAction):
+            return result.eval(self)
+        return result
+
+class Text:
+
+    LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+    def __init__(self, items, delimiter="", prefix=None):
+        self.items = items
+        self.delimiter = delimiter
+        self.prefix = prefix
+        self.text = None
+
+    def __str__(self):
+        if self.text is None:
+            output = io.StringIO()
+            self.write(output.write)
+            self.text = output.getvalue()
+        return self.text
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __eq__(self, other):
+        return str(self) == other
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def write(self, write):
+        levels = []
+        owed = 0
+        def emit(text):
+            nonlocal owed
+            if not levels:
+                write(text)
+                return
+            for line in text.splitlines(True):
+                if owed < len(levels):
+                    write("".join(levels[owed:]))
+                    owed = len(levels)
+                write(line)
+                if line[-1] in self.LINE_BREAKS:
+                    owed = 0
+        frames = []
+        def enter(text):
+            if text.prefix is not None:
+                levels.append(text.prefix)
+            frames.append((text, iter(text.items), [False], text.prefix is not None))
+        enter(self)
+        while frames:
+            text, items, started, indented = frames[-1]
+            for item in items:
+                if isinstance(item, list) and item:
+                    frames.append((text, iter(item), started, False))
+                    break
+                if started[0]:
+                    emit(text.delimiter)
+                started[0] = True
+                if isinstance(item, Text) and item.text is None:
+                    enter(item)
+                    break
+                if not isinstance(item, list):
+                    emit(str(item))
+            else:
+                frames.pop()
+                if indented:
+                    levels.pop()
+                    owed = min(owed, len(levels))
+
+def materialize(value):
+    if isinstance(value, Text):
+        return str(value)
+    return value
+
+def splice_items(depth, item):
+    if depth == 0:
+        yield item
+    else:
+        for subitem in item:
+            yield from splice_items(depth-1, subitem)
+
 class Counter:
 
     def __init__(self):
@@ -185,82 +736,375 @@ class Counter:
         self.number += 1
         return result
 
-def run_simulation(actors, extra={}, messages=[], debug=False, fail=True):
+def run_simulation(actors, extra={}, messages=[], debug=False, fail=True, packrat=0, processes=0, mailboxes=False):
     def debug_log(text):
         if callable(debug):
             debug(text)
         elif debug:
             sys.stderr.write(f"{text}\n")
-    def read(path):
-        if path == "-":
-            return sys.stdin.read()
-        with open(path) as f:
-            return f.read()
     def trunc(thing, n):
         x = repr(thing)
         if len(x) > n:
             return f"{x[:n]} ..."
         else:
             return x
+    def register(actor, serial):
+        heads = getattr(actor, "_accepts", None)
+        if heads is None:
+            anyone.append((serial, actor))
+        else:
+            for head in heads:
+                index.setdefault(head, []).append((serial, actor))
+        boxes[serial] = deque()
+        addresses[id(actor)] = serial
+    def unregister(actor, serial):
+        heads = getattr(actor, "_accepts", None)
+        for members in [anyone] if heads is None else [index[head] for head in heads]:
+            del members[bisect_left(members, (serial,))]
+        del addresses[id(actor)]
+        for message, since, address in boxes.pop(serial):
+            route(message, since, serial+1, address)
+    def spawn(actor):
+        nonlocal spawned
+        actors.append(actor)
+        serials.append(spawned)
+        if not parks(actor):
+            restless.append((spawned, actor))
+        if mailboxes:
+            register(actor, spawned)
+        if pool is not None:
+            born.append((spawned, replica(actor)))
+        spawned += 1
+    def kill(actor):
+        index = actors.index(actor)
+        serial = serials[index]
+        del actors[index]
+        del serials[index]
+        if not parks(actor):
+            del restless[bisect_left(restless, (serial,))]
+        if mailboxes:
+            unregister(actor, serial)
+        if pool is not None:
+            killed.add(serial)
+    def put(message):
+        if mailboxes:
+            route(message, 0, 0, None)
+        else:
+            queue.append((message, 0))
+    def send(actor, message):
+        route(message, 0, 0, addresses.get(id(actor), -1))
+    def retries(since, after):
+        return takewhile(
+            lambda member: member[0] < since,
+            islice(restless, bisect_left(restless, (after,)), None)
+        )
+    def deliver(message, since, after=0):
+        start = bisect_left(serials, max(since, after))
+        for _, actor in merge(
+            retries(since, after),
+            ((serials[index], actors[index]) for index in range(start, len(actors)))
+        ):
+            if accepts(actor, message) and run_actor(actor, message, x, lambda: kill(actor), packrat, memo_hits, memo_misses):
+                return True
+        return False
+    def commit(effects):
+        for effect, value in effects:
+            if effect == "put":
+                put(value)
+            elif effect == "spawn":
+                spawn(value)
+            elif effect == "write":
+                sys.stdout.write(value)
+            else:
+                kill(actors[bisect_left(serials, value)])
+    def deliver_generation(generation):
+        first = spawned
+        size = -(-len(generation)//processes)
+        for start, (connection, _) in zip(range(0, size*processes, size), pool):
+            connection.send((born, sorted(killed), generation[start:start+size]))
+        born.clear()
+        killed.clear()
+        results = []
+        for connection, _ in pool:
+            kind, result = connection.recv()
+            while kind == "read":
+                connection.send(x["read"](result))
+                kind, result = connection.recv()
+            if kind == "error":
+                raise result
+            evaluated, hits, misses = result
+            results.extend(evaluated)
+            for key, count in hits.items():
+                memo_hits[key] += count
+            for key, count in misses.items():
+                memo_misses[key] += count
+        processed = False
+        for (message, since), (serial, resume, touched, effects) in zip(generation, results):
+            if killed.isdisjoint(touched):
+                commit(effects)
+                done = serial is not None or deliver(message, since, first if resume is None else resume)
+            else:
+                done = deliver(message, since)
+            if done:
+                processed = True
+            else:
+                queue.append((message, spawned))
+        return processed
+    def candidates(message, since, after, address):
+        if address is not None:
+            if address >= after and address in boxes:
+                if address >= since or not parks(actors[bisect_left(serials, address)]):
+                    yield address
+            return
+        start = max(since, after)
+        try:
+            members = index.get(message[0], [])
+        except (IndexError, KeyError, TypeError):
+            members = []
+        for serial, _ in merge(
+            members[bisect_left(members, (start,)):],
+            anyone[bisect_left(anyone, (start,)):],
+            (member for member in retries(since, after) if accepts(member[1], message))
+        ):
+            yield serial
+    def route(message, since, after, address):
+        for serial in candidates(message, since, after, address):
+            box = boxes[serial]
+            if not box:
+                ready.append(serial)
+            box.append((message, since, address))
+            return
+        queue.append((message, spawned, address))
+    def run_mailboxes():
+        processed = True
+        while ready or (queue and processed):
+            if not ready:
+                processed = False
+                for _ in range(len(queue)):
+                    message, since, address = queue.popleft()
+                    route(message, since, 0, address)
+                continue
+            serial = ready.popleft()
+            box = boxes.get(serial)
+            if not box:
+                continue
+            message, since, address = box.popleft()
+            actor = actors[bisect_left(serials, serial)]
+            if run_actor(actor, message, x, lambda: kill(actor), packrat, memo_hits, memo_misses):
+                processed = True
+            else:
+                route(message, since, serial+1, address)
+            if box and serial in boxes:
+                ready.append(serial)
+    def run_generations():
+        iteration = 0
+        while queue:
+            if debug:
+                debug_log(f"Iteration {iteration}")
+                for actor in actors:
+                    debug_log(f"  Actor   {actor.__class__.__name__} {trunc(actor._state, 60)}")
+                for message, _ in queue:
+                    debug_log(f"  Message {trunc(message, 60)}")
+                debug_log("")
+            processed = False
+            if pool is not None:
+                processed = deliver_generation([queue.popleft() for _ in range(len(queue))])
+            else:
+                for _ in range(len(queue)):
+                    message, since = queue.popleft()
+                    if deliver(message, since):
+                        processed = True
+                    else:
+                        queue.append((message, spawned))
+            if not processed:
+                break
+            iteration += 1
+    if mailboxes and processes:
+        raise ValueError("Mailboxes can not be combined with processes.")
     if not isinstance(actors, list):
         actors = [actors]
     if not messages:
         messages.append(["Args"]+sys.argv[1:])
-    iteration = 0
-    while messages:
-        debug_log(f"Iteration {iteration}")
-        for index, actor in enumerate(actors):
-            debug_log(f"  Actor   {actor.__class__.__name__} {trunc(actor._state, 60)}")
-        for index, message in enumerate(messages):
-            debug_log(f"  Message {trunc(message, 60)}")
-        debug_log("")
-        next_messages = []
-        x = {
-            "put": next_messages.append,
-            "spawn": actors.append,
-            "write": sys.stdout.write,
-            "repr": repr,
-            "read": read,
-            "len": len,
-            "repr": repr,
-            "int": int,
-            "sum": sum,
-            "Counter": Counter,
-        }
-        for name, native in natives.items():
-            x[name] = native
-        for key, value in extra.items():
-            x[key] = value
-        processed = False
-        errors = []
+    queue = deque()
+    spawned = len(actors)
+    serials = list(range(spawned))
+    restless = [(serial, actor) for serial, actor in enumerate(actors) if not parks(actor)]
+    index = {}
+    anyone = []
+    boxes = {}
+    addresses = {}
+    ready = deque()
+    killed = set()
+    born = []
+    memo_hits = defaultdict(int)
+    memo_misses = defaultdict(int)
+    x = simulation_natives(put, spawn, sys.stdout.write, {"send": send, **extra} if mailboxes else extra)
+    pool = None
+    if mailboxes:
+        for serial, actor in enumerate(actors):
+            register(actor, serial)
         for message in messages:
-            for actor in list(actors):
+            put(message)
+        run_mailboxes()
+    elif processes:
+        import multiprocessing
+        context = multiprocessing.get_context("fork")
+        queue.extend((message, 0) for message in messages)
+        pool = []
+        try:
+            for _ in range(processes):
+                connection, remote = context.Pipe()
+                worker = context.Process(
+                    target=serve_actors,
+                    args=(remote, [(serial, replica(actor)) for serial, actor in zip(serials, actors)], extra, packrat),
+                    daemon=True
+                )
+                worker.start()
+                pool.append((connection, worker))
+            run_generations()
+        finally:
+            for connection, worker in pool:
+                connection.send(None)
+                worker.join()
+    else:
+        queue.extend((message, 0) for message in messages)
+        run_generations()
+    if queue and fail:
+        errors = []
+        for message, *_ in queue:
+            for actor in actors:
                 try:
-                    actor.run(Stream(message)).eval(Runtime(actor, x).bind(
-                        "kill",
-                        lambda: actors.remove(actor)
-                    ))
+                    actor.run(Stream(message, packrat))
                 except MatchError as e:
                     errors.append((actor, e))
-                else:
-                    processed = True
-                    break
-            else:
-                next_messages.append(message)
-        if not processed:
-            if fail:
-                for actor, error in sorted(errors, key=lambda x: x[1].index):
-                    sys.stderr.write(f"{actor.__class__.__name__} {trunc(actor._state, 60)}\n")
-                    sys.stderr.write(f"  {error} at {error.index}\n")
-                    sys.stderr.write(f"  {trunc(error.items, 60)}\n")
-                    sys.stderr.write("\n")
-                sys.exit("No message processed.")
-            else:
-                break
-        messages = next_messages
-        iteration += 1
+        for actor, error in sorted(errors, key=lambda x: x[1].index):
+            sys.stderr.write(f"{actor.__class__.__name__} {trunc(actor._state, 60)}\n")
+            sys.stderr.write(f"  {error} at {error.index}\n")
+            sys.stderr.write(f"  {trunc(error.items, 60)}\n")
+            sys.stderr.write("\n")
+        sys.exit("No message processed.")
+    for key in sorted(memo_misses, key=lambda key: -memo_hits[key]):
+        debug_log(f"Packrat {'.'.join(key)} hits={memo_hits[key]} misses={memo_misses[key]}")
     debug_log("Simulation done!")
-    return messages
+    return [message for message, *_ in queue]
+
+def accepts(actor, message):
+    heads = getattr(actor, "_accepts", None)
+    if heads is None:
+        return True
+    try:
+        return message[0] in heads
+    except (IndexError, KeyError, TypeError):
+        return False
+
+def parks(actor):
+    return getattr(actor, "_parks", False)
+
+def simulation_natives(put, spawn, write, extra):
+    def read(path):
+        if path == "-":
+            return sys.stdin.read()
+        with open(path) as f:
+            return f.read()
+    x = {
+        "put": put,
+        "spawn": spawn,
+        "write": write,
+        "repr": repr,
+        "read": read,
+        "len": len,
+        "repr": repr,
+        "int": int,
+        "sum": sum,
+        "Counter": Counter,
+    }
+    for name, native in natives.items():
+        x[name] = native
+    for key, value in extra.items():
+        x[key] = value
+    return x
+
+def run_actor(actor, message, x, kill, packrat, memo_hits, memo_misses):
+    stream = Stream(message, packrat)
+    try:
+        result = actor.run(stream)
+        if isinstance(result, SemanticAction):
+            result.eval(Runtime(actor, x).bind("kill", kill))
+    except MatchError:
+        return False
+    else:
+        return True
+    finally:
+        count_memo(actor, stream, memo_hits, memo_misses)
+
+class LocalActor:
+
+    def __init__(self, actor):
+        self._accepts = getattr(actor, "_accepts", None)
+        self._parks = parks(actor)
+
+def replica(actor):
+    if getattr(actor, "_replicable", False):
+        return actor
+    return LocalActor(actor)
+
+def serve_actors(connection, members, extra, packrat):
+    def read(path):
+        connection.send(("read", path))
+        return connection.recv()
+    extra = {"read": read, **extra}
+    alive = dict(members)
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        born, killed, generation = task
+        alive.update(born)
+        for serial in killed:
+            del alive[serial]
+        try:
+            connection.send(("done", evaluate_remote(list(alive.items()), generation, extra, packrat)))
+        except Exception as e:
+            connection.send(("error", e))
+
+def evaluate_remote(members, generation, extra, packrat):
+    evaluated = []
+    memo_hits = defaultdict(int)
+    memo_misses = defaultdict(int)
+    for message, since in generation:
+        matched = None
+        resume = None
+        touched = []
+        effects = []
+        x = simulation_natives(
+            lambda message: effects.append(("put", message)),
+            lambda actor: effects.append(("spawn", actor)),
+            lambda text: effects.append(("write", text)),
+            extra
+        )
+        for serial, actor in members:
+            if (serial < since and parks(actor)) or not accepts(actor, message):
+                continue
+            if isinstance(actor, LocalActor):
+                resume = serial
+                break
+            count = len(effects)
+            kill = lambda serial=serial: effects.append(("kill", serial))
+            if run_actor(actor, message, x, kill, packrat, memo_hits, memo_misses):
+                matched = serial
+            if matched is not None or len(effects) > count:
+                touched.append(serial)
+            if matched is not None:
+                break
+        evaluated.append((matched, resume, touched, effects))
+    return evaluated, memo_hits, memo_misses
+
+def count_memo(actor, stream, memo_hits, memo_misses):
+    if stream.memo is not None:
+        for name, count in stream.memo_hits.items():
+            memo_hits[(actor.__class__.__name__, name)] += count
+        for name, count in stream.memo_misses.items():
+            memo_misses[(actor.__class__.__name__, name)] += count
 
 class Example(unittest.TestCase):
 
@@ -294,17 +1138,13 @@ natives = {
     "tuple": lambda *xs: tuple(xs),
     "dec": lambda x: x-1,
 }
-natives['SUPPORT'] = 'import sys\nimport unittest\nfrom collections import defaultdict\n\nclass Stream:\n\n    def __init__(self, items):\n        self.items = items\n        self.index = 0\n        self.latest_error = None\n        self.scope = None\n\n    def operator_or(self, matchers):\n        for matcher in matchers:\n            backtrack_index = self.index\n            try:\n                return matcher(self)\n            except MatchError:\n                self.index = backtrack_index\n        self.error("no or match")\n\n    def operator_and(self, matchers):\n        result = self.action()\n        for matcher in matchers:\n            result = matcher(self)\n        return result\n\n    def operator_star(self, matcher):\n        results = []\n        while True:\n            backtrack_index = self.index\n            try:\n                results.append(matcher(self))\n            except MatchError:\n                self.index = backtrack_index\n                return self.action(lambda self: [x.eval(self.runtime) for x in results])\n\n    def operator_not(self, matcher):\n        backtrack_index = self.index\n        try:\n            matcher(self)\n        except MatchError:\n            return self.action()\n        finally:\n            self.index = backtrack_index\n        self.error("not matched")\n\n    def action(self, fn=lambda self: None):\n        return SemanticAction(self.scope, fn)\n\n    def with_scope(self, matcher):\n        current_scope = self.scope\n        self.scope = {}\n        try:\n            return matcher(self)\n        finally:\n            self.scope = current_scope\n\n    def bind(self, name, semantic_action):\n        self.scope[name] = semantic_action\n        return semantic_action\n\n    def match_list(self, matcher):\n        if self.index < len(self.items):\n            items, index = self.items, self.index\n            try:\n                self.items = self.items[self.index]\n                self.index = 0\n                result = matcher(self)\n                index += 1\n            finally:\n                self.items, self.index = items, index\n            return result\n        self.error("no list found")\n\n    def match_call_rule(self, rules):\n        name = str(self.items[self.index])\n        if name in rules:\n            matcher = rules[name]\n            self.index += 1\n            return matcher(self)\n        else:\n            self.error(f"Unknown rule {name}.")\n\n    def match(self, fn, description):\n        if self.index < len(self.items):\n            item = self.items[self.index]\n            if fn(item):\n                self.index += 1\n                return self.action(lambda self: item)\n        self.error(f"expected {description}")\n\n    def error(self, name):\n        if not self.latest_error or self.index > self.latest_error[2]:\n            self.latest_error = (name, self.items, self.index)\n        raise MatchError(*self.latest_error)\n\nclass MatchError(Exception):\n\n    def __init__(self, name, items, index):\n        Exception.__init__(self, name)\n        self.items = items\n        self.index = index\n\nclass SemanticAction:\n\n    def __init__(self, scope, fn):\n        self.scope = scope\n        self.fn = fn\n\n    def eval(self, runtime):\n        self.runtime = runtime\n        return self.fn(self)\n\n    def bind(self, name, value, continuation):\n        self.runtime = self.runtime.bind(name, value)\n        return continuation()\n\n    def lookup(self, name):\n        if name in self.scope:\n            return self.scope[name].eval(self.runtime)\n        else:\n            return self.runtime.lookup(name)\n\nclass Runtime:\n\n    def __init__(self, actor, extra={}):\n        self.vars = extra\n        self.actor = actor\n\n    def bind(self, name, value):\n        return Runtime(self.actor, dict(self.vars, **{name: value}))\n\n    def lookup(self, name):\n        if name in self.vars:\n            return self.vars[name]\n        elif self.actor and name in self.actor._state:\n            return self.actor._state[name]\n        else:\n            return getattr(self, name)\n\n    def increment(self, number):\n        return number + 1\n\n    def decrement(self, number):\n        return number - 1\n\n    def collector(self):\n        class collector(list):\n            def __call__(self, item):\n                self.append(item)\n        return collector()\n\n    def join(self, items, delimiter=""):\n        return delimiter.join(\n            self.join(item, delimiter) if isinstance(item, list) else str(item)\n            for item in items\n        )\n\n    def indent(self, text, prefix="    "):\n        return "".join(prefix+line for line in text.splitlines(True))\n\n    def splice(self, depth, item):\n        if depth == 0:\n            return [item]\n        else:\n            return self.concat([self.splice(depth-1, subitem) for subitem in item])\n\n    def concat(self, lists):\n        return [x for xs in lists for x in xs]\n\n    def collectDictList(self, tuples):\n        result = defaultdict(list)\n        for key, value in tuples:\n            result[key].append(value)\n        return result\n\nclass Counter:\n\n    def __init__(self):\n        self.number = 0\n\n    def __call__(self):\n        result = self.number\n        self.number += 1\n        return result\n\ndef run_simulation(actors, extra={}, messages=[], debug=False, fail=True):\n    def debug_log(text):\n        if callable(debug):\n            debug(text)\n        elif debug:\n            sys.stderr.write(f"{text}\\n")\n    def read(path):\n        if path == "-":\n            return sys.stdin.read()\n        with open(path) as f:\n            return f.read()\n    def trunc(thing, n):\n        x = repr(thing)\n        if len(x) > n:\n            return f"{x[:n]} ..."\n        else:\n            return x\n    if not isinstance(actors, list):\n        actors = [actors]\n    if not messages:\n        messages.append(["Args"]+sys.argv[1:])\n    iteration = 0\n    while messages:\n        debug_log(f"Iteration {iteration}")\n        for index, actor in enumerate(actors):\n            debug_log(f"  Actor   {actor.__class__.__name__} {trunc(actor._state, 60)}")\n        for index, message in enumerate(messages):\n            debug_log(f"  Message {trunc(message, 60)}")\n        debug_log("")\n        next_messages = []\n        x = {\n            "put": next_messages.append,\n            "spawn": actors.append,\n            "write": sys.stdout.write,\n            "repr": repr,\n            "read": read,\n            "len": len,\n            "repr": repr,\n            "int": int,\n            "sum": sum,\n            "Counter": Counter,\n        }\n        for name, native in natives.items():\n            x[name] = native\n        for key, value in extra.items():\n            x[key] = value\n        processed = False\n        errors = []\n        for message in messages:\n            for actor in list(actors):\n                try:\n                    actor.run(Stream(message)).eval(Runtime(actor, x).bind(\n                        "kill",\n                        lambda: actors.remove(actor)\n                    ))\n                except MatchError as e:\n                    errors.append((actor, e))\n                else:\n                    processed = True\n                    break\n            else:\n                next_messages.append(message)\n        if not processed:\n            if fail:\n                for actor, error in sorted(errors, key=lambda x: x[1].index):\n                    sys.stderr.write(f"{actor.__class__.__name__} {trunc(actor._state, 60)}\\n")\n                    sys.stderr.write(f"  {error} at {error.index}\\n")\n                    sys.stderr.write(f"  {trunc(error.items, 60)}\\n")\n                    sys.stderr.write("\\n")\n                sys.exit("No message processed.")\n            else:\n                break\n        messages = next_messages\n        iteration += 1\n    debug_log("Simulation done!")\n    return messages\n\nclass Example(unittest.TestCase):\n\n    def check_example(self, actors, in_message, expected_out_messages):\n        log = []\n        actual_out_messages = run_simulation(\n            actors=actors,\n            extra={},\n            debug=log.append,\n            fail=False,\n            messages=[in_message]\n        )\n        if actual_out_messages != expected_out_messages:\n            self.fail("\\n".join([\n                f"Example failed.",\n                f"",\n            ]+log+[\n                f"",\n                f"Message:  {in_message!r}",\n                f"Expected: {expected_out_messages!r}",\n                f"Actual:   {actual_out_messages!r}",\n            ]))\n\nnatives = {\n    "selftest": lambda: unittest.main(argv=[sys.argv[0]]),\n    "None": None,\n    "dict": dict,\n    "abs": abs,\n    "min": min,\n    "max": max,\n    "tuple": lambda *xs: tuple(xs),\n    "dec": lambda x: x-1,\n}\n'
+natives['SUPPORT'] = 'import io\nimport re\nimport sys\nimport unittest\nfrom bisect import bisect_left\nfrom collections import defaultdict, deque\nfrom heapq import merge\nfrom itertools import islice, takewhile\nfrom types import MethodType\n\nclass Stream:\n\n    def __init__(self, items, memo_size=0):\n        self.items = items\n        self.index = 0\n        self.latest_error = None\n        self.scope = None\n        self.exact = False\n        self.shortcut = False\n        self.memo = {} if memo_size else None\n        self.memo_size = memo_size\n        if memo_size:\n            self.memo_hits = defaultdict(int)\n            self.memo_misses = defaultdict(int)\n\n    def operator_or(self, matchers):\n        for matcher in matchers:\n            backtrack_index = self.index\n            result = matcher(self)\n            if result is not FAIL:\n                return result\n            self.index = backtrack_index\n        return self.fail("no or match")\n\n    def operator_dispatch(self, dispatch, matchers):\n        return self.operator_or([\n            matchers[i] for i in dispatch.select(self, self.items, self.index)\n        ])\n\n    def operator_and(self, matchers):\n        result = None\n        for matcher in matchers:\n            result = matcher(self)\n            if result is FAIL:\n                break\n        return result\n\n    def operator_star(self, matcher):\n        results = []\n        while True:\n            backtrack_index = self.index\n            result = matcher(self)\n            if result is FAIL:\n                self.index = backtrack_index\n                return self.action_list(results)\n            results.append(result)\n\n    def operator_skip(self, matcher):\n        while True:\n            backtrack_index = self.index\n            if matcher(self) is FAIL:\n                self.index = backtrack_index\n                return None\n\n    def operator_span(self, matcher):\n        start_index = self.index\n        result = matcher(self)\n        if result is FAIL:\n            return result\n        return self.items[start_index:self.index]\n\n    def operator_star_until(self, until):\n        start_index = self.index\n        self.index = until.scan(self, self.items, self.index)\n        return list(self.items[start_index:self.index])\n\n    def operator_skip_until(self, until):\n        self.index = until.scan(self, self.items, self.index)\n        return None\n\n    def operator_not(self, matcher):\n        backtrack_index = self.index\n        result = matcher(self)\n        self.index = backtrack_index\n        if result is FAIL:\n            return None\n        return self.fail("not matched")\n\n    def action(self, fn):\n        return SemanticAction(self.scope, fn)\n\n    def action_list(self, results):\n        for result in results:\n            if isinstance(result, SemanticAction):\n                return self.action(lambda self: [\n                    x.eval(self.runtime) if isinstance(x, SemanticAction) else x\n                    for x in results\n                ])\n        return results\n\n    def with_scope(self, matcher):\n        current_scope = self.scope\n        self.scope = {}\n        result = matcher(self)\n        self.scope = current_scope\n        return result\n\n    def bind(self, name, result):\n        if result is not FAIL:\n            self.scope[name] = result\n        return result\n\n    def match_list(self, matcher):\n        if self.index < len(self.items):\n            items, index = self.items, self.index\n            self.items = self.items[self.index]\n            self.index = 0\n            result = matcher(self)\n            if result is not FAIL:\n                index += 1\n            self.items, self.index = items, index\n            return result\n        return self.fail("no list found")\n\n    def match_rule(self, matcher, name):\n        if self.memo is None:\n            return matcher(self)\n        key = (name, id(self.items), self.index)\n        if key in self.memo:\n            self.memo_hits[name] += 1\n            result, self.index = self.memo[key]\n            return result\n        self.memo_misses[name] += 1\n        if len(self.memo) >= self.memo_size:\n            del self.memo[next(iter(self.memo))]\n        result = matcher(self)\n        self.memo[key] = (result, self.index)\n        return result\n\n    def match_call_rule(self, rules, actor):\n        item = self.items[self.index]\n        try:\n            matcher = rules[item]\n        except (KeyError, TypeError):\n            return self.fail("Unknown rule {}.", item)\n        self.index += 1\n        return matcher(actor, self)\n\n    def match_literal(self, literal):\n        index = literal_end(self, self.items, self.index, literal)\n        if index is FAIL:\n            return FAIL\n        self.index = index\n        return self.items[index-1]\n\n    def match_regex(self, regex, matcher):\n        if self.exact or not ATOMIC_REGEX or not isinstance(self.items, str):\n            return matcher(self)\n        self.shortcut = True\n        match = regex.match(self.items, self.index)\n        if match is None:\n            return FAIL\n        self.index = match.end()\n        return regex.value(match)\n\n    def match(self, fn, description):\n        if self.index < len(self.items):\n            item = self.items[self.index]\n            if fn(item):\n                self.index += 1\n                return item\n        return self.fail("expected {}", description)\n\n    def fail(self, message, *args):\n        return self.fail_at(self.items, self.index, message, *args)\n\n    def fail_at(self, items, index, message, *args):\n        if not self.latest_error or index > self.latest_error[2]:\n            self.latest_error = (message.format(*args), items, index)\n        return FAIL\n\n    def run(self, matcher):\n        items, index = self.items, self.index\n        result = matcher(self)\n        if result is FAIL and self.shortcut and not self.exact:\n            raise ShortcutMatchError(self, matcher, items, index)\n        if result is FAIL:\n            raise MatchError(*self.latest_error)\n        return result\n\n    def rerun_exact(self, matcher, items, index):\n        self.items, self.index = items, index\n        self.latest_error = None\n        self.exact = True\n        if self.memo is not None:\n            self.memo.clear()\n        matcher(self)\n        return MatchError(*self.latest_error)\n\nFAIL = object()\n\nATOMIC_REGEX = sys.version_info >= (3, 11)\n\nEMPTY_SCOPE = {}\n\ndef in_ranges(item, ranges):\n    return isinstance(item, str) and any(lo <= item <= hi for lo, hi in ranges)\n\ndef expect_first(stream, items, index, description):\n    stream.fail_at(items, index, "expected {}", description)\n    return True\n\ndef literal_end(stream, items, index, literal):\n    end = index+len(literal)\n    if items[index:end] == literal:\n        return end\n    for char in literal:\n        if index >= len(items) or items[index] != char:\n            return stream.fail_at(items, index, "expected {!r}", char)\n        index += 1\n    return index\n\nclass MatchError(Exception):\n\n    def __init__(self, name, items, index):\n        Exception.__init__(self, name)\n        self.items = items\n        self.index = index\n\nclass ShortcutMatchError(MatchError):\n\n    def __init__(self, stream, matcher, items, index):\n        Exception.__init__(self)\n        self.rerun = (stream, matcher, items, index)\n        self.error = None\n\n    def exact(self):\n        if self.error is None:\n            stream, matcher, items, index = self.rerun\n            self.error = stream.rerun_exact(matcher, items, index)\n        return self.error\n\n    @property\n    def items(self):\n        return self.exact().items\n\n    @property\n    def index(self):\n        return self.exact().index\n\n    def __str__(self):\n        return str(self.exact())\n\nclass Until:\n\n    def __init__(self, stops, description, first):\n        self.stops = [list(stop) for stop in stops]\n        self.pattern = None\n        self.description = description\n        self.first = first\n\n    def scan(self, stream, items, index):\n        begin = index\n        if isinstance(items, str):\n            if self.pattern is None:\n                self.pattern = re.compile("|".join(\n                    re.escape("".join(stop)) for stop in self.stops\n                    if all(isinstance(x, str) and len(x) == 1 for x in stop)\n                ) or "(?!)")\n            match = self.pattern.search(items, index)\n            index = match.start() if match else len(items)\n        else:\n            while index < len(items) and not any(\n                items[index:index+len(stop)] == stop\n                for stop in self.stops\n            ):\n                index += 1\n        for start in range(max(begin, index-len(max(self.stops, key=len))+1), index):\n            for stop in self.stops:\n                end = start\n                while end < len(items) and items[end] == stop[end-start]:\n                    end += 1\n                stream.fail_at(items, end, "expected {!r}", stop[end-start])\n        if index < len(items):\n            if self.first and not self.first[0] <= items[index] <= self.first[1]:\n                stream.fail_at(items, index, "expected {}", self.description)\n            stream.fail_at(items, index, "not matched")\n        else:\n            stream.fail_at(items, index, "expected {}", self.description)\n        return index\n\nclass Dispatch:\n\n    def __init__(self, head, table, default):\n        self.head = head\n        self.table = table\n        self.default = default\n        self.all = sorted(set(default).union(*table.values()))\n\n    def select(self, stream, items, index):\n        if stream.exact:\n            return self.all\n        stream.shortcut = True\n        try:\n            item = items[index]\n            if self.head:\n                item = item[0]\n            return self.table.get(item, self.default)\n        except (IndexError, KeyError, TypeError):\n            return self.default\n\nclass Regex:\n\n    def __init__(self, pattern, kind):\n        self.pattern = pattern\n        self.kind = kind\n        self.compiled = None\n\n    def match(self, items, index):\n        if self.compiled is None:\n            self.compiled = re.compile(self.pattern, re.DOTALL)\n            self.group = min(self.compiled.groups, 1)\n        return self.compiled.match(items, index)\n\n    def value(self, match):\n        text = match.group(self.group)\n        if self.kind == "text":\n            return text\n        elif self.kind == "last":\n            return text[-1]\n        elif self.kind == "chars":\n            return list(text)\n        else:\n            return None\n\nclass VmRule:\n\n    def __init__(self, program):\n        self.program = program\n\n    def __get__(self, actor, owner=None):\n        if actor is None:\n            return self\n        return MethodType(self, actor)\n\n    def __call__(self, actor, stream):\n        return vm(actor, self.program, stream)\n\ndef assemble(instructions):\n    labels = {}\n    program = []\n    for instruction in instructions:\n        if instruction[0] == "LABEL":\n            labels[instruction[1]] = len(program)\n        else:\n            program.append((instruction+(None, None))[:3])\n    return [\n        (op, labels[arg1], arg2) if op in ("BACKTRACK", "COMMIT", "REGEX") else\n        (op, arg1, [labels[x] for x in arg2]) if op == "DISPATCH" else\n        (op, arg1, arg2)\n        for op, arg1, arg2 in program\n    ]\n\ndef vm(actor, program, stream):\n    rules = actor._rules\n    memo = stream.memo\n    items = stream.items\n    index = stream.index\n    items_stack = []\n    scopes = [stream.scope]\n    pending = []\n    stack = []\n    result = None\n    pc = 0\n    while True:\n        op, arg1, arg2 = program[pc]\n        pc += 1\n        if op == "MATCH_EQ":\n            if index < len(items) and items[index] == arg1:\n                result = items[index]\n                index += 1\n                continue\n            message = ("expected {!r}", arg1)\n        elif op == "MATCH_LITERAL":\n            end = literal_end(stream, items, index, arg1)\n            if end is not FAIL:\n                index = end\n                result = items[index-1]\n                continue\n            message = None\n        elif op == "BACKTRACK":\n            stack.append((program, arg1, index, items, len(items_stack), len(scopes), len(pending)))\n            continue\n        elif op == "COMMIT":\n            stack.pop()\n            pc = arg1\n            continue\n        elif op == "CALL":\n            if arg2 is None:\n                arg2 = rules[arg1].program\n                program[pc-1] = (op, arg1, arg2)\n            if memo is None:\n                stack.append((program, pc, None))\n                program = arg2\n                pc = 0\n                continue\n            key = (arg1, id(items), index)\n            if key not in memo:\n                stream.memo_misses[arg1] += 1\n                if len(memo) >= stream.memo_size:\n                    del memo[next(iter(memo))]\n                stack.append((program, pc, key))\n                program = arg2\n                pc = 0\n                continue\n            stream.memo_hits[arg1] += 1\n            result, index = memo[key]\n            if result is not FAIL:\n                continue\n            message = None\n        elif op == "RETURN":\n            if not stack:\n                stream.index = index\n                return result\n            program, pc, key = stack.pop()\n            if key is not None:\n                memo[key] = (result, index)\n            continue\n        elif op == "PUSH_SCOPE":\n            scopes.append({})\n            continue\n        elif op == "POP_SCOPE":\n            scopes.pop()\n            continue\n        elif op == "BIND":\n            scopes[-1][arg1] = result\n            continue\n        elif op == "ACTION":\n            result = SemanticAction(scopes[-1] if arg2 is None else arg2, arg1)\n            continue\n        elif op == "ACTION_LOOKUP":\n            result = lookup_action(scopes[-1] if arg2 is None else arg2, arg1)\n            continue\n        elif op == "VALUE":\n            result = arg1\n            continue\n        elif op == "MATCH_RANGE":\n            if index < len(items) and arg1 <= items[index] <= arg2:\n                result = items[index]\n                index += 1\n                continue\n            message = ("expected {!r}-{!r}", arg1, arg2)\n        elif op == "MATCH_CLASS":\n            if index < len(items) and (\n                items[index] in arg1[0]\n                if isinstance(items[index], str) and len(items[index]) == 1\n                else in_ranges(items[index], arg1[1])\n            ):\n                if not arg1[2][0] <= items[index] <= arg1[2][1]:\n                    stream.fail_at(items, index, "expected {}", arg2)\n                result = items[index]\n                index += 1\n                continue\n            message = ("expected {}", arg2)\n        elif op == "REGEX":\n            if stream.exact or not ATOMIC_REGEX or not isinstance(items, str):\n                continue\n            stream.shortcut = True\n            match = arg2.match(items, index)\n            if match is not None:\n                index = match.end()\n                result = arg2.value(match)\n                pc = arg1\n                continue\n            message = None\n        elif op == "DISPATCH":\n            selected = arg1.select(stream, items, index)\n            pc = arg2[selected[0] if selected else -1]\n            continue\n        elif op == "STAR_UNTIL":\n            start = index\n            index = arg1.scan(stream, items, index)\n            result = list(items[start:index])\n            continue\n        elif op == "SKIP_UNTIL":\n            index = arg1.scan(stream, items, index)\n            result = None\n            continue\n        elif op == "MATCH_ANY":\n            if index < len(items):\n                result = items[index]\n                index += 1\n                continue\n            message = ("expected any",)\n        elif op == "MATCH_STATE":\n            if index < len(items) and items[index] == actor._state[arg1]:\n                result = items[index]\n                index += 1\n                continue\n            message = ("expected state",)\n        elif op == "LIST_START":\n            pending.append([])\n            continue\n        elif op == "LIST_APPEND":\n            pending[-1].append(result)\n            continue\n        elif op == "LIST_END":\n            result = stream.action_list(pending.pop())\n            continue\n        elif op == "SPAN_START":\n            pending.append(index)\n            continue\n        elif op == "SPAN_END":\n            result = items[pending.pop():index]\n            continue\n        elif op == "PUSH_ITEMS":\n            if index < len(items):\n                items_stack.append((items, index))\n                items = items[index]\n                index = 0\n                continue\n            message = ("no list found",)\n        elif op == "POP_ITEMS":\n            items, index = items_stack.pop()\n            index += 1\n            continue\n        elif op == "CALL_ITEM":\n            try:\n                target = rules[items[index]]\n            except (KeyError, TypeError):\n                message = ("Unknown rule {}.", items[index])\n            else:\n                index += 1\n                stack.append((program, pc, None))\n                program = target.program\n                pc = 0\n                continue\n        elif op == "NONE":\n            result = None\n            continue\n        elif op == "COMMIT_FAIL":\n            index = stack.pop()[2]\n            message = (arg1,)\n        elif op == "FAIL":\n            message = (arg1,)\n        else:\n            raise ValueError(f"Unknown instruction {op}.")\n        if message is not None:\n            stream.fail_at(items, index, *message)\n        while stack:\n            entry = stack.pop()\n            if len(entry) == 3:\n                if entry[2] is not None:\n                    memo[entry[2]] = (FAIL, index)\n            else:\n                program, pc, index, items, items_depth, scopes_depth, pending_depth = entry\n                del items_stack[items_depth:]\n                del scopes[scopes_depth:]\n                del pending[pending_depth:]\n                break\n        else:\n            return FAIL\n\nclass SemanticAction:\n\n    def __init__(self, scope, fn):\n        self.scope = scope\n        self.fn = fn\n\n    def eval(self, runtime):\n        self.runtime = runtime\n        return self.fn(self)\n\n    def bind(self, name, value, continuation):\n        self.runtime = self.runtime.bind(name, value)\n        return continuation()\n\n    def lookup(self, name):\n        if name in self.scope:\n            value = self.scope[name]\n            if isinstance(value, SemanticAction):\n                return value.eval(self.runtime)\n            return value\n        else:\n            return self.runtime.lookup(name)\n\ndef lookup_action(scope, name):\n    if name in scope:\n        return scope[name]\n    return SemanticAction(scope, lambda self: self.lookup(name))\n\nclass Runtime:\n\n    def __init__(self, actor, extra={}, bound={}):\n        self.extra = extra\n        self.bound = bound\n        self.actor = actor\n\n    def bind(self, name, value):\n        return Runtime(self.actor, self.extra, {**self.bound, name: value})\n\n    def lookup(self, name):\n        if name in self.bound:\n            return self.bound[name]\n        elif name in self.extra:\n            return self.extra[name]\n        elif self.actor and name in self.actor._state:\n            return self.actor._state[name]\n        else:\n            return getattr(self, name)\n\n    def increment(self, number):\n        return number + 1\n\n    def decrement(self, number):\n        return number - 1\n\n    def collector(self):\n        class collector(list):\n            def __call__(self, item):\n                self.append(item)\n        return collector()\n\n    def join(self, items, delimiter=""):\n        return Text(items, delimiter)\n\n    def indent(self, text, prefix="    "):\n        return Text([text], "", prefix)\n\n    def splice(self, depth, item):\n        return list(splice_items(depth, item))\n\n    def concat(self, lists):\n        return [x for xs in lists for x in xs]\n\n    def collectDictList(self, tuples):\n        result = defaultdict(list)\n        for key, value in tuples:\n            result[key].append(value)\n        return result\n\n    def match(self, rule, items):\n        result = Stream(items).run(\n            lambda stream: self.actor._rules[rule](self.actor, stream)\n        )\n        if isinstance(result, SemanticAction):\n            return result.eval(self)\n        return result\n\nclass Text:\n\n    LINE_BREAKS = "\\n\\r\\x0b\\x0c\\x1c\\x1d\\x1e\\x85\\u2028\\u2029"\n\n    def __init__(self, items, delimiter="", prefix=None):\n        self.items = items\n        self.delimiter = delimiter\n        self.prefix = prefix\n        self.text = None\n\n    def __str__(self):\n        if self.text is None:\n            output = io.StringIO()\n            self.write(output.write)\n            self.text = output.getvalue()\n        return self.text\n\n    def __repr__(self):\n        return repr(str(self))\n\n    def __eq__(self, other):\n        return str(self) == other\n\n    def __hash__(self):\n        return hash(str(self))\n\n    def write(self, write):\n        levels = []\n        owed = 0\n        def emit(text):\n            nonlocal owed\n            if not levels:\n                write(text)\n                return\n            for line in text.splitlines(True):\n                if owed < len(levels):\n                    write("".join(levels[owed:]))\n                    owed = len(levels)\n                write(line)\n                if line[-1] in self.LINE_BREAKS:\n                    owed = 0\n        frames = []\n        def enter(text):\n            if text.prefix is not None:\n                levels.append(text.prefix)\n            frames.append((text, iter(text.items), [False], text.prefix is not None))\n        enter(self)\n        while frames:\n            text, items, started, indented = frames[-1]\n            for item in items:\n                if isinstance(item, list) and item:\n                    frames.append((text, iter(item), started, False))\n                    break\n                if started[0]:\n                    emit(text.delimiter)\n                started[0] = True\n                if isinstance(item, Text) and item.text is None:\n                    enter(item)\n                    break\n                if not isinstance(item, list):\n                    emit(str(item))\n            else:\n                frames.pop()\n                if indented:\n                    levels.pop()\n                    owed = min(owed, len(levels))\n\ndef materialize(value):\n    if isinstance(value, Text):\n        return str(value)\n    return value\n\ndef splice_items(depth, item):\n    if depth == 0:\n        yield item\n    else:\n        for subitem in item:\n            yield from splice_items(depth-1, subitem)\n\nclass Counter:\n\n    def __init__(self):\n        self.number = 0\n\n    def __call__(self):\n        result = self.number\n        self.number += 1\n        return result\n\ndef run_simulation(actors, extra={}, messages=[], debug=False, fail=True, packrat=0, processes=0, mailboxes=False):\n    def debug_log(text):\n        if callable(debug):\n            debug(text)\n        elif debug:\n            sys.stderr.write(f"{text}\\n")\n    def trunc(thing, n):\n        x = repr(thing)\n        if len(x) > n:\n            return f"{x[:n]} ..."\n        else:\n            return x\n    def register(actor, serial):\n        heads = getattr(actor, "_accepts", None)\n        if heads is None:\n            anyone.append((serial, actor))\n        else:\n            for head in heads:\n                index.setdefault(head, []).append((serial, actor))\n        boxes[serial] = deque()\n        addresses[id(actor)] = serial\n    def unregister(actor, serial):\n        heads = getattr(actor, "_accepts", None)\n        for members in [anyone] if heads is None else [index[head] for head in heads]:\n            del members[bisect_left(members, (serial,))]\n        del addresses[id(actor)]\n        for message, since, address in boxes.pop(serial):\n            route(message, since, serial+1, address)\n    def spawn(actor):\n        nonlocal spawned\n        actors.append(actor)\n        serials.append(spawned)\n        if not parks(actor):\n            restless.append((spawned, actor))\n        if mailboxes:\n            register(actor, spawned)\n        if pool is not None:\n            born.append((spawned, replica(actor)))\n        spawned += 1\n    def kill(actor):\n        index = actors.index(actor)\n        serial = serials[index]\n        del actors[index]\n        del serials[index]\n        if not parks(actor):\n            del restless[bisect_left(restless, (serial,))]\n        if mailboxes:\n            unregister(actor, serial)\n        if pool is not None:\n            killed.add(serial)\n    def put(message):\n        if mailboxes:\n            route(message, 0, 0, None)\n        else:\n            queue.append((message, 0))\n    def send(actor, message):\n        route(message, 0, 0, addresses.get(id(actor), -1))\n    def retries(since, after):\n        return takewhile(\n            lambda member: member[0] < since,\n            islice(restless, bisect_left(restless, (after,)), None)\n        )\n    def deliver(message, since, after=0):\n        start = bisect_left(serials, max(since, after))\n        for _, actor in merge(\n            retries(since, after),\n            ((serials[index], actors[index]) for index in range(start, len(actors)))\n        ):\n            if accepts(actor, message) and run_actor(actor, message, x, lambda: kill(actor), packrat, memo_hits, memo_misses):\n                return True\n        return False\n    def commit(effects):\n        for effect, value in effects:\n            if effect == "put":\n                put(value)\n            elif effect == "spawn":\n                spawn(value)\n            elif effect == "write":\n                sys.stdout.write(value)\n            else:\n                kill(actors[bisect_left(serials, value)])\n    def deliver_generation(generation):\n        first = spawned\n        size = -(-len(generation)//processes)\n        for start, (connection, _) in zip(range(0, size*processes, size), pool):\n            connection.send((born, sorted(killed), generation[start:start+size]))\n        born.clear()\n        killed.clear()\n        results = []\n        for connection, _ in pool:\n            kind, result = connection.recv()\n            while kind == "read":\n                connection.send(x["read"](result))\n                kind, result = connection.recv()\n            if kind == "error":\n                raise result\n            evaluated, hits, misses = result\n            results.extend(evaluated)\n            for key, count in hits.items():\n                memo_hits[key] += count\n            for key, count in misses.items():\n                memo_misses[key] += count\n        processed = False\n        for (message, since), (serial, resume, touched, effects) in zip(generation, results):\n            if killed.isdisjoint(touched):\n                commit(effects)\n                done = serial is not None or deliver(message, since, first if resume is None else resume)\n            else:\n                done = deliver(message, since)\n            if done:\n                processed = True\n            else:\n                queue.append((message, spawned))\n        return processed\n    def candidates(message, since, after, address):\n        if address is not None:\n            if address >= after and address in boxes:\n                if address >= since or not parks(actors[bisect_left(serials, address)]):\n                    yield address\n            return\n        start = max(since, after)\n        try:\n            members = index.get(message[0], [])\n        except (IndexError, KeyError, TypeError):\n            members = []\n        for serial, _ in merge(\n            members[bisect_left(members, (start,)):],\n            anyone[bisect_left(anyone, (start,)):],\n            (member for member in retries(since, after) if accepts(member[1], message))\n        ):\n            yield serial\n    def route(message, since, after, address):\n        for serial in candidates(message, since, after, address):\n            box = boxes[serial]\n            if not box:\n                ready.append(serial)\n            box.append((message, since, address))\n            return\n        queue.append((message, spawned, address))\n    def run_mailboxes():\n        processed = True\n        while ready or (queue and processed):\n            if not ready:\n                processed = False\n                for _ in range(len(queue)):\n                    message, since, address = queue.popleft()\n                    route(message, since, 0, address)\n                continue\n            serial = ready.popleft()\n            box = boxes.get(serial)\n            if not box:\n                continue\n            message, since, address = box.popleft()\n            actor = actors[bisect_left(serials, serial)]\n            if run_actor(actor, message, x, lambda: kill(actor), packrat, memo_hits, memo_misses):\n                processed = True\n            else:\n                route(message, since, serial+1, address)\n            if box and serial in boxes:\n                ready.append(serial)\n    def run_generations():\n        iteration = 0\n        while queue:\n            if debug:\n                debug_log(f"Iteration {iteration}")\n                for actor in actors:\n                    debug_log(f"  Actor   {actor.__class__.__name__} {trunc(actor._state, 60)}")\n                for message, _ in queue:\n                    debug_log(f"  Message {trunc(message, 60)}")\n                debug_log("")\n            processed = False\n            if pool is not None:\n                processed = deliver_generation([queue.popleft() for _ in range(len(queue))])\n            else:\n                for _ in range(len(queue)):\n                    message, since = queue.popleft()\n                    if deliver(message, since):\n                        processed = True\n                    else:\n                        queue.append((message, spawned))\n            if not processed:\n                break\n            iteration += 1\n    if mailboxes and processes:\n        raise ValueError("Mailboxes can not be combined with processes.")\n    if not isinstance(actors, list):\n        actors = [actors]\n    if not messages:\n        messages.append(["Args"]+sys.argv[1:])\n    queue = deque()\n    spawned = len(actors)\n    serials = list(range(spawned))\n    restless = [(serial, actor) for serial, actor in enumerate(actors) if not parks(actor)]\n    index = {}\n    anyone = []\n    boxes = {}\n    addresses = {}\n    ready = deque()\n    killed = set()\n    born = []\n    memo_hits = defaultdict(int)\n    memo_misses = defaultdict(int)\n    x = simulation_natives(put, spawn, sys.stdout.write, {"send": send, **extra} if mailboxes else extra)\n    pool = None\n    if mailboxes:\n        for serial, actor in enumerate(actors):\n            register(actor, serial)\n        for message in messages:\n            put(message)\n        run_mailboxes()\n    elif processes:\n        import multiprocessing\n        context = multiprocessing.get_context("fork")\n        queue.extend((message, 0) for message in messages)\n        pool = []\n        try:\n            for _ in range(processes):\n                connection, remote = context.Pipe()\n                worker = context.Process(\n                    target=serve_actors,\n                    args=(remote, [(serial, replica(actor)) for serial, actor in zip(serials, actors)], extra, packrat),\n                    daemon=True\n                )\n                worker.start()\n                pool.append((connection, worker))\n            run_generations()\n        finally:\n            for connection, worker in pool:\n                connection.send(None)\n                worker.join()\n    else:\n        queue.extend((message, 0) for message in messages)\n        run_generations()\n    if queue and fail:\n        errors = []\n        for message, *_ in queue:\n            for actor in actors:\n                try:\n                    actor.run(Stream(message, packrat))\n                except MatchError as e:\n                    errors.append((actor, e))\n        for actor, error in sorted(errors, key=lambda x: x[1].index):\n            sys.stderr.write(f"{actor.__class__.__name__} {trunc(actor._state, 60)}\\n")\n            sys.stderr.write(f"  {error} at {error.index}\\n")\n            sys.stderr.write(f"  {trunc(error.items, 60)}\\n")\n            sys.stderr.write("\\n")\n        sys.exit("No message processed.")\n    for key in sorted(memo_misses, key=lambda key: -memo_hits[key]):\n        debug_log(f"Packrat {\'.\'.join(key)} hits={memo_hits[key]} misses={memo_misses[key]}")\n    debug_log("Simulation done!")\n    return [message for message, *_ in queue]\n\ndef accepts(actor, message):\n    heads = getattr(actor, "_accepts", None)\n    if heads is None:\n        return True\n    try:\n        return message[0] in heads\n    except (IndexError, KeyError, TypeError):\n        return False\n\ndef parks(actor):\n    return getattr(actor, "_parks", False)\n\ndef simulation_natives(put, spawn, write, extra):\n    def read(path):\n        if path == "-":\n            return sys.stdin.read()\n        with open(path) as f:\n            return f.read()\n    x = {\n        "put": put,\n        "spawn": spawn,\n        "write": write,\n        "repr": repr,\n        "read": read,\n        "len": len,\n        "repr": repr,\n        "int": int,\n        "sum": sum,\n        "Counter": Counter,\n    }\n    for name, native in natives.items():\n        x[name] = native\n    for key, value in extra.items():\n        x[key] = value\n    return x\n\ndef run_actor(actor, message, x, kill, packrat, memo_hits, memo_misses):\n    stream = Stream(message, packrat)\n    try:\n        result = actor.run(stream)\n        if isinstance(result, SemanticAction):\n            result.eval(Runtime(actor, x).bind("kill", kill))\n    except MatchError:\n        return False\n    else:\n        return True\n    finally:\n        count_memo(actor, stream, memo_hits, memo_misses)\n\nclass LocalActor:\n\n    def __init__(self, actor):\n        self._accepts = getattr(actor, "_accepts", None)\n        self._parks = parks(actor)\n\ndef replica(actor):\n    if getattr(actor, "_replicable", False):\n        return actor\n    return LocalActor(actor)\n\ndef serve_actors(connection, members, extra, packrat):\n    def read(path):\n        connection.send(("read", path))\n        return connection.recv()\n    extra = {"read": read, **extra}\n    alive = dict(members)\n    while True:\n        task = connection.recv()\n        if task is None:\n            break\n        born, killed, generation = task\n        alive.update(born)\n        for serial in killed:\n            del alive[serial]\n        try:\n            connection.send(("done", evaluate_remote(list(alive.items()), generation, extra, packrat)))\n        except Exception as e:\n            connection.send(("error", e))\n\ndef evaluate_remote(members, generation, extra, packrat):\n    evaluated = []\n    memo_hits = defaultdict(int)\n    memo_misses = defaultdict(int)\n    for message, since in generation:\n        matched = None\n        resume = None\n        touched = []\n        effects = []\n        x = simulation_natives(\n            lambda message: effects.append(("put", message)),\n            lambda actor: effects.append(("spawn", actor)),\n            lambda text: effects.append(("write", text)),\n            extra\n        )\n        for serial, actor in members:\n            if (serial < since and parks(actor)) or not accepts(actor, message):\n                continue\n            if isinstance(actor, LocalActor):\n                resume = serial\n                break\n            count = len(effects)\n            kill = lambda serial=serial: effects.append(("kill", serial))\n            if run_actor(actor, message, x, kill, packrat, memo_hits, memo_misses):\n                matched = serial\n            if matched is not None or len(effects) > count:\n                touched.append(serial)\n            if matched is not None:\n                break\n        evaluated.append((matched, resume, touched, effects))\n    return evaluated, memo_hits, memo_misses\n\ndef count_memo(actor, stream, memo_hits, memo_misses):\n    if stream.memo is not None:\n        for name, count in stream.memo_hits.items():\n            memo_hits[(actor.__class__.__name__, name)] += count\n        for name, count in stream.memo_misses.items():\n            memo_misses[(actor.__class__.__name__, name)] += count\n\nclass Example(unittest.TestCase):\n\n    def check_example(self, actors, in_message, expected_out_messages):\n        log = []\n        actual_out_messages = run_simulation(\n            actors=actors,\n            extra={},\n            debug=log.append,\n            fail=False,\n            messages=[in_message]\n        )\n        if actual_out_messages != expected_out_messages:\n            self.fail("\\n".join([\n                f"Example failed.",\n                f"",\n            ]+log+[\n                f"",\n                f"Message:  {in_message!r}",\n                f"Expected: {expected_out_messages!r}",\n                f"Actual:   {actual_out_messages!r}",\n            ]))\n\nnatives = {\n    "selftest": lambda: unittest.main(argv=[sys.argv[0]]),\n    "None": None,\n    "dict": dict,\n    "abs": abs,\n    "min": min,\n    "max": max,\n    "tuple": lambda *xs: tuple(xs),\n    "dec": lambda x: x-1,\n}\n'
 class Cli:
+    __slots__ = ('_state',)
     def __init__(self):
         self._state = {}
-        self._rules = {
-            '_main': self._matcher_15,
-            'arg': self._matcher_44,
-        }
-        self._main = self._rules.pop('_main')
     def run(self, stream):
-        return self._main(stream)
+        return stream.run(self._main)
     def _matcher_0(self, stream):
         return stream.match(lambda item: item == 'Args', "'Args'")
     def _matcher_1(self, stream):
@@ -312,12 +1152,12 @@ class Cli:
     def _matcher_2(self, stream):
         return stream.operator_not(self._matcher_1)
     def _matcher_3(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(0, 'Args'),
-                self.lookup('splice')(0, '--compile'),
-                self.lookup('splice')(0, '-')
-            ])
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.runtime.lookup('put')(
+            [
+                'Args',
+                '--compile',
+                '-'
+            ]
         ))
     def _matcher_4(self, stream):
         return stream.operator_and([
@@ -326,193 +1166,199 @@ class Cli:
             self._matcher_3
         ])
     def _matcher_5(self, stream):
-        return stream.with_scope(self._matcher_4)
+        return self._rule_arg(stream) if stream.memo is None else stream.match_rule(self._rule_arg, 'arg')
     def _matcher_6(self, stream):
-        return stream.match(lambda item: item == 'Args', "'Args'")
+        return stream.operator_star(self._matcher_5)
     def _matcher_7(self, stream):
-        return self._rules['arg'](stream)
+        return stream.bind('xs', self._matcher_6(stream))
     def _matcher_8(self, stream):
-        return stream.operator_star(self._matcher_7)
-    def _matcher_9(self, stream):
-        return stream.bind('xs', self._matcher_8(stream))
-    def _matcher_10(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_11(self, stream):
-        return stream.operator_not(self._matcher_10)
-    def _matcher_12(self, stream):
-        return stream.action(lambda self: self.bind('next', self.lookup('Counter')(
+        return SemanticAction(stream.scope, lambda self: self.bind('next', self.runtime.lookup('Counter')(
         
-        ), lambda: self.bind('', self.lookup('xs'), lambda: self.lookup('spawn')(
-            self.lookup('PartCollector')(
+        ), lambda: self.bind('', self.lookup('xs'), lambda: self.runtime.lookup('spawn')(
+            materialize(self.runtime.lookup('PartWriter')(
                 0,
-                self.lookup('decrement')(
-                    self.lookup('next')(
+                materialize(self.runtime.extra.get('decrement', self.runtime.decrement)(
+                    materialize(self.runtime.lookup('next')(
                     
-                    )
-                ),
-                self.lookup('concat')([
-                
-                ]),
-                self.lookup('concat')([
-                    self.lookup('splice')(0, 'Write')
-                ])
-            )
+                    ))
+                ))
+            ))
         ))))
-    def _matcher_13(self, stream):
+    def _matcher_9(self, stream):
         return stream.operator_and([
-            self._matcher_6,
-            self._matcher_9,
-            self._matcher_11,
-            self._matcher_12
+            self._matcher_0,
+            self._matcher_7,
+            self._matcher_2,
+            self._matcher_8
+        ])
+    def _matcher_10(self, stream):
+        return stream.with_scope(self._matcher_9)
+    def _matcher_11(self, stream):
+        return stream.operator_or([
+            self._matcher_4,
+            self._matcher_10
         ])
+    _dispatch_12 = Dispatch(False, {'--support': [0], '--copy': [1], '--embed': [2], '--compile': [3], '--compile-with': [4], '--main': [5]}, [])
+    def _matcher_13(self, stream):
+        return stream.match(lambda item: item == '--support', "'--support'")
     def _matcher_14(self, stream):
-        return stream.with_scope(self._matcher_13)
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.runtime.lookup('put')(
+            [
+                'Part',
+                materialize(self.runtime.lookup('next')(
+                
+                )),
+                materialize(self.runtime.lookup('SUPPORT'))
+            ]
+        ))
     def _matcher_15(self, stream):
-        return stream.operator_or([
-            self._matcher_5,
+        return stream.operator_and([
+            self._matcher_13,
             self._matcher_14
         ])
     def _matcher_16(self, stream):
-        return stream.match(lambda item: item == '--support', "'--support'")
+        return stream.match(lambda item: item == '--copy', "'--copy'")
     def _matcher_17(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(0, 'Part'),
-                self.lookup('splice')(0, self.lookup('next')(
+        return stream.bind('x', self._matcher_1(stream))
+    def _matcher_18(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('put')(
+            [
+                'Part',
+                materialize(self.runtime.lookup('next')(
                 
                 )),
-                self.lookup('splice')(0, self.lookup('SUPPORT'))
-            ])
+                materialize(self.runtime.lookup('read')(
+                    materialize(self.lookup('x'))
+                ))
+            ]
         ))
-    def _matcher_18(self, stream):
+    def _matcher_19(self, stream):
         return stream.operator_and([
             self._matcher_16,
-            self._matcher_17
+            self._matcher_17,
+            self._matcher_18
         ])
-    def _matcher_19(self, stream):
-        return stream.with_scope(self._matcher_18)
     def _matcher_20(self, stream):
-        return stream.match(lambda item: item == '--copy', "'--copy'")
+        return stream.with_scope(self._matcher_19)
     def _matcher_21(self, stream):
-        return stream.match(lambda item: True, 'any')
+        return stream.match(lambda item: item == '--embed', "'--embed'")
     def _matcher_22(self, stream):
-        return stream.bind('x', self._matcher_21(stream))
+        return stream.bind('y', self._matcher_1(stream))
     def _matcher_23(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(0, 'Part'),
-                self.lookup('splice')(0, self.lookup('next')(
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('put')(
+            [
+                'Part',
+                materialize(self.runtime.lookup('next')(
                 
                 )),
-                self.lookup('splice')(0, self.lookup('read')(
-                    self.lookup('x')
-                ))
-            ])
+                materialize(self.runtime.join([
+                    'natives[',
+                    self.runtime.lookup('repr')(
+                        materialize(self.lookup('x'))
+                    ),
+                    '] = ',
+                    self.runtime.lookup('repr')(
+                        materialize(self.runtime.lookup('read')(
+                            materialize(self.lookup('y'))
+                        ))
+                    ),
+                    '\n'
+                ]))
+            ]
         ))
     def _matcher_24(self, stream):
         return stream.operator_and([
-            self._matcher_20,
+            self._matcher_21,
+            self._matcher_17,
             self._matcher_22,
             self._matcher_23
         ])
     def _matcher_25(self, stream):
         return stream.with_scope(self._matcher_24)
     def _matcher_26(self, stream):
-        return stream.match(lambda item: item == '--embed', "'--embed'")
+        return stream.match(lambda item: item == '--compile', "'--compile'")
     def _matcher_27(self, stream):
-        return stream.match(lambda item: True, 'any')
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('put')(
+            [
+                'SourceCode',
+                materialize(self.runtime.lookup('next')(
+                
+                )),
+                materialize(self.runtime.lookup('read')(
+                    materialize(self.lookup('x'))
+                ))
+            ]
+        ))
     def _matcher_28(self, stream):
-        return stream.bind('x', self._matcher_27(stream))
+        return stream.operator_and([
+            self._matcher_26,
+            self._matcher_17,
+            self._matcher_27
+        ])
     def _matcher_29(self, stream):
-        return stream.match(lambda item: True, 'any')
+        return stream.with_scope(self._matcher_28)
     def _matcher_30(self, stream):
-        return stream.bind('y', self._matcher_29(stream))
+        return stream.match(lambda item: item == '--compile-with', "'--compile-with'")
     def _matcher_31(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(0, 'Part'),
-                self.lookup('splice')(0, self.lookup('next')(
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('put')(
+            [
+                'SourceCode',
+                materialize(self.runtime.lookup('next')(
                 
                 )),
-                self.lookup('splice')(0, self.lookup('join')([
-                    'natives[',
-                    self.lookup('repr')(
-                        self.lookup('x')
-                    ),
-                    '] = ',
-                    self.lookup('repr')(
-                        self.lookup('read')(
-                            self.lookup('y')
-                        )
-                    ),
-                    '\n'
-                ]))
-            ])
+                materialize(self.runtime.lookup('read')(
+                    materialize(self.lookup('y'))
+                )),
+                materialize(self.lookup('x'))
+            ]
         ))
     def _matcher_32(self, stream):
         return stream.operator_and([
-            self._matcher_26,
-            self._matcher_28,
             self._matcher_30,
+            self._matcher_17,
+            self._matcher_22,
             self._matcher_31
         ])
     def _matcher_33(self, stream):
         return stream.with_scope(self._matcher_32)
     def _matcher_34(self, stream):
-        return stream.match(lambda item: item == '--compile', "'--compile'")
+        return stream.match(lambda item: item == '--main', "'--main'")
     def _matcher_35(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_36(self, stream):
-        return stream.bind('x', self._matcher_35(stream))
-    def _matcher_37(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(0, 'SourceCode'),
-                self.lookup('splice')(0, self.lookup('next')(
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.runtime.lookup('put')(
+            [
+                'Part',
+                materialize(self.runtime.lookup('next')(
                 
                 )),
-                self.lookup('splice')(0, self.lookup('read')(
-                    self.lookup('x')
-                ))
-            ])
+                materialize(self.runtime.join([
+                    'if __name__ == "__main__":\n    run_simulation(natives["Main"]())\n'
+                ]))
+            ]
         ))
-    def _matcher_38(self, stream):
+    def _matcher_36(self, stream):
         return stream.operator_and([
             self._matcher_34,
-            self._matcher_36,
-            self._matcher_37
+            self._matcher_35
         ])
-    def _matcher_39(self, stream):
-        return stream.with_scope(self._matcher_38)
-    def _matcher_40(self, stream):
-        return stream.match(lambda item: item == '--main', "'--main'")
-    def _matcher_41(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(0, 'Part'),
-                self.lookup('splice')(0, self.lookup('next')(
-                
-                )),
-                self.lookup('splice')(0, self.lookup('join')([
-                    'if __name__ == "__main__":\n    run_simulation(natives["Main"]())\n'
-                ]))
-            ])
-        ))
-    def _matcher_42(self, stream):
-        return stream.operator_and([
-            self._matcher_40,
-            self._matcher_41
-        ])
-    def _matcher_43(self, stream):
-        return stream.with_scope(self._matcher_42)
-    def _matcher_44(self, stream):
-        return stream.operator_or([
-            self._matcher_19,
+    def _matcher_37(self, stream):
+        return stream.operator_dispatch(self._dispatch_12, [
+            self._matcher_15,
+            self._matcher_20,
             self._matcher_25,
+            self._matcher_29,
             self._matcher_33,
-            self._matcher_39,
-            self._matcher_43
-        ])
+            self._matcher_36
+        ])
+    _rule__main = _matcher_11
+    _rule_arg = _matcher_37
+    _accepts = {'Args'}
+    _parks = True
+    _replicable = True
+    _rules = {
+        '_main': _rule__main,
+        'arg': _rule_arg,
+    }
+    _main = _rules.pop('_main')
 natives['Cli'] = Cli
 natives['Main'] = lambda: [
     SemanticAction({}, lambda self: self.lookup('Cli')(
@@ -526,58 +1372,14 @@ natives['Main'] = lambda: [
     )).eval(Runtime(None, natives)),
     SemanticAction({}, lambda self: self.lookup('CodeGenerator')(
     
-    )).eval(Runtime(None, natives)),
-    SemanticAction({}, lambda self: self.lookup('StdoutWriter')(
-    
     )).eval(Runtime(None, natives))
 ]
 class Parser:
+    __slots__ = ('_state',)
     def __init__(self):
         self._state = {}
-        self._rules = {
-            '_main': self._matcher_9,
-            'file': self._matcher_20,
-            'body': self._matcher_87,
-            'examplesp': self._matcher_103,
-            'example': self._matcher_116,
-            'globalHostExpr': self._matcher_121,
-            'whereItems': self._matcher_132,
-            'field': self._matcher_138,
-            'rule': self._matcher_149,
-            'choice': self._matcher_171,
-            'sequence': self._matcher_183,
-            'expr': self._matcher_205,
-            'expr1': self._matcher_230,
-            'expr2': self._matcher_239,
-            'expr3': self._matcher_310,
-            'matchChar': self._matcher_315,
-            'maybeAction': self._matcher_323,
-            'actionExpr': self._matcher_353,
-            'hostExpr': self._matcher_410,
-            'hostListItem': self._matcher_419,
-            'var': self._matcher_429,
-            'restLine': self._matcher_442,
-            'indented': self._matcher_448,
-            'string': self._matcher_462,
-            'char': self._matcher_472,
-            'innerChar': self._matcher_479,
-            'escape': self._matcher_496,
-            'number': self._matcher_504,
-            'name': self._matcher_514,
-            'reserved': self._matcher_525,
-            'keyDef': self._matcher_532,
-            'keyActor': self._matcher_541,
-            'keyWhere': self._matcher_550,
-            'keyUniverse': self._matcher_562,
-            'keyExamples': self._matcher_574,
-            'nameStart': self._matcher_579,
-            'nameChar': self._matcher_586,
-            'space': self._matcher_595,
-            'comment': self._matcher_607,
-        }
-        self._main = self._rules.pop('_main')
     def run(self, stream):
-        return self._main(stream)
+        return stream.run(self._main)
     def _matcher_0(self, stream):
         return stream.match(lambda item: item == 'SourceCode', "'SourceCode'")
     def _matcher_1(self, stream):
@@ -585,3187 +1387,7752 @@ class Parser:
     def _matcher_2(self, stream):
         return stream.bind('p', self._matcher_1(stream))
     def _matcher_3(self, stream):
-        return self._rules['file'](stream)
+        return self._rule_file(stream) if stream.memo is None else stream.match_rule(self._rule_file, 'file')
     def _matcher_4(self, stream):
         return stream.bind('x', self._matcher_3(stream))
     def _matcher_5(self, stream):
-        return stream.operator_and([
-            self._matcher_4
-        ])
-    def _matcher_6(self, stream):
-        return stream.match_list(self._matcher_5)
+        return stream.match_list(self._matcher_4)
+    _regex_6 = Regex('(?:.)*+', 'chars')
     def _matcher_7(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(0, 'Ast'),
-                self.lookup('splice')(0, self.lookup('p')),
-                self.lookup('splice')(0, self.lookup('x'))
-            ])
-        ))
+        return stream.operator_star(self._matcher_1)
     def _matcher_8(self, stream):
-        return stream.operator_and([
-            self._matcher_0,
-            self._matcher_2,
-            self._matcher_6,
-            self._matcher_7
-        ])
+        return stream.match_regex(self._regex_6, self._matcher_7)
     def _matcher_9(self, stream):
-        return stream.with_scope(self._matcher_8)
+        return stream.bind('ys', self._matcher_8(stream))
     def _matcher_10(self, stream):
-        return self._rules['space'](stream)
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('put')(
+            [
+                'Ast',
+                materialize(self.lookup('p')),
+                materialize(self.lookup('x')),
+                *materialize(self.lookup('ys'))
+            ]
+        ))
     def _matcher_11(self, stream):
-        return self._rules['body'](stream)
-    def _matcher_12(self, stream):
         return stream.operator_and([
-            self._matcher_10,
-            self._matcher_11
+            self._matcher_0,
+            self._matcher_2,
+            self._matcher_5,
+            self._matcher_9,
+            self._matcher_10
         ])
-    def _matcher_13(self, stream):
-        return stream.operator_star(self._matcher_12)
+    def _matcher_12(self, stream):
+        return stream.with_scope(self._matcher_11)
+    _regex_13 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+', 'none')
     def _matcher_14(self, stream):
-        return stream.bind('xs', self._matcher_13(stream))
+        return self._rule_space(stream) if stream.memo is None else stream.match_rule(self._rule_space, 'space')
     def _matcher_15(self, stream):
-        return self._rules['space'](stream)
+        return stream.match_regex(self._regex_13, self._matcher_14)
     def _matcher_16(self, stream):
-        return stream.match(lambda item: True, 'any')
+        return self._rule_body(stream) if stream.memo is None else stream.match_rule(self._rule_body, 'body')
     def _matcher_17(self, stream):
-        return stream.operator_not(self._matcher_16)
-    def _matcher_18(self, stream):
-        return stream.action(lambda self: self.lookup('xs'))
-    def _matcher_19(self, stream):
         return stream.operator_and([
-            self._matcher_14,
             self._matcher_15,
-            self._matcher_17,
-            self._matcher_18
+            self._matcher_16
         ])
-    def _matcher_20(self, stream):
-        return stream.with_scope(self._matcher_19)
+    def _matcher_18(self, stream):
+        return stream.operator_star(self._matcher_17)
+    def _matcher_19(self, stream):
+        return stream.bind('xs', self._matcher_18(stream))
+    _regex_20 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+(?!.)', 'none')
     def _matcher_21(self, stream):
-        return self._rules['keyActor'](stream)
+        return stream.operator_not(self._matcher_1)
     def _matcher_22(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_and([
+            self._matcher_14,
+            self._matcher_21
+        ])
     def _matcher_23(self, stream):
-        return self._rules['name'](stream)
+        return stream.match_regex(self._regex_20, self._matcher_22)
     def _matcher_24(self, stream):
+        return lookup_action(stream.scope, 'xs')
+    def _matcher_25(self, stream):
         return stream.operator_and([
-            self._matcher_22,
-            self._matcher_23
+            self._matcher_19,
+            self._matcher_23,
+            self._matcher_24
         ])
-    def _matcher_25(self, stream):
-        return stream.bind('x', self._matcher_24(stream))
     def _matcher_26(self, stream):
-        return self._rules['space'](stream)
-    def _matcher_27(self, stream):
-        return self._rules['field'](stream)
+        return stream.with_scope(self._matcher_25)
+    _regex_27 = Regex('actor(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])', 'none')
     def _matcher_28(self, stream):
-        return stream.operator_and([
-            self._matcher_26,
-            self._matcher_27
-        ])
+        return self._rule_keyActor(stream) if stream.memo is None else stream.match_rule(self._rule_keyActor, 'keyActor')
     def _matcher_29(self, stream):
-        return stream.operator_star(self._matcher_28)
-    def _matcher_30(self, stream):
-        return stream.bind('ys', self._matcher_29(stream))
+        return stream.match_regex(self._regex_27, self._matcher_28)
+    _regex_30 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+(?!(?>def(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|actor(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|where(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|universe(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|examples(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])))([ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz](?:[0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])*+)', 'text')
     def _matcher_31(self, stream):
-        return self._rules['space'](stream)
+        return self._rule_name(stream) if stream.memo is None else stream.match_rule(self._rule_name, 'name')
     def _matcher_32(self, stream):
-        return stream.match(lambda item: item == '=', "'='")
+        return stream.operator_and([
+            self._matcher_14,
+            self._matcher_31
+        ])
     def _matcher_33(self, stream):
-        return self._rules['space'](stream)
+        return stream.match_regex(self._regex_30, self._matcher_32)
     def _matcher_34(self, stream):
-        return self._rules['choice'](stream)
+        return stream.bind('x', self._matcher_33(stream))
     def _matcher_35(self, stream):
+        return self._rule_field(stream) if stream.memo is None else stream.match_rule(self._rule_field, 'field')
+    def _matcher_36(self, stream):
         return stream.operator_and([
-            self._matcher_33,
-            self._matcher_34
+            self._matcher_15,
+            self._matcher_35
         ])
-    def _matcher_36(self, stream):
-        return stream.bind('z', self._matcher_35(stream))
     def _matcher_37(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_star(self._matcher_36)
     def _matcher_38(self, stream):
-        return self._rules['whereItems'](stream)
-    def _matcher_39(self, stream):
-        return stream.operator_and([
-            self._matcher_37,
-            self._matcher_38
-        ])
+        return stream.bind('ys', self._matcher_37(stream))
+    _regex_39 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+=', 'none')
     def _matcher_40(self, stream):
-        return stream.bind('zs', self._matcher_39(stream))
+        return stream.match(lambda item: item == '=', "'='")
     def _matcher_41(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_and([
+            self._matcher_14,
+            self._matcher_40
+        ])
     def _matcher_42(self, stream):
-        return self._rules['examplesp'](stream)
+        return stream.match_regex(self._regex_39, self._matcher_41)
     def _matcher_43(self, stream):
+        return self._rule_choice(stream) if stream.memo is None else stream.match_rule(self._rule_choice, 'choice')
+    def _matcher_44(self, stream):
         return stream.operator_and([
-            self._matcher_41,
-            self._matcher_42
+            self._matcher_15,
+            self._matcher_43
         ])
-    def _matcher_44(self, stream):
-        return stream.bind('es', self._matcher_43(stream))
     def _matcher_45(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Actor'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('ys')),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'Rule'),
-                self.lookup('splice')(0, '_main'),
-                self.lookup('splice')(0, self.lookup('z'))
-            ])),
-            self.lookup('splice')(1, self.lookup('zs')),
-            self.lookup('splice')(1, self.lookup('es'))
-        ]))
+        return stream.bind('z', self._matcher_44(stream))
     def _matcher_46(self, stream):
+        return self._rule_whereItems(stream) if stream.memo is None else stream.match_rule(self._rule_whereItems, 'whereItems')
+    def _matcher_47(self, stream):
         return stream.operator_and([
-            self._matcher_21,
-            self._matcher_25,
-            self._matcher_30,
-            self._matcher_31,
-            self._matcher_32,
-            self._matcher_36,
-            self._matcher_40,
-            self._matcher_44,
-            self._matcher_45
+            self._matcher_15,
+            self._matcher_46
         ])
-    def _matcher_47(self, stream):
-        return stream.with_scope(self._matcher_46)
     def _matcher_48(self, stream):
-        return self._rules['keyDef'](stream)
+        return stream.bind('zs', self._matcher_47(stream))
     def _matcher_49(self, stream):
-        return self._rules['space'](stream)
+        return self._rule_examplesp(stream) if stream.memo is None else stream.match_rule(self._rule_examplesp, 'examplesp')
     def _matcher_50(self, stream):
-        return self._rules['name'](stream)
-    def _matcher_51(self, stream):
         return stream.operator_and([
-            self._matcher_49,
-            self._matcher_50
+            self._matcher_15,
+            self._matcher_49
         ])
+    def _matcher_51(self, stream):
+        return stream.bind('es', self._matcher_50(stream))
     def _matcher_52(self, stream):
-        return stream.bind('x', self._matcher_51(stream))
+        return SemanticAction(stream.scope, lambda self: [
+            'Actor',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('ys')),
+            [
+                'Rule',
+                '_main',
+                materialize(self.lookup('z'))
+            ],
+            *materialize(self.lookup('zs')),
+            *materialize(self.lookup('es'))
+        ])
     def _matcher_53(self, stream):
-        return self._rules['space'](stream)
-    def _matcher_54(self, stream):
-        return self._rules['name'](stream)
-    def _matcher_55(self, stream):
         return stream.operator_and([
-            self._matcher_53,
-            self._matcher_54
+            self._matcher_29,
+            self._matcher_34,
+            self._matcher_38,
+            self._matcher_42,
+            self._matcher_45,
+            self._matcher_48,
+            self._matcher_51,
+            self._matcher_52
         ])
+    def _matcher_54(self, stream):
+        return stream.with_scope(self._matcher_53)
+    _regex_55 = Regex('def(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])', 'none')
     def _matcher_56(self, stream):
-        return stream.operator_star(self._matcher_55)
+        return self._rule_keyDef(stream) if stream.memo is None else stream.match_rule(self._rule_keyDef, 'keyDef')
     def _matcher_57(self, stream):
-        return stream.bind('ys', self._matcher_56(stream))
+        return stream.match_regex(self._regex_55, self._matcher_56)
     def _matcher_58(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_star(self._matcher_33)
     def _matcher_59(self, stream):
-        return stream.match(lambda item: item == '=', "'='")
-    def _matcher_60(self, stream):
-        return stream.match(lambda item: item == '\n', "'\\n'")
+        return stream.bind('ys', self._matcher_58(stream))
+    _regex_60 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+=\\\n', 'none')
     def _matcher_61(self, stream):
+        return stream.match_literal('=\n')
+    def _matcher_62(self, stream):
         return stream.operator_and([
-            self._matcher_59,
-            self._matcher_60
+            self._matcher_14,
+            self._matcher_61
         ])
-    def _matcher_62(self, stream):
-        return self._rules['indented'](stream)
     def _matcher_63(self, stream):
-        return stream.operator_star(self._matcher_62)
-    def _matcher_64(self, stream):
-        return stream.bind('zs', self._matcher_63(stream))
+        return stream.match_regex(self._regex_60, self._matcher_62)
+    _regex_64 = Regex('\\ (?:(?!\\\n).)*+\\\n', 'text')
     def _matcher_65(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Native'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('join')([
+        return self._rule_indented(stream) if stream.memo is None else stream.match_rule(self._rule_indented, 'indented')
+    def _matcher_66(self, stream):
+        return stream.match_regex(self._regex_64, self._matcher_65)
+    def _matcher_67(self, stream):
+        return stream.operator_star(self._matcher_66)
+    def _matcher_68(self, stream):
+        return stream.bind('zs', self._matcher_67(stream))
+    def _matcher_69(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Native',
+            materialize(self.lookup('x')),
+            materialize(self.runtime.join([
                 'def ',
                 self.lookup('x'),
                 '(',
-                self.lookup('join')(
+                self.runtime.extra.get('join', self.runtime.join)(
                     self.lookup('ys'),
                     ', '
                 ),
                 '):\n',
                 self.lookup('zs')
             ]))
-        ]))
-    def _matcher_66(self, stream):
-        return stream.operator_and([
-            self._matcher_48,
-            self._matcher_52,
-            self._matcher_57,
-            self._matcher_58,
-            self._matcher_61,
-            self._matcher_64,
-            self._matcher_65
         ])
-    def _matcher_67(self, stream):
-        return stream.with_scope(self._matcher_66)
-    def _matcher_68(self, stream):
-        return self._rules['keyUniverse'](stream)
-    def _matcher_69(self, stream):
-        return self._rules['space'](stream)
     def _matcher_70(self, stream):
-        return self._rules['name'](stream)
-    def _matcher_71(self, stream):
         return stream.operator_and([
-            self._matcher_69,
-            self._matcher_70
+            self._matcher_57,
+            self._matcher_34,
+            self._matcher_59,
+            self._matcher_63,
+            self._matcher_68,
+            self._matcher_69
         ])
-    def _matcher_72(self, stream):
-        return stream.bind('x', self._matcher_71(stream))
+    def _matcher_71(self, stream):
+        return stream.with_scope(self._matcher_70)
+    _regex_72 = Regex('universe(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])', 'none')
     def _matcher_73(self, stream):
-        return self._rules['space'](stream)
+        return self._rule_keyUniverse(stream) if stream.memo is None else stream.match_rule(self._rule_keyUniverse, 'keyUniverse')
     def _matcher_74(self, stream):
-        return stream.match(lambda item: item == '=', "'='")
+        return stream.match_regex(self._regex_72, self._matcher_73)
     def _matcher_75(self, stream):
-        return self._rules['space'](stream)
+        return self._rule_globalHostExpr(stream) if stream.memo is None else stream.match_rule(self._rule_globalHostExpr, 'globalHostExpr')
     def _matcher_76(self, stream):
-        return self._rules['globalHostExpr'](stream)
-    def _matcher_77(self, stream):
         return stream.operator_and([
-            self._matcher_75,
-            self._matcher_76
+            self._matcher_15,
+            self._matcher_75
         ])
+    def _matcher_77(self, stream):
+        return stream.operator_star(self._matcher_76)
     def _matcher_78(self, stream):
-        return stream.operator_star(self._matcher_77)
+        return stream.bind('xs', self._matcher_77(stream))
     def _matcher_79(self, stream):
-        return stream.bind('xs', self._matcher_78(stream))
+        return stream.bind('ys', self._matcher_50(stream))
     def _matcher_80(self, stream):
-        return self._rules['space'](stream)
-    def _matcher_81(self, stream):
-        return self._rules['examplesp'](stream)
-    def _matcher_82(self, stream):
-        return stream.operator_and([
-            self._matcher_80,
-            self._matcher_81
+        return SemanticAction(stream.scope, lambda self: [
+            'Universe',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('xs')),
+            materialize(self.lookup('ys'))
         ])
-    def _matcher_83(self, stream):
-        return stream.bind('ys', self._matcher_82(stream))
-    def _matcher_84(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Universe'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('xs')),
-            self.lookup('splice')(0, self.lookup('ys'))
-        ]))
-    def _matcher_85(self, stream):
+    def _matcher_81(self, stream):
         return stream.operator_and([
-            self._matcher_68,
-            self._matcher_72,
-            self._matcher_73,
             self._matcher_74,
+            self._matcher_34,
+            self._matcher_42,
+            self._matcher_78,
             self._matcher_79,
-            self._matcher_83,
-            self._matcher_84
+            self._matcher_80
         ])
-    def _matcher_86(self, stream):
-        return stream.with_scope(self._matcher_85)
-    def _matcher_87(self, stream):
+    def _matcher_82(self, stream):
+        return stream.with_scope(self._matcher_81)
+    def _matcher_83(self, stream):
         return stream.operator_or([
-            self._matcher_47,
-            self._matcher_67,
-            self._matcher_86
+            self._matcher_54,
+            self._matcher_71,
+            self._matcher_82
         ])
+    _regex_84 = Regex('examples(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])', 'none')
+    def _matcher_85(self, stream):
+        return self._rule_keyExamples(stream) if stream.memo is None else stream.match_rule(self._rule_keyExamples, 'keyExamples')
+    def _matcher_86(self, stream):
+        return stream.match_regex(self._regex_84, self._matcher_85)
+    def _matcher_87(self, stream):
+        return self._rule_example(stream) if stream.memo is None else stream.match_rule(self._rule_example, 'example')
     def _matcher_88(self, stream):
-        return self._rules['keyExamples'](stream)
+        return stream.operator_and([
+            self._matcher_15,
+            self._matcher_87
+        ])
     def _matcher_89(self, stream):
-        return self._rules['space'](stream)
+        return stream.bind('x', self._matcher_88(stream))
     def _matcher_90(self, stream):
-        return self._rules['example'](stream)
+        return stream.operator_star(self._matcher_88)
     def _matcher_91(self, stream):
+        return stream.bind('xs', self._matcher_90(stream))
+    def _matcher_92(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.lookup('x')),
+            *materialize(self.lookup('xs'))
+        ])
+    def _matcher_93(self, stream):
         return stream.operator_and([
+            self._matcher_86,
             self._matcher_89,
-            self._matcher_90
+            self._matcher_91,
+            self._matcher_92
         ])
-    def _matcher_92(self, stream):
-        return stream.bind('x', self._matcher_91(stream))
-    def _matcher_93(self, stream):
-        return self._rules['space'](stream)
     def _matcher_94(self, stream):
-        return self._rules['example'](stream)
+        return stream.with_scope(self._matcher_93)
     def _matcher_95(self, stream):
-        return stream.operator_and([
-            self._matcher_93,
-            self._matcher_94
+        return SemanticAction(EMPTY_SCOPE, lambda self: [
+        
         ])
     def _matcher_96(self, stream):
-        return stream.operator_star(self._matcher_95)
+        return stream.operator_or([
+            self._matcher_94,
+            self._matcher_95
+        ])
     def _matcher_97(self, stream):
-        return stream.bind('xs', self._matcher_96(stream))
-    def _matcher_98(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(1, self.lookup('xs'))
-        ]))
+        return stream.bind('x', self._matcher_75(stream))
+    _regex_98 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+\\->', 'none')
     def _matcher_99(self, stream):
+        return stream.match_literal('->')
+    def _matcher_100(self, stream):
         return stream.operator_and([
-            self._matcher_88,
-            self._matcher_92,
-            self._matcher_97,
-            self._matcher_98
+            self._matcher_14,
+            self._matcher_99
         ])
-    def _matcher_100(self, stream):
-        return stream.with_scope(self._matcher_99)
     def _matcher_101(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-        
-        ]))
+        return stream.match_regex(self._regex_98, self._matcher_100)
     def _matcher_102(self, stream):
-        return stream.with_scope(self._matcher_101)
+        return stream.bind('y', self._matcher_76(stream))
     def _matcher_103(self, stream):
-        return stream.operator_or([
-            self._matcher_100,
-            self._matcher_102
+        return SemanticAction(stream.scope, lambda self: [
+            'Example',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
         ])
     def _matcher_104(self, stream):
-        return self._rules['globalHostExpr'](stream)
+        return stream.operator_and([
+            self._matcher_97,
+            self._matcher_101,
+            self._matcher_102,
+            self._matcher_103
+        ])
     def _matcher_105(self, stream):
-        return stream.bind('x', self._matcher_104(stream))
+        return stream.with_scope(self._matcher_104)
     def _matcher_106(self, stream):
-        return self._rules['space'](stream)
+        return self._rule_hostExpr(stream) if stream.memo is None else stream.match_rule(self._rule_hostExpr, 'hostExpr')
     def _matcher_107(self, stream):
-        return stream.match(lambda item: item == '-', "'-'")
+        return stream.bind('x', self._matcher_106(stream))
     def _matcher_108(self, stream):
-        return stream.match(lambda item: item == '>', "'>'")
+        return SemanticAction(stream.scope, lambda self: [
+            'GlobalExpr',
+            materialize(self.lookup('x'))
+        ])
     def _matcher_109(self, stream):
         return stream.operator_and([
             self._matcher_107,
             self._matcher_108
         ])
     def _matcher_110(self, stream):
-        return self._rules['space'](stream)
-    def _matcher_111(self, stream):
-        return self._rules['globalHostExpr'](stream)
+        return stream.with_scope(self._matcher_109)
+    _regex_111 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+where(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])', 'none')
     def _matcher_112(self, stream):
+        return self._rule_keyWhere(stream) if stream.memo is None else stream.match_rule(self._rule_keyWhere, 'keyWhere')
+    def _matcher_113(self, stream):
         return stream.operator_and([
-            self._matcher_110,
-            self._matcher_111
+            self._matcher_14,
+            self._matcher_112
         ])
-    def _matcher_113(self, stream):
-        return stream.bind('y', self._matcher_112(stream))
     def _matcher_114(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Example'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('y'))
-        ]))
+        return stream.match_regex(self._regex_111, self._matcher_113)
     def _matcher_115(self, stream):
+        return self._rule_rule(stream) if stream.memo is None else stream.match_rule(self._rule_rule, 'rule')
+    def _matcher_116(self, stream):
         return stream.operator_and([
-            self._matcher_105,
-            self._matcher_106,
-            self._matcher_109,
-            self._matcher_113,
-            self._matcher_114
+            self._matcher_15,
+            self._matcher_115
         ])
-    def _matcher_116(self, stream):
-        return stream.with_scope(self._matcher_115)
     def _matcher_117(self, stream):
-        return self._rules['hostExpr'](stream)
+        return stream.operator_star(self._matcher_116)
     def _matcher_118(self, stream):
-        return stream.bind('x', self._matcher_117(stream))
-    def _matcher_119(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'GlobalExpr'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
-    def _matcher_120(self, stream):
         return stream.operator_and([
+            self._matcher_114,
+            self._matcher_117
+        ])
+    def _matcher_119(self, stream):
+        return stream.operator_or([
             self._matcher_118,
-            self._matcher_119
+            self._matcher_95
         ])
-    def _matcher_121(self, stream):
-        return stream.with_scope(self._matcher_120)
+    def _matcher_120(self, stream):
+        return stream.match(lambda item: item == '#', "'#'")
+    _regex_121 = Regex('(?!(?>def(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|actor(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|where(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|universe(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|examples(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])))([ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz](?:[0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])*+)', 'text')
     def _matcher_122(self, stream):
-        return self._rules['space'](stream)
+        return stream.match_regex(self._regex_121, self._matcher_31)
     def _matcher_123(self, stream):
-        return self._rules['keyWhere'](stream)
+        return stream.bind('x', self._matcher_122(stream))
     def _matcher_124(self, stream):
-        return self._rules['space'](stream)
+        return SemanticAction(stream.scope, lambda self: [
+            'Field',
+            materialize(self.lookup('x'))
+        ])
     def _matcher_125(self, stream):
-        return self._rules['rule'](stream)
-    def _matcher_126(self, stream):
         return stream.operator_and([
-            self._matcher_124,
-            self._matcher_125
+            self._matcher_120,
+            self._matcher_123,
+            self._matcher_124
         ])
+    def _matcher_126(self, stream):
+        return stream.with_scope(self._matcher_125)
     def _matcher_127(self, stream):
-        return stream.operator_star(self._matcher_126)
+        return stream.bind('y', self._matcher_44(stream))
     def _matcher_128(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Rule',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_129(self, stream):
         return stream.operator_and([
-            self._matcher_122,
             self._matcher_123,
-            self._matcher_127
+            self._matcher_42,
+            self._matcher_127,
+            self._matcher_128
         ])
-    def _matcher_129(self, stream):
-        return stream.with_scope(self._matcher_128)
     def _matcher_130(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-        
-        ]))
-    def _matcher_131(self, stream):
-        return stream.with_scope(self._matcher_130)
+        return stream.with_scope(self._matcher_129)
+    _regex_131 = Regex('(?>\\||)', 'none')
     def _matcher_132(self, stream):
-        return stream.operator_or([
-            self._matcher_129,
-            self._matcher_131
-        ])
+        return stream.match(lambda item: item == '|', "'|'")
     def _matcher_133(self, stream):
-        return stream.match(lambda item: item == '#', "'#'")
-    def _matcher_134(self, stream):
-        return self._rules['name'](stream)
+        return stream.operator_and([
+        
+        ])
+    def _matcher_134(self, stream):
+        return stream.operator_or([
+            self._matcher_132,
+            self._matcher_133
+        ])
     def _matcher_135(self, stream):
-        return stream.bind('x', self._matcher_134(stream))
+        return stream.match_regex(self._regex_131, self._matcher_134)
     def _matcher_136(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Field'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
+        return self._rule_sequence(stream) if stream.memo is None else stream.match_rule(self._rule_sequence, 'sequence')
     def _matcher_137(self, stream):
         return stream.operator_and([
-            self._matcher_133,
-            self._matcher_135,
+            self._matcher_15,
             self._matcher_136
         ])
     def _matcher_138(self, stream):
-        return stream.with_scope(self._matcher_137)
-    def _matcher_139(self, stream):
-        return self._rules['name'](stream)
+        return stream.bind('x', self._matcher_137(stream))
+    _regex_139 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+\\|(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+', 'none')
     def _matcher_140(self, stream):
-        return stream.bind('x', self._matcher_139(stream))
+        return stream.operator_and([
+            self._matcher_14,
+            self._matcher_132,
+            self._matcher_14
+        ])
     def _matcher_141(self, stream):
-        return self._rules['space'](stream)
+        return stream.match_regex(self._regex_139, self._matcher_140)
     def _matcher_142(self, stream):
-        return stream.match(lambda item: item == '=', "'='")
+        return stream.operator_and([
+            self._matcher_141,
+            self._matcher_136
+        ])
     def _matcher_143(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_star(self._matcher_142)
     def _matcher_144(self, stream):
-        return self._rules['choice'](stream)
+        return stream.bind('xs', self._matcher_143(stream))
     def _matcher_145(self, stream):
-        return stream.operator_and([
-            self._matcher_143,
-            self._matcher_144
+        return SemanticAction(stream.scope, lambda self: [
+            'Or',
+            materialize(self.lookup('x')),
+            *materialize(self.lookup('xs'))
         ])
     def _matcher_146(self, stream):
-        return stream.bind('y', self._matcher_145(stream))
+        return stream.operator_and([
+            self._matcher_135,
+            self._matcher_138,
+            self._matcher_144,
+            self._matcher_145
+        ])
     def _matcher_147(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Rule'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('y'))
-        ]))
+        return stream.with_scope(self._matcher_146)
     def _matcher_148(self, stream):
+        return self._rule_expr(stream) if stream.memo is None else stream.match_rule(self._rule_expr, 'expr')
+    def _matcher_149(self, stream):
         return stream.operator_and([
-            self._matcher_140,
-            self._matcher_141,
-            self._matcher_142,
-            self._matcher_146,
-            self._matcher_147
+            self._matcher_15,
+            self._matcher_148
         ])
-    def _matcher_149(self, stream):
-        return stream.with_scope(self._matcher_148)
     def _matcher_150(self, stream):
-        return stream.match(lambda item: item == '|', "'|'")
+        return stream.operator_star(self._matcher_149)
     def _matcher_151(self, stream):
-        return stream.operator_and([
-        
-        ])
+        return stream.bind('xs', self._matcher_150(stream))
     def _matcher_152(self, stream):
-        return stream.operator_or([
-            self._matcher_150,
-            self._matcher_151
-        ])
+        return self._rule_maybeAction(stream) if stream.memo is None else stream.match_rule(self._rule_maybeAction, 'maybeAction')
     def _matcher_153(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_and([
+            self._matcher_15,
+            self._matcher_152
+        ])
     def _matcher_154(self, stream):
-        return self._rules['sequence'](stream)
+        return stream.bind('ys', self._matcher_153(stream))
     def _matcher_155(self, stream):
-        return stream.operator_and([
-            self._matcher_153,
-            self._matcher_154
+        return SemanticAction(stream.scope, lambda self: [
+            'Scope',
+            [
+                'And',
+                *materialize(self.lookup('xs')),
+                *materialize(self.lookup('ys'))
+            ]
         ])
     def _matcher_156(self, stream):
-        return stream.bind('x', self._matcher_155(stream))
+        return stream.operator_and([
+            self._matcher_151,
+            self._matcher_154,
+            self._matcher_155
+        ])
     def _matcher_157(self, stream):
-        return self._rules['space'](stream)
+        return stream.with_scope(self._matcher_156)
     def _matcher_158(self, stream):
-        return stream.match(lambda item: item == '|', "'|'")
+        return self._rule_expr1(stream) if stream.memo is None else stream.match_rule(self._rule_expr1, 'expr1')
     def _matcher_159(self, stream):
-        return stream.operator_and([
-            self._matcher_158
-        ])
+        return stream.bind('x', self._matcher_158(stream))
     def _matcher_160(self, stream):
-        return stream.operator_and([
-            self._matcher_157,
-            self._matcher_159
-        ])
+        return stream.match(lambda item: item == ':', "':'")
     def _matcher_161(self, stream):
-        return self._rules['space'](stream)
+        return stream.bind('y', self._matcher_122(stream))
     def _matcher_162(self, stream):
-        return self._rules['sequence'](stream)
+        return SemanticAction(stream.scope, lambda self: [
+            'Bind',
+            materialize(self.lookup('y')),
+            materialize(self.lookup('x'))
+        ])
     def _matcher_163(self, stream):
         return stream.operator_and([
+            self._matcher_159,
+            self._matcher_160,
             self._matcher_161,
             self._matcher_162
         ])
     def _matcher_164(self, stream):
-        return stream.operator_and([
-            self._matcher_160,
-            self._matcher_163
-        ])
+        return stream.with_scope(self._matcher_163)
     def _matcher_165(self, stream):
-        return stream.with_scope(self._matcher_164)
-    def _matcher_166(self, stream):
-        return stream.operator_or([
-            self._matcher_165
-        ])
+        return stream.match(lambda item: item == '[', "'['")
+    _regex_166 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+\\]', 'none')
     def _matcher_167(self, stream):
-        return stream.operator_star(self._matcher_166)
+        return stream.match(lambda item: item == ']', "']'")
     def _matcher_168(self, stream):
-        return stream.bind('xs', self._matcher_167(stream))
+        return stream.operator_and([
+            self._matcher_14,
+            self._matcher_167
+        ])
     def _matcher_169(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Or'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(1, self.lookup('xs'))
-        ]))
+        return stream.match_regex(self._regex_166, self._matcher_168)
     def _matcher_170(self, stream):
-        return stream.operator_and([
-            self._matcher_152,
-            self._matcher_156,
-            self._matcher_168,
-            self._matcher_169
+        return SemanticAction(stream.scope, lambda self: [
+            'MatchList',
+            [
+                'And',
+                *materialize(self.lookup('xs'))
+            ]
         ])
     def _matcher_171(self, stream):
-        return stream.with_scope(self._matcher_170)
+        return stream.operator_and([
+            self._matcher_165,
+            self._matcher_151,
+            self._matcher_169,
+            self._matcher_170
+        ])
     def _matcher_172(self, stream):
-        return self._rules['space'](stream)
+        return stream.with_scope(self._matcher_171)
     def _matcher_173(self, stream):
-        return self._rules['expr'](stream)
-    def _matcher_174(self, stream):
-        return stream.operator_and([
+        return stream.operator_or([
+            self._matcher_164,
             self._matcher_172,
-            self._matcher_173
+            self._matcher_158
         ])
+    _dispatch_174 = Dispatch(False, {'!': [0, 1, 2, 4], '%': [0, 1, 3, 4]}, [0, 1, 4])
     def _matcher_175(self, stream):
-        return stream.operator_star(self._matcher_174)
+        return self._rule_expr2(stream) if stream.memo is None else stream.match_rule(self._rule_expr2, 'expr2')
     def _matcher_176(self, stream):
-        return stream.bind('xs', self._matcher_175(stream))
+        return stream.bind('x', self._matcher_175(stream))
     def _matcher_177(self, stream):
-        return self._rules['space'](stream)
+        return stream.match(lambda item: item == '*', "'*'")
     def _matcher_178(self, stream):
-        return self._rules['maybeAction'](stream)
+        return SemanticAction(stream.scope, lambda self: [
+            'Star',
+            materialize(self.lookup('x'))
+        ])
     def _matcher_179(self, stream):
         return stream.operator_and([
+            self._matcher_176,
             self._matcher_177,
             self._matcher_178
         ])
     def _matcher_180(self, stream):
-        return stream.bind('ys', self._matcher_179(stream))
+        return stream.with_scope(self._matcher_179)
     def _matcher_181(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Scope'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'And'),
-                self.lookup('splice')(1, self.lookup('xs')),
-                self.lookup('splice')(1, self.lookup('ys'))
-            ]))
-        ]))
+        return stream.match(lambda item: item == '?', "'?'")
     def _matcher_182(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Or',
+            materialize(self.lookup('x')),
+            [
+                'And'
+            ]
+        ])
+    def _matcher_183(self, stream):
         return stream.operator_and([
             self._matcher_176,
-            self._matcher_180,
-            self._matcher_181
+            self._matcher_181,
+            self._matcher_182
         ])
-    def _matcher_183(self, stream):
-        return stream.with_scope(self._matcher_182)
     def _matcher_184(self, stream):
-        return self._rules['expr1'](stream)
+        return stream.with_scope(self._matcher_183)
     def _matcher_185(self, stream):
-        return stream.bind('x', self._matcher_184(stream))
+        return stream.match(lambda item: item == '!', "'!'")
     def _matcher_186(self, stream):
-        return stream.match(lambda item: item == ':', "':'")
+        return SemanticAction(stream.scope, lambda self: [
+            'Not',
+            materialize(self.lookup('x'))
+        ])
     def _matcher_187(self, stream):
-        return self._rules['name'](stream)
+        return stream.operator_and([
+            self._matcher_185,
+            self._matcher_176,
+            self._matcher_186
+        ])
     def _matcher_188(self, stream):
-        return stream.bind('y', self._matcher_187(stream))
+        return stream.with_scope(self._matcher_187)
     def _matcher_189(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Bind'),
-            self.lookup('splice')(0, self.lookup('y')),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
+        return stream.match(lambda item: item == '%', "'%'")
     def _matcher_190(self, stream):
-        return stream.operator_and([
-            self._matcher_185,
-            self._matcher_186,
-            self._matcher_188,
-            self._matcher_189
+        return SemanticAction(EMPTY_SCOPE, lambda self: [
+            'MatchCallRule'
         ])
     def _matcher_191(self, stream):
-        return stream.with_scope(self._matcher_190)
+        return stream.operator_and([
+            self._matcher_189,
+            self._matcher_190
+        ])
     def _matcher_192(self, stream):
-        return stream.match(lambda item: item == '[', "'['")
+        return stream.operator_dispatch(self._dispatch_174, [
+            self._matcher_180,
+            self._matcher_184,
+            self._matcher_188,
+            self._matcher_191,
+            self._matcher_175
+        ])
     def _matcher_193(self, stream):
-        return self._rules['space'](stream)
+        return stream.match(lambda item: item == '^', "'^'")
     def _matcher_194(self, stream):
-        return self._rules['expr'](stream)
+        return self._rule_expr3(stream) if stream.memo is None else stream.match_rule(self._rule_expr3, 'expr3')
     def _matcher_195(self, stream):
+        return stream.bind('x', self._matcher_194(stream))
+    def _matcher_196(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'And',
+            [
+                'MatchRule',
+                'space'
+            ],
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_197(self, stream):
         return stream.operator_and([
             self._matcher_193,
-            self._matcher_194
+            self._matcher_195,
+            self._matcher_196
         ])
-    def _matcher_196(self, stream):
-        return stream.operator_star(self._matcher_195)
-    def _matcher_197(self, stream):
-        return stream.bind('xs', self._matcher_196(stream))
     def _matcher_198(self, stream):
-        return self._rules['space'](stream)
+        return stream.with_scope(self._matcher_197)
     def _matcher_199(self, stream):
-        return stream.match(lambda item: item == ']', "']'")
-    def _matcher_200(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchList'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'And'),
-                self.lookup('splice')(1, self.lookup('xs'))
-            ]))
-        ]))
-    def _matcher_201(self, stream):
-        return stream.operator_and([
-            self._matcher_192,
-            self._matcher_197,
+        return stream.operator_or([
             self._matcher_198,
-            self._matcher_199,
-            self._matcher_200
+            self._matcher_194
         ])
+    _dispatch_200 = Dispatch(False, {"'": [0, 1, 2, 3, 7, 8], '.': [0, 1, 2, 4, 7, 8], '(': [0, 1, 2, 5, 7, 8], '<': [0, 1, 2, 6, 7, 8], '#': [0, 1, 2, 7, 8, 9]}, [0, 1, 2, 7, 8])
+    _regex_201 = Regex('(?!(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+=)', 'none')
     def _matcher_202(self, stream):
-        return stream.with_scope(self._matcher_201)
+        return stream.operator_not(self._matcher_41)
     def _matcher_203(self, stream):
-        return self._rules['expr1'](stream)
+        return stream.match_regex(self._regex_201, self._matcher_202)
     def _matcher_204(self, stream):
-        return stream.with_scope(self._matcher_203)
+        return SemanticAction(stream.scope, lambda self: [
+            'MatchRule',
+            materialize(self.lookup('x'))
+        ])
     def _matcher_205(self, stream):
-        return stream.operator_or([
-            self._matcher_191,
-            self._matcher_202,
+        return stream.operator_and([
+            self._matcher_123,
+            self._matcher_203,
             self._matcher_204
         ])
     def _matcher_206(self, stream):
-        return self._rules['expr2'](stream)
+        return stream.with_scope(self._matcher_205)
     def _matcher_207(self, stream):
-        return stream.bind('x', self._matcher_206(stream))
+        return self._rule_char(stream) if stream.memo is None else stream.match_rule(self._rule_char, 'char')
     def _matcher_208(self, stream):
-        return stream.match(lambda item: item == '*', "'*'")
+        return stream.bind('x', self._matcher_207(stream))
     def _matcher_209(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Star'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
+        return stream.match(lambda item: item == '-', "'-'")
     def _matcher_210(self, stream):
+        return stream.bind('y', self._matcher_207(stream))
+    def _matcher_211(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'MatchObject',
+            [
+                'Range',
+                materialize(self.lookup('x')),
+                materialize(self.lookup('y'))
+            ]
+        ])
+    def _matcher_212(self, stream):
         return stream.operator_and([
-            self._matcher_207,
             self._matcher_208,
-            self._matcher_209
+            self._matcher_209,
+            self._matcher_210,
+            self._matcher_211
         ])
-    def _matcher_211(self, stream):
-        return stream.with_scope(self._matcher_210)
-    def _matcher_212(self, stream):
-        return self._rules['expr2'](stream)
     def _matcher_213(self, stream):
-        return stream.bind('x', self._matcher_212(stream))
+        return stream.with_scope(self._matcher_212)
     def _matcher_214(self, stream):
-        return stream.match(lambda item: item == '?', "'?'")
+        return self._rule_number(stream) if stream.memo is None else stream.match_rule(self._rule_number, 'number')
     def _matcher_215(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Or'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'And')
-            ]))
-        ]))
+        return stream.bind('x', self._matcher_214(stream))
     def _matcher_216(self, stream):
+        return stream.bind('y', self._matcher_214(stream))
+    def _matcher_217(self, stream):
         return stream.operator_and([
-            self._matcher_213,
-            self._matcher_214,
-            self._matcher_215
+            self._matcher_215,
+            self._matcher_209,
+            self._matcher_216,
+            self._matcher_211
         ])
-    def _matcher_217(self, stream):
-        return stream.with_scope(self._matcher_216)
     def _matcher_218(self, stream):
-        return stream.match(lambda item: item == '!', "'!'")
+        return stream.with_scope(self._matcher_217)
     def _matcher_219(self, stream):
-        return self._rules['expr2'](stream)
+        return stream.match(lambda item: item == "'", '"\'"')
     def _matcher_220(self, stream):
-        return stream.bind('x', self._matcher_219(stream))
+        return stream.operator_not(self._matcher_219)
     def _matcher_221(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Not'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
+        return self._rule_matchChar(stream) if stream.memo is None else stream.match_rule(self._rule_matchChar, 'matchChar')
     def _matcher_222(self, stream):
         return stream.operator_and([
-            self._matcher_218,
             self._matcher_220,
             self._matcher_221
         ])
     def _matcher_223(self, stream):
-        return stream.with_scope(self._matcher_222)
+        return stream.operator_star(self._matcher_222)
     def _matcher_224(self, stream):
-        return stream.match(lambda item: item == '%', "'%'")
+        return stream.bind('xs', self._matcher_223(stream))
     def _matcher_225(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchCallRule')
-        ]))
+        return SemanticAction(stream.scope, lambda self: [
+            'And',
+            *materialize(self.lookup('xs'))
+        ])
     def _matcher_226(self, stream):
         return stream.operator_and([
+            self._matcher_219,
             self._matcher_224,
+            self._matcher_219,
             self._matcher_225
         ])
     def _matcher_227(self, stream):
         return stream.with_scope(self._matcher_226)
     def _matcher_228(self, stream):
-        return self._rules['expr2'](stream)
+        return stream.match(lambda item: item == '.', "'.'")
     def _matcher_229(self, stream):
-        return stream.with_scope(self._matcher_228)
+        return SemanticAction(EMPTY_SCOPE, lambda self: [
+            'MatchObject',
+            [
+                'Any'
+            ]
+        ])
     def _matcher_230(self, stream):
-        return stream.operator_or([
-            self._matcher_211,
-            self._matcher_217,
-            self._matcher_223,
-            self._matcher_227,
+        return stream.operator_and([
+            self._matcher_228,
             self._matcher_229
         ])
     def _matcher_231(self, stream):
-        return stream.match(lambda item: item == '^', "'^'")
+        return stream.match(lambda item: item == '(', "'('")
     def _matcher_232(self, stream):
-        return self._rules['expr3'](stream)
-    def _matcher_233(self, stream):
-        return stream.bind('x', self._matcher_232(stream))
+        return stream.bind('x', self._matcher_44(stream))
+    _regex_233 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+\\)', 'none')
     def _matcher_234(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'And'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'MatchRule'),
-                self.lookup('splice')(0, 'space')
-            ])),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
+        return stream.match(lambda item: item == ')', "')'")
     def _matcher_235(self, stream):
         return stream.operator_and([
-            self._matcher_231,
-            self._matcher_233,
+            self._matcher_14,
             self._matcher_234
         ])
     def _matcher_236(self, stream):
-        return stream.with_scope(self._matcher_235)
+        return stream.match_regex(self._regex_233, self._matcher_235)
     def _matcher_237(self, stream):
-        return self._rules['expr3'](stream)
+        return lookup_action(stream.scope, 'x')
     def _matcher_238(self, stream):
-        return stream.with_scope(self._matcher_237)
-    def _matcher_239(self, stream):
-        return stream.operator_or([
+        return stream.operator_and([
+            self._matcher_231,
+            self._matcher_232,
             self._matcher_236,
-            self._matcher_238
+            self._matcher_237
         ])
+    def _matcher_239(self, stream):
+        return stream.with_scope(self._matcher_238)
     def _matcher_240(self, stream):
-        return self._rules['name'](stream)
-    def _matcher_241(self, stream):
-        return stream.bind('x', self._matcher_240(stream))
+        return stream.match(lambda item: item == '<', "'<'")
+    _regex_241 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+>', 'none')
     def _matcher_242(self, stream):
-        return self._rules['space'](stream)
+        return stream.match(lambda item: item == '>', "'>'")
     def _matcher_243(self, stream):
-        return stream.match(lambda item: item == '=', "'='")
-    def _matcher_244(self, stream):
         return stream.operator_and([
-            self._matcher_243
+            self._matcher_14,
+            self._matcher_242
         ])
+    def _matcher_244(self, stream):
+        return stream.match_regex(self._regex_241, self._matcher_243)
     def _matcher_245(self, stream):
-        return stream.operator_and([
-            self._matcher_242,
-            self._matcher_244
+        return SemanticAction(stream.scope, lambda self: [
+            'Span',
+            [
+                'And',
+                *materialize(self.lookup('xs'))
+            ]
         ])
     def _matcher_246(self, stream):
-        return stream.operator_not(self._matcher_245)
+        return stream.operator_and([
+            self._matcher_240,
+            self._matcher_151,
+            self._matcher_244,
+            self._matcher_245
+        ])
     def _matcher_247(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchRule'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
+        return stream.with_scope(self._matcher_246)
     def _matcher_248(self, stream):
-        return stream.operator_and([
-            self._matcher_241,
-            self._matcher_246,
-            self._matcher_247
+        return SemanticAction(stream.scope, lambda self: [
+            'MatchObject',
+            [
+                'Eq',
+                materialize(self.lookup('x'))
+            ]
         ])
     def _matcher_249(self, stream):
-        return stream.with_scope(self._matcher_248)
+        return stream.operator_and([
+            self._matcher_215,
+            self._matcher_248
+        ])
     def _matcher_250(self, stream):
-        return self._rules['char'](stream)
+        return stream.with_scope(self._matcher_249)
     def _matcher_251(self, stream):
-        return stream.bind('x', self._matcher_250(stream))
+        return self._rule_string(stream) if stream.memo is None else stream.match_rule(self._rule_string, 'string')
     def _matcher_252(self, stream):
-        return stream.match(lambda item: item == '-', "'-'")
+        return stream.bind('x', self._matcher_251(stream))
     def _matcher_253(self, stream):
-        return self._rules['char'](stream)
+        return stream.operator_and([
+            self._matcher_252,
+            self._matcher_248
+        ])
     def _matcher_254(self, stream):
-        return stream.bind('y', self._matcher_253(stream))
+        return stream.with_scope(self._matcher_253)
     def _matcher_255(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchObject'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'Range'),
-                self.lookup('splice')(0, self.lookup('x')),
-                self.lookup('splice')(0, self.lookup('y'))
-            ]))
-        ]))
+        return SemanticAction(stream.scope, lambda self: [
+            'MatchObject',
+            [
+                'State',
+                materialize(self.lookup('x'))
+            ]
+        ])
     def _matcher_256(self, stream):
         return stream.operator_and([
-            self._matcher_251,
-            self._matcher_252,
-            self._matcher_254,
+            self._matcher_120,
+            self._matcher_123,
             self._matcher_255
         ])
     def _matcher_257(self, stream):
         return stream.with_scope(self._matcher_256)
     def _matcher_258(self, stream):
-        return self._rules['number'](stream)
+        return stream.operator_dispatch(self._dispatch_200, [
+            self._matcher_206,
+            self._matcher_213,
+            self._matcher_218,
+            self._matcher_227,
+            self._matcher_230,
+            self._matcher_239,
+            self._matcher_247,
+            self._matcher_250,
+            self._matcher_254,
+            self._matcher_257
+        ])
     def _matcher_259(self, stream):
-        return stream.bind('x', self._matcher_258(stream))
+        return self._rule_innerChar(stream) if stream.memo is None else stream.match_rule(self._rule_innerChar, 'innerChar')
     def _matcher_260(self, stream):
-        return stream.match(lambda item: item == '-', "'-'")
+        return stream.bind('x', self._matcher_259(stream))
     def _matcher_261(self, stream):
-        return self._rules['number'](stream)
-    def _matcher_262(self, stream):
-        return stream.bind('y', self._matcher_261(stream))
-    def _matcher_263(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchObject'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'Range'),
-                self.lookup('splice')(0, self.lookup('x')),
-                self.lookup('splice')(0, self.lookup('y'))
-            ]))
-        ]))
-    def _matcher_264(self, stream):
         return stream.operator_and([
-            self._matcher_259,
             self._matcher_260,
-            self._matcher_262,
-            self._matcher_263
+            self._matcher_248
         ])
+    def _matcher_262(self, stream):
+        return stream.with_scope(self._matcher_261)
+    def _matcher_263(self, stream):
+        return self._rule_actionExpr(stream) if stream.memo is None else stream.match_rule(self._rule_actionExpr, 'actionExpr')
+    def _matcher_264(self, stream):
+        return stream.bind('x', self._matcher_263(stream))
     def _matcher_265(self, stream):
-        return stream.with_scope(self._matcher_264)
+        return SemanticAction(stream.scope, lambda self: [
+            [
+                'Action',
+                materialize(self.lookup('x'))
+            ]
+        ])
     def _matcher_266(self, stream):
-        return stream.match(lambda item: item == "'", '"\'"')
+        return stream.operator_and([
+            self._matcher_264,
+            self._matcher_265
+        ])
     def _matcher_267(self, stream):
-        return stream.match(lambda item: item == "'", '"\'"')
+        return stream.with_scope(self._matcher_266)
     def _matcher_268(self, stream):
-        return stream.operator_and([
-            self._matcher_267
+        return stream.operator_or([
+            self._matcher_267,
+            self._matcher_95
         ])
     def _matcher_269(self, stream):
-        return stream.operator_not(self._matcher_268)
-    def _matcher_270(self, stream):
-        return self._rules['matchChar'](stream)
-    def _matcher_271(self, stream):
         return stream.operator_and([
-            self._matcher_269,
-            self._matcher_270
+            self._matcher_15,
+            self._matcher_106
         ])
+    def _matcher_270(self, stream):
+        return stream.bind('x', self._matcher_269(stream))
+    _regex_271 = Regex(':(?!(?>def(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|actor(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|where(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|universe(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|examples(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])))([ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz](?:[0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])*+)', 'text')
     def _matcher_272(self, stream):
-        return stream.with_scope(self._matcher_271)
-    def _matcher_273(self, stream):
-        return stream.operator_or([
-            self._matcher_272
+        return stream.operator_and([
+            self._matcher_160,
+            self._matcher_31
         ])
+    def _matcher_273(self, stream):
+        return stream.match_regex(self._regex_271, self._matcher_272)
     def _matcher_274(self, stream):
-        return stream.operator_star(self._matcher_273)
+        return ''
     def _matcher_275(self, stream):
-        return stream.bind('xs', self._matcher_274(stream))
+        return stream.operator_or([
+            self._matcher_273,
+            self._matcher_274
+        ])
     def _matcher_276(self, stream):
-        return stream.match(lambda item: item == "'", '"\'"')
+        return stream.bind('y', self._matcher_275(stream))
     def _matcher_277(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'And'),
-            self.lookup('splice')(1, self.lookup('xs'))
-        ]))
-    def _matcher_278(self, stream):
         return stream.operator_and([
-            self._matcher_266,
-            self._matcher_275,
-            self._matcher_276,
-            self._matcher_277
+            self._matcher_15,
+            self._matcher_263
         ])
+    def _matcher_278(self, stream):
+        return stream.bind('z', self._matcher_277(stream))
     def _matcher_279(self, stream):
-        return stream.with_scope(self._matcher_278)
+        return SemanticAction(stream.scope, lambda self: [
+            'Set',
+            materialize(self.lookup('y')),
+            materialize(self.lookup('x')),
+            materialize(self.lookup('z'))
+        ])
     def _matcher_280(self, stream):
-        return stream.match(lambda item: item == '.', "'.'")
-    def _matcher_281(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchObject'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'Any')
-            ]))
-        ]))
-    def _matcher_282(self, stream):
         return stream.operator_and([
-            self._matcher_280,
-            self._matcher_281
+            self._matcher_99,
+            self._matcher_270,
+            self._matcher_276,
+            self._matcher_278,
+            self._matcher_279
         ])
+    def _matcher_281(self, stream):
+        return stream.with_scope(self._matcher_280)
+    _regex_282 = Regex('\\->(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+', 'none')
     def _matcher_283(self, stream):
-        return stream.with_scope(self._matcher_282)
+        return stream.operator_and([
+            self._matcher_99,
+            self._matcher_14
+        ])
     def _matcher_284(self, stream):
-        return stream.match(lambda item: item == '(', "'('")
+        return stream.match_regex(self._regex_282, self._matcher_283)
     def _matcher_285(self, stream):
-        return self._rules['space'](stream)
-    def _matcher_286(self, stream):
-        return self._rules['choice'](stream)
-    def _matcher_287(self, stream):
         return stream.operator_and([
-            self._matcher_285,
-            self._matcher_286
+            self._matcher_284,
+            self._matcher_106
         ])
+    def _matcher_286(self, stream):
+        return stream.operator_or([
+            self._matcher_281,
+            self._matcher_285
+        ])
+    _dispatch_287 = Dispatch(False, {'[': [0, 1, 2, 4, 5, 6], '{': [0, 1, 3, 4, 5, 6]}, [0, 1, 4, 5, 6])
     def _matcher_288(self, stream):
-        return stream.bind('x', self._matcher_287(stream))
+        return SemanticAction(stream.scope, lambda self: [
+            'String',
+            materialize(self.lookup('x'))
+        ])
     def _matcher_289(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_and([
+            self._matcher_252,
+            self._matcher_288
+        ])
     def _matcher_290(self, stream):
-        return stream.match(lambda item: item == ')', "')'")
+        return stream.with_scope(self._matcher_289)
     def _matcher_291(self, stream):
-        return stream.action(lambda self: self.lookup('x'))
+        return SemanticAction(stream.scope, lambda self: [
+            'Number',
+            materialize(self.lookup('x'))
+        ])
     def _matcher_292(self, stream):
         return stream.operator_and([
-            self._matcher_284,
-            self._matcher_288,
-            self._matcher_289,
-            self._matcher_290,
+            self._matcher_215,
             self._matcher_291
         ])
     def _matcher_293(self, stream):
         return stream.with_scope(self._matcher_292)
     def _matcher_294(self, stream):
-        return self._rules['number'](stream)
+        return self._rule_hostListItem(stream) if stream.memo is None else stream.match_rule(self._rule_hostListItem, 'hostListItem')
     def _matcher_295(self, stream):
-        return stream.bind('x', self._matcher_294(stream))
-    def _matcher_296(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchObject'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'Eq'),
-                self.lookup('splice')(0, self.lookup('x'))
-            ]))
-        ]))
-    def _matcher_297(self, stream):
         return stream.operator_and([
-            self._matcher_295,
-            self._matcher_296
+            self._matcher_15,
+            self._matcher_294
         ])
+    def _matcher_296(self, stream):
+        return stream.operator_star(self._matcher_295)
+    def _matcher_297(self, stream):
+        return stream.bind('xs', self._matcher_296(stream))
     def _matcher_298(self, stream):
-        return stream.with_scope(self._matcher_297)
+        return SemanticAction(stream.scope, lambda self: [
+            'List',
+            *materialize(self.lookup('xs'))
+        ])
     def _matcher_299(self, stream):
-        return self._rules['string'](stream)
+        return stream.operator_and([
+            self._matcher_165,
+            self._matcher_297,
+            self._matcher_169,
+            self._matcher_298
+        ])
     def _matcher_300(self, stream):
-        return stream.bind('x', self._matcher_299(stream))
+        return stream.with_scope(self._matcher_299)
     def _matcher_301(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchObject'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'Eq'),
-                self.lookup('splice')(0, self.lookup('x'))
-            ]))
-        ]))
+        return stream.match(lambda item: item == '{', "'{'")
     def _matcher_302(self, stream):
-        return stream.operator_and([
-            self._matcher_300,
-            self._matcher_301
-        ])
+        return stream.operator_star(self._matcher_269)
     def _matcher_303(self, stream):
-        return stream.with_scope(self._matcher_302)
-    def _matcher_304(self, stream):
-        return stream.match(lambda item: item == '#', "'#'")
+        return stream.bind('xs', self._matcher_302(stream))
+    _regex_304 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+\\}', 'none')
     def _matcher_305(self, stream):
-        return self._rules['name'](stream)
+        return stream.match(lambda item: item == '}', "'}'")
     def _matcher_306(self, stream):
-        return stream.bind('x', self._matcher_305(stream))
+        return stream.operator_and([
+            self._matcher_14,
+            self._matcher_305
+        ])
     def _matcher_307(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchObject'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'State'),
-                self.lookup('splice')(0, self.lookup('x'))
-            ]))
-        ]))
+        return stream.match_regex(self._regex_304, self._matcher_306)
     def _matcher_308(self, stream):
-        return stream.operator_and([
-            self._matcher_304,
-            self._matcher_306,
-            self._matcher_307
+        return SemanticAction(stream.scope, lambda self: [
+            'Format',
+            *materialize(self.lookup('xs'))
         ])
     def _matcher_309(self, stream):
-        return stream.with_scope(self._matcher_308)
-    def _matcher_310(self, stream):
-        return stream.operator_or([
-            self._matcher_249,
-            self._matcher_257,
-            self._matcher_265,
-            self._matcher_279,
-            self._matcher_283,
-            self._matcher_293,
-            self._matcher_298,
+        return stream.operator_and([
+            self._matcher_301,
             self._matcher_303,
-            self._matcher_309
+            self._matcher_307,
+            self._matcher_308
         ])
+    def _matcher_310(self, stream):
+        return stream.with_scope(self._matcher_309)
     def _matcher_311(self, stream):
-        return self._rules['innerChar'](stream)
+        return self._rule_var(stream) if stream.memo is None else stream.match_rule(self._rule_var, 'var')
     def _matcher_312(self, stream):
         return stream.bind('x', self._matcher_311(stream))
-    def _matcher_313(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'MatchObject'),
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'Eq'),
-                self.lookup('splice')(0, self.lookup('x'))
-            ]))
-        ]))
+    _regex_313 = Regex('(?:(?>[\\\n\\ ]|//(?:(?!\\\n).)*+\\\n))*+\\(', 'none')
     def _matcher_314(self, stream):
         return stream.operator_and([
-            self._matcher_312,
-            self._matcher_313
+            self._matcher_14,
+            self._matcher_231
         ])
     def _matcher_315(self, stream):
-        return stream.with_scope(self._matcher_314)
+        return stream.match_regex(self._regex_313, self._matcher_314)
     def _matcher_316(self, stream):
-        return self._rules['actionExpr'](stream)
+        return stream.bind('ys', self._matcher_302(stream))
     def _matcher_317(self, stream):
-        return stream.bind('x', self._matcher_316(stream))
+        return SemanticAction(stream.scope, lambda self: [
+            'Call',
+            materialize(self.lookup('x')),
+            *materialize(self.lookup('ys'))
+        ])
     def _matcher_318(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, self.lookup('concat')([
-                self.lookup('splice')(0, 'Action'),
-                self.lookup('splice')(0, self.lookup('x'))
-            ]))
-        ]))
-    def _matcher_319(self, stream):
         return stream.operator_and([
-            self._matcher_317,
-            self._matcher_318
+            self._matcher_312,
+            self._matcher_315,
+            self._matcher_316,
+            self._matcher_236,
+            self._matcher_317
         ])
+    def _matcher_319(self, stream):
+        return stream.with_scope(self._matcher_318)
     def _matcher_320(self, stream):
-        return stream.with_scope(self._matcher_319)
+        return SemanticAction(stream.scope, lambda self: [
+            'Get',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])
     def _matcher_321(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-        
-        ]))
+        return stream.operator_and([
+            self._matcher_312,
+            self._matcher_228,
+            self._matcher_161,
+            self._matcher_320
+        ])
     def _matcher_322(self, stream):
         return stream.with_scope(self._matcher_321)
     def _matcher_323(self, stream):
-        return stream.operator_or([
-            self._matcher_320,
-            self._matcher_322
+        return stream.operator_dispatch(self._dispatch_287, [
+            self._matcher_290,
+            self._matcher_293,
+            self._matcher_300,
+            self._matcher_310,
+            self._matcher_319,
+            self._matcher_322,
+            self._matcher_311
         ])
-    def _matcher_324(self, stream):
-        return stream.match(lambda item: item == '-', "'-'")
+    _regex_324 = Regex('(?:\\~)*+', 'chars')
     def _matcher_325(self, stream):
-        return stream.match(lambda item: item == '>', "'>'")
+        return stream.match(lambda item: item == '~', "'~'")
     def _matcher_326(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_star(self._matcher_325)
     def _matcher_327(self, stream):
-        return self._rules['hostExpr'](stream)
+        return stream.match_regex(self._regex_324, self._matcher_326)
     def _matcher_328(self, stream):
-        return stream.operator_and([
-            self._matcher_326,
-            self._matcher_327
-        ])
+        return stream.bind('ys', self._matcher_327(stream))
     def _matcher_329(self, stream):
-        return stream.bind('x', self._matcher_328(stream))
+        return SemanticAction(stream.scope, lambda self: [
+            'ListItem',
+            materialize(self.runtime.lookup('len')(
+                materialize(self.lookup('ys'))
+            )),
+            materialize(self.lookup('x'))
+        ])
     def _matcher_330(self, stream):
-        return stream.match(lambda item: item == ':', "':'")
-    def _matcher_331(self, stream):
         return stream.operator_and([
-            self._matcher_330
+            self._matcher_328,
+            self._matcher_107,
+            self._matcher_329
         ])
+    def _matcher_331(self, stream):
+        return stream.with_scope(self._matcher_330)
     def _matcher_332(self, stream):
-        return self._rules['name'](stream)
+        return SemanticAction(stream.scope, lambda self: [
+            'Lookup',
+            materialize(self.lookup('x'))
+        ])
     def _matcher_333(self, stream):
         return stream.operator_and([
-            self._matcher_331,
+            self._matcher_123,
+            self._matcher_203,
             self._matcher_332
         ])
     def _matcher_334(self, stream):
         return stream.with_scope(self._matcher_333)
-    def _matcher_335(self, stream):
-        return stream.action(lambda self: '')
-    def _matcher_336(self, stream):
-        return stream.operator_and([
-            self._matcher_335
-        ])
+    _regex_335 = Regex('(?:(?!\\\n).)*+\\\n', 'text')
+    _until_336 = Until([['\n']], "'\\n'", [])
     def _matcher_337(self, stream):
-        return stream.with_scope(self._matcher_336)
+        return stream.operator_skip_until(self._until_336)
     def _matcher_338(self, stream):
-        return stream.operator_or([
-            self._matcher_334,
-            self._matcher_337
-        ])
+        return stream.match(lambda item: item == '\n', "'\\n'")
     def _matcher_339(self, stream):
-        return stream.bind('y', self._matcher_338(stream))
+        return stream.operator_and([
+            self._matcher_337,
+            self._matcher_338
+        ])
     def _matcher_340(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_span(self._matcher_339)
     def _matcher_341(self, stream):
-        return self._rules['actionExpr'](stream)
+        return stream.match_regex(self._regex_335, self._matcher_340)
     def _matcher_342(self, stream):
-        return stream.operator_and([
-            self._matcher_340,
-            self._matcher_341
-        ])
+        return stream.match(lambda item: item == ' ', "' '")
     def _matcher_343(self, stream):
-        return stream.bind('z', self._matcher_342(stream))
+        return self._rule_restLine(stream) if stream.memo is None else stream.match_rule(self._rule_restLine, 'restLine')
     def _matcher_344(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Set'),
-            self.lookup('splice')(0, self.lookup('y')),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('z'))
-        ]))
-    def _matcher_345(self, stream):
         return stream.operator_and([
-            self._matcher_324,
-            self._matcher_325,
-            self._matcher_329,
-            self._matcher_339,
-            self._matcher_343,
-            self._matcher_344
+            self._matcher_342,
+            self._matcher_343
         ])
+    def _matcher_345(self, stream):
+        return stream.operator_span(self._matcher_344)
     def _matcher_346(self, stream):
-        return stream.with_scope(self._matcher_345)
+        return stream.match_regex(self._regex_64, self._matcher_345)
     def _matcher_347(self, stream):
-        return stream.match(lambda item: item == '-', "'-'")
+        return stream.match(lambda item: item == '"', '\'"\'')
     def _matcher_348(self, stream):
-        return stream.match(lambda item: item == '>', "'>'")
+        return stream.operator_not(self._matcher_347)
     def _matcher_349(self, stream):
-        return self._rules['space'](stream)
-    def _matcher_350(self, stream):
-        return self._rules['hostExpr'](stream)
-    def _matcher_351(self, stream):
         return stream.operator_and([
-            self._matcher_347,
             self._matcher_348,
-            self._matcher_349,
-            self._matcher_350
+            self._matcher_259
         ])
+    def _matcher_350(self, stream):
+        return stream.operator_star(self._matcher_349)
+    def _matcher_351(self, stream):
+        return stream.bind('xs', self._matcher_350(stream))
     def _matcher_352(self, stream):
-        return stream.with_scope(self._matcher_351)
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            self.lookup('xs')
+        ]))
     def _matcher_353(self, stream):
-        return stream.operator_or([
-            self._matcher_346,
+        return stream.operator_and([
+            self._matcher_347,
+            self._matcher_351,
+            self._matcher_347,
             self._matcher_352
         ])
     def _matcher_354(self, stream):
-        return self._rules['string'](stream)
-    def _matcher_355(self, stream):
-        return stream.bind('x', self._matcher_354(stream))
+        return stream.with_scope(self._matcher_353)
+    _regex_355 = Regex("'(?!')", 'none')
     def _matcher_356(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'String'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
-    def _matcher_357(self, stream):
         return stream.operator_and([
-            self._matcher_355,
-            self._matcher_356
+            self._matcher_219,
+            self._matcher_220
         ])
+    def _matcher_357(self, stream):
+        return stream.match_regex(self._regex_355, self._matcher_356)
     def _matcher_358(self, stream):
-        return stream.with_scope(self._matcher_357)
+        return stream.operator_and([
+            self._matcher_357,
+            self._matcher_260,
+            self._matcher_219,
+            self._matcher_237
+        ])
     def _matcher_359(self, stream):
-        return self._rules['number'](stream)
+        return stream.with_scope(self._matcher_358)
     def _matcher_360(self, stream):
-        return stream.bind('x', self._matcher_359(stream))
+        return stream.match(lambda item: item == '\\', "'\\\\'")
     def _matcher_361(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Number'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
+        return self._rule_escape(stream) if stream.memo is None else stream.match_rule(self._rule_escape, 'escape')
     def _matcher_362(self, stream):
         return stream.operator_and([
             self._matcher_360,
             self._matcher_361
         ])
     def _matcher_363(self, stream):
-        return stream.with_scope(self._matcher_362)
-    def _matcher_364(self, stream):
-        return stream.match(lambda item: item == '[', "'['")
+        return stream.operator_or([
+            self._matcher_362,
+            self._matcher_1
+        ])
+    _dispatch_364 = Dispatch(False, {'\\': [0], "'": [1], '"': [2], 'n': [3]}, [])
     def _matcher_365(self, stream):
-        return self._rules['space'](stream)
+        return '\\'
     def _matcher_366(self, stream):
-        return self._rules['hostListItem'](stream)
-    def _matcher_367(self, stream):
         return stream.operator_and([
-            self._matcher_365,
-            self._matcher_366
+            self._matcher_360,
+            self._matcher_365
         ])
+    def _matcher_367(self, stream):
+        return "'"
     def _matcher_368(self, stream):
-        return stream.operator_star(self._matcher_367)
+        return stream.operator_and([
+            self._matcher_219,
+            self._matcher_367
+        ])
     def _matcher_369(self, stream):
-        return stream.bind('xs', self._matcher_368(stream))
+        return '"'
     def _matcher_370(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_and([
+            self._matcher_347,
+            self._matcher_369
+        ])
     def _matcher_371(self, stream):
-        return stream.match(lambda item: item == ']', "']'")
+        return stream.match(lambda item: item == 'n', "'n'")
     def _matcher_372(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'List'),
-            self.lookup('splice')(1, self.lookup('xs'))
-        ]))
+        return '\n'
     def _matcher_373(self, stream):
         return stream.operator_and([
-            self._matcher_364,
-            self._matcher_369,
-            self._matcher_370,
             self._matcher_371,
             self._matcher_372
         ])
     def _matcher_374(self, stream):
-        return stream.with_scope(self._matcher_373)
-    def _matcher_375(self, stream):
-        return stream.match(lambda item: item == '{', "'{'")
+        return stream.operator_dispatch(self._dispatch_364, [
+            self._matcher_366,
+            self._matcher_368,
+            self._matcher_370,
+            self._matcher_373
+        ])
+    _regex_375 = Regex('[0-9](?:[0-9])*+', 'text')
     def _matcher_376(self, stream):
-        return self._rules['space'](stream)
+        return stream.match(lambda item: '0' <= item <= '9', "'0'-'9'")
     def _matcher_377(self, stream):
-        return self._rules['hostExpr'](stream)
+        return stream.operator_skip(self._matcher_376)
     def _matcher_378(self, stream):
         return stream.operator_and([
             self._matcher_376,
             self._matcher_377
         ])
     def _matcher_379(self, stream):
-        return stream.operator_star(self._matcher_378)
+        return stream.operator_span(self._matcher_378)
     def _matcher_380(self, stream):
-        return stream.bind('xs', self._matcher_379(stream))
+        return stream.match_regex(self._regex_375, self._matcher_379)
     def _matcher_381(self, stream):
-        return self._rules['space'](stream)
+        return stream.bind('x', self._matcher_380(stream))
     def _matcher_382(self, stream):
-        return stream.match(lambda item: item == '}', "'}'")
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('int')(
+            materialize(self.lookup('x'))
+        ))
     def _matcher_383(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Format'),
-            self.lookup('splice')(1, self.lookup('xs'))
-        ]))
-    def _matcher_384(self, stream):
         return stream.operator_and([
-            self._matcher_375,
-            self._matcher_380,
             self._matcher_381,
-            self._matcher_382,
-            self._matcher_383
+            self._matcher_382
         ])
+    def _matcher_384(self, stream):
+        return stream.with_scope(self._matcher_383)
     def _matcher_385(self, stream):
-        return stream.with_scope(self._matcher_384)
+        return self._rule_reserved(stream) if stream.memo is None else stream.match_rule(self._rule_reserved, 'reserved')
     def _matcher_386(self, stream):
-        return self._rules['var'](stream)
+        return stream.operator_not(self._matcher_385)
     def _matcher_387(self, stream):
-        return stream.bind('x', self._matcher_386(stream))
+        return self._rule_nameStart(stream) if stream.memo is None else stream.match_rule(self._rule_nameStart, 'nameStart')
     def _matcher_388(self, stream):
-        return self._rules['space'](stream)
+        return self._rule_nameChar(stream) if stream.memo is None else stream.match_rule(self._rule_nameChar, 'nameChar')
     def _matcher_389(self, stream):
-        return stream.match(lambda item: item == '(', "'('")
+        return stream.operator_skip(self._matcher_388)
     def _matcher_390(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_and([
+            self._matcher_387,
+            self._matcher_389
+        ])
     def _matcher_391(self, stream):
-        return self._rules['hostExpr'](stream)
+        return stream.operator_span(self._matcher_390)
     def _matcher_392(self, stream):
         return stream.operator_and([
-            self._matcher_390,
+            self._matcher_386,
             self._matcher_391
         ])
     def _matcher_393(self, stream):
-        return stream.operator_star(self._matcher_392)
-    def _matcher_394(self, stream):
-        return stream.bind('ys', self._matcher_393(stream))
+        return stream.match_regex(self._regex_121, self._matcher_392)
+    _regex_394 = Regex('(?>def(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|actor(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|where(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|universe(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])|examples(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz]))', 'none')
     def _matcher_395(self, stream):
-        return self._rules['space'](stream)
+        return stream.operator_or([
+            self._matcher_56,
+            self._matcher_28,
+            self._matcher_112,
+            self._matcher_73,
+            self._matcher_85
+        ])
     def _matcher_396(self, stream):
-        return stream.match(lambda item: item == ')', "')'")
+        return stream.match_regex(self._regex_394, self._matcher_395)
     def _matcher_397(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Call'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(1, self.lookup('ys'))
-        ]))
+        return stream.match_literal('def')
     def _matcher_398(self, stream):
+        return stream.operator_not(self._matcher_388)
+    def _matcher_399(self, stream):
         return stream.operator_and([
-            self._matcher_387,
-            self._matcher_388,
-            self._matcher_389,
-            self._matcher_394,
-            self._matcher_395,
-            self._matcher_396,
-            self._matcher_397
+            self._matcher_397,
+            self._matcher_398
         ])
-    def _matcher_399(self, stream):
-        return stream.with_scope(self._matcher_398)
     def _matcher_400(self, stream):
-        return self._rules['var'](stream)
+        return stream.match_regex(self._regex_55, self._matcher_399)
     def _matcher_401(self, stream):
-        return stream.bind('x', self._matcher_400(stream))
+        return stream.match_literal('actor')
     def _matcher_402(self, stream):
-        return stream.match(lambda item: item == '.', "'.'")
+        return stream.operator_and([
+            self._matcher_401,
+            self._matcher_398
+        ])
     def _matcher_403(self, stream):
-        return self._rules['name'](stream)
-    def _matcher_404(self, stream):
-        return stream.bind('y', self._matcher_403(stream))
+        return stream.match_regex(self._regex_27, self._matcher_402)
+    _regex_404 = Regex('where(?![0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz])', 'none')
     def _matcher_405(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Get'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('y'))
-        ]))
+        return stream.match_literal('where')
     def _matcher_406(self, stream):
         return stream.operator_and([
-            self._matcher_401,
-            self._matcher_402,
-            self._matcher_404,
-            self._matcher_405
+            self._matcher_405,
+            self._matcher_398
         ])
     def _matcher_407(self, stream):
-        return stream.with_scope(self._matcher_406)
+        return stream.match_regex(self._regex_404, self._matcher_406)
     def _matcher_408(self, stream):
-        return self._rules['var'](stream)
+        return stream.match_literal('universe')
     def _matcher_409(self, stream):
-        return stream.with_scope(self._matcher_408)
-    def _matcher_410(self, stream):
-        return stream.operator_or([
-            self._matcher_358,
-            self._matcher_363,
-            self._matcher_374,
-            self._matcher_385,
-            self._matcher_399,
-            self._matcher_407,
-            self._matcher_409
+        return stream.operator_and([
+            self._matcher_408,
+            self._matcher_398
         ])
+    def _matcher_410(self, stream):
+        return stream.match_regex(self._regex_72, self._matcher_409)
     def _matcher_411(self, stream):
-        return stream.match(lambda item: item == '~', "'~'")
+        return stream.match_literal('examples')
     def _matcher_412(self, stream):
         return stream.operator_and([
-            self._matcher_411
+            self._matcher_411,
+            self._matcher_398
         ])
     def _matcher_413(self, stream):
-        return stream.operator_star(self._matcher_412)
+        return stream.match_regex(self._regex_84, self._matcher_412)
     def _matcher_414(self, stream):
-        return stream.bind('ys', self._matcher_413(stream))
+        return stream.match(lambda item: (item in {'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z'} if isinstance(item, str) and len(item) == 1 else in_ranges(item, [('a', 'z'), ('A', 'Z')])) and ('a' <= item <= 'z' or expect_first(stream, stream.items, stream.index, "'a'-'z'")), "'a'-'z'")
     def _matcher_415(self, stream):
-        return self._rules['hostExpr'](stream)
+        return stream.match(lambda item: (item in {'0', '1', '2', '3', '4', '5', '6', '7', '8', '9', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z'} if isinstance(item, str) and len(item) == 1 else in_ranges(item, [('a', 'z'), ('A', 'Z'), ('0', '9')])) and ('a' <= item <= 'z' or expect_first(stream, stream.items, stream.index, "'a'-'z'")), "'a'-'z'")
     def _matcher_416(self, stream):
-        return stream.bind('x', self._matcher_415(stream))
-    def _matcher_417(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'ListItem'),
-            self.lookup('splice')(0, self.lookup('len')(
-                self.lookup('ys')
-            )),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
+        return stream.match(lambda item: (item in {'\n', ' '} if isinstance(item, str) and len(item) == 1 else in_ranges(item, [])) and (' ' <= item <= ' ' or expect_first(stream, stream.items, stream.index, "' '")), "' '")
+    _regex_417 = Regex('//((?:(?!\\\n).)*+\\\n)', 'text')
     def _matcher_418(self, stream):
-        return stream.operator_and([
-            self._matcher_414,
-            self._matcher_416,
-            self._matcher_417
-        ])
+        return self._rule_comment(stream) if stream.memo is None else stream.match_rule(self._rule_comment, 'comment')
     def _matcher_419(self, stream):
-        return stream.with_scope(self._matcher_418)
+        return stream.match_regex(self._regex_417, self._matcher_418)
     def _matcher_420(self, stream):
-        return self._rules['name'](stream)
+        return stream.operator_or([
+            self._matcher_416,
+            self._matcher_419
+        ])
     def _matcher_421(self, stream):
-        return stream.bind('x', self._matcher_420(stream))
+        return stream.operator_star(self._matcher_420)
     def _matcher_422(self, stream):
-        return self._rules['space'](stream)
+        return stream.match_literal('//')
     def _matcher_423(self, stream):
-        return stream.match(lambda item: item == '=', "'='")
-    def _matcher_424(self, stream):
-        return stream.operator_and([
-            self._matcher_423
-        ])
-    def _matcher_425(self, stream):
         return stream.operator_and([
             self._matcher_422,
-            self._matcher_424
-        ])
-    def _matcher_426(self, stream):
-        return stream.operator_not(self._matcher_425)
-    def _matcher_427(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Lookup'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
-    def _matcher_428(self, stream):
-        return stream.operator_and([
-            self._matcher_421,
-            self._matcher_426,
-            self._matcher_427
+            self._matcher_343
         ])
-    def _matcher_429(self, stream):
-        return stream.with_scope(self._matcher_428)
-    def _matcher_430(self, stream):
-        return stream.match(lambda item: item == '\n', "'\\n'")
-    def _matcher_431(self, stream):
-        return stream.operator_and([
-            self._matcher_430
-        ])
-    def _matcher_432(self, stream):
-        return stream.operator_not(self._matcher_431)
-    def _matcher_433(self, stream):
+    def _matcher_424(self, stream):
+        return stream.match_regex(self._regex_417, self._matcher_423)
+    _rule__main = _matcher_12
+    _rule_file = _matcher_26
+    _rule_body = _matcher_83
+    _rule_examplesp = _matcher_96
+    _rule_example = _matcher_105
+    _rule_globalHostExpr = _matcher_110
+    _rule_whereItems = _matcher_119
+    _rule_field = _matcher_126
+    _rule_rule = _matcher_130
+    _rule_choice = _matcher_147
+    _rule_sequence = _matcher_157
+    _rule_expr = _matcher_173
+    _rule_expr1 = _matcher_192
+    _rule_expr2 = _matcher_199
+    _rule_expr3 = _matcher_258
+    _rule_matchChar = _matcher_262
+    _rule_maybeAction = _matcher_268
+    _rule_actionExpr = _matcher_286
+    _rule_hostExpr = _matcher_323
+    _rule_hostListItem = _matcher_331
+    _rule_var = _matcher_334
+    _rule_restLine = _matcher_341
+    _rule_indented = _matcher_346
+    _rule_string = _matcher_354
+    _rule_char = _matcher_359
+    _rule_innerChar = _matcher_363
+    _rule_escape = _matcher_374
+    _rule_number = _matcher_384
+    _rule_name = _matcher_393
+    _rule_reserved = _matcher_396
+    _rule_keyDef = _matcher_400
+    _rule_keyActor = _matcher_403
+    _rule_keyWhere = _matcher_407
+    _rule_keyUniverse = _matcher_410
+    _rule_keyExamples = _matcher_413
+    _rule_nameStart = _matcher_414
+    _rule_nameChar = _matcher_415
+    _rule_space = _matcher_421
+    _rule_comment = _matcher_424
+    _accepts = {'SourceCode'}
+    _parks = True
+    _replicable = True
+    _rules = {
+        '_main': _rule__main,
+        'file': _rule_file,
+        'body': _rule_body,
+        'examplesp': _rule_examplesp,
+        'example': _rule_example,
+        'globalHostExpr': _rule_globalHostExpr,
+        'whereItems': _rule_whereItems,
+        'field': _rule_field,
+        'rule': _rule_rule,
+        'choice': _rule_choice,
+        'sequence': _rule_sequence,
+        'expr': _rule_expr,
+        'expr1': _rule_expr1,
+        'expr2': _rule_expr2,
+        'expr3': _rule_expr3,
+        'matchChar': _rule_matchChar,
+        'maybeAction': _rule_maybeAction,
+        'actionExpr': _rule_actionExpr,
+        'hostExpr': _rule_hostExpr,
+        'hostListItem': _rule_hostListItem,
+        'var': _rule_var,
+        'restLine': _rule_restLine,
+        'indented': _rule_indented,
+        'string': _rule_string,
+        'char': _rule_char,
+        'innerChar': _rule_innerChar,
+        'escape': _rule_escape,
+        'number': _rule_number,
+        'name': _rule_name,
+        'reserved': _rule_reserved,
+        'keyDef': _rule_keyDef,
+        'keyActor': _rule_keyActor,
+        'keyWhere': _rule_keyWhere,
+        'keyUniverse': _rule_keyUniverse,
+        'keyExamples': _rule_keyExamples,
+        'nameStart': _rule_nameStart,
+        'nameChar': _rule_nameChar,
+        'space': _rule_space,
+        'comment': _rule_comment,
+    }
+    _main = _rules.pop('_main')
+natives['Parser'] = Parser
+class Optimizer:
+    __slots__ = ('_state',)
+    def __init__(self):
+        self._state = {}
+    def run(self, stream):
+        return stream.run(self._main)
+    def _matcher_0(self, stream):
+        return stream.match(lambda item: item == 'Ast', "'Ast'")
+    def _matcher_1(self, stream):
         return stream.match(lambda item: True, 'any')
-    def _matcher_434(self, stream):
+    def _matcher_2(self, stream):
+        return stream.bind('p', self._matcher_1(stream))
+    def _matcher_3(self, stream):
+        return self._rule_opts(stream) if stream.memo is None else stream.match_rule(self._rule_opts, 'opts')
+    def _matcher_4(self, stream):
+        return stream.bind('xs', self._matcher_3(stream))
+    def _matcher_5(self, stream):
+        return stream.match_list(self._matcher_4)
+    def _matcher_6(self, stream):
+        return self._rule_backend(stream) if stream.memo is None else stream.match_rule(self._rule_backend, 'backend')
+    def _matcher_7(self, stream):
+        return stream.bind('x', self._matcher_6(stream))
+    def _matcher_8(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('rule', self.lookup('x'), lambda: self.bind('star', 'Star', lambda: self.runtime.lookup('put')(
+            [
+                'Optimized',
+                materialize(self.lookup('p')),
+                materialize(self.lookup('xs'))
+            ]
+        ))))
+    def _matcher_9(self, stream):
         return stream.operator_and([
-            self._matcher_432,
-            self._matcher_433
+            self._matcher_0,
+            self._matcher_2,
+            self._matcher_5,
+            self._matcher_7,
+            self._matcher_8
         ])
-    def _matcher_435(self, stream):
-        return stream.with_scope(self._matcher_434)
-    def _matcher_436(self, stream):
-        return stream.operator_or([
-            self._matcher_435
+    def _matcher_10(self, stream):
+        return stream.with_scope(self._matcher_9)
+    _dispatch_11 = Dispatch(False, {'inline': [0, 2], 'vm': [1, 2]}, [2])
+    def _matcher_12(self, stream):
+        return stream.match(lambda item: item == 'inline', "'inline'")
+    def _matcher_13(self, stream):
+        return stream.operator_not(self._matcher_1)
+    def _matcher_14(self, stream):
+        return 'InlineRule'
+    def _matcher_15(self, stream):
+        return stream.operator_and([
+            self._matcher_12,
+            self._matcher_13,
+            self._matcher_14
         ])
-    def _matcher_437(self, stream):
-        return stream.operator_star(self._matcher_436)
-    def _matcher_438(self, stream):
-        return stream.bind('xs', self._matcher_437(stream))
-    def _matcher_439(self, stream):
-        return stream.match(lambda item: item == '\n', "'\\n'")
-    def _matcher_440(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            self.lookup('xs'),
-            '\n'
-        ]))
-    def _matcher_441(self, stream):
+    def _matcher_16(self, stream):
+        return stream.match(lambda item: item == 'vm', "'vm'")
+    def _matcher_17(self, stream):
+        return 'VmRule'
+    def _matcher_18(self, stream):
         return stream.operator_and([
-            self._matcher_438,
-            self._matcher_439,
-            self._matcher_440
+            self._matcher_16,
+            self._matcher_13,
+            self._matcher_17
         ])
-    def _matcher_442(self, stream):
-        return stream.with_scope(self._matcher_441)
-    def _matcher_443(self, stream):
-        return stream.match(lambda item: item == ' ', "' '")
-    def _matcher_444(self, stream):
-        return self._rules['restLine'](stream)
-    def _matcher_445(self, stream):
-        return stream.bind('x', self._matcher_444(stream))
-    def _matcher_446(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            ' ',
-            self.lookup('x')
-        ]))
-    def _matcher_447(self, stream):
+    def _matcher_19(self, stream):
+        return 'Rule'
+    def _matcher_20(self, stream):
         return stream.operator_and([
-            self._matcher_443,
-            self._matcher_445,
-            self._matcher_446
+            self._matcher_13,
+            self._matcher_19
         ])
-    def _matcher_448(self, stream):
-        return stream.with_scope(self._matcher_447)
-    def _matcher_449(self, stream):
-        return stream.match(lambda item: item == '"', '\'"\'')
-    def _matcher_450(self, stream):
-        return stream.match(lambda item: item == '"', '\'"\'')
-    def _matcher_451(self, stream):
+    def _matcher_21(self, stream):
+        return stream.operator_dispatch(self._dispatch_11, [
+            self._matcher_15,
+            self._matcher_18,
+            self._matcher_20
+        ])
+    def _matcher_22(self, stream):
+        return self._rule_opt(stream) if stream.memo is None else stream.match_rule(self._rule_opt, 'opt')
+    def _matcher_23(self, stream):
+        return stream.operator_star(self._matcher_22)
+    def _matcher_24(self, stream):
+        return stream.bind('xs', self._matcher_23(stream))
+    def _matcher_25(self, stream):
+        return lookup_action(stream.scope, 'xs')
+    def _matcher_26(self, stream):
         return stream.operator_and([
-            self._matcher_450
+            self._matcher_24,
+            self._matcher_13,
+            self._matcher_25
         ])
-    def _matcher_452(self, stream):
-        return stream.operator_not(self._matcher_451)
-    def _matcher_453(self, stream):
-        return self._rules['innerChar'](stream)
-    def _matcher_454(self, stream):
+    def _matcher_27(self, stream):
+        return stream.with_scope(self._matcher_26)
+    def _matcher_28(self, stream):
+        return stream.match_call_rule(self._rules, self)
+    def _matcher_29(self, stream):
+        return stream.bind('x', self._matcher_28(stream))
+    def _matcher_30(self, stream):
+        return stream.match_list(self._matcher_29)
+    def _matcher_31(self, stream):
+        return lookup_action(stream.scope, 'x')
+    def _matcher_32(self, stream):
         return stream.operator_and([
-            self._matcher_452,
-            self._matcher_453
+            self._matcher_30,
+            self._matcher_31
         ])
-    def _matcher_455(self, stream):
-        return stream.with_scope(self._matcher_454)
-    def _matcher_456(self, stream):
+    def _matcher_33(self, stream):
+        return stream.with_scope(self._matcher_32)
+    def _matcher_34(self, stream):
         return stream.operator_or([
-            self._matcher_455
+            self._matcher_33,
+            self._matcher_1
         ])
-    def _matcher_457(self, stream):
-        return stream.operator_star(self._matcher_456)
-    def _matcher_458(self, stream):
-        return stream.bind('xs', self._matcher_457(stream))
-    def _matcher_459(self, stream):
-        return stream.match(lambda item: item == '"', '\'"\'')
-    def _matcher_460(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            self.lookup('xs')
-        ]))
-    def _matcher_461(self, stream):
+    def _matcher_35(self, stream):
+        return stream.bind('x', self._matcher_1(stream))
+    def _matcher_36(self, stream):
+        return self._rule_field(stream) if stream.memo is None else stream.match_rule(self._rule_field, 'field')
+    def _matcher_37(self, stream):
+        return stream.operator_star(self._matcher_36)
+    def _matcher_38(self, stream):
+        return stream.bind('fs', self._matcher_37(stream))
+    def _matcher_39(self, stream):
+        return stream.match_list(self._matcher_38)
+    def _matcher_40(self, stream):
+        return stream.operator_span(self._matcher_39)
+    def _matcher_41(self, stream):
+        return stream.bind('y', self._matcher_40(stream))
+    def _matcher_42(self, stream):
+        return stream.bind('zs', self._matcher_3(stream))
+    def _matcher_43(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('fields', self.lookup('fs'), lambda: self.bind('settable', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('lookups', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('stateful', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('rules', self.lookup('zs'), lambda: self.bind('', self.runtime.lookup('releaseLookups')(
+            materialize(self.runtime.lookup('lookups')),
+            materialize(self.runtime.lookup('settable'))
+        ), lambda: self.bind('regexTrees', self.runtime.lookup('dict')(
+            materialize(self.runtime.extra.get('match', self.runtime.match)(
+                'regexTrees',
+                materialize(self.runtime.lookup('rules'))
+            ))
+        ), lambda: [
+            'Actor',
+            materialize(self.lookup('x')),
+            *materialize(self.lookup('y')),
+            *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                'regexes',
+                materialize(self.runtime.lookup('rules'))
+            )),
+            *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                'accepts',
+                materialize(self.runtime.lookup('rules'))
+            )),
+            *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                'parks',
+                [
+                    materialize(self.runtime.lookup('stateful'))
+                ]
+            )),
+            *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                'replicable',
+                [
+                    materialize(self.lookup('fs'))
+                ]
+            ))
+        ]))))))))
+    def _matcher_44(self, stream):
         return stream.operator_and([
-            self._matcher_449,
-            self._matcher_458,
-            self._matcher_459,
-            self._matcher_460
+            self._matcher_35,
+            self._matcher_41,
+            self._matcher_42,
+            self._matcher_43
         ])
-    def _matcher_462(self, stream):
-        return stream.with_scope(self._matcher_461)
-    def _matcher_463(self, stream):
-        return stream.match(lambda item: item == "'", '"\'"')
-    def _matcher_464(self, stream):
-        return stream.match(lambda item: item == "'", '"\'"')
-    def _matcher_465(self, stream):
+    def _matcher_45(self, stream):
+        return stream.with_scope(self._matcher_44)
+    def _matcher_46(self, stream):
+        return stream.match(lambda item: item == 'Field', "'Field'")
+    def _matcher_47(self, stream):
         return stream.operator_and([
-            self._matcher_464
+            self._matcher_46,
+            self._matcher_35
         ])
-    def _matcher_466(self, stream):
-        return stream.operator_not(self._matcher_465)
-    def _matcher_467(self, stream):
-        return self._rules['innerChar'](stream)
-    def _matcher_468(self, stream):
-        return stream.bind('x', self._matcher_467(stream))
-    def _matcher_469(self, stream):
-        return stream.match(lambda item: item == "'", '"\'"')
-    def _matcher_470(self, stream):
-        return stream.action(lambda self: self.lookup('x'))
-    def _matcher_471(self, stream):
+    def _matcher_48(self, stream):
+        return stream.match_list(self._matcher_47)
+    def _matcher_49(self, stream):
         return stream.operator_and([
-            self._matcher_463,
-            self._matcher_466,
-            self._matcher_468,
-            self._matcher_469,
-            self._matcher_470
+            self._matcher_48,
+            self._matcher_31
         ])
-    def _matcher_472(self, stream):
-        return stream.with_scope(self._matcher_471)
-    def _matcher_473(self, stream):
-        return stream.match(lambda item: item == '\\', "'\\\\'")
-    def _matcher_474(self, stream):
-        return self._rules['escape'](stream)
-    def _matcher_475(self, stream):
+    def _matcher_50(self, stream):
+        return stream.with_scope(self._matcher_49)
+    def _matcher_51(self, stream):
+        return stream.bind('y', self._matcher_22(stream))
+    def _matcher_52(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.runtime.lookup('rule')),
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_53(self, stream):
         return stream.operator_and([
-            self._matcher_473,
-            self._matcher_474
+            self._matcher_35,
+            self._matcher_51,
+            self._matcher_52
         ])
-    def _matcher_476(self, stream):
-        return stream.with_scope(self._matcher_475)
-    def _matcher_477(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_478(self, stream):
-        return stream.with_scope(self._matcher_477)
-    def _matcher_479(self, stream):
+    def _matcher_54(self, stream):
+        return stream.with_scope(self._matcher_53)
+    def _matcher_55(self, stream):
+        return lookup_action(stream.scope, 'y')
+    def _matcher_56(self, stream):
+        return stream.operator_and([
+            self._matcher_51,
+            self._matcher_13,
+            self._matcher_55
+        ])
+    def _matcher_57(self, stream):
+        return stream.with_scope(self._matcher_56)
+    def _matcher_58(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.extra.get('match', self.runtime.match)(
+            'dispatch',
+            [
+                materialize(self.runtime.lookup('fuseCharClasses')(
+                    materialize(self.lookup('xs'))
+                ))
+            ]
+        ))
+    def _matcher_59(self, stream):
+        return stream.operator_and([
+            self._matcher_4,
+            self._matcher_58
+        ])
+    def _matcher_60(self, stream):
+        return stream.with_scope(self._matcher_59)
+    def _matcher_61(self, stream):
         return stream.operator_or([
-            self._matcher_476,
-            self._matcher_478
+            self._matcher_57,
+            self._matcher_60
         ])
-    def _matcher_480(self, stream):
-        return stream.match(lambda item: item == '\\', "'\\\\'")
-    def _matcher_481(self, stream):
-        return stream.action(lambda self: '\\')
-    def _matcher_482(self, stream):
+    def _matcher_62(self, stream):
+        return stream.bind('x', self._matcher_22(stream))
+    def _matcher_63(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('binds', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('actions', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.runtime.extra.get('match', self.runtime.match)(
+            'scoped',
+            [
+                materialize(self.lookup('x')),
+                materialize(self.runtime.lookup('binds')),
+                materialize(self.runtime.lookup('actions'))
+            ]
+        ))))
+    def _matcher_64(self, stream):
         return stream.operator_and([
-            self._matcher_480,
-            self._matcher_481
+            self._matcher_62,
+            self._matcher_63
         ])
-    def _matcher_483(self, stream):
-        return stream.with_scope(self._matcher_482)
-    def _matcher_484(self, stream):
-        return stream.match(lambda item: item == "'", '"\'"')
-    def _matcher_485(self, stream):
-        return stream.action(lambda self: "'")
-    def _matcher_486(self, stream):
+    def _matcher_65(self, stream):
+        return stream.with_scope(self._matcher_64)
+    def _matcher_66(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.extra.get('match', self.runtime.match)(
+            'until',
+            [
+                materialize(self.runtime.lookup('star')),
+                materialize(self.lookup('x'))
+            ]
+        ))
+    def _matcher_67(self, stream):
         return stream.operator_and([
-            self._matcher_484,
-            self._matcher_485
+            self._matcher_62,
+            self._matcher_66
         ])
-    def _matcher_487(self, stream):
-        return stream.with_scope(self._matcher_486)
-    def _matcher_488(self, stream):
-        return stream.match(lambda item: item == '"', '\'"\'')
-    def _matcher_489(self, stream):
-        return stream.action(lambda self: '"')
-    def _matcher_490(self, stream):
+    def _matcher_68(self, stream):
+        return stream.with_scope(self._matcher_67)
+    def _matcher_69(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('star', 'Skip', lambda: [
+            'Span',
+            materialize(self.lookup('x'))
+        ]))
+    def _matcher_70(self, stream):
         return stream.operator_and([
-            self._matcher_488,
-            self._matcher_489
+            self._matcher_62,
+            self._matcher_69
         ])
-    def _matcher_491(self, stream):
-        return stream.with_scope(self._matcher_490)
-    def _matcher_492(self, stream):
-        return stream.match(lambda item: item == 'n', "'n'")
-    def _matcher_493(self, stream):
-        return stream.action(lambda self: '\n')
-    def _matcher_494(self, stream):
+    def _matcher_71(self, stream):
+        return stream.with_scope(self._matcher_70)
+    def _matcher_72(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('star', 'Star', lambda: self.bind('', self.runtime.lookup('binds')(
+            materialize(self.lookup('x'))
+        ), lambda: [
+            'Bind',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])))
+    def _matcher_73(self, stream):
         return stream.operator_and([
-            self._matcher_492,
-            self._matcher_493
+            self._matcher_35,
+            self._matcher_51,
+            self._matcher_72
         ])
+    def _matcher_74(self, stream):
+        return stream.with_scope(self._matcher_73)
+    _dispatch_75 = Dispatch(False, {'String': [0], 'Number': [1]}, [])
+    def _matcher_76(self, stream):
+        return stream.match(lambda item: item == 'String', "'String'")
+    def _matcher_77(self, stream):
+        return stream.match(lambda item: item == 'Number', "'Number'")
+    def _matcher_78(self, stream):
+        return stream.operator_dispatch(self._dispatch_75, [
+            self._matcher_76,
+            self._matcher_77
+        ])
+    def _matcher_79(self, stream):
+        return stream.operator_and([
+            self._matcher_78,
+            self._matcher_1
+        ])
+    def _matcher_80(self, stream):
+        return stream.match_list(self._matcher_79)
+    def _matcher_81(self, stream):
+        return stream.operator_span(self._matcher_80)
+    def _matcher_82(self, stream):
+        return stream.bind('x', self._matcher_81(stream))
+    def _matcher_83(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Action',
+            *materialize(self.lookup('x'))
+        ])
+    def _matcher_84(self, stream):
+        return stream.operator_and([
+            self._matcher_82,
+            self._matcher_83
+        ])
+    def _matcher_85(self, stream):
+        return stream.with_scope(self._matcher_84)
+    def _matcher_86(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('', self.runtime.lookup('actions')(
+            materialize(self.lookup('x'))
+        ), lambda: [
+            'Action',
+            materialize(self.lookup('x'))
+        ]))
+    def _matcher_87(self, stream):
+        return stream.operator_and([
+            self._matcher_62,
+            self._matcher_86
+        ])
+    def _matcher_88(self, stream):
+        return stream.with_scope(self._matcher_87)
+    def _matcher_89(self, stream):
+        return stream.operator_or([
+            self._matcher_85,
+            self._matcher_88
+        ])
+    def _matcher_90(self, stream):
+        return stream.bind('z', self._matcher_22(stream))
+    def _matcher_91(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('', self.runtime.lookup('settable')(
+            materialize(self.lookup('x'))
+        ), lambda: [
+            'Set',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y')),
+            materialize(self.lookup('z'))
+        ]))
+    def _matcher_92(self, stream):
+        return stream.operator_and([
+            self._matcher_35,
+            self._matcher_51,
+            self._matcher_90,
+            self._matcher_91
+        ])
+    def _matcher_93(self, stream):
+        return stream.with_scope(self._matcher_92)
+    def _matcher_94(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Call',
+            *materialize(self.lookup('xs'))
+        ])
+    def _matcher_95(self, stream):
+        return stream.operator_and([
+            self._matcher_4,
+            self._matcher_94
+        ])
+    def _matcher_96(self, stream):
+        return stream.with_scope(self._matcher_95)
+    def _matcher_97(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Format',
+            *materialize(self.lookup('xs'))
+        ])
+    def _matcher_98(self, stream):
+        return stream.operator_and([
+            self._matcher_4,
+            self._matcher_97
+        ])
+    def _matcher_99(self, stream):
+        return stream.with_scope(self._matcher_98)
+    def _matcher_100(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'List',
+            *materialize(self.lookup('xs'))
+        ])
+    def _matcher_101(self, stream):
+        return stream.operator_and([
+            self._matcher_4,
+            self._matcher_100
+        ])
+    def _matcher_102(self, stream):
+        return stream.with_scope(self._matcher_101)
+    def _matcher_103(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'ListItem',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_104(self, stream):
+        return stream.operator_and([
+            self._matcher_35,
+            self._matcher_51,
+            self._matcher_103
+        ])
+    def _matcher_105(self, stream):
+        return stream.with_scope(self._matcher_104)
+    def _matcher_106(self, stream):
+        return stream.bind('y', self._matcher_1(stream))
+    def _matcher_107(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Get',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_108(self, stream):
+        return stream.operator_and([
+            self._matcher_62,
+            self._matcher_106,
+            self._matcher_107
+        ])
+    def _matcher_109(self, stream):
+        return stream.with_scope(self._matcher_108)
+    def _matcher_110(self, stream):
+        return self._rule_kind(stream) if stream.memo is None else stream.match_rule(self._rule_kind, 'kind')
+    def _matcher_111(self, stream):
+        return stream.bind('k', self._matcher_110(stream))
+    def _matcher_112(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('y', self.runtime.lookup('resolveLookup')(
+            materialize(self.lookup('x')),
+            materialize(self.runtime.lookup('binds')),
+            materialize(self.runtime.lookup('fields')),
+            materialize(self.lookup('k'))
+        ), lambda: self.bind('', self.runtime.lookup('lookups')(
+            materialize(self.runtime.lookup('y'))
+        ), lambda: self.runtime.lookup('y'))))
+    def _matcher_113(self, stream):
+        return stream.operator_and([
+            self._matcher_111,
+            self._matcher_35,
+            self._matcher_112
+        ])
+    def _matcher_114(self, stream):
+        return stream.with_scope(self._matcher_113)
+    def _matcher_115(self, stream):
+        return self._rule_helper(stream) if stream.memo is None else stream.match_rule(self._rule_helper, 'helper')
+    def _matcher_116(self, stream):
+        return stream.operator_not(self._matcher_115)
+    def _matcher_117(self, stream):
+        return stream.operator_not(self._matcher_116)
+    def _matcher_118(self, stream):
+        return 'HelperLookup'
+    def _matcher_119(self, stream):
+        return stream.operator_and([
+            self._matcher_117,
+            self._matcher_118
+        ])
+    def _matcher_120(self, stream):
+        return 'RuntimeLookup'
+    def _matcher_121(self, stream):
+        return stream.operator_or([
+            self._matcher_119,
+            self._matcher_120
+        ])
+    _dispatch_122 = Dispatch(False, {'increment': [0], 'decrement': [1], 'collector': [2], 'join': [3], 'indent': [4], 'splice': [5], 'concat': [6], 'collectDictList': [7], 'match': [8]}, [])
+    def _matcher_123(self, stream):
+        return stream.match(lambda item: item == 'increment', "'increment'")
+    def _matcher_124(self, stream):
+        return stream.match(lambda item: item == 'decrement', "'decrement'")
+    def _matcher_125(self, stream):
+        return stream.match(lambda item: item == 'collector', "'collector'")
+    def _matcher_126(self, stream):
+        return stream.match(lambda item: item == 'join', "'join'")
+    def _matcher_127(self, stream):
+        return stream.match(lambda item: item == 'indent', "'indent'")
+    def _matcher_128(self, stream):
+        return stream.match(lambda item: item == 'splice', "'splice'")
+    def _matcher_129(self, stream):
+        return stream.match(lambda item: item == 'concat', "'concat'")
+    def _matcher_130(self, stream):
+        return stream.match(lambda item: item == 'collectDictList', "'collectDictList'")
+    def _matcher_131(self, stream):
+        return stream.match(lambda item: item == 'match', "'match'")
+    def _matcher_132(self, stream):
+        return stream.operator_dispatch(self._dispatch_122, [
+            self._matcher_123,
+            self._matcher_124,
+            self._matcher_125,
+            self._matcher_126,
+            self._matcher_127,
+            self._matcher_128,
+            self._matcher_129,
+            self._matcher_130,
+            self._matcher_131
+        ])
+    def _matcher_133(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Not',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_134(self, stream):
+        return stream.operator_and([
+            self._matcher_62,
+            self._matcher_133
+        ])
+    def _matcher_135(self, stream):
+        return stream.with_scope(self._matcher_134)
+    def _matcher_136(self, stream):
+        return stream.match(lambda item: item == 'State', "'State'")
+    def _matcher_137(self, stream):
+        return stream.operator_and([
+            self._matcher_136,
+            self._matcher_35
+        ])
+    def _matcher_138(self, stream):
+        return stream.match_list(self._matcher_137)
+    def _matcher_139(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('', self.runtime.lookup('stateful')(
+            materialize(self.lookup('x'))
+        ), lambda: [
+            'MatchObject',
+            [
+                'State',
+                materialize(self.lookup('x'))
+            ]
+        ]))
+    def _matcher_140(self, stream):
+        return stream.operator_and([
+            self._matcher_138,
+            self._matcher_139
+        ])
+    def _matcher_141(self, stream):
+        return stream.with_scope(self._matcher_140)
+    def _matcher_142(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'MatchObject',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_143(self, stream):
+        return stream.operator_and([
+            self._matcher_35,
+            self._matcher_142
+        ])
+    def _matcher_144(self, stream):
+        return stream.with_scope(self._matcher_143)
+    def _matcher_145(self, stream):
+        return stream.operator_or([
+            self._matcher_141,
+            self._matcher_144
+        ])
+    def _matcher_146(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'MatchList',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_147(self, stream):
+        return stream.operator_and([
+            self._matcher_62,
+            self._matcher_146
+        ])
+    def _matcher_148(self, stream):
+        return stream.with_scope(self._matcher_147)
+    def _matcher_149(self, stream):
+        return stream.operator_and([
+            self._matcher_62,
+            self._matcher_13,
+            self._matcher_31
+        ])
+    def _matcher_150(self, stream):
+        return stream.with_scope(self._matcher_149)
+    def _matcher_151(self, stream):
+        return self._rule_andInner(stream) if stream.memo is None else stream.match_rule(self._rule_andInner, 'andInner')
+    def _matcher_152(self, stream):
+        return stream.operator_star(self._matcher_151)
+    def _matcher_153(self, stream):
+        return stream.bind('xs', self._matcher_152(stream))
+    def _matcher_154(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('fuseLiterals')(
+            materialize(self.runtime.extra.get('concat', self.runtime.concat)(
+                materialize(self.lookup('xs'))
+            ))
+        ))
+    def _matcher_155(self, stream):
+        return stream.operator_and([
+            self._matcher_153,
+            self._matcher_154
+        ])
+    def _matcher_156(self, stream):
+        return stream.with_scope(self._matcher_155)
+    def _matcher_157(self, stream):
+        return stream.operator_or([
+            self._matcher_150,
+            self._matcher_156
+        ])
+    def _matcher_158(self, stream):
+        return stream.match(lambda item: item == 'And', "'And'")
+    def _matcher_159(self, stream):
+        return stream.operator_and([
+            self._matcher_158,
+            self._matcher_4
+        ])
+    def _matcher_160(self, stream):
+        return stream.match_list(self._matcher_159)
+    def _matcher_161(self, stream):
+        return stream.operator_and([
+            self._matcher_160,
+            self._matcher_25
+        ])
+    def _matcher_162(self, stream):
+        return stream.with_scope(self._matcher_161)
+    def _matcher_163(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_164(self, stream):
+        return stream.operator_and([
+            self._matcher_62,
+            self._matcher_163
+        ])
+    def _matcher_165(self, stream):
+        return stream.with_scope(self._matcher_164)
+    def _matcher_166(self, stream):
+        return stream.operator_or([
+            self._matcher_162,
+            self._matcher_165
+        ])
+    def _matcher_167(self, stream):
+        return stream.match_list(self._matcher_1)
+    def _matcher_168(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Scope',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_169(self, stream):
+        return stream.operator_and([
+            self._matcher_35,
+            self._matcher_167,
+            self._matcher_1,
+            self._matcher_168
+        ])
+    def _matcher_170(self, stream):
+        return stream.with_scope(self._matcher_169)
+    def _matcher_171(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Unscoped',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_172(self, stream):
+        return stream.operator_and([
+            self._matcher_35,
+            self._matcher_1,
+            self._matcher_167,
+            self._matcher_171
+        ])
+    def _matcher_173(self, stream):
+        return stream.with_scope(self._matcher_172)
+    def _matcher_174(self, stream):
+        return stream.operator_or([
+            self._matcher_170,
+            self._matcher_173,
+            self._matcher_1
+        ])
+    def _matcher_175(self, stream):
+        return stream.match(lambda item: item == 'Or', "'Or'")
+    def _matcher_176(self, stream):
+        return self._rule_firsts(stream) if stream.memo is None else stream.match_rule(self._rule_firsts, 'firsts')
+    def _matcher_177(self, stream):
+        return stream.bind('ys', self._matcher_176(stream))
+    def _matcher_178(self, stream):
+        return stream.operator_span(self._matcher_177)
+    def _matcher_179(self, stream):
+        return stream.bind('xs', self._matcher_178(stream))
+    def _matcher_180(self, stream):
+        return stream.operator_and([
+            self._matcher_175,
+            self._matcher_179
+        ])
+    def _matcher_181(self, stream):
+        return stream.match_list(self._matcher_180)
+    def _matcher_182(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('dispatchOr')(
+            materialize(self.lookup('xs')),
+            materialize(self.lookup('ys'))
+        ))
+    def _matcher_183(self, stream):
+        return stream.operator_and([
+            self._matcher_181,
+            self._matcher_182
+        ])
+    def _matcher_184(self, stream):
+        return stream.with_scope(self._matcher_183)
+    def _matcher_185(self, stream):
+        return stream.operator_or([
+            self._matcher_184,
+            self._matcher_1
+        ])
+    def _matcher_186(self, stream):
+        return stream.match_list(self._matcher_13)
+    def _matcher_187(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: [
+            [
+                'Parks'
+            ]
+        ])
+    def _matcher_188(self, stream):
+        return stream.operator_and([
+            self._matcher_186,
+            self._matcher_187
+        ])
+    def _matcher_189(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: [
+        
+        ])
+    def _matcher_190(self, stream):
+        return stream.operator_or([
+            self._matcher_188,
+            self._matcher_189
+        ])
+    def _matcher_191(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: [
+            [
+                'Replicable'
+            ]
+        ])
+    def _matcher_192(self, stream):
+        return stream.operator_and([
+            self._matcher_186,
+            self._matcher_191
+        ])
+    def _matcher_193(self, stream):
+        return stream.operator_or([
+            self._matcher_192,
+            self._matcher_189
+        ])
+    def _matcher_194(self, stream):
+        return stream.match(lambda item: item == '_main', "'_main'")
+    def _matcher_195(self, stream):
+        return self._rule_first(stream) if stream.memo is None else stream.match_rule(self._rule_first, 'first')
+    def _matcher_196(self, stream):
+        return stream.bind('xs', self._matcher_195(stream))
+    def _matcher_197(self, stream):
+        return stream.operator_and([
+            self._matcher_1,
+            self._matcher_194,
+            self._matcher_196
+        ])
+    def _matcher_198(self, stream):
+        return stream.match_list(self._matcher_197)
+    def _matcher_199(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('acceptedHeads')(
+            materialize(self.lookup('xs'))
+        ))
+    def _matcher_200(self, stream):
+        return stream.operator_and([
+            self._matcher_198,
+            self._matcher_199
+        ])
+    def _matcher_201(self, stream):
+        return stream.with_scope(self._matcher_200)
+    def _matcher_202(self, stream):
+        return stream.operator_or([
+            self._matcher_201,
+            self._matcher_189
+        ])
+    def _matcher_203(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.runtime.lookup('None'))
+    def _matcher_204(self, stream):
+        return stream.operator_and([
+            self._matcher_1,
+            self._matcher_203
+        ])
+    def _matcher_205(self, stream):
+        return stream.operator_or([
+            self._matcher_195,
+            self._matcher_204
+        ])
+    def _matcher_206(self, stream):
+        return stream.operator_star(self._matcher_205)
+    def _matcher_207(self, stream):
+        return stream.bind('xs', self._matcher_206(stream))
+    def _matcher_208(self, stream):
+        return stream.operator_and([
+            self._matcher_207,
+            self._matcher_13,
+            self._matcher_25
+        ])
+    def _matcher_209(self, stream):
+        return stream.with_scope(self._matcher_208)
+    _dispatch_210 = Dispatch(True, {'Scope': [0], 'Span': [0], 'Unscoped': [0], 'Bind': [1], 'Dispatch': [2], 'And': [3], 'Or': [4], 'MatchList': [5], 'MatchLiteral': [6], 'MatchObject': [7, 8]}, [])
+    _dispatch_211 = Dispatch(False, {'Scope': [0], 'Unscoped': [1], 'Span': [2]}, [])
+    def _matcher_212(self, stream):
+        return stream.match(lambda item: item == 'Scope', "'Scope'")
+    def _matcher_213(self, stream):
+        return stream.match(lambda item: item == 'Unscoped', "'Unscoped'")
+    def _matcher_214(self, stream):
+        return stream.match(lambda item: item == 'Span', "'Span'")
+    def _matcher_215(self, stream):
+        return stream.operator_dispatch(self._dispatch_211, [
+            self._matcher_212,
+            self._matcher_213,
+            self._matcher_214
+        ])
+    def _matcher_216(self, stream):
+        return stream.bind('x', self._matcher_195(stream))
+    def _matcher_217(self, stream):
+        return stream.operator_and([
+            self._matcher_215,
+            self._matcher_216
+        ])
+    def _matcher_218(self, stream):
+        return stream.match_list(self._matcher_217)
+    def _matcher_219(self, stream):
+        return stream.operator_and([
+            self._matcher_218,
+            self._matcher_31
+        ])
+    def _matcher_220(self, stream):
+        return stream.with_scope(self._matcher_219)
+    def _matcher_221(self, stream):
+        return stream.match(lambda item: item == 'Bind', "'Bind'")
+    def _matcher_222(self, stream):
+        return stream.operator_and([
+            self._matcher_221,
+            self._matcher_1,
+            self._matcher_216
+        ])
+    def _matcher_223(self, stream):
+        return stream.match_list(self._matcher_222)
+    def _matcher_224(self, stream):
+        return stream.operator_and([
+            self._matcher_223,
+            self._matcher_31
+        ])
+    def _matcher_225(self, stream):
+        return stream.with_scope(self._matcher_224)
+    def _matcher_226(self, stream):
+        return stream.match(lambda item: item == 'Dispatch', "'Dispatch'")
+    _regex_227 = Regex('...', 'none')
+    def _matcher_228(self, stream):
+        return stream.operator_and([
+            self._matcher_1,
+            self._matcher_1,
+            self._matcher_1
+        ])
+    def _matcher_229(self, stream):
+        return stream.match_regex(self._regex_227, self._matcher_228)
+    def _matcher_230(self, stream):
+        return stream.operator_and([
+            self._matcher_226,
+            self._matcher_229,
+            self._matcher_216
+        ])
+    def _matcher_231(self, stream):
+        return stream.match_list(self._matcher_230)
+    def _matcher_232(self, stream):
+        return stream.operator_and([
+            self._matcher_231,
+            self._matcher_31
+        ])
+    def _matcher_233(self, stream):
+        return stream.with_scope(self._matcher_232)
+    def _matcher_234(self, stream):
+        return stream.match(lambda item: item == 'Action', "'Action'")
+    def _matcher_235(self, stream):
+        return stream.operator_and([
+            self._matcher_234,
+            self._matcher_1
+        ])
+    def _matcher_236(self, stream):
+        return stream.match_list(self._matcher_235)
+    def _matcher_237(self, stream):
+        return stream.operator_star(self._matcher_236)
+    def _matcher_238(self, stream):
+        return stream.operator_and([
+            self._matcher_158,
+            self._matcher_237,
+            self._matcher_216
+        ])
+    def _matcher_239(self, stream):
+        return stream.match_list(self._matcher_238)
+    def _matcher_240(self, stream):
+        return stream.operator_and([
+            self._matcher_239,
+            self._matcher_31
+        ])
+    def _matcher_241(self, stream):
+        return stream.with_scope(self._matcher_240)
+    def _matcher_242(self, stream):
+        return stream.operator_star(self._matcher_195)
+    def _matcher_243(self, stream):
+        return stream.bind('xs', self._matcher_242(stream))
+    def _matcher_244(self, stream):
+        return stream.operator_and([
+            self._matcher_175,
+            self._matcher_243,
+            self._matcher_13
+        ])
+    def _matcher_245(self, stream):
+        return stream.match_list(self._matcher_244)
+    def _matcher_246(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.extra.get('concat', self.runtime.concat)(
+            materialize(self.lookup('xs'))
+        ))
+    def _matcher_247(self, stream):
+        return stream.operator_and([
+            self._matcher_245,
+            self._matcher_246
+        ])
+    def _matcher_248(self, stream):
+        return stream.with_scope(self._matcher_247)
+    def _matcher_249(self, stream):
+        return stream.match(lambda item: item == 'MatchList', "'MatchList'")
+    def _matcher_250(self, stream):
+        return stream.operator_and([
+            self._matcher_249,
+            self._matcher_216
+        ])
+    def _matcher_251(self, stream):
+        return stream.match_list(self._matcher_250)
+    def _matcher_252(self, stream):
+        return stream.operator_and([
+            self._matcher_251,
+            self._matcher_163
+        ])
+    def _matcher_253(self, stream):
+        return stream.with_scope(self._matcher_252)
+    def _matcher_254(self, stream):
+        return stream.match(lambda item: item == 'MatchLiteral', "'MatchLiteral'")
+    def _matcher_255(self, stream):
+        return stream.match_list(self._matcher_35)
+    def _matcher_256(self, stream):
+        return stream.operator_and([
+            self._matcher_254,
+            self._matcher_255
+        ])
+    def _matcher_257(self, stream):
+        return stream.match_list(self._matcher_256)
+    def _matcher_258(self, stream):
+        return stream.operator_and([
+            self._matcher_257,
+            self._matcher_163
+        ])
+    def _matcher_259(self, stream):
+        return stream.with_scope(self._matcher_258)
+    def _matcher_260(self, stream):
+        return stream.match(lambda item: item == 'MatchObject', "'MatchObject'")
+    def _matcher_261(self, stream):
+        return stream.match(lambda item: item == 'Eq', "'Eq'")
+    def _matcher_262(self, stream):
+        return stream.operator_and([
+            self._matcher_261,
+            self._matcher_35
+        ])
+    def _matcher_263(self, stream):
+        return stream.match_list(self._matcher_262)
+    def _matcher_264(self, stream):
+        return stream.operator_and([
+            self._matcher_260,
+            self._matcher_263
+        ])
+    def _matcher_265(self, stream):
+        return stream.match_list(self._matcher_264)
+    def _matcher_266(self, stream):
+        return stream.operator_and([
+            self._matcher_265,
+            self._matcher_163
+        ])
+    def _matcher_267(self, stream):
+        return stream.with_scope(self._matcher_266)
+    def _matcher_268(self, stream):
+        return stream.match(lambda item: item == 'Class', "'Class'")
+    def _matcher_269(self, stream):
+        return stream.bind('xs', self._matcher_1(stream))
+    def _matcher_270(self, stream):
+        return stream.operator_and([
+            self._matcher_268,
+            self._matcher_269,
+            self._matcher_1,
+            self._matcher_186
+        ])
+    def _matcher_271(self, stream):
+        return stream.match_list(self._matcher_270)
+    def _matcher_272(self, stream):
+        return stream.operator_and([
+            self._matcher_260,
+            self._matcher_271
+        ])
+    def _matcher_273(self, stream):
+        return stream.match_list(self._matcher_272)
+    def _matcher_274(self, stream):
+        return stream.operator_and([
+            self._matcher_273,
+            self._matcher_25
+        ])
+    def _matcher_275(self, stream):
+        return stream.with_scope(self._matcher_274)
+    def _matcher_276(self, stream):
+        return stream.operator_dispatch(self._dispatch_210, [
+            self._matcher_220,
+            self._matcher_225,
+            self._matcher_233,
+            self._matcher_241,
+            self._matcher_248,
+            self._matcher_253,
+            self._matcher_259,
+            self._matcher_267,
+            self._matcher_275
+        ])
+    def _matcher_277(self, stream):
+        return stream.bind('k', self._matcher_1(stream))
+    def _matcher_278(self, stream):
+        return self._rule_loopUntil(stream) if stream.memo is None else stream.match_rule(self._rule_loopUntil, 'loopUntil')
+    def _matcher_279(self, stream):
+        return stream.operator_and([
+            self._matcher_212,
+            self._matcher_278
+        ])
+    def _matcher_280(self, stream):
+        return stream.match_list(self._matcher_279)
+    def _matcher_281(self, stream):
+        return stream.operator_or([
+            self._matcher_280,
+            self._matcher_278
+        ])
+    def _matcher_282(self, stream):
+        return stream.bind('x', self._matcher_281(stream))
+    def _matcher_283(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.runtime.join([
+                self.lookup('k'),
+                'Until'
+            ])),
+            *materialize(self.lookup('x'))
+        ])
+    def _matcher_284(self, stream):
+        return stream.operator_and([
+            self._matcher_277,
+            self._matcher_282,
+            self._matcher_283
+        ])
+    def _matcher_285(self, stream):
+        return stream.with_scope(self._matcher_284)
+    def _matcher_286(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.lookup('k')),
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_287(self, stream):
+        return stream.operator_and([
+            self._matcher_277,
+            self._matcher_35,
+            self._matcher_286
+        ])
+    def _matcher_288(self, stream):
+        return stream.with_scope(self._matcher_287)
+    def _matcher_289(self, stream):
+        return stream.operator_or([
+            self._matcher_285,
+            self._matcher_288
+        ])
+    def _matcher_290(self, stream):
+        return stream.match(lambda item: item == 'Not', "'Not'")
+    def _matcher_291(self, stream):
+        return self._rule_stop(stream) if stream.memo is None else stream.match_rule(self._rule_stop, 'stop')
+    def _matcher_292(self, stream):
+        return stream.bind('x', self._matcher_291(stream))
+    def _matcher_293(self, stream):
+        return stream.operator_and([
+            self._matcher_290,
+            self._matcher_292
+        ])
+    def _matcher_294(self, stream):
+        return stream.match_list(self._matcher_293)
+    def _matcher_295(self, stream):
+        return stream.match(lambda item: item == 'Any', "'Any'")
+    def _matcher_296(self, stream):
+        return stream.match_list(self._matcher_295)
+    def _matcher_297(self, stream):
+        return stream.operator_and([
+            self._matcher_260,
+            self._matcher_296
+        ])
+    def _matcher_298(self, stream):
+        return stream.match_list(self._matcher_297)
+    def _matcher_299(self, stream):
+        return stream.operator_and([
+            self._matcher_158,
+            self._matcher_294,
+            self._matcher_298,
+            self._matcher_13
+        ])
+    def _matcher_300(self, stream):
+        return stream.match_list(self._matcher_299)
+    def _matcher_301(self, stream):
+        return stream.operator_and([
+            self._matcher_300,
+            self._matcher_31
+        ])
+    def _matcher_302(self, stream):
+        return stream.with_scope(self._matcher_301)
+    _dispatch_303 = Dispatch(True, {'MatchLiteral': [0], 'MatchObject': [1, 2]}, [])
+    _regex_304 = Regex('(?:.)*+', 'none')
+    def _matcher_305(self, stream):
+        return stream.operator_skip(self._matcher_1)
+    def _matcher_306(self, stream):
+        return stream.match_regex(self._regex_304, self._matcher_305)
+    def _matcher_307(self, stream):
+        return stream.operator_and([
+            self._matcher_35,
+            self._matcher_306
+        ])
+    def _matcher_308(self, stream):
+        return stream.match_list(self._matcher_307)
+    def _matcher_309(self, stream):
+        return stream.operator_span(self._matcher_308)
+    def _matcher_310(self, stream):
+        return stream.bind('xs', self._matcher_309(stream))
+    def _matcher_311(self, stream):
+        return stream.operator_and([
+            self._matcher_254,
+            self._matcher_310
+        ])
+    def _matcher_312(self, stream):
+        return stream.match_list(self._matcher_311)
+    def _matcher_313(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.lookup('xs')),
+            materialize(self.runtime.lookup('repr')(
+                materialize(self.lookup('x'))
+            )),
+            [
+            
+            ]
+        ])
+    def _matcher_314(self, stream):
+        return stream.operator_and([
+            self._matcher_312,
+            self._matcher_313
+        ])
+    def _matcher_315(self, stream):
+        return stream.with_scope(self._matcher_314)
+    def _matcher_316(self, stream):
+        return stream.operator_and([
+            self._matcher_268,
+            self._matcher_269,
+            self._matcher_35,
+            self._matcher_186,
+            self._matcher_106
+        ])
+    def _matcher_317(self, stream):
+        return stream.match_list(self._matcher_316)
+    def _matcher_318(self, stream):
+        return stream.operator_and([
+            self._matcher_260,
+            self._matcher_317
+        ])
+    def _matcher_319(self, stream):
+        return stream.match_list(self._matcher_318)
+    def _matcher_320(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.lookup('xs')),
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_321(self, stream):
+        return stream.operator_and([
+            self._matcher_319,
+            self._matcher_320
+        ])
+    def _matcher_322(self, stream):
+        return stream.with_scope(self._matcher_321)
+    def _matcher_323(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            [
+                [
+                    materialize(self.lookup('x'))
+                ]
+            ],
+            materialize(self.runtime.lookup('repr')(
+                materialize(self.lookup('x'))
+            )),
+            [
+            
+            ]
+        ])
+    def _matcher_324(self, stream):
+        return stream.operator_and([
+            self._matcher_265,
+            self._matcher_323
+        ])
+    def _matcher_325(self, stream):
+        return stream.with_scope(self._matcher_324)
+    def _matcher_326(self, stream):
+        return stream.operator_dispatch(self._dispatch_303, [
+            self._matcher_315,
+            self._matcher_322,
+            self._matcher_325
+        ])
+    def _matcher_327(self, stream):
+        return self._rule_regexRule(stream) if stream.memo is None else stream.match_rule(self._rule_regexRule, 'regexRule')
+    def _matcher_328(self, stream):
+        return stream.operator_star(self._matcher_327)
+    def _matcher_329(self, stream):
+        return stream.bind('xs', self._matcher_328(stream))
+    def _matcher_330(self, stream):
+        return stream.operator_and([
+            self._matcher_329,
+            self._matcher_13,
+            self._matcher_246
+        ])
+    def _matcher_331(self, stream):
+        return stream.with_scope(self._matcher_330)
+    def _matcher_332(self, stream):
+        return stream.match(lambda item: item == 'Example', "'Example'")
+    def _matcher_333(self, stream):
+        return stream.operator_not(self._matcher_332)
+    def _matcher_334(self, stream):
+        return self._rule_used(stream) if stream.memo is None else stream.match_rule(self._rule_used, 'used')
+    def _matcher_335(self, stream):
+        return stream.bind('z', self._matcher_334(stream))
+    def _matcher_336(self, stream):
+        return stream.operator_and([
+            self._matcher_333,
+            self._matcher_35,
+            self._matcher_106,
+            self._matcher_335
+        ])
+    def _matcher_337(self, stream):
+        return stream.match_list(self._matcher_336)
+    def _matcher_338(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            [
+                materialize(self.lookup('x')),
+                materialize(self.lookup('y')),
+                materialize(self.lookup('z'))
+            ]
+        ])
+    def _matcher_339(self, stream):
+        return stream.operator_and([
+            self._matcher_337,
+            self._matcher_338
+        ])
+    def _matcher_340(self, stream):
+        return stream.with_scope(self._matcher_339)
+    def _matcher_341(self, stream):
+        return stream.operator_and([
+            self._matcher_35,
+            self._matcher_163
+        ])
+    def _matcher_342(self, stream):
+        return stream.with_scope(self._matcher_341)
+    def _matcher_343(self, stream):
+        return stream.operator_or([
+            self._matcher_340,
+            self._matcher_342
+        ])
+    def _matcher_344(self, stream):
+        return self._rule_trivial(stream) if stream.memo is None else stream.match_rule(self._rule_trivial, 'trivial')
+    def _matcher_345(self, stream):
+        return stream.operator_not(self._matcher_344)
+    def _matcher_346(self, stream):
+        return stream.operator_not(self._matcher_345)
+    def _matcher_347(self, stream):
+        return stream.operator_and([
+            self._matcher_346,
+            self._matcher_1
+        ])
+    def _matcher_348(self, stream):
+        return self._rule_opaque(stream) if stream.memo is None else stream.match_rule(self._rule_opaque, 'opaque')
+    def _matcher_349(self, stream):
+        return stream.operator_not(self._matcher_348)
+    def _matcher_350(self, stream):
+        return stream.operator_not(self._matcher_349)
+    def _matcher_351(self, stream):
+        return self._rule_usedNode(stream) if stream.memo is None else stream.match_rule(self._rule_usedNode, 'usedNode')
+    def _matcher_352(self, stream):
+        return stream.operator_and([
+            self._matcher_350,
+            self._matcher_351
+        ])
+    def _matcher_353(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.extra.get('match', self.runtime.match)(
+            'pickUsed',
+            [
+                *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                    'usedRegex',
+                    [
+                        materialize(self.lookup('x'))
+                    ]
+                )),
+                materialize(self.lookup('x'))
+            ]
+        ))
+    def _matcher_354(self, stream):
+        return stream.operator_and([
+            self._matcher_35,
+            self._matcher_353
+        ])
+    def _matcher_355(self, stream):
+        return stream.with_scope(self._matcher_354)
+    def _matcher_356(self, stream):
+        return stream.operator_or([
+            self._matcher_347,
+            self._matcher_352,
+            self._matcher_355
+        ])
+    def _matcher_357(self, stream):
+        return self._rule_unusedNode(stream) if stream.memo is None else stream.match_rule(self._rule_unusedNode, 'unusedNode')
+    def _matcher_358(self, stream):
+        return stream.operator_and([
+            self._matcher_350,
+            self._matcher_357
+        ])
+    def _matcher_359(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.extra.get('match', self.runtime.match)(
+            'pickUnused',
+            [
+                *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                    'unusedRegex',
+                    [
+                        materialize(self.lookup('x'))
+                    ]
+                )),
+                materialize(self.lookup('x'))
+            ]
+        ))
+    def _matcher_360(self, stream):
+        return stream.operator_and([
+            self._matcher_35,
+            self._matcher_359
+        ])
+    def _matcher_361(self, stream):
+        return stream.with_scope(self._matcher_360)
+    def _matcher_362(self, stream):
+        return stream.operator_or([
+            self._matcher_347,
+            self._matcher_358,
+            self._matcher_361
+        ])
+    def _matcher_363(self, stream):
+        return self._rule_value(stream) if stream.memo is None else stream.match_rule(self._rule_value, 'value')
+    def _matcher_364(self, stream):
+        return stream.bind('x', self._matcher_363(stream))
+    def _matcher_365(self, stream):
+        return stream.operator_span(self._matcher_364)
+    def _matcher_366(self, stream):
+        return stream.bind('y', self._matcher_365(stream))
+    def _matcher_367(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('regexMatch')(
+            materialize(self.lookup('y')),
+            materialize(self.lookup('x')),
+            materialize(self.runtime.lookup('regexTrees'))
+        ))
+    def _matcher_368(self, stream):
+        return stream.operator_and([
+            self._matcher_366,
+            self._matcher_367
+        ])
+    def _matcher_369(self, stream):
+        return stream.with_scope(self._matcher_368)
+    def _matcher_370(self, stream):
+        return stream.operator_or([
+            self._matcher_369,
+            self._matcher_189
+        ])
+    def _matcher_371(self, stream):
+        return self._rule_skip(stream) if stream.memo is None else stream.match_rule(self._rule_skip, 'skip')
+    def _matcher_372(self, stream):
+        return stream.bind('x', self._matcher_371(stream))
+    def _matcher_373(self, stream):
+        return stream.operator_span(self._matcher_372)
+    def _matcher_374(self, stream):
+        return stream.bind('y', self._matcher_373(stream))
+    def _matcher_375(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('regexMatch')(
+            materialize(self.lookup('y')),
+            [
+                'Capture',
+                'none',
+                materialize(self.lookup('x'))
+            ],
+            materialize(self.runtime.lookup('regexTrees'))
+        ))
+    def _matcher_376(self, stream):
+        return stream.operator_and([
+            self._matcher_374,
+            self._matcher_375
+        ])
+    def _matcher_377(self, stream):
+        return stream.with_scope(self._matcher_376)
+    def _matcher_378(self, stream):
+        return stream.operator_or([
+            self._matcher_377,
+            self._matcher_189
+        ])
+    def _matcher_379(self, stream):
+        return self._rule_found(stream) if stream.memo is None else stream.match_rule(self._rule_found, 'found')
+    def _matcher_380(self, stream):
+        return stream.bind('x', self._matcher_379(stream))
+    def _matcher_381(self, stream):
+        return stream.operator_and([
+            self._matcher_380,
+            self._matcher_1,
+            self._matcher_31
+        ])
+    def _matcher_382(self, stream):
+        return stream.with_scope(self._matcher_381)
+    def _matcher_383(self, stream):
+        return stream.operator_or([
+            self._matcher_382,
+            self._matcher_351
+        ])
+    def _matcher_384(self, stream):
+        return stream.operator_or([
+            self._matcher_382,
+            self._matcher_357
+        ])
+    def _matcher_385(self, stream):
+        return stream.match(lambda item: item == 'MatchRegex', "'MatchRegex'")
+    _regex_386 = Regex('(?:.)*+', 'chars')
+    def _matcher_387(self, stream):
+        return stream.operator_star(self._matcher_1)
+    def _matcher_388(self, stream):
+        return stream.match_regex(self._regex_386, self._matcher_387)
+    def _matcher_389(self, stream):
+        return stream.bind('xs', self._matcher_388(stream))
+    def _matcher_390(self, stream):
+        return stream.operator_and([
+            self._matcher_385,
+            self._matcher_389
+        ])
+    def _matcher_391(self, stream):
+        return stream.match_list(self._matcher_390)
+    def _matcher_392(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'MatchRegex',
+            *materialize(self.lookup('xs'))
+        ])
+    def _matcher_393(self, stream):
+        return stream.operator_and([
+            self._matcher_391,
+            self._matcher_392
+        ])
+    def _matcher_394(self, stream):
+        return stream.with_scope(self._matcher_393)
+    _dispatch_395 = Dispatch(True, {'And': [0, 3], 'MatchList': [1, 3], 'Or': [1, 3], 'Scope': [1, 3], 'Star': [1, 3], 'Unscoped': [1, 3], 'Dispatch': [2, 3]}, [3])
+    def _matcher_396(self, stream):
+        return self._rule_groups(stream) if stream.memo is None else stream.match_rule(self._rule_groups, 'groups')
+    def _matcher_397(self, stream):
+        return stream.bind('xs', self._matcher_396(stream))
+    def _matcher_398(self, stream):
+        return stream.operator_and([
+            self._matcher_158,
+            self._matcher_397
+        ])
+    def _matcher_399(self, stream):
+        return stream.match_list(self._matcher_398)
+    def _matcher_400(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'And',
+            *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                'usedGroups',
+                materialize(self.lookup('xs'))
+            ))
+        ])
+    def _matcher_401(self, stream):
+        return stream.operator_and([
+            self._matcher_399,
+            self._matcher_400
+        ])
+    def _matcher_402(self, stream):
+        return stream.with_scope(self._matcher_401)
+    _dispatch_403 = Dispatch(False, {'Or': [0], 'Scope': [1], 'Unscoped': [2], 'Star': [3], 'MatchList': [4]}, [])
+    def _matcher_404(self, stream):
+        return stream.match(lambda item: item == 'Star', "'Star'")
+    def _matcher_405(self, stream):
+        return stream.operator_dispatch(self._dispatch_403, [
+            self._matcher_175,
+            self._matcher_212,
+            self._matcher_213,
+            self._matcher_404,
+            self._matcher_249
+        ])
+    def _matcher_406(self, stream):
+        return stream.bind('x', self._matcher_405(stream))
+    def _matcher_407(self, stream):
+        return stream.operator_star(self._matcher_334)
+    def _matcher_408(self, stream):
+        return stream.bind('ys', self._matcher_407(stream))
+    def _matcher_409(self, stream):
+        return stream.operator_and([
+            self._matcher_406,
+            self._matcher_408
+        ])
+    def _matcher_410(self, stream):
+        return stream.match_list(self._matcher_409)
+    def _matcher_411(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.lookup('x')),
+            *materialize(self.lookup('ys'))
+        ])
+    def _matcher_412(self, stream):
+        return stream.operator_and([
+            self._matcher_410,
+            self._matcher_411
+        ])
+    def _matcher_413(self, stream):
+        return stream.with_scope(self._matcher_412)
+    def _matcher_414(self, stream):
+        return stream.bind('z', self._matcher_1(stream))
+    def _matcher_415(self, stream):
+        return stream.bind('w', self._matcher_334(stream))
+    def _matcher_416(self, stream):
+        return stream.operator_and([
+            self._matcher_226,
+            self._matcher_35,
+            self._matcher_106,
+            self._matcher_414,
+            self._matcher_415
+        ])
+    def _matcher_417(self, stream):
+        return stream.match_list(self._matcher_416)
+    def _matcher_418(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Dispatch',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y')),
+            materialize(self.lookup('z')),
+            materialize(self.lookup('w'))
+        ])
+    def _matcher_419(self, stream):
+        return stream.operator_and([
+            self._matcher_417,
+            self._matcher_418
+        ])
+    def _matcher_420(self, stream):
+        return stream.with_scope(self._matcher_419)
+    def _matcher_421(self, stream):
+        return self._rule_fixedNode(stream) if stream.memo is None else stream.match_rule(self._rule_fixedNode, 'fixedNode')
+    def _matcher_422(self, stream):
+        return stream.operator_dispatch(self._dispatch_395, [
+            self._matcher_402,
+            self._matcher_413,
+            self._matcher_420,
+            self._matcher_421
+        ])
+    def _matcher_423(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'And',
+            *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                'unusedGroups',
+                materialize(self.lookup('xs'))
+            ))
+        ])
+    def _matcher_424(self, stream):
+        return stream.operator_and([
+            self._matcher_399,
+            self._matcher_423
+        ])
+    def _matcher_425(self, stream):
+        return stream.with_scope(self._matcher_424)
+    def _matcher_426(self, stream):
+        return self._rule_unused(stream) if stream.memo is None else stream.match_rule(self._rule_unused, 'unused')
+    def _matcher_427(self, stream):
+        return stream.operator_star(self._matcher_426)
+    def _matcher_428(self, stream):
+        return stream.bind('ys', self._matcher_427(stream))
+    def _matcher_429(self, stream):
+        return stream.operator_and([
+            self._matcher_406,
+            self._matcher_428
+        ])
+    def _matcher_430(self, stream):
+        return stream.match_list(self._matcher_429)
+    def _matcher_431(self, stream):
+        return stream.operator_and([
+            self._matcher_430,
+            self._matcher_411
+        ])
+    def _matcher_432(self, stream):
+        return stream.with_scope(self._matcher_431)
+    def _matcher_433(self, stream):
+        return stream.bind('w', self._matcher_426(stream))
+    def _matcher_434(self, stream):
+        return stream.operator_and([
+            self._matcher_226,
+            self._matcher_35,
+            self._matcher_106,
+            self._matcher_414,
+            self._matcher_433
+        ])
+    def _matcher_435(self, stream):
+        return stream.match_list(self._matcher_434)
+    def _matcher_436(self, stream):
+        return stream.operator_and([
+            self._matcher_435,
+            self._matcher_418
+        ])
+    def _matcher_437(self, stream):
+        return stream.with_scope(self._matcher_436)
+    def _matcher_438(self, stream):
+        return stream.operator_dispatch(self._dispatch_395, [
+            self._matcher_425,
+            self._matcher_432,
+            self._matcher_437,
+            self._matcher_421
+        ])
+    _dispatch_439 = Dispatch(True, {'Not': [0, 2], 'Skip': [0, 2], 'Span': [0, 2], 'Bind': [1, 2]}, [2])
+    _dispatch_440 = Dispatch(False, {'Skip': [0], 'Span': [1], 'Not': [2]}, [])
+    def _matcher_441(self, stream):
+        return stream.match(lambda item: item == 'Skip', "'Skip'")
+    def _matcher_442(self, stream):
+        return stream.operator_dispatch(self._dispatch_440, [
+            self._matcher_441,
+            self._matcher_214,
+            self._matcher_290
+        ])
+    def _matcher_443(self, stream):
+        return stream.bind('x', self._matcher_442(stream))
+    def _matcher_444(self, stream):
+        return stream.bind('y', self._matcher_426(stream))
+    def _matcher_445(self, stream):
+        return stream.operator_and([
+            self._matcher_443,
+            self._matcher_444
+        ])
+    def _matcher_446(self, stream):
+        return stream.match_list(self._matcher_445)
+    def _matcher_447(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_448(self, stream):
+        return stream.operator_and([
+            self._matcher_446,
+            self._matcher_447
+        ])
+    def _matcher_449(self, stream):
+        return stream.with_scope(self._matcher_448)
+    def _matcher_450(self, stream):
+        return stream.bind('y', self._matcher_334(stream))
+    def _matcher_451(self, stream):
+        return stream.operator_and([
+            self._matcher_221,
+            self._matcher_35,
+            self._matcher_450
+        ])
+    def _matcher_452(self, stream):
+        return stream.match_list(self._matcher_451)
+    def _matcher_453(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Bind',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_454(self, stream):
+        return stream.operator_and([
+            self._matcher_452,
+            self._matcher_453
+        ])
+    def _matcher_455(self, stream):
+        return stream.with_scope(self._matcher_454)
+    def _matcher_456(self, stream):
+        return stream.operator_dispatch(self._dispatch_439, [
+            self._matcher_449,
+            self._matcher_455,
+            self._matcher_1
+        ])
+    def _matcher_457(self, stream):
+        return stream.operator_or([
+            self._matcher_371,
+            self._matcher_204
+        ])
+    def _matcher_458(self, stream):
+        return stream.operator_star(self._matcher_457)
+    def _matcher_459(self, stream):
+        return stream.bind('xs', self._matcher_458(stream))
+    def _matcher_460(self, stream):
+        return stream.operator_span(self._matcher_459)
+    def _matcher_461(self, stream):
+        return stream.bind('ys', self._matcher_460(stream))
+    def _matcher_462(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('regexGroups')(
+            materialize(self.lookup('ys')),
+            materialize(self.lookup('xs')),
+            materialize(self.runtime.lookup('regexTrees'))
+        ))
+    def _matcher_463(self, stream):
+        return stream.operator_and([
+            self._matcher_461,
+            self._matcher_13,
+            self._matcher_462
+        ])
+    def _matcher_464(self, stream):
+        return stream.with_scope(self._matcher_463)
+    def _matcher_465(self, stream):
+        return stream.operator_and([
+            self._matcher_13,
+            self._matcher_189
+        ])
+    _regex_466 = Regex('(?!.(?!.))', 'none')
+    def _matcher_467(self, stream):
+        return stream.operator_and([
+            self._matcher_1,
+            self._matcher_13
+        ])
+    def _matcher_468(self, stream):
+        return stream.operator_not(self._matcher_467)
+    def _matcher_469(self, stream):
+        return stream.match_regex(self._regex_466, self._matcher_468)
+    def _matcher_470(self, stream):
+        return self._rule_unusedGroup(stream) if stream.memo is None else stream.match_rule(self._rule_unusedGroup, 'unusedGroup')
+    def _matcher_471(self, stream):
+        return stream.operator_and([
+            self._matcher_469,
+            self._matcher_470
+        ])
+    def _matcher_472(self, stream):
+        return stream.operator_star(self._matcher_471)
+    def _matcher_473(self, stream):
+        return stream.bind('xs', self._matcher_472(stream))
+    def _matcher_474(self, stream):
+        return self._rule_usedGroup(stream) if stream.memo is None else stream.match_rule(self._rule_usedGroup, 'usedGroup')
+    def _matcher_475(self, stream):
+        return stream.bind('y', self._matcher_474(stream))
+    def _matcher_476(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            *splice_items(2, self.lookup('xs')),
+            *materialize(self.lookup('y'))
+        ])
+    def _matcher_477(self, stream):
+        return stream.operator_and([
+            self._matcher_473,
+            self._matcher_475,
+            self._matcher_476
+        ])
+    def _matcher_478(self, stream):
+        return stream.with_scope(self._matcher_477)
+    def _matcher_479(self, stream):
+        return stream.operator_or([
+            self._matcher_465,
+            self._matcher_478
+        ])
+    def _matcher_480(self, stream):
+        return stream.operator_star(self._matcher_470)
+    def _matcher_481(self, stream):
+        return stream.bind('xs', self._matcher_480(stream))
+    def _matcher_482(self, stream):
+        return stream.operator_and([
+            self._matcher_481,
+            self._matcher_13,
+            self._matcher_246
+        ])
+    def _matcher_483(self, stream):
+        return stream.with_scope(self._matcher_482)
+    _dispatch_484 = Dispatch(True, {'Run': [0], 'Node': [1]}, [])
+    def _matcher_485(self, stream):
+        return stream.match(lambda item: item == 'Run', "'Run'")
+    def _matcher_486(self, stream):
+        return stream.operator_and([
+            self._matcher_485,
+            self._matcher_389
+        ])
+    def _matcher_487(self, stream):
+        return stream.match_list(self._matcher_486)
+    def _matcher_488(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.extra.get('match', self.runtime.match)(
+            'pickUsedRun',
+            [
+                *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                    'usedRegex',
+                    [
+                        [
+                            'And',
+                            *materialize(self.lookup('xs'))
+                        ]
+                    ]
+                )),
+                materialize(self.lookup('xs'))
+            ]
+        ))
+    def _matcher_489(self, stream):
+        return stream.operator_and([
+            self._matcher_487,
+            self._matcher_488
+        ])
+    def _matcher_490(self, stream):
+        return stream.with_scope(self._matcher_489)
+    def _matcher_491(self, stream):
+        return stream.match(lambda item: item == 'Node', "'Node'")
+    def _matcher_492(self, stream):
+        return stream.bind('x', self._matcher_334(stream))
+    def _matcher_493(self, stream):
+        return stream.operator_and([
+            self._matcher_491,
+            self._matcher_492
+        ])
+    def _matcher_494(self, stream):
+        return stream.match_list(self._matcher_493)
     def _matcher_495(self, stream):
-        return stream.with_scope(self._matcher_494)
+        return stream.operator_and([
+            self._matcher_494,
+            self._matcher_163
+        ])
     def _matcher_496(self, stream):
+        return stream.with_scope(self._matcher_495)
+    def _matcher_497(self, stream):
+        return stream.operator_dispatch(self._dispatch_484, [
+            self._matcher_490,
+            self._matcher_496
+        ])
+    def _matcher_498(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.extra.get('match', self.runtime.match)(
+            'pickUnusedRun',
+            [
+                *materialize(self.runtime.extra.get('match', self.runtime.match)(
+                    'unusedRegex',
+                    [
+                        [
+                            'And',
+                            *materialize(self.lookup('xs'))
+                        ]
+                    ]
+                )),
+                materialize(self.lookup('xs'))
+            ]
+        ))
+    def _matcher_499(self, stream):
+        return stream.operator_and([
+            self._matcher_487,
+            self._matcher_498
+        ])
+    def _matcher_500(self, stream):
+        return stream.with_scope(self._matcher_499)
+    def _matcher_501(self, stream):
+        return stream.bind('x', self._matcher_426(stream))
+    def _matcher_502(self, stream):
+        return stream.operator_and([
+            self._matcher_491,
+            self._matcher_501
+        ])
+    def _matcher_503(self, stream):
+        return stream.match_list(self._matcher_502)
+    def _matcher_504(self, stream):
+        return stream.operator_and([
+            self._matcher_503,
+            self._matcher_163
+        ])
+    def _matcher_505(self, stream):
+        return stream.with_scope(self._matcher_504)
+    def _matcher_506(self, stream):
+        return stream.operator_dispatch(self._dispatch_484, [
+            self._matcher_500,
+            self._matcher_505
+        ])
+    def _matcher_507(self, stream):
+        return stream.operator_and([
+            self._matcher_380,
+            self._matcher_1,
+            self._matcher_163
+        ])
+    def _matcher_508(self, stream):
+        return stream.with_scope(self._matcher_507)
+    def _matcher_509(self, stream):
+        return stream.operator_and([
+            self._matcher_469,
+            self._matcher_426
+        ])
+    def _matcher_510(self, stream):
+        return stream.operator_star(self._matcher_509)
+    def _matcher_511(self, stream):
+        return stream.bind('xs', self._matcher_510(stream))
+    def _matcher_512(self, stream):
+        return stream.operator_and([
+            self._matcher_511,
+            self._matcher_450
+        ])
+    def _matcher_513(self, stream):
+        return stream.match_list(self._matcher_512)
+    def _matcher_514(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            *materialize(self.lookup('xs')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_515(self, stream):
+        return stream.operator_and([
+            self._matcher_513,
+            self._matcher_514
+        ])
+    def _matcher_516(self, stream):
+        return stream.with_scope(self._matcher_515)
+    def _matcher_517(self, stream):
+        return stream.operator_or([
+            self._matcher_508,
+            self._matcher_516
+        ])
+    def _matcher_518(self, stream):
+        return stream.bind('xs', self._matcher_427(stream))
+    def _matcher_519(self, stream):
+        return stream.match_list(self._matcher_518)
+    def _matcher_520(self, stream):
+        return stream.operator_and([
+            self._matcher_519,
+            self._matcher_25
+        ])
+    def _matcher_521(self, stream):
+        return stream.with_scope(self._matcher_520)
+    def _matcher_522(self, stream):
+        return stream.operator_or([
+            self._matcher_508,
+            self._matcher_521
+        ])
+    _dispatch_523 = Dispatch(False, {'Bind': [0], 'Unscoped': [1], 'MatchList': [2], 'MatchCallRule': [3], 'Action': [4]}, [])
+    def _matcher_524(self, stream):
+        return stream.match(lambda item: item == 'MatchCallRule', "'MatchCallRule'")
+    def _matcher_525(self, stream):
+        return stream.operator_dispatch(self._dispatch_523, [
+            self._matcher_221,
+            self._matcher_213,
+            self._matcher_249,
+            self._matcher_524,
+            self._matcher_234
+        ])
+    def _matcher_526(self, stream):
+        return stream.operator_and([
+            self._matcher_525,
+            self._matcher_388
+        ])
+    def _matcher_527(self, stream):
+        return stream.match_list(self._matcher_526)
+    _dispatch_528 = Dispatch(True, {'Not': [0], 'Scope': [0], 'MatchLiteral': [1], 'MatchObject': [1], 'SkipUntil': [1], 'StarUntil': [1]}, [])
+    _dispatch_529 = Dispatch(False, {'Scope': [0], 'Not': [1]}, [])
+    def _matcher_530(self, stream):
+        return stream.operator_dispatch(self._dispatch_529, [
+            self._matcher_212,
+            self._matcher_290
+        ])
+    def _matcher_531(self, stream):
+        return stream.operator_and([
+            self._matcher_530,
+            self._matcher_344
+        ])
+    def _matcher_532(self, stream):
+        return stream.match_list(self._matcher_531)
+    _dispatch_533 = Dispatch(False, {'MatchObject': [0], 'MatchLiteral': [1], 'StarUntil': [2], 'SkipUntil': [3]}, [])
+    def _matcher_534(self, stream):
+        return stream.match(lambda item: item == 'StarUntil', "'StarUntil'")
+    def _matcher_535(self, stream):
+        return stream.match(lambda item: item == 'SkipUntil', "'SkipUntil'")
+    def _matcher_536(self, stream):
+        return stream.operator_dispatch(self._dispatch_533, [
+            self._matcher_260,
+            self._matcher_254,
+            self._matcher_534,
+            self._matcher_535
+        ])
+    def _matcher_537(self, stream):
+        return stream.operator_and([
+            self._matcher_536,
+            self._matcher_388
+        ])
+    def _matcher_538(self, stream):
+        return stream.match_list(self._matcher_537)
+    def _matcher_539(self, stream):
+        return stream.operator_dispatch(self._dispatch_528, [
+            self._matcher_532,
+            self._matcher_538
+        ])
+    def _matcher_540(self, stream):
+        return self._rule_regexTree(stream) if stream.memo is None else stream.match_rule(self._rule_regexTree, 'regexTree')
+    def _matcher_541(self, stream):
+        return stream.operator_star(self._matcher_540)
+    def _matcher_542(self, stream):
+        return stream.bind('xs', self._matcher_541(stream))
+    def _matcher_543(self, stream):
+        return stream.operator_and([
+            self._matcher_542,
+            self._matcher_13,
+            self._matcher_246
+        ])
+    def _matcher_544(self, stream):
+        return stream.with_scope(self._matcher_543)
+    def _matcher_545(self, stream):
+        return stream.operator_and([
+            self._matcher_333,
+            self._matcher_1,
+            self._matcher_35,
+            self._matcher_106
+        ])
+    def _matcher_546(self, stream):
+        return stream.match_list(self._matcher_545)
+    def _matcher_547(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            [
+                materialize(self.lookup('x')),
+                materialize(self.runtime.extra.get('match', self.runtime.match)(
+                    'regexParts',
+                    [
+                        materialize(self.lookup('y')),
+                        materialize(self.lookup('y')),
+                        materialize(self.lookup('y'))
+                    ]
+                ))
+            ]
+        ])
+    def _matcher_548(self, stream):
+        return stream.operator_and([
+            self._matcher_546,
+            self._matcher_547
+        ])
+    def _matcher_549(self, stream):
+        return stream.with_scope(self._matcher_548)
+    def _matcher_550(self, stream):
+        return stream.operator_and([
+            self._matcher_1,
+            self._matcher_189
+        ])
+    def _matcher_551(self, stream):
+        return stream.operator_or([
+            self._matcher_549,
+            self._matcher_550
+        ])
+    def _matcher_552(self, stream):
+        return stream.bind('x', self._matcher_457(stream))
+    def _matcher_553(self, stream):
+        return stream.operator_or([
+            self._matcher_363,
+            self._matcher_204
+        ])
+    def _matcher_554(self, stream):
+        return stream.bind('y', self._matcher_553(stream))
+    def _matcher_555(self, stream):
+        return self._rule_single(stream) if stream.memo is None else stream.match_rule(self._rule_single, 'single')
+    def _matcher_556(self, stream):
+        return stream.operator_or([
+            self._matcher_555,
+            self._matcher_204
+        ])
+    def _matcher_557(self, stream):
+        return stream.bind('z', self._matcher_556(stream))
+    def _matcher_558(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y')),
+            materialize(self.lookup('z'))
+        ])
+    def _matcher_559(self, stream):
+        return stream.operator_and([
+            self._matcher_552,
+            self._matcher_554,
+            self._matcher_557,
+            self._matcher_558
+        ])
+    def _matcher_560(self, stream):
+        return stream.with_scope(self._matcher_559)
+    _dispatch_561 = Dispatch(True, {'Scope': [0, 7, 8], 'Span': [0, 7, 8], 'Dispatch': [1, 7, 8], 'Star': [2, 7, 8], 'And': [3, 7, 8], 'Or': [4, 7, 8], 'StarUntil': [5, 7, 8], 'MatchRule': [6, 7, 8]}, [7, 8])
+    _dispatch_562 = Dispatch(False, {'Scope': [0], 'Span': [1]}, [])
+    def _matcher_563(self, stream):
+        return stream.operator_dispatch(self._dispatch_562, [
+            self._matcher_212,
+            self._matcher_214
+        ])
+    def _matcher_564(self, stream):
+        return stream.operator_and([
+            self._matcher_563,
+            self._matcher_372
+        ])
+    def _matcher_565(self, stream):
+        return stream.match_list(self._matcher_564)
+    def _matcher_566(self, stream):
+        return stream.operator_and([
+            self._matcher_565,
+            self._matcher_31
+        ])
+    def _matcher_567(self, stream):
+        return stream.with_scope(self._matcher_566)
+    def _matcher_568(self, stream):
+        return stream.operator_and([
+            self._matcher_226,
+            self._matcher_229,
+            self._matcher_372
+        ])
+    def _matcher_569(self, stream):
+        return stream.match_list(self._matcher_568)
+    def _matcher_570(self, stream):
+        return stream.operator_and([
+            self._matcher_569,
+            self._matcher_31
+        ])
+    def _matcher_571(self, stream):
+        return stream.with_scope(self._matcher_570)
+    def _matcher_572(self, stream):
+        return stream.operator_and([
+            self._matcher_404,
+            self._matcher_372
+        ])
+    def _matcher_573(self, stream):
+        return stream.match_list(self._matcher_572)
+    def _matcher_574(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Loop',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_575(self, stream):
+        return stream.operator_and([
+            self._matcher_573,
+            self._matcher_574
+        ])
+    def _matcher_576(self, stream):
+        return stream.with_scope(self._matcher_575)
+    def _matcher_577(self, stream):
+        return stream.operator_star(self._matcher_371)
+    def _matcher_578(self, stream):
+        return stream.bind('xs', self._matcher_577(stream))
+    def _matcher_579(self, stream):
+        return stream.operator_and([
+            self._matcher_158,
+            self._matcher_578,
+            self._matcher_13
+        ])
+    def _matcher_580(self, stream):
+        return stream.match_list(self._matcher_579)
+    def _matcher_581(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Seq',
+            *materialize(self.lookup('xs'))
+        ])
+    def _matcher_582(self, stream):
+        return stream.operator_and([
+            self._matcher_580,
+            self._matcher_581
+        ])
+    def _matcher_583(self, stream):
+        return stream.with_scope(self._matcher_582)
+    def _matcher_584(self, stream):
+        return stream.operator_and([
+            self._matcher_175,
+            self._matcher_578,
+            self._matcher_13
+        ])
+    def _matcher_585(self, stream):
+        return stream.match_list(self._matcher_584)
+    def _matcher_586(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Alt',
+            *materialize(self.lookup('xs'))
+        ])
+    def _matcher_587(self, stream):
+        return stream.operator_and([
+            self._matcher_585,
+            self._matcher_586
+        ])
+    def _matcher_588(self, stream):
+        return stream.with_scope(self._matcher_587)
+    def _matcher_589(self, stream):
+        return stream.operator_and([
+            self._matcher_534,
+            self._matcher_35,
+            self._matcher_1
+        ])
+    def _matcher_590(self, stream):
+        return stream.match_list(self._matcher_589)
+    def _matcher_591(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Until',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_592(self, stream):
+        return stream.operator_and([
+            self._matcher_590,
+            self._matcher_591
+        ])
+    def _matcher_593(self, stream):
+        return stream.with_scope(self._matcher_592)
+    def _matcher_594(self, stream):
+        return stream.match(lambda item: item == 'MatchRule', "'MatchRule'")
+    def _matcher_595(self, stream):
+        return stream.operator_and([
+            self._matcher_594,
+            self._matcher_35
+        ])
+    def _matcher_596(self, stream):
+        return stream.match_list(self._matcher_595)
+    def _matcher_597(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Rule',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_598(self, stream):
+        return stream.operator_and([
+            self._matcher_596,
+            self._matcher_597
+        ])
+    def _matcher_599(self, stream):
+        return stream.with_scope(self._matcher_598)
+    def _matcher_600(self, stream):
+        return self._rule_discard(stream) if stream.memo is None else stream.match_rule(self._rule_discard, 'discard')
+    def _matcher_601(self, stream):
+        return self._rule_leaf(stream) if stream.memo is None else stream.match_rule(self._rule_leaf, 'leaf')
+    def _matcher_602(self, stream):
+        return stream.operator_dispatch(self._dispatch_561, [
+            self._matcher_567,
+            self._matcher_571,
+            self._matcher_576,
+            self._matcher_583,
+            self._matcher_588,
+            self._matcher_593,
+            self._matcher_599,
+            self._matcher_600,
+            self._matcher_601
+        ])
+    _dispatch_603 = Dispatch(True, {'Skip': [0], 'Not': [1], 'SkipUntil': [2]}, [])
+    def _matcher_604(self, stream):
+        return stream.operator_and([
+            self._matcher_441,
+            self._matcher_372
+        ])
+    def _matcher_605(self, stream):
+        return stream.match_list(self._matcher_604)
+    def _matcher_606(self, stream):
+        return stream.operator_and([
+            self._matcher_605,
+            self._matcher_574
+        ])
+    def _matcher_607(self, stream):
+        return stream.with_scope(self._matcher_606)
+    def _matcher_608(self, stream):
+        return stream.operator_and([
+            self._matcher_290,
+            self._matcher_372
+        ])
+    def _matcher_609(self, stream):
+        return stream.match_list(self._matcher_608)
+    def _matcher_610(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Avoid',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_611(self, stream):
+        return stream.operator_and([
+            self._matcher_609,
+            self._matcher_610
+        ])
+    def _matcher_612(self, stream):
+        return stream.with_scope(self._matcher_611)
+    def _matcher_613(self, stream):
+        return stream.operator_and([
+            self._matcher_535,
+            self._matcher_35,
+            self._matcher_1
+        ])
+    def _matcher_614(self, stream):
+        return stream.match_list(self._matcher_613)
+    def _matcher_615(self, stream):
+        return stream.operator_and([
+            self._matcher_614,
+            self._matcher_591
+        ])
+    def _matcher_616(self, stream):
+        return stream.with_scope(self._matcher_615)
+    def _matcher_617(self, stream):
+        return stream.operator_dispatch(self._dispatch_603, [
+            self._matcher_607,
+            self._matcher_612,
+            self._matcher_616
+        ])
+    def _matcher_618(self, stream):
+        return stream.operator_and([
+            self._matcher_254,
+            self._matcher_35
+        ])
+    def _matcher_619(self, stream):
+        return stream.match_list(self._matcher_618)
+    def _matcher_620(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Text',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_621(self, stream):
+        return stream.operator_and([
+            self._matcher_619,
+            self._matcher_620
+        ])
+    def _matcher_622(self, stream):
+        return stream.with_scope(self._matcher_621)
+    def _matcher_623(self, stream):
+        return self._rule_object(stream) if stream.memo is None else stream.match_rule(self._rule_object, 'object')
+    def _matcher_624(self, stream):
+        return stream.operator_or([
+            self._matcher_622,
+            self._matcher_623
+        ])
+    def _matcher_625(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: [
+            'Any'
+        ])
+    def _matcher_626(self, stream):
+        return stream.operator_and([
+            self._matcher_298,
+            self._matcher_625
+        ])
+    def _matcher_627(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Char',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_628(self, stream):
+        return stream.operator_and([
+            self._matcher_265,
+            self._matcher_627
+        ])
+    def _matcher_629(self, stream):
+        return stream.with_scope(self._matcher_628)
+    def _matcher_630(self, stream):
+        return stream.match(lambda item: item == 'Range', "'Range'")
+    def _matcher_631(self, stream):
+        return stream.operator_and([
+            self._matcher_630,
+            self._matcher_35,
+            self._matcher_106
+        ])
+    def _matcher_632(self, stream):
+        return stream.match_list(self._matcher_631)
+    def _matcher_633(self, stream):
+        return stream.operator_and([
+            self._matcher_260,
+            self._matcher_632
+        ])
+    def _matcher_634(self, stream):
+        return stream.match_list(self._matcher_633)
+    def _matcher_635(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Range',
+            materialize(self.lookup('x')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_636(self, stream):
+        return stream.operator_and([
+            self._matcher_634,
+            self._matcher_635
+        ])
+    def _matcher_637(self, stream):
+        return stream.with_scope(self._matcher_636)
+    _regex_638 = Regex('..', 'none')
+    def _matcher_639(self, stream):
+        return stream.operator_and([
+            self._matcher_1,
+            self._matcher_1
+        ])
+    def _matcher_640(self, stream):
+        return stream.match_regex(self._regex_638, self._matcher_639)
+    def _matcher_641(self, stream):
+        return stream.operator_and([
+            self._matcher_268,
+            self._matcher_35,
+            self._matcher_640
+        ])
+    def _matcher_642(self, stream):
+        return stream.match_list(self._matcher_641)
+    def _matcher_643(self, stream):
+        return stream.operator_and([
+            self._matcher_260,
+            self._matcher_642
+        ])
+    def _matcher_644(self, stream):
+        return stream.match_list(self._matcher_643)
+    def _matcher_645(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Class',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_646(self, stream):
+        return stream.operator_and([
+            self._matcher_644,
+            self._matcher_645
+        ])
+    def _matcher_647(self, stream):
+        return stream.with_scope(self._matcher_646)
+    def _matcher_648(self, stream):
+        return stream.operator_or([
+            self._matcher_626,
+            self._matcher_629,
+            self._matcher_637,
+            self._matcher_647
+        ])
+    _dispatch_649 = Dispatch(True, {'Dispatch': [0, 8, 9], 'Scope': [0, 8, 9], 'MatchRule': [1, 8, 9], 'And': [2, 3, 8, 9], 'Or': [4, 8, 9], 'Span': [5, 8, 9], 'Star': [6, 8, 9], 'StarUntil': [7, 8, 9]}, [8, 9])
+    _dispatch_650 = Dispatch(False, {'Scope': [0], 'Dispatch': [1]}, [])
+    def _matcher_651(self, stream):
+        return stream.operator_and([
+            self._matcher_226,
+            self._matcher_229
+        ])
+    def _matcher_652(self, stream):
+        return stream.operator_dispatch(self._dispatch_650, [
+            self._matcher_212,
+            self._matcher_651
+        ])
+    def _matcher_653(self, stream):
+        return stream.operator_and([
+            self._matcher_652,
+            self._matcher_364
+        ])
+    def _matcher_654(self, stream):
+        return stream.match_list(self._matcher_653)
+    def _matcher_655(self, stream):
+        return stream.operator_and([
+            self._matcher_654,
+            self._matcher_31
+        ])
+    def _matcher_656(self, stream):
+        return stream.with_scope(self._matcher_655)
+    def _matcher_657(self, stream):
+        return stream.operator_and([
+            self._matcher_469,
+            self._matcher_371
+        ])
+    def _matcher_658(self, stream):
+        return stream.operator_star(self._matcher_657)
+    def _matcher_659(self, stream):
+        return stream.bind('xs', self._matcher_658(stream))
+    def _matcher_660(self, stream):
+        return stream.bind('y', self._matcher_363(stream))
+    def _matcher_661(self, stream):
+        return stream.operator_and([
+            self._matcher_158,
+            self._matcher_659,
+            self._matcher_660
+        ])
+    def _matcher_662(self, stream):
+        return stream.match_list(self._matcher_661)
+    def _matcher_663(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Then',
+            materialize(self.lookup('xs')),
+            materialize(self.lookup('y'))
+        ])
+    def _matcher_664(self, stream):
+        return stream.operator_and([
+            self._matcher_662,
+            self._matcher_663
+        ])
+    def _matcher_665(self, stream):
+        return stream.with_scope(self._matcher_664)
+    def _matcher_666(self, stream):
+        return stream.operator_and([
+            self._matcher_158,
+            self._matcher_13
+        ])
+    def _matcher_667(self, stream):
+        return stream.match_list(self._matcher_666)
+    def _matcher_668(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: [
+            'Capture',
+            'none',
+            [
+                'Seq'
+            ]
+        ])
+    def _matcher_669(self, stream):
+        return stream.operator_and([
+            self._matcher_667,
+            self._matcher_668
+        ])
+    def _matcher_670(self, stream):
+        return stream.operator_star(self._matcher_363)
+    def _matcher_671(self, stream):
+        return stream.bind('xs', self._matcher_670(stream))
+    def _matcher_672(self, stream):
+        return stream.operator_and([
+            self._matcher_175,
+            self._matcher_671,
+            self._matcher_13
+        ])
+    def _matcher_673(self, stream):
+        return stream.match_list(self._matcher_672)
+    def _matcher_674(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Choice',
+            *materialize(self.lookup('xs'))
+        ])
+    def _matcher_675(self, stream):
+        return stream.operator_and([
+            self._matcher_673,
+            self._matcher_674
+        ])
+    def _matcher_676(self, stream):
+        return stream.with_scope(self._matcher_675)
+    def _matcher_677(self, stream):
+        return stream.operator_and([
+            self._matcher_214,
+            self._matcher_372
+        ])
+    def _matcher_678(self, stream):
+        return stream.match_list(self._matcher_677)
+    def _matcher_679(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Capture',
+            'text',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_680(self, stream):
+        return stream.operator_and([
+            self._matcher_678,
+            self._matcher_679
+        ])
+    def _matcher_681(self, stream):
+        return stream.with_scope(self._matcher_680)
+    def _matcher_682(self, stream):
+        return stream.bind('x', self._matcher_555(stream))
+    def _matcher_683(self, stream):
+        return stream.operator_and([
+            self._matcher_404,
+            self._matcher_682
+        ])
+    def _matcher_684(self, stream):
+        return stream.match_list(self._matcher_683)
+    def _matcher_685(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Capture',
+            'chars',
+            [
+                'Loop',
+                materialize(self.lookup('x'))
+            ]
+        ])
+    def _matcher_686(self, stream):
+        return stream.operator_and([
+            self._matcher_684,
+            self._matcher_685
+        ])
+    def _matcher_687(self, stream):
+        return stream.with_scope(self._matcher_686)
+    def _matcher_688(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Capture',
+            'chars',
+            [
+                'Until',
+                materialize(self.lookup('x'))
+            ]
+        ])
+    def _matcher_689(self, stream):
+        return stream.operator_and([
+            self._matcher_590,
+            self._matcher_688
+        ])
+    def _matcher_690(self, stream):
+        return stream.with_scope(self._matcher_689)
+    def _matcher_691(self, stream):
+        return stream.bind('x', self._matcher_600(stream))
+    def _matcher_692(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Capture',
+            'none',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_693(self, stream):
+        return stream.operator_and([
+            self._matcher_691,
+            self._matcher_692
+        ])
+    def _matcher_694(self, stream):
+        return stream.with_scope(self._matcher_693)
+    def _matcher_695(self, stream):
+        return stream.bind('x', self._matcher_601(stream))
+    def _matcher_696(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Capture',
+            'last',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_697(self, stream):
+        return stream.operator_and([
+            self._matcher_695,
+            self._matcher_696
+        ])
+    def _matcher_698(self, stream):
+        return stream.with_scope(self._matcher_697)
+    def _matcher_699(self, stream):
+        return stream.operator_dispatch(self._dispatch_649, [
+            self._matcher_656,
+            self._matcher_599,
+            self._matcher_665,
+            self._matcher_669,
+            self._matcher_676,
+            self._matcher_681,
+            self._matcher_687,
+            self._matcher_690,
+            self._matcher_694,
+            self._matcher_698
+        ])
+    _dispatch_700 = Dispatch(True, {'Scope': [0, 2], 'MatchRule': [1, 2]}, [2])
+    def _matcher_701(self, stream):
+        return stream.operator_and([
+            self._matcher_212,
+            self._matcher_682
+        ])
+    def _matcher_702(self, stream):
+        return stream.match_list(self._matcher_701)
+    def _matcher_703(self, stream):
+        return stream.operator_and([
+            self._matcher_702,
+            self._matcher_31
+        ])
+    def _matcher_704(self, stream):
+        return stream.with_scope(self._matcher_703)
+    def _matcher_705(self, stream):
+        return SemanticAction(stream.scope, lambda self: [
+            'Single',
+            materialize(self.lookup('x'))
+        ])
+    def _matcher_706(self, stream):
+        return stream.operator_and([
+            self._matcher_596,
+            self._matcher_705
+        ])
+    def _matcher_707(self, stream):
+        return stream.with_scope(self._matcher_706)
+    def _matcher_708(self, stream):
+        return stream.operator_dispatch(self._dispatch_700, [
+            self._matcher_704,
+            self._matcher_707,
+            self._matcher_623
+        ])
+    _rule__main = _matcher_10
+    _rule_backend = _matcher_21
+    _rule_opts = _matcher_27
+    _rule_opt = _matcher_34
+    _rule_Actor = _matcher_45
+    _rule_field = _matcher_50
+    _rule_Rule = _matcher_54
+    _rule_Or = _matcher_61
+    _rule_Scope = _matcher_65
+    _rule_Star = _matcher_68
+    _rule_Span = _matcher_71
+    _rule_Bind = _matcher_74
+    _rule_Action = _matcher_89
+    _rule_Set = _matcher_93
+    _rule_Call = _matcher_96
+    _rule_Format = _matcher_99
+    _rule_List = _matcher_102
+    _rule_ListItem = _matcher_105
+    _rule_Get = _matcher_109
+    _rule_Lookup = _matcher_114
+    _rule_kind = _matcher_121
+    _rule_helper = _matcher_132
+    _rule_Not = _matcher_135
+    _rule_MatchObject = _matcher_145
+    _rule_MatchList = _matcher_148
+    _rule_And = _matcher_157
+    _rule_andInner = _matcher_166
+    _rule_scoped = _matcher_174
+    _rule_dispatch = _matcher_185
+    _rule_parks = _matcher_190
+    _rule_replicable = _matcher_193
+    _rule_accepts = _matcher_202
+    _rule_firsts = _matcher_209
+    _rule_first = _matcher_276
+    _rule_until = _matcher_289
+    _rule_loopUntil = _matcher_302
+    _rule_stop = _matcher_326
+    _rule_regexes = _matcher_331
+    _rule_regexRule = _matcher_343
+    _rule_used = _matcher_356
+    _rule_unused = _matcher_362
+    _rule_usedRegex = _matcher_370
+    _rule_unusedRegex = _matcher_378
+    _rule_pickUsed = _matcher_383
+    _rule_pickUnused = _matcher_384
+    _rule_found = _matcher_394
+    _rule_usedNode = _matcher_422
+    _rule_unusedNode = _matcher_438
+    _rule_fixedNode = _matcher_456
+    _rule_groups = _matcher_464
+    _rule_usedGroups = _matcher_479
+    _rule_unusedGroups = _matcher_483
+    _rule_usedGroup = _matcher_497
+    _rule_unusedGroup = _matcher_506
+    _rule_pickUsedRun = _matcher_517
+    _rule_pickUnusedRun = _matcher_522
+    _rule_opaque = _matcher_527
+    _rule_trivial = _matcher_539
+    _rule_regexTrees = _matcher_544
+    _rule_regexTree = _matcher_551
+    _rule_regexParts = _matcher_560
+    _rule_skip = _matcher_602
+    _rule_discard = _matcher_617
+    _rule_leaf = _matcher_624
+    _rule_object = _matcher_648
+    _rule_value = _matcher_699
+    _rule_single = _matcher_708
+    _accepts = {'Ast'}
+    _parks = True
+    _replicable = True
+    _rules = {
+        '_main': _rule__main,
+        'backend': _rule_backend,
+        'opts': _rule_opts,
+        'opt': _rule_opt,
+        'Actor': _rule_Actor,
+        'field': _rule_field,
+        'Rule': _rule_Rule,
+        'Or': _rule_Or,
+        'Scope': _rule_Scope,
+        'Star': _rule_Star,
+        'Span': _rule_Span,
+        'Bind': _rule_Bind,
+        'Action': _rule_Action,
+        'Set': _rule_Set,
+        'Call': _rule_Call,
+        'Format': _rule_Format,
+        'List': _rule_List,
+        'ListItem': _rule_ListItem,
+        'Get': _rule_Get,
+        'Lookup': _rule_Lookup,
+        'kind': _rule_kind,
+        'helper': _rule_helper,
+        'Not': _rule_Not,
+        'MatchObject': _rule_MatchObject,
+        'MatchList': _rule_MatchList,
+        'And': _rule_And,
+        'andInner': _rule_andInner,
+        'scoped': _rule_scoped,
+        'dispatch': _rule_dispatch,
+        'parks': _rule_parks,
+        'replicable': _rule_replicable,
+        'accepts': _rule_accepts,
+        'firsts': _rule_firsts,
+        'first': _rule_first,
+        'until': _rule_until,
+        'loopUntil': _rule_loopUntil,
+        'stop': _rule_stop,
+        'regexes': _rule_regexes,
+        'regexRule': _rule_regexRule,
+        'used': _rule_used,
+        'unused': _rule_unused,
+        'usedRegex': _rule_usedRegex,
+        'unusedRegex': _rule_unusedRegex,
+        'pickUsed': _rule_pickUsed,
+        'pickUnused': _rule_pickUnused,
+        'found': _rule_found,
+        'usedNode': _rule_usedNode,
+        'unusedNode': _rule_unusedNode,
+        'fixedNode': _rule_fixedNode,
+        'groups': _rule_groups,
+        'usedGroups': _rule_usedGroups,
+        'unusedGroups': _rule_unusedGroups,
+        'usedGroup': _rule_usedGroup,
+        'unusedGroup': _rule_unusedGroup,
+        'pickUsedRun': _rule_pickUsedRun,
+        'pickUnusedRun': _rule_pickUnusedRun,
+        'opaque': _rule_opaque,
+        'trivial': _rule_trivial,
+        'regexTrees': _rule_regexTrees,
+        'regexTree': _rule_regexTree,
+        'regexParts': _rule_regexParts,
+        'skip': _rule_skip,
+        'discard': _rule_discard,
+        'leaf': _rule_leaf,
+        'object': _rule_object,
+        'value': _rule_value,
+        'single': _rule_single,
+    }
+    _main = _rules.pop('_main')
+natives['Optimizer'] = Optimizer
+def fuseLiterals(nodes):
+    fused = []
+    chars = []
+    for node in nodes+[None]:
+        if node and node[0] == "MatchObject" and node[1][0] == "Eq" and isinstance(node[1][1], str) and len(node[1][1]) == 1:
+            chars.append(node[1][1])
+            continue
+        if len(chars) > 1:
+            fused.append(["MatchLiteral", "".join(chars)])
+        elif chars:
+            fused.append(["MatchObject", ["Eq", chars[0]]])
+        chars = []
+        if node:
+            fused.append(node)
+    if len(fused) == 1:
+        return fused[0]
+    return ["And"]+fused
+natives['fuseLiterals'] = fuseLiterals
+def fuseCharClasses(nodes):
+    fused = []
+    tests = []
+    for node in nodes+[None]:
+        test = node[1] if node and node[0] == "Scope" else node
+        if test and test[0] == "MatchObject" and test[1][0] in ("Eq", "Range") and all(isinstance(x, str) and len(x) == 1 for x in test[1][1:]) and ord(test[1][-1])-ord(test[1][1]) < 256:
+            tests.append((node, test[1]))
+            continue
+        if len(tests) > 1:
+            chars = set()
+            for _, test in tests:
+                chars.update(chr(x) for x in range(ord(test[1]), ord(test[-1])+1))
+            ranges = [test[1:] for _, test in tests if test[0] == "Range"]
+            first = tests[0][1]
+            fused.append(["MatchObject", ["Class", sorted(chars), "-".join(repr(x) for x in first[1:]), ranges, [first[1], first[-1]]]])
+        else:
+            fused.extend(node for node, _ in tests)
+        tests = []
+        if node:
+            fused.append(node)
+    if len(fused) == 1:
+        return fused[0]
+    return ["Or"]+fused
+natives['fuseCharClasses'] = fuseCharClasses
+def resolveLookup(name, binds, fields, kind):
+    if name in binds:
+        return ["Lookup", name]
+    if name in fields:
+        return ["FieldLookup", name]
+    return [kind, name]
+natives['resolveLookup'] = resolveLookup
+def releaseLookups(lookups, settable):
+    for lookup in lookups:
+        if lookup[0] != "Lookup" and lookup[1] in settable:
+            lookup[0] = "RuntimeLookup"
+natives['releaseLookups'] = releaseLookups
+def firstKeys(keys):
+    pairs = set()
+    for key in keys:
+        if not isinstance(key, list):
+            pairs.add((False, key))
+        elif any(isinstance(x, list) for x in key):
+            return None
+        else:
+            pairs.update((True, x) for x in key)
+    return pairs
+natives['firstKeys'] = firstKeys
+def acceptedHeads(keys):
+    keys = firstKeys(keys)
+    if keys and not any(head for head, _ in keys):
+        return [["Accepts", sorted((key for _, key in keys), key=repr)]]
+    return []
+natives['acceptedHeads'] = acceptedHeads
+def dispatchOr(nodes, firsts):
+    firsts = [None if keys is None else firstKeys(keys) for keys in firsts]
+    keyed = [keys for keys in firsts if keys]
+    if len(keyed) < 2:
+        return ["Or"]+nodes
+    head = min(x for x, _ in keyed[0])
+    firsts = [
+        {key for _, key in keys} if keys and all(x == head for x, _ in keys) else None
+        for keys in firsts
+    ]
+    table = {}
+    for keys in firsts:
+        for key in sorted(keys or [], key=repr):
+            table[key] = [i for i, x in enumerate(firsts) if x is None or key in x]
+    if len(set(map(tuple, table.values()))) < 2:
+        return ["Or"]+nodes
+    default = [i for i, x in enumerate(firsts) if x is None]
+    return ["Dispatch", head, [[key, xs] for key, xs in table.items()], default, ["Or"]+nodes]
+natives['dispatchOr'] = dispatchOr
+def regexMatch(nodes, tree, trees):
+    value = regexValue(tree, trees, [])
+    if value is None:
+        return []
+    return [["MatchRegex", value[0], value[1], nodes[0]]]
+natives['regexMatch'] = regexMatch
+def regexGroups(nodes, skips, trees):
+    groups = []
+    run = []
+    for node, skip in zip(nodes+[None], skips+[None]):
+        if skip is not None and regexPattern(skip, trees, []) is not None:
+            run.append(node)
+            continue
+        if len(run) > 1:
+            groups.append(["Run"]+run)
+        else:
+            groups.extend(["Node", x] for x in run)
+        run = []
+        if node is not None:
+            groups.append(["Node", node])
+    return groups
+natives['regexGroups'] = regexGroups
+def regexValue(tree, trees, seen):
+    if tree[0] == "Rule":
+        inlined = regexInline(tree[1], 1, trees, seen)
+        return inlined and regexValue(inlined, trees, seen+[tree[1]])
+    if tree[0] == "Capture":
+        pattern = regexPattern(tree[2], trees, seen)
+        return None if pattern is None else (pattern, tree[1], False)
+    if tree[0] == "Then":
+        prefix = [regexPattern(x, trees, seen) for x in tree[1]]
+        last = regexValue(tree[2], trees, seen)
+        if None in prefix or last is None:
+            return None
+        pattern, kind, grouped = last
+        if kind in ("text", "chars") and not grouped:
+            pattern, grouped = f"({pattern})", True
+        return ("".join(prefix)+pattern, kind, grouped)
+    values = [regexValue(x, trees, seen) for x in tree[1:]]
+    if None in values or any(grouped for _, _, grouped in values) or len(set(kind for _, kind, _ in values)) != 1:
+        return None
+    return ("(?>"+"|".join(pattern for pattern, _, _ in values)+")", values[0][1], False)
+natives['regexValue'] = regexValue
+def regexPattern(tree, trees, seen):
+    def char(x):
+        return isinstance(x, str) and len(x) == 1
+    if tree[0] in ("Rule", "Single"):
+        inlined = regexInline(tree[1], 0 if tree[0] == "Rule" else 2, trees, seen)
+        return inlined and regexPattern(inlined, trees, seen+[tree[1]])
+    if tree[0] in ("Seq", "Alt", "Loop", "Avoid"):
+        parts = [regexPattern(x, trees, seen) for x in tree[1:]]
+        if None in parts:
+            return None
+        if tree[0] == "Seq":
+            return "".join(parts)
+        if tree[0] == "Alt":
+            return "(?>"+"|".join(parts)+")"
+        if tree[0] == "Loop":
+            return f"(?:{parts[0]})*+"
+        return f"(?!{parts[0]})"
+    if tree[0] == "Text":
+        return re.escape(tree[1])
+    if tree[0] == "Any":
+        return "."
+    if tree[0] == "Class":
+        return "["+"".join(re.escape(x) for x in tree[1])+"]"
+    if tree[0] == "Char" and char(tree[1]):
+        return re.escape(tree[1])
+    if tree[0] == "Range" and char(tree[1]) and char(tree[2]) and tree[1] <= tree[2]:
+        return "["+re.escape(tree[1])+"-"+re.escape(tree[2])+"]"
+    if tree[0] == "Until" and all(char(x) for stop in tree[1] for x in stop):
+        return "(?:(?!"+"|".join(re.escape("".join(stop)) for stop in tree[1])+").)*+"
+    return None
+natives['regexPattern'] = regexPattern
+def regexInline(name, part, trees, seen):
+    if name in seen or name not in trees:
+        return None
+    return trees[name][part]
+natives['regexInline'] = regexInline
+class CodeGenerator:
+    __slots__ = ('_state',)
+    def __init__(self):
+        self._state = {}
+    def run(self, stream):
+        return stream.run(self._main)
+    def _matcher_0(self, stream):
+        return stream.match(lambda item: item == 'Optimized', "'Optimized'")
+    def _matcher_1(self, stream):
+        return stream.match(lambda item: True, 'any')
+    def _matcher_2(self, stream):
+        return stream.bind('p', self._matcher_1(stream))
+    def _matcher_3(self, stream):
+        return self._rule_asts(stream) if stream.memo is None else stream.match_rule(self._rule_asts, 'asts')
+    def _matcher_4(self, stream):
+        return stream.bind('x', self._matcher_3(stream))
+    def _matcher_5(self, stream):
+        return stream.match_list(self._matcher_4)
+    def _matcher_6(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('put')(
+            [
+                'Part',
+                materialize(self.lookup('p')),
+                materialize(self.lookup('x'))
+            ]
+        ))
+    def _matcher_7(self, stream):
+        return stream.operator_and([
+            self._matcher_0,
+            self._matcher_2,
+            self._matcher_5,
+            self._matcher_6
+        ])
+    def _matcher_8(self, stream):
+        return stream.with_scope(self._matcher_7)
+    def _matcher_9(self, stream):
+        return self._rule_ast(stream) if stream.memo is None else stream.match_rule(self._rule_ast, 'ast')
+    def _matcher_10(self, stream):
+        return stream.operator_star(self._matcher_9)
+    def _matcher_11(self, stream):
+        return stream.bind('xs', self._matcher_10(stream))
+    def _matcher_12(self, stream):
+        return stream.operator_not(self._matcher_1)
+    def _matcher_13(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            self.lookup('xs')
+        ]))
+    def _matcher_14(self, stream):
+        return stream.operator_and([
+            self._matcher_11,
+            self._matcher_12,
+            self._matcher_13
+        ])
+    def _matcher_15(self, stream):
+        return stream.with_scope(self._matcher_14)
+    def _matcher_16(self, stream):
+        return stream.match_call_rule(self._rules, self)
+    def _matcher_17(self, stream):
+        return stream.bind('x', self._matcher_16(stream))
+    def _matcher_18(self, stream):
+        return stream.operator_and([
+            self._matcher_17,
+            self._matcher_12
+        ])
+    def _matcher_19(self, stream):
+        return stream.match_list(self._matcher_18)
+    def _matcher_20(self, stream):
+        return lookup_action(stream.scope, 'x')
+    def _matcher_21(self, stream):
+        return stream.operator_and([
+            self._matcher_19,
+            self._matcher_20
+        ])
+    def _matcher_22(self, stream):
+        return stream.with_scope(self._matcher_21)
+    def _matcher_23(self, stream):
+        return stream.bind('x', self._matcher_1(stream))
+    def _matcher_24(self, stream):
+        return stream.bind('y', self._matcher_1(stream))
+    def _matcher_25(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            self.lookup('y'),
+            'natives[',
+            self.runtime.lookup('repr')(
+                materialize(self.lookup('x'))
+            ),
+            '] = ',
+            self.lookup('x'),
+            '\n'
+        ]))
+    def _matcher_26(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_24,
+            self._matcher_25
+        ])
+    def _matcher_27(self, stream):
+        return stream.with_scope(self._matcher_26)
+    def _matcher_28(self, stream):
+        return self._rule_astList(stream) if stream.memo is None else stream.match_rule(self._rule_astList, 'astList')
+    def _matcher_29(self, stream):
+        return stream.bind('xs', self._matcher_28(stream))
+    def _matcher_30(self, stream):
+        return stream.match_list(self._matcher_29)
+    def _matcher_31(self, stream):
+        return stream.bind('ys', self._matcher_10(stream))
+    def _matcher_32(self, stream):
+        return stream.match_list(self._matcher_31)
+    def _matcher_33(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('nextid', self.runtime.lookup('Counter')(
+        
+        ), lambda: self.bind('name', self.lookup('x'), lambda: self.runtime.join([
+            self.lookup('ys'),
+            'natives[',
+            self.runtime.lookup('repr')(
+                materialize(self.runtime.lookup('name'))
+            ),
+            '] = lambda: [',
+            self.lookup('xs'),
+            ']\n'
+        ]))))
+    def _matcher_34(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_30,
+            self._matcher_32,
+            self._matcher_33
+        ])
+    def _matcher_35(self, stream):
+        return stream.with_scope(self._matcher_34)
+    def _matcher_36(self, stream):
+        return stream.bind('x', self._matcher_9(stream))
+    def _matcher_37(self, stream):
+        return stream.bind('y', self._matcher_9(stream))
+    def _matcher_38(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'class ',
+            self.runtime.lookup('name'),
+            '_Example_',
+            self.runtime.lookup('nextid')(
+            
+            ),
+            '(Example):\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'def test_example(self):\n',
+                    self.runtime.extra.get('indent', self.runtime.indent)(
+                        self.runtime.join([
+                            'self.check_example(natives[',
+                            self.runtime.lookup('repr')(
+                                materialize(self.runtime.lookup('name'))
+                            ),
+                            '](), ',
+                            self.lookup('x'),
+                            ', ',
+                            self.lookup('y'),
+                            ')\n'
+                        ])
+                    )
+                ])
+            )
+        ]))
+    def _matcher_39(self, stream):
+        return stream.operator_and([
+            self._matcher_36,
+            self._matcher_37,
+            self._matcher_38
+        ])
+    def _matcher_40(self, stream):
+        return stream.with_scope(self._matcher_39)
+    def _matcher_41(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'SemanticAction({}, lambda self: ',
+            self.lookup('x'),
+            ').eval(Runtime(None, natives))'
+        ]))
+    def _matcher_42(self, stream):
+        return stream.operator_and([
+            self._matcher_36,
+            self._matcher_41
+        ])
+    def _matcher_43(self, stream):
+        return stream.with_scope(self._matcher_42)
+    def _matcher_44(self, stream):
+        return stream.bind('ys', self._matcher_3(stream))
+    def _matcher_45(self, stream):
+        return stream.match_list(self._matcher_44)
+    def _matcher_46(self, stream):
+        return stream.bind('zs', self._matcher_10(stream))
+    def _matcher_47(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('nextid', self.runtime.lookup('Counter')(
+        
+        ), lambda: self.bind('matchers', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('defined', self.runtime.lookup('dict')(
+        
+        ), lambda: self.bind('rules', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('param', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('init', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('bindings', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('name', self.lookup('x'), lambda: self.runtime.join([
+            self.lookup('ys'),
+            self.lookup('zs'),
+            'class ',
+            self.lookup('x'),
+            ':\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    "__slots__ = ('_state',)\n",
+                    'def __init__(self',
+                    self.runtime.join([
+                        self.runtime.lookup('param')
+                    ]),
+                    '):\n',
+                    self.runtime.extra.get('indent', self.runtime.indent)(
+                        self.runtime.join([
+                            'self._state = {',
+                            self.runtime.lookup('init'),
+                            '}\n'
+                        ])
+                    ),
+                    'def run(self, stream):\n',
+                    self.runtime.extra.get('indent', self.runtime.indent)(
+                        self.runtime.join([
+                            'return stream.run(self._main)\n'
+                        ])
+                    ),
+                    self.runtime.lookup('matchers'),
+                    self.runtime.lookup('bindings'),
+                    '_rules = {\n',
+                    self.runtime.extra.get('indent', self.runtime.indent)(
+                        self.runtime.join([
+                            self.runtime.lookup('rules')
+                        ])
+                    ),
+                    '}\n',
+                    "_main = _rules.pop('_main')\n"
+                ])
+            ),
+            'natives[',
+            self.runtime.lookup('repr')(
+                materialize(self.lookup('x'))
+            ),
+            '] = ',
+            self.lookup('x'),
+            '\n'
+        ]))))))))))
+    def _matcher_48(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_45,
+            self._matcher_46,
+            self._matcher_47
+        ])
+    def _matcher_49(self, stream):
+        return stream.with_scope(self._matcher_48)
+    def _matcher_50(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('', self.runtime.lookup('param')(
+            materialize(self.runtime.join([
+                ', ',
+                self.lookup('x')
+            ]))
+        ), lambda: self.bind('', self.runtime.lookup('init')(
+            materialize(self.runtime.join([
+                self.runtime.lookup('repr')(
+                    materialize(self.lookup('x'))
+                ),
+                ': ',
+                self.lookup('x'),
+                ',\n'
+            ]))
+        ), lambda: '')))
+    def _matcher_51(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_50
+        ])
+    def _matcher_52(self, stream):
+        return stream.with_scope(self._matcher_51)
+    def _matcher_53(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('scope', 'stream.scope', lambda: self.bind('', self.runtime.lookup('bindings')(
+            materialize(self.runtime.join([
+                '_rule_',
+                self.lookup('x'),
+                ' = ',
+                self.lookup('y'),
+                '\n'
+            ]))
+        ), lambda: self.bind('', self.runtime.lookup('rules')(
+            materialize(self.runtime.join([
+                self.runtime.lookup('repr')(
+                    materialize(self.lookup('x'))
+                ),
+                ': _rule_',
+                self.lookup('x'),
+                ',\n'
+            ]))
+        ), lambda: ''))))
+    def _matcher_54(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_37,
+            self._matcher_53
+        ])
+    def _matcher_55(self, stream):
+        return stream.with_scope(self._matcher_54)
+    def _matcher_56(self, stream):
+        return self._rule_repr(stream) if stream.memo is None else stream.match_rule(self._rule_repr, 'repr')
+    def _matcher_57(self, stream):
+        return stream.operator_star(self._matcher_56)
+    def _matcher_58(self, stream):
+        return stream.bind('xs', self._matcher_57(stream))
+    def _matcher_59(self, stream):
+        return stream.match_list(self._matcher_58)
+    def _matcher_60(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('', self.runtime.lookup('bindings')(
+            materialize(self.runtime.join([
+                '_accepts = {',
+                self.runtime.extra.get('join', self.runtime.join)(
+                    self.lookup('xs'),
+                    ', '
+                ),
+                '}\n'
+            ]))
+        ), lambda: ''))
+    def _matcher_61(self, stream):
+        return stream.operator_and([
+            self._matcher_59,
+            self._matcher_60
+        ])
+    def _matcher_62(self, stream):
+        return stream.with_scope(self._matcher_61)
+    def _matcher_63(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.bind('', self.runtime.lookup('bindings')(
+            '_parks = True\n'
+        ), lambda: ''))
+    def _matcher_64(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.bind('', self.runtime.lookup('bindings')(
+            '_replicable = True\n'
+        ), lambda: ''))
+    def _matcher_65(self, stream):
+        return self._rule_inline(stream) if stream.memo is None else stream.match_rule(self._rule_inline, 'inline')
+    def _matcher_66(self, stream):
+        return stream.bind('y', self._matcher_65(stream))
+    def _matcher_67(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('scope', 'None', lambda: self.bind('', self.runtime.lookup('rules')(
+            materialize(self.runtime.join([
+                self.runtime.lookup('repr')(
+                    materialize(self.lookup('x'))
+                ),
+                ': _rule_',
+                self.lookup('x'),
+                ',\n'
+            ]))
+        ), lambda: self.bind('', self.runtime.lookup('matchers')(
+            materialize(self.runtime.join([
+                'def _rule_',
+                self.lookup('x'),
+                '(self, stream):\n',
+                self.runtime.extra.get('indent', self.runtime.indent)(
+                    self.runtime.join([
+                        'items = stream.items\n',
+                        'index = stream.index\n',
+                        self.lookup('y'),
+                        'stream.index = index\n',
+                        'return result\n'
+                    ])
+                )
+            ]))
+        ), lambda: ''))))
+    def _matcher_68(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_66,
+            self._matcher_67
+        ])
+    def _matcher_69(self, stream):
+        return stream.with_scope(self._matcher_68)
+    def _matcher_70(self, stream):
+        return self._rule_vm(stream) if stream.memo is None else stream.match_rule(self._rule_vm, 'vm')
+    def _matcher_71(self, stream):
+        return stream.bind('y', self._matcher_70(stream))
+    def _matcher_72(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('scope', 'None', lambda: self.bind('', self.runtime.lookup('bindings')(
+            materialize(self.runtime.join([
+                '_rule_',
+                self.lookup('x'),
+                ' = VmRule(_program_',
+                self.lookup('x'),
+                ')\n'
+            ]))
+        ), lambda: self.bind('', self.runtime.lookup('rules')(
+            materialize(self.runtime.join([
+                self.runtime.lookup('repr')(
+                    materialize(self.lookup('x'))
+                ),
+                ': _rule_',
+                self.lookup('x'),
+                ',\n'
+            ]))
+        ), lambda: self.bind('', self.runtime.lookup('matchers')(
+            materialize(self.runtime.join([
+                '_program_',
+                self.lookup('x'),
+                ' = assemble([\n',
+                self.runtime.extra.get('indent', self.runtime.indent)(
+                    self.runtime.join([
+                        self.lookup('y'),
+                        "('RETURN',),\n"
+                    ])
+                ),
+                '])\n'
+            ]))
+        ), lambda: '')))))
+    def _matcher_73(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_71,
+            self._matcher_72
+        ])
+    def _matcher_74(self, stream):
+        return stream.with_scope(self._matcher_73)
+    def _matcher_75(self, stream):
+        return self._rule_matcher(stream) if stream.memo is None else stream.match_rule(self._rule_matcher, 'matcher')
+    def _matcher_76(self, stream):
+        return stream.bind('m', self._matcher_75(stream))
+    def _matcher_77(self, stream):
+        return self._rule_methodList(stream) if stream.memo is None else stream.match_rule(self._rule_methodList, 'methodList')
+    def _matcher_78(self, stream):
+        return stream.bind('x', self._matcher_77(stream))
+    def _matcher_79(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.operator_or([',
+            self.lookup('x'),
+            '])'
+        ]), lambda: self.lookup('m')))
+    def _matcher_80(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_78,
+            self._matcher_79
+        ])
+    def _matcher_81(self, stream):
+        return stream.with_scope(self._matcher_80)
+    def _matcher_82(self, stream):
+        return self._rule_dispatch(stream) if stream.memo is None else stream.match_rule(self._rule_dispatch, 'dispatch')
+    def _matcher_83(self, stream):
+        return stream.bind('x', self._matcher_82(stream))
+    def _matcher_84(self, stream):
+        return stream.match(lambda item: item == 'Or', "'Or'")
+    def _matcher_85(self, stream):
+        return stream.bind('y', self._matcher_77(stream))
+    def _matcher_86(self, stream):
+        return stream.operator_and([
+            self._matcher_84,
+            self._matcher_85
+        ])
+    def _matcher_87(self, stream):
+        return stream.match_list(self._matcher_86)
+    def _matcher_88(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.operator_dispatch(',
+            self.lookup('x'),
+            ', [',
+            self.lookup('y'),
+            '])'
+        ]), lambda: self.lookup('m')))
+    def _matcher_89(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_83,
+            self._matcher_87,
+            self._matcher_88
+        ])
+    def _matcher_90(self, stream):
+        return stream.with_scope(self._matcher_89)
+    def _matcher_91(self, stream):
+        return self._rule_method(stream) if stream.memo is None else stream.match_rule(self._rule_method, 'method')
+    def _matcher_92(self, stream):
+        return stream.bind('x', self._matcher_91(stream))
+    def _matcher_93(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('scope', 'stream.scope', lambda: self.bind('body', self.runtime.join([
+            'stream.with_scope(',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m'))))
+    def _matcher_94(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_92,
+            self._matcher_93
+        ])
+    def _matcher_95(self, stream):
+        return stream.with_scope(self._matcher_94)
+    def _matcher_96(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('scope', 'EMPTY_SCOPE', lambda: self.lookup('x')))
+    def _matcher_97(self, stream):
+        return stream.operator_and([
+            self._matcher_36,
+            self._matcher_96
+        ])
+    def _matcher_98(self, stream):
+        return stream.with_scope(self._matcher_97)
+    def _matcher_99(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.operator_and([',
+            self.lookup('x'),
+            '])'
+        ]), lambda: self.lookup('m')))
+    def _matcher_100(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_78,
+            self._matcher_99
+        ])
+    def _matcher_101(self, stream):
+        return stream.with_scope(self._matcher_100)
+    def _matcher_102(self, stream):
+        return stream.bind('x', self._matcher_56(stream))
+    def _matcher_103(self, stream):
+        return stream.bind('y', self._matcher_91(stream))
+    def _matcher_104(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.bind(',
+            self.lookup('x'),
+            ', ',
+            self.lookup('y'),
+            '(stream))'
+        ]), lambda: self.lookup('m')))
+    def _matcher_105(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_102,
+            self._matcher_103,
+            self._matcher_104
+        ])
+    def _matcher_106(self, stream):
+        return stream.with_scope(self._matcher_105)
+    def _matcher_107(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.operator_star(',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_108(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_92,
+            self._matcher_107
+        ])
+    def _matcher_109(self, stream):
+        return stream.with_scope(self._matcher_108)
+    def _matcher_110(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.operator_skip(',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_111(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_92,
+            self._matcher_110
+        ])
+    def _matcher_112(self, stream):
+        return stream.with_scope(self._matcher_111)
+    def _matcher_113(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.operator_span(',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_114(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_92,
+            self._matcher_113
+        ])
+    def _matcher_115(self, stream):
+        return stream.with_scope(self._matcher_114)
+    def _matcher_116(self, stream):
+        return self._rule_until(stream) if stream.memo is None else stream.match_rule(self._rule_until, 'until')
+    def _matcher_117(self, stream):
+        return stream.bind('x', self._matcher_116(stream))
+    def _matcher_118(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.operator_star_until(',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_119(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_117,
+            self._matcher_118
+        ])
+    def _matcher_120(self, stream):
+        return stream.with_scope(self._matcher_119)
+    def _matcher_121(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.operator_skip_until(',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_122(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_117,
+            self._matcher_121
+        ])
+    def _matcher_123(self, stream):
+        return stream.with_scope(self._matcher_122)
+    def _matcher_124(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.operator_not(',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_125(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_92,
+            self._matcher_124
+        ])
+    def _matcher_126(self, stream):
+        return stream.with_scope(self._matcher_125)
+    def _matcher_127(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.match_call_rule(self._rules, self)'
+        ]), lambda: self.lookup('m')))
+    def _matcher_128(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_127
+        ])
+    def _matcher_129(self, stream):
+        return stream.with_scope(self._matcher_128)
+    def _matcher_130(self, stream):
+        return self._rule_rule(stream) if stream.memo is None else stream.match_rule(self._rule_rule, 'rule')
+    def _matcher_131(self, stream):
+        return stream.bind('x', self._matcher_130(stream))
+    def _matcher_132(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            self.lookup('x')
+        ]), lambda: self.lookup('m')))
+    def _matcher_133(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_131,
+            self._matcher_132
+        ])
+    def _matcher_134(self, stream):
+        return stream.with_scope(self._matcher_133)
+    def _matcher_135(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.match(lambda item: ',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_136(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_36,
+            self._matcher_135
+        ])
+    def _matcher_137(self, stream):
+        return stream.with_scope(self._matcher_136)
+    def _matcher_138(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.match_literal(',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_139(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_102,
+            self._matcher_138
+        ])
+    def _matcher_140(self, stream):
+        return stream.with_scope(self._matcher_139)
+    def _matcher_141(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.match_list(',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_142(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_92,
+            self._matcher_141
+        ])
+    def _matcher_143(self, stream):
+        return stream.with_scope(self._matcher_142)
+    def _matcher_144(self, stream):
+        return self._rule_regex(stream) if stream.memo is None else stream.match_rule(self._rule_regex, 'regex')
+    def _matcher_145(self, stream):
+        return stream.bind('x', self._matcher_144(stream))
+    def _matcher_146(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'stream.match_regex(',
+            self.lookup('x'),
+            ', ',
+            self.lookup('y'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_147(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_145,
+            self._matcher_103,
+            self._matcher_146
+        ])
+    def _matcher_148(self, stream):
+        return stream.with_scope(self._matcher_147)
+    def _matcher_149(self, stream):
+        return stream.match(lambda item: item == 'Lookup', "'Lookup'")
+    def _matcher_150(self, stream):
+        return stream.operator_and([
+            self._matcher_149,
+            self._matcher_102
+        ])
+    def _matcher_151(self, stream):
+        return stream.match_list(self._matcher_150)
+    def _matcher_152(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'lookup_action(',
+            self.runtime.lookup('scope'),
+            ', ',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_153(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_151,
+            self._matcher_152
+        ])
+    def _matcher_154(self, stream):
+        return stream.with_scope(self._matcher_153)
+    def _matcher_155(self, stream):
+        return self._rule_constant(stream) if stream.memo is None else stream.match_rule(self._rule_constant, 'constant')
+    def _matcher_156(self, stream):
+        return stream.bind('x', self._matcher_155(stream))
+    def _matcher_157(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_156,
+            self._matcher_132
+        ])
+    def _matcher_158(self, stream):
+        return stream.with_scope(self._matcher_157)
+    def _matcher_159(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('body', self.runtime.join([
+            'SemanticAction(',
+            self.runtime.lookup('scope'),
+            ', lambda self: ',
+            self.lookup('x'),
+            ')'
+        ]), lambda: self.lookup('m')))
+    def _matcher_160(self, stream):
+        return stream.operator_and([
+            self._matcher_76,
+            self._matcher_36,
+            self._matcher_159
+        ])
+    def _matcher_161(self, stream):
+        return stream.with_scope(self._matcher_160)
+    def _matcher_162(self, stream):
+        return stream.operator_or([
+            self._matcher_154,
+            self._matcher_158,
+            self._matcher_161
+        ])
+    def _matcher_163(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.runtime.join([
+            'True',
+            ", 'any'"
+        ]))
+    def _matcher_164(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'item == self._state[',
+            self.lookup('x'),
+            "], 'state'"
+        ]))
+    def _matcher_165(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_164
+        ])
+    def _matcher_166(self, stream):
+        return stream.with_scope(self._matcher_165)
+    def _matcher_167(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'item == ',
+            self.lookup('x'),
+            ', ',
+            self.runtime.lookup('repr')(
+                materialize(self.lookup('x'))
+            )
+        ]))
+    def _matcher_168(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_167
+        ])
+    def _matcher_169(self, stream):
+        return stream.with_scope(self._matcher_168)
+    def _matcher_170(self, stream):
+        return stream.bind('y', self._matcher_56(stream))
+    def _matcher_171(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            self.lookup('x'),
+            ' <= item <= ',
+            self.lookup('y'),
+            ', "',
+            self.lookup('x'),
+            '-',
+            self.lookup('y'),
+            '"'
+        ]))
+    def _matcher_172(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_170,
+            self._matcher_171
+        ])
+    def _matcher_173(self, stream):
+        return stream.with_scope(self._matcher_172)
+    def _matcher_174(self, stream):
+        return self._rule_classRange(stream) if stream.memo is None else stream.match_rule(self._rule_classRange, 'classRange')
+    def _matcher_175(self, stream):
+        return stream.operator_star(self._matcher_174)
+    def _matcher_176(self, stream):
+        return stream.bind('zs', self._matcher_175(stream))
+    def _matcher_177(self, stream):
+        return stream.match_list(self._matcher_176)
+    def _matcher_178(self, stream):
+        return stream.bind('v', self._matcher_56(stream))
+    def _matcher_179(self, stream):
+        return stream.bind('w', self._matcher_56(stream))
+    def _matcher_180(self, stream):
+        return stream.operator_and([
+            self._matcher_178,
+            self._matcher_179
+        ])
+    def _matcher_181(self, stream):
+        return stream.match_list(self._matcher_180)
+    def _matcher_182(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            '(item in {',
+            self.runtime.extra.get('join', self.runtime.join)(
+                self.lookup('xs'),
+                ', '
+            ),
+            '} if isinstance(item, str) and len(item) == 1 ',
+            'else in_ranges(item, [',
+            self.runtime.extra.get('join', self.runtime.join)(
+                self.lookup('zs'),
+                ', '
+            ),
+            '])) and ',
+            '(',
+            self.lookup('v'),
+            ' <= item <= ',
+            self.lookup('w'),
+            ' or expect_first(stream, stream.items, stream.index, ',
+            self.lookup('y'),
+            ')), ',
+            self.lookup('y')
+        ]))
+    def _matcher_183(self, stream):
+        return stream.operator_and([
+            self._matcher_59,
+            self._matcher_170,
+            self._matcher_177,
+            self._matcher_181,
+            self._matcher_182
+        ])
+    def _matcher_184(self, stream):
+        return stream.with_scope(self._matcher_183)
+    def _matcher_185(self, stream):
+        return stream.bind('z', self._matcher_9(stream))
+    def _matcher_186(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.bind(',
+            self.lookup('x'),
+            ', ',
+            self.lookup('y'),
+            ', lambda: ',
+            self.lookup('z'),
+            ')'
+        ]))
+    def _matcher_187(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_37,
+            self._matcher_185,
+            self._matcher_186
+        ])
+    def _matcher_188(self, stream):
+        return stream.with_scope(self._matcher_187)
+    def _matcher_189(self, stream):
+        return self._rule_listItem(stream) if stream.memo is None else stream.match_rule(self._rule_listItem, 'listItem')
+    def _matcher_190(self, stream):
+        return stream.operator_star(self._matcher_189)
+    def _matcher_191(self, stream):
+        return stream.bind('xs', self._matcher_190(stream))
+    def _matcher_192(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            '[',
+            '\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.extra.get('join', self.runtime.join)(
+                    self.lookup('xs'),
+                    ',\n'
+                )
+            ),
+            '\n',
+            ']'
+        ]))
+    def _matcher_193(self, stream):
+        return stream.operator_and([
+            self._matcher_191,
+            self._matcher_192
+        ])
+    def _matcher_194(self, stream):
+        return stream.with_scope(self._matcher_193)
+    def _matcher_195(self, stream):
+        return stream.bind('x', self._matcher_28(stream))
+    def _matcher_196(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.runtime.join([',
+            self.lookup('x'),
+            '])'
+        ]))
+    def _matcher_197(self, stream):
+        return stream.operator_and([
+            self._matcher_195,
+            self._matcher_196
+        ])
+    def _matcher_198(self, stream):
+        return stream.with_scope(self._matcher_197)
+    def _matcher_199(self, stream):
+        return self._rule_helper(stream) if stream.memo is None else stream.match_rule(self._rule_helper, 'helper')
+    def _matcher_200(self, stream):
+        return stream.operator_not(self._matcher_199)
+    def _matcher_201(self, stream):
+        return stream.operator_not(self._matcher_200)
+    def _matcher_202(self, stream):
+        return stream.bind('y', self._matcher_28(stream))
+    def _matcher_203(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            self.lookup('x'),
+            '(',
+            self.lookup('y'),
+            ')'
+        ]))
+    def _matcher_204(self, stream):
+        return stream.operator_and([
+            self._matcher_201,
+            self._matcher_36,
+            self._matcher_202,
+            self._matcher_203
+        ])
+    def _matcher_205(self, stream):
+        return stream.with_scope(self._matcher_204)
+    def _matcher_206(self, stream):
+        return self._rule_textList(stream) if stream.memo is None else stream.match_rule(self._rule_textList, 'textList')
+    def _matcher_207(self, stream):
+        return stream.bind('y', self._matcher_206(stream))
+    def _matcher_208(self, stream):
+        return stream.operator_and([
+            self._matcher_36,
+            self._matcher_207,
+            self._matcher_203
+        ])
+    def _matcher_209(self, stream):
+        return stream.with_scope(self._matcher_208)
+    def _matcher_210(self, stream):
+        return stream.operator_or([
+            self._matcher_205,
+            self._matcher_209
+        ])
+    def _matcher_211(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            self.lookup('x'),
+            '[',
+            self.lookup('y'),
+            ']'
+        ]))
+    def _matcher_212(self, stream):
+        return stream.operator_and([
+            self._matcher_36,
+            self._matcher_170,
+            self._matcher_211
+        ])
+    def _matcher_213(self, stream):
+        return stream.with_scope(self._matcher_212)
+    def _matcher_214(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.lookup(',
+            self.lookup('x'),
+            ')'
+        ]))
+    def _matcher_215(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_214
+        ])
+    def _matcher_216(self, stream):
+        return stream.with_scope(self._matcher_215)
+    def _matcher_217(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.runtime.lookup(',
+            self.lookup('x'),
+            ')'
+        ]))
+    def _matcher_218(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_217
+        ])
+    def _matcher_219(self, stream):
+        return stream.with_scope(self._matcher_218)
+    def _matcher_220(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.runtime.actor._state[',
+            self.lookup('x'),
+            ']'
+        ]))
+    def _matcher_221(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_220
+        ])
+    def _matcher_222(self, stream):
+        return stream.with_scope(self._matcher_221)
+    def _matcher_223(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.runtime.extra.get(',
+            self.runtime.lookup('repr')(
+                materialize(self.lookup('x'))
+            ),
+            ', self.runtime.',
+            self.lookup('x'),
+            ')'
+        ]))
+    def _matcher_224(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_223
+        ])
+    def _matcher_225(self, stream):
+        return stream.with_scope(self._matcher_224)
+    def _matcher_226(self, stream):
+        return stream.match(lambda item: item == 'ListItem', "'ListItem'")
+    def _matcher_227(self, stream):
+        return stream.match(lambda item: item == 0, '0')
+    def _matcher_228(self, stream):
+        return self._rule_text(stream) if stream.memo is None else stream.match_rule(self._rule_text, 'text')
+    def _matcher_229(self, stream):
+        return stream.bind('x', self._matcher_228(stream))
+    def _matcher_230(self, stream):
+        return stream.operator_and([
+            self._matcher_226,
+            self._matcher_227,
+            self._matcher_229
+        ])
+    def _matcher_231(self, stream):
+        return stream.match_list(self._matcher_230)
+    def _matcher_232(self, stream):
+        return stream.operator_and([
+            self._matcher_231,
+            self._matcher_20
+        ])
+    def _matcher_233(self, stream):
+        return stream.with_scope(self._matcher_232)
+    def _matcher_234(self, stream):
+        return stream.match(lambda item: item == 1, '1')
+    def _matcher_235(self, stream):
+        return stream.operator_and([
+            self._matcher_226,
+            self._matcher_234,
+            self._matcher_229
+        ])
+    def _matcher_236(self, stream):
+        return stream.match_list(self._matcher_235)
+    def _matcher_237(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            '*',
+            self.lookup('x')
+        ]))
+    def _matcher_238(self, stream):
+        return stream.operator_and([
+            self._matcher_236,
+            self._matcher_237
+        ])
+    def _matcher_239(self, stream):
+        return stream.with_scope(self._matcher_238)
+    def _matcher_240(self, stream):
+        return stream.operator_and([
+            self._matcher_226,
+            self._matcher_102,
+            self._matcher_37
+        ])
+    def _matcher_241(self, stream):
+        return stream.match_list(self._matcher_240)
+    def _matcher_242(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            '*splice_items(',
+            self.lookup('x'),
+            ', ',
+            self.lookup('y'),
+            ')'
+        ]))
+    def _matcher_243(self, stream):
+        return stream.operator_and([
+            self._matcher_241,
+            self._matcher_242
+        ])
+    def _matcher_244(self, stream):
+        return stream.with_scope(self._matcher_243)
+    def _matcher_245(self, stream):
         return stream.operator_or([
-            self._matcher_483,
-            self._matcher_487,
-            self._matcher_491,
-            self._matcher_495
+            self._matcher_233,
+            self._matcher_239,
+            self._matcher_244
+        ])
+    def _matcher_246(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            '\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.extra.get('join', self.runtime.join)(
+                    self.lookup('xs'),
+                    ',\n'
+                )
+            ),
+            '\n'
+        ]))
+    def _matcher_247(self, stream):
+        return stream.operator_and([
+            self._matcher_11,
+            self._matcher_246
+        ])
+    def _matcher_248(self, stream):
+        return stream.with_scope(self._matcher_247)
+    def _matcher_249(self, stream):
+        return stream.operator_star(self._matcher_228)
+    def _matcher_250(self, stream):
+        return stream.bind('xs', self._matcher_249(stream))
+    def _matcher_251(self, stream):
+        return stream.operator_and([
+            self._matcher_250,
+            self._matcher_246
+        ])
+    def _matcher_252(self, stream):
+        return stream.with_scope(self._matcher_251)
+    def _matcher_253(self, stream):
+        return stream.match(lambda item: item == 'HelperLookup', "'HelperLookup'")
+    _dispatch_254 = Dispatch(False, {'join': [0], 'indent': [1]}, [])
+    def _matcher_255(self, stream):
+        return stream.match(lambda item: item == 'join', "'join'")
+    def _matcher_256(self, stream):
+        return stream.match(lambda item: item == 'indent', "'indent'")
+    def _matcher_257(self, stream):
+        return stream.operator_dispatch(self._dispatch_254, [
+            self._matcher_255,
+            self._matcher_256
+        ])
+    def _matcher_258(self, stream):
+        return stream.operator_and([
+            self._matcher_253,
+            self._matcher_257
+        ])
+    def _matcher_259(self, stream):
+        return stream.match_list(self._matcher_258)
+    def _matcher_260(self, stream):
+        return self._rule_list(stream) if stream.memo is None else stream.match_rule(self._rule_list, 'list')
+    def _matcher_261(self, stream):
+        return stream.operator_not(self._matcher_260)
+    def _matcher_262(self, stream):
+        return stream.operator_not(self._matcher_261)
+    def _matcher_263(self, stream):
+        return stream.operator_and([
+            self._matcher_262,
+            self._matcher_9
+        ])
+    def _matcher_264(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'materialize(',
+            self.lookup('x'),
+            ')'
+        ]))
+    def _matcher_265(self, stream):
+        return stream.operator_and([
+            self._matcher_36,
+            self._matcher_264
+        ])
+    def _matcher_266(self, stream):
+        return stream.with_scope(self._matcher_265)
+    def _matcher_267(self, stream):
+        return stream.operator_or([
+            self._matcher_155,
+            self._matcher_263,
+            self._matcher_266
+        ])
+    def _matcher_268(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.',
+            self.lookup('x')
+        ]))
+    def _matcher_269(self, stream):
+        return stream.operator_and([
+            self._matcher_36,
+            self._matcher_268
+        ])
+    def _matcher_270(self, stream):
+        return stream.with_scope(self._matcher_269)
+    def _matcher_271(self, stream):
+        return stream.operator_star(self._matcher_91)
+    def _matcher_272(self, stream):
+        return stream.bind('xs', self._matcher_271(stream))
+    def _matcher_273(self, stream):
+        return stream.operator_and([
+            self._matcher_272,
+            self._matcher_246
+        ])
+    def _matcher_274(self, stream):
+        return stream.with_scope(self._matcher_273)
+    def _matcher_275(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.runtime.lookup('define')(
+            materialize(self.runtime.lookup('defined')),
+            materialize(self.runtime.lookup('matchers')),
+            materialize(self.runtime.lookup('nextid')),
+            '_matcher_',
+            'def ',
+            materialize(self.runtime.join([
+                '(self, stream):\n',
+                self.runtime.extra.get('indent', self.runtime.indent)(
+                    self.runtime.join([
+                        'return ',
+                        self.runtime.lookup('body'),
+                        '\n'
+                    ])
+                )
+            ]))
+        ))
+    def _matcher_276(self, stream):
+        return stream.bind('z', self._matcher_56(stream))
+    def _matcher_277(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.',
+            self.runtime.lookup('define')(
+                materialize(self.runtime.lookup('defined')),
+                materialize(self.runtime.lookup('matchers')),
+                materialize(self.runtime.lookup('nextid')),
+                '_until_',
+                '',
+                materialize(self.runtime.join([
+                    ' = Until([',
+                    self.runtime.extra.get('join', self.runtime.join)(
+                        self.lookup('xs'),
+                        ', '
+                    ),
+                    '], ',
+                    self.lookup('y'),
+                    ', ',
+                    self.lookup('z'),
+                    ')\n'
+                ]))
+            )
+        ]))
+    def _matcher_278(self, stream):
+        return stream.operator_and([
+            self._matcher_59,
+            self._matcher_170,
+            self._matcher_276,
+            self._matcher_277
+        ])
+    def _matcher_279(self, stream):
+        return stream.with_scope(self._matcher_278)
+    def _matcher_280(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.',
+            self.runtime.lookup('define')(
+                materialize(self.runtime.lookup('defined')),
+                materialize(self.runtime.lookup('matchers')),
+                materialize(self.runtime.lookup('nextid')),
+                '_regex_',
+                '',
+                materialize(self.runtime.join([
+                    ' = Regex(',
+                    self.lookup('x'),
+                    ', ',
+                    self.lookup('y'),
+                    ')\n'
+                ]))
+            )
+        ]))
+    def _matcher_281(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_170,
+            self._matcher_280
+        ])
+    def _matcher_282(self, stream):
+        return stream.with_scope(self._matcher_281)
+    def _matcher_283(self, stream):
+        return self._rule_dispatchKey(stream) if stream.memo is None else stream.match_rule(self._rule_dispatchKey, 'dispatchKey')
+    def _matcher_284(self, stream):
+        return stream.operator_star(self._matcher_283)
+    def _matcher_285(self, stream):
+        return stream.bind('ys', self._matcher_284(stream))
+    def _matcher_286(self, stream):
+        return stream.match_list(self._matcher_285)
+    def _matcher_287(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self.',
+            self.runtime.lookup('define')(
+                materialize(self.runtime.lookup('defined')),
+                materialize(self.runtime.lookup('matchers')),
+                materialize(self.runtime.lookup('nextid')),
+                '_dispatch_',
+                '',
+                materialize(self.runtime.join([
+                    ' = Dispatch(',
+                    self.lookup('x'),
+                    ', {',
+                    self.runtime.extra.get('join', self.runtime.join)(
+                        self.lookup('ys'),
+                        ', '
+                    ),
+                    '}, ',
+                    self.lookup('z'),
+                    ')\n'
+                ]))
+            )
+        ]))
+    def _matcher_288(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_286,
+            self._matcher_276,
+            self._matcher_287
+        ])
+    def _matcher_289(self, stream):
+        return stream.with_scope(self._matcher_288)
+    def _matcher_290(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_170
+        ])
+    def _matcher_291(self, stream):
+        return stream.match_list(self._matcher_290)
+    def _matcher_292(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            self.lookup('x'),
+            ': ',
+            self.lookup('y')
+        ]))
+    def _matcher_293(self, stream):
+        return stream.operator_and([
+            self._matcher_291,
+            self._matcher_292
+        ])
+    def _matcher_294(self, stream):
+        return stream.with_scope(self._matcher_293)
+    def _matcher_295(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            '(',
+            self.lookup('x'),
+            ', ',
+            self.lookup('y'),
+            ')'
+        ]))
+    def _matcher_296(self, stream):
+        return stream.operator_and([
+            self._matcher_291,
+            self._matcher_295
+        ])
+    def _matcher_297(self, stream):
+        return stream.with_scope(self._matcher_296)
+    def _matcher_298(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'self._rule_',
+            self.lookup('x'),
+            '(stream) if stream.memo is None ',
+            'else stream.match_rule(self._rule_',
+            self.lookup('x'),
+            ', ',
+            self.runtime.lookup('repr')(
+                materialize(self.lookup('x'))
+            ),
+            ')'
+        ]))
+    def _matcher_299(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_298
+        ])
+    def _matcher_300(self, stream):
+        return stream.with_scope(self._matcher_299)
+    def _matcher_301(self, stream):
+        return stream.match(lambda item: item == 'List', "'List'")
+    _regex_302 = Regex('(?:.)*+', 'chars')
+    def _matcher_303(self, stream):
+        return stream.operator_star(self._matcher_1)
+    def _matcher_304(self, stream):
+        return stream.match_regex(self._regex_302, self._matcher_303)
+    def _matcher_305(self, stream):
+        return stream.operator_and([
+            self._matcher_301,
+            self._matcher_304
+        ])
+    def _matcher_306(self, stream):
+        return stream.match_list(self._matcher_305)
+    _dispatch_307 = Dispatch(False, {'String': [0], 'Number': [1]}, [])
+    def _matcher_308(self, stream):
+        return stream.match(lambda item: item == 'String', "'String'")
+    def _matcher_309(self, stream):
+        return stream.match(lambda item: item == 'Number', "'Number'")
+    def _matcher_310(self, stream):
+        return stream.operator_dispatch(self._dispatch_307, [
+            self._matcher_308,
+            self._matcher_309
+        ])
+    def _matcher_311(self, stream):
+        return stream.operator_and([
+            self._matcher_310,
+            self._matcher_102,
+            self._matcher_12
+        ])
+    def _matcher_312(self, stream):
+        return stream.match_list(self._matcher_311)
+    def _matcher_313(self, stream):
+        return stream.operator_and([
+            self._matcher_312,
+            self._matcher_20
+        ])
+    def _matcher_314(self, stream):
+        return stream.with_scope(self._matcher_313)
+    def _matcher_315(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('repr')(
+            materialize(self.lookup('x'))
+        ))
+    def _matcher_316(self, stream):
+        return stream.operator_and([
+            self._matcher_23,
+            self._matcher_315
+        ])
+    def _matcher_317(self, stream):
+        return stream.with_scope(self._matcher_316)
+    _dispatch_318 = Dispatch(True, {'Or': [0], 'Dispatch': [1], 'Scope': [2], 'Unscoped': [3], 'And': [4, 5], 'Bind': [6], 'Star': [7], 'Skip': [8], 'StarUntil': [9], 'SkipUntil': [10], 'Span': [11], 'Not': [12], 'MatchCallRule': [13], 'MatchRule': [14], 'MatchObject': [15], 'MatchLiteral': [16], 'MatchList': [17], 'MatchRegex': [18], 'Action': [19, 20, 21]}, [])
+    def _matcher_319(self, stream):
+        return stream.bind('x', self._matcher_65(stream))
+    def _matcher_320(self, stream):
+        return self._rule_inlineOr(stream) if stream.memo is None else stream.match_rule(self._rule_inlineOr, 'inlineOr')
+    def _matcher_321(self, stream):
+        return stream.operator_star(self._matcher_320)
+    def _matcher_322(self, stream):
+        return stream.bind('xs', self._matcher_321(stream))
+    def _matcher_323(self, stream):
+        return stream.operator_and([
+            self._matcher_84,
+            self._matcher_319,
+            self._matcher_322
+        ])
+    def _matcher_324(self, stream):
+        return stream.match_list(self._matcher_323)
+    def _matcher_325(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            '_i',
+            self.runtime.lookup('n'),
+            ' = index\n',
+            self.lookup('x'),
+            self.lookup('xs'),
+            'if result is FAIL:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'index = _i',
+                    self.runtime.lookup('n'),
+                    '\n',
+                    "result = stream.fail_at(items, index, 'no or match')\n"
+                ])
+            )
+        ])))
+    def _matcher_326(self, stream):
+        return stream.operator_and([
+            self._matcher_324,
+            self._matcher_325
+        ])
+    def _matcher_327(self, stream):
+        return stream.with_scope(self._matcher_326)
+    def _matcher_328(self, stream):
+        return stream.match(lambda item: item == 'Dispatch', "'Dispatch'")
+    def _matcher_329(self, stream):
+        return stream.bind('d', self._matcher_82(stream))
+    def _matcher_330(self, stream):
+        return self._rule_inlineCase(stream) if stream.memo is None else stream.match_rule(self._rule_inlineCase, 'inlineCase')
+    def _matcher_331(self, stream):
+        return stream.operator_star(self._matcher_330)
+    def _matcher_332(self, stream):
+        return stream.bind('xs', self._matcher_331(stream))
+    def _matcher_333(self, stream):
+        return stream.operator_and([
+            self._matcher_84,
+            self._matcher_332
         ])
-    def _matcher_497(self, stream):
-        return stream.match(lambda item: '0' <= item <= '9', "'0'-'9'")
-    def _matcher_498(self, stream):
-        return stream.bind('x', self._matcher_497(stream))
-    def _matcher_499(self, stream):
-        return stream.match(lambda item: '0' <= item <= '9', "'0'-'9'")
-    def _matcher_500(self, stream):
-        return stream.operator_star(self._matcher_499)
-    def _matcher_501(self, stream):
-        return stream.bind('xs', self._matcher_500(stream))
-    def _matcher_502(self, stream):
-        return stream.action(lambda self: self.lookup('int')(
-            self.lookup('join')([
-                self.lookup('x'),
-                self.lookup('xs')
-            ])
-        ))
-    def _matcher_503(self, stream):
+    def _matcher_334(self, stream):
+        return stream.match_list(self._matcher_333)
+    def _matcher_335(self, stream):
         return stream.operator_and([
-            self._matcher_498,
-            self._matcher_501,
-            self._matcher_502
+            self._matcher_328,
+            self._matcher_329,
+            self._matcher_334
         ])
-    def _matcher_504(self, stream):
-        return stream.with_scope(self._matcher_503)
-    def _matcher_505(self, stream):
-        return self._rules['reserved'](stream)
-    def _matcher_506(self, stream):
-        return stream.operator_not(self._matcher_505)
-    def _matcher_507(self, stream):
-        return self._rules['nameStart'](stream)
-    def _matcher_508(self, stream):
-        return stream.bind('x', self._matcher_507(stream))
-    def _matcher_509(self, stream):
-        return self._rules['nameChar'](stream)
-    def _matcher_510(self, stream):
-        return stream.operator_star(self._matcher_509)
-    def _matcher_511(self, stream):
-        return stream.bind('xs', self._matcher_510(stream))
-    def _matcher_512(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
+    def _matcher_336(self, stream):
+        return stream.match_list(self._matcher_335)
+    def _matcher_337(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.bind('alt', self.runtime.lookup('Counter')(
+        
+        ), lambda: self.runtime.join([
+            '_i',
+            self.runtime.lookup('n'),
+            ' = index\n',
+            '_d',
+            self.runtime.lookup('n'),
+            ' = ',
+            self.lookup('d'),
+            '.select(stream, items, index)\n',
+            'result = FAIL\n',
+            self.lookup('xs'),
+            'if result is FAIL:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'index = _i',
+                    self.runtime.lookup('n'),
+                    '\n',
+                    "result = stream.fail_at(items, index, 'no or match')\n"
+                ])
+            )
+        ]))))
+    def _matcher_338(self, stream):
+        return stream.operator_and([
+            self._matcher_336,
+            self._matcher_337
+        ])
+    def _matcher_339(self, stream):
+        return stream.with_scope(self._matcher_338)
+    def _matcher_340(self, stream):
+        return stream.match(lambda item: item == 'Scope', "'Scope'")
+    def _matcher_341(self, stream):
+        return stream.operator_and([
+            self._matcher_340,
+            self._matcher_319
+        ])
+    def _matcher_342(self, stream):
+        return stream.match_list(self._matcher_341)
+    def _matcher_343(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('scope', self.runtime.join([
+            '_s',
+            self.runtime.lookup('nextid')(
+            
+            )
+        ]), lambda: self.runtime.join([
+            self.runtime.lookup('scope'),
+            ' = {}\n',
+            self.lookup('x')
+        ])))
+    def _matcher_344(self, stream):
+        return stream.operator_and([
+            self._matcher_342,
+            self._matcher_343
+        ])
+    def _matcher_345(self, stream):
+        return stream.with_scope(self._matcher_344)
+    def _matcher_346(self, stream):
+        return stream.match(lambda item: item == 'Unscoped', "'Unscoped'")
+    def _matcher_347(self, stream):
+        return stream.operator_and([
+            self._matcher_346,
+            self._matcher_319
+        ])
+    def _matcher_348(self, stream):
+        return stream.match_list(self._matcher_347)
+    def _matcher_349(self, stream):
+        return stream.operator_and([
+            self._matcher_348,
+            self._matcher_96
+        ])
+    def _matcher_350(self, stream):
+        return stream.with_scope(self._matcher_349)
+    def _matcher_351(self, stream):
+        return stream.match(lambda item: item == 'And', "'And'")
+    def _matcher_352(self, stream):
+        return self._rule_inlineAnd(stream) if stream.memo is None else stream.match_rule(self._rule_inlineAnd, 'inlineAnd')
+    def _matcher_353(self, stream):
+        return stream.operator_star(self._matcher_352)
+    def _matcher_354(self, stream):
+        return stream.bind('xs', self._matcher_353(stream))
+    def _matcher_355(self, stream):
+        return stream.operator_and([
+            self._matcher_351,
+            self._matcher_319,
+            self._matcher_354
+        ])
+    def _matcher_356(self, stream):
+        return stream.match_list(self._matcher_355)
+    def _matcher_357(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
             self.lookup('x'),
             self.lookup('xs')
         ]))
-    def _matcher_513(self, stream):
+    def _matcher_358(self, stream):
         return stream.operator_and([
-            self._matcher_506,
-            self._matcher_508,
-            self._matcher_511,
-            self._matcher_512
+            self._matcher_356,
+            self._matcher_357
         ])
-    def _matcher_514(self, stream):
-        return stream.with_scope(self._matcher_513)
-    def _matcher_515(self, stream):
-        return self._rules['keyDef'](stream)
-    def _matcher_516(self, stream):
-        return stream.with_scope(self._matcher_515)
-    def _matcher_517(self, stream):
-        return self._rules['keyActor'](stream)
-    def _matcher_518(self, stream):
-        return stream.with_scope(self._matcher_517)
-    def _matcher_519(self, stream):
-        return self._rules['keyWhere'](stream)
-    def _matcher_520(self, stream):
-        return stream.with_scope(self._matcher_519)
-    def _matcher_521(self, stream):
-        return self._rules['keyUniverse'](stream)
-    def _matcher_522(self, stream):
-        return stream.with_scope(self._matcher_521)
-    def _matcher_523(self, stream):
-        return self._rules['keyExamples'](stream)
-    def _matcher_524(self, stream):
-        return stream.with_scope(self._matcher_523)
-    def _matcher_525(self, stream):
-        return stream.operator_or([
-            self._matcher_516,
-            self._matcher_518,
-            self._matcher_520,
-            self._matcher_522,
-            self._matcher_524
+    def _matcher_359(self, stream):
+        return stream.with_scope(self._matcher_358)
+    def _matcher_360(self, stream):
+        return stream.match_list(self._matcher_351)
+    def _matcher_361(self, stream):
+        return 'result = None\n'
+    def _matcher_362(self, stream):
+        return stream.operator_and([
+            self._matcher_360,
+            self._matcher_361
         ])
-    def _matcher_526(self, stream):
-        return stream.match(lambda item: item == 'd', "'d'")
-    def _matcher_527(self, stream):
-        return stream.match(lambda item: item == 'e', "'e'")
-    def _matcher_528(self, stream):
-        return stream.match(lambda item: item == 'f', "'f'")
-    def _matcher_529(self, stream):
-        return self._rules['nameChar'](stream)
-    def _matcher_530(self, stream):
-        return stream.operator_not(self._matcher_529)
-    def _matcher_531(self, stream):
+    def _matcher_363(self, stream):
+        return stream.match(lambda item: item == 'Bind', "'Bind'")
+    def _matcher_364(self, stream):
         return stream.operator_and([
-            self._matcher_526,
-            self._matcher_527,
-            self._matcher_528,
-            self._matcher_530
+            self._matcher_363,
+            self._matcher_102,
+            self._matcher_66
         ])
-    def _matcher_532(self, stream):
-        return stream.with_scope(self._matcher_531)
-    def _matcher_533(self, stream):
-        return stream.match(lambda item: item == 'a', "'a'")
-    def _matcher_534(self, stream):
-        return stream.match(lambda item: item == 'c', "'c'")
-    def _matcher_535(self, stream):
-        return stream.match(lambda item: item == 't', "'t'")
-    def _matcher_536(self, stream):
-        return stream.match(lambda item: item == 'o', "'o'")
-    def _matcher_537(self, stream):
-        return stream.match(lambda item: item == 'r', "'r'")
-    def _matcher_538(self, stream):
-        return self._rules['nameChar'](stream)
-    def _matcher_539(self, stream):
-        return stream.operator_not(self._matcher_538)
-    def _matcher_540(self, stream):
+    def _matcher_365(self, stream):
+        return stream.match_list(self._matcher_364)
+    def _matcher_366(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            self.lookup('y'),
+            'if result is not FAIL:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    self.runtime.lookup('scope'),
+                    '[',
+                    self.lookup('x'),
+                    '] = result\n'
+                ])
+            )
+        ]))
+    def _matcher_367(self, stream):
         return stream.operator_and([
-            self._matcher_533,
-            self._matcher_534,
-            self._matcher_535,
-            self._matcher_536,
-            self._matcher_537,
-            self._matcher_539
+            self._matcher_365,
+            self._matcher_366
         ])
-    def _matcher_541(self, stream):
-        return stream.with_scope(self._matcher_540)
-    def _matcher_542(self, stream):
-        return stream.match(lambda item: item == 'w', "'w'")
-    def _matcher_543(self, stream):
-        return stream.match(lambda item: item == 'h', "'h'")
-    def _matcher_544(self, stream):
-        return stream.match(lambda item: item == 'e', "'e'")
-    def _matcher_545(self, stream):
-        return stream.match(lambda item: item == 'r', "'r'")
-    def _matcher_546(self, stream):
-        return stream.match(lambda item: item == 'e', "'e'")
-    def _matcher_547(self, stream):
-        return self._rules['nameChar'](stream)
-    def _matcher_548(self, stream):
-        return stream.operator_not(self._matcher_547)
-    def _matcher_549(self, stream):
+    def _matcher_368(self, stream):
+        return stream.with_scope(self._matcher_367)
+    def _matcher_369(self, stream):
+        return stream.match(lambda item: item == 'Star', "'Star'")
+    def _matcher_370(self, stream):
+        return stream.operator_and([
+            self._matcher_369,
+            self._matcher_319
+        ])
+    def _matcher_371(self, stream):
+        return stream.match_list(self._matcher_370)
+    def _matcher_372(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            '_xs',
+            self.runtime.lookup('n'),
+            ' = []\n',
+            'while True:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    '_i',
+                    self.runtime.lookup('n'),
+                    ' = index\n',
+                    self.lookup('x'),
+                    'if result is FAIL:\n',
+                    self.runtime.extra.get('indent', self.runtime.indent)(
+                        self.runtime.join([
+                            'index = _i',
+                            self.runtime.lookup('n'),
+                            '\n',
+                            'break\n'
+                        ])
+                    ),
+                    '_xs',
+                    self.runtime.lookup('n'),
+                    '.append(result)\n'
+                ])
+            ),
+            'result = stream.action_list(_xs',
+            self.runtime.lookup('n'),
+            ')\n'
+        ])))
+    def _matcher_373(self, stream):
+        return stream.operator_and([
+            self._matcher_371,
+            self._matcher_372
+        ])
+    def _matcher_374(self, stream):
+        return stream.with_scope(self._matcher_373)
+    def _matcher_375(self, stream):
+        return stream.match(lambda item: item == 'Skip', "'Skip'")
+    def _matcher_376(self, stream):
+        return stream.operator_and([
+            self._matcher_375,
+            self._matcher_319
+        ])
+    def _matcher_377(self, stream):
+        return stream.match_list(self._matcher_376)
+    def _matcher_378(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            'while True:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    '_i',
+                    self.runtime.lookup('n'),
+                    ' = index\n',
+                    self.lookup('x'),
+                    'if result is FAIL:\n',
+                    self.runtime.extra.get('indent', self.runtime.indent)(
+                        self.runtime.join([
+                            'index = _i',
+                            self.runtime.lookup('n'),
+                            '\n',
+                            'break\n'
+                        ])
+                    )
+                ])
+            ),
+            'result = None\n'
+        ])))
+    def _matcher_379(self, stream):
+        return stream.operator_and([
+            self._matcher_377,
+            self._matcher_378
+        ])
+    def _matcher_380(self, stream):
+        return stream.with_scope(self._matcher_379)
+    def _matcher_381(self, stream):
+        return stream.match(lambda item: item == 'StarUntil', "'StarUntil'")
+    def _matcher_382(self, stream):
+        return stream.operator_and([
+            self._matcher_381,
+            self._matcher_117
+        ])
+    def _matcher_383(self, stream):
+        return stream.match_list(self._matcher_382)
+    def _matcher_384(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            '_i',
+            self.runtime.lookup('n'),
+            ' = index\n',
+            'index = ',
+            self.lookup('x'),
+            '.scan(stream, items, index)\n',
+            'result = list(items[_i',
+            self.runtime.lookup('n'),
+            ':index])\n'
+        ])))
+    def _matcher_385(self, stream):
+        return stream.operator_and([
+            self._matcher_383,
+            self._matcher_384
+        ])
+    def _matcher_386(self, stream):
+        return stream.with_scope(self._matcher_385)
+    def _matcher_387(self, stream):
+        return stream.match(lambda item: item == 'SkipUntil', "'SkipUntil'")
+    def _matcher_388(self, stream):
+        return stream.operator_and([
+            self._matcher_387,
+            self._matcher_117
+        ])
+    def _matcher_389(self, stream):
+        return stream.match_list(self._matcher_388)
+    def _matcher_390(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'index = ',
+            self.lookup('x'),
+            '.scan(stream, items, index)\n',
+            'result = None\n'
+        ]))
+    def _matcher_391(self, stream):
+        return stream.operator_and([
+            self._matcher_389,
+            self._matcher_390
+        ])
+    def _matcher_392(self, stream):
+        return stream.with_scope(self._matcher_391)
+    def _matcher_393(self, stream):
+        return stream.match(lambda item: item == 'Span', "'Span'")
+    def _matcher_394(self, stream):
+        return stream.operator_and([
+            self._matcher_393,
+            self._matcher_319
+        ])
+    def _matcher_395(self, stream):
+        return stream.match_list(self._matcher_394)
+    def _matcher_396(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            '_i',
+            self.runtime.lookup('n'),
+            ' = index\n',
+            self.lookup('x'),
+            'if result is not FAIL:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'result = items[_i',
+                    self.runtime.lookup('n'),
+                    ':index]\n'
+                ])
+            )
+        ])))
+    def _matcher_397(self, stream):
+        return stream.operator_and([
+            self._matcher_395,
+            self._matcher_396
+        ])
+    def _matcher_398(self, stream):
+        return stream.with_scope(self._matcher_397)
+    def _matcher_399(self, stream):
+        return stream.match(lambda item: item == 'Not', "'Not'")
+    def _matcher_400(self, stream):
+        return stream.operator_and([
+            self._matcher_399,
+            self._matcher_319
+        ])
+    def _matcher_401(self, stream):
+        return stream.match_list(self._matcher_400)
+    def _matcher_402(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            '_i',
+            self.runtime.lookup('n'),
+            ' = index\n',
+            self.lookup('x'),
+            'index = _i',
+            self.runtime.lookup('n'),
+            '\n',
+            'if result is FAIL:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'result = None\n'
+                ])
+            ),
+            'else:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    "result = stream.fail_at(items, index, 'not matched')\n"
+                ])
+            )
+        ])))
+    def _matcher_403(self, stream):
+        return stream.operator_and([
+            self._matcher_401,
+            self._matcher_402
+        ])
+    def _matcher_404(self, stream):
+        return stream.with_scope(self._matcher_403)
+    def _matcher_405(self, stream):
+        return stream.match(lambda item: item == 'MatchCallRule', "'MatchCallRule'")
+    def _matcher_406(self, stream):
+        return stream.match_list(self._matcher_405)
+    def _matcher_407(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.runtime.join([
+            'stream.index = index\n',
+            'result = stream.match_call_rule(self._rules, self)\n',
+            'index = stream.index\n'
+        ]))
+    def _matcher_408(self, stream):
+        return stream.operator_and([
+            self._matcher_406,
+            self._matcher_407
+        ])
+    def _matcher_409(self, stream):
+        return stream.match(lambda item: item == 'MatchRule', "'MatchRule'")
+    def _matcher_410(self, stream):
+        return stream.operator_and([
+            self._matcher_409,
+            self._matcher_131
+        ])
+    def _matcher_411(self, stream):
+        return stream.match_list(self._matcher_410)
+    def _matcher_412(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'stream.index = index\n',
+            'result = ',
+            self.lookup('x'),
+            '\n',
+            'index = stream.index\n'
+        ]))
+    def _matcher_413(self, stream):
         return stream.operator_and([
-            self._matcher_542,
-            self._matcher_543,
-            self._matcher_544,
-            self._matcher_545,
-            self._matcher_546,
-            self._matcher_548
+            self._matcher_411,
+            self._matcher_412
         ])
-    def _matcher_550(self, stream):
-        return stream.with_scope(self._matcher_549)
-    def _matcher_551(self, stream):
-        return stream.match(lambda item: item == 'u', "'u'")
-    def _matcher_552(self, stream):
-        return stream.match(lambda item: item == 'n', "'n'")
-    def _matcher_553(self, stream):
-        return stream.match(lambda item: item == 'i', "'i'")
-    def _matcher_554(self, stream):
-        return stream.match(lambda item: item == 'v', "'v'")
-    def _matcher_555(self, stream):
-        return stream.match(lambda item: item == 'e', "'e'")
-    def _matcher_556(self, stream):
-        return stream.match(lambda item: item == 'r', "'r'")
-    def _matcher_557(self, stream):
-        return stream.match(lambda item: item == 's', "'s'")
-    def _matcher_558(self, stream):
-        return stream.match(lambda item: item == 'e', "'e'")
-    def _matcher_559(self, stream):
-        return self._rules['nameChar'](stream)
-    def _matcher_560(self, stream):
-        return stream.operator_not(self._matcher_559)
-    def _matcher_561(self, stream):
+    def _matcher_414(self, stream):
+        return stream.with_scope(self._matcher_413)
+    def _matcher_415(self, stream):
+        return stream.match(lambda item: item == 'MatchObject', "'MatchObject'")
+    def _matcher_416(self, stream):
+        return self._rule_inlineTest(stream) if stream.memo is None else stream.match_rule(self._rule_inlineTest, 'inlineTest')
+    def _matcher_417(self, stream):
+        return stream.bind('x', self._matcher_416(stream))
+    def _matcher_418(self, stream):
         return stream.operator_and([
-            self._matcher_551,
-            self._matcher_552,
-            self._matcher_553,
-            self._matcher_554,
-            self._matcher_555,
-            self._matcher_556,
-            self._matcher_557,
-            self._matcher_558,
-            self._matcher_560
+            self._matcher_415,
+            self._matcher_417
         ])
-    def _matcher_562(self, stream):
-        return stream.with_scope(self._matcher_561)
-    def _matcher_563(self, stream):
-        return stream.match(lambda item: item == 'e', "'e'")
-    def _matcher_564(self, stream):
-        return stream.match(lambda item: item == 'x', "'x'")
-    def _matcher_565(self, stream):
-        return stream.match(lambda item: item == 'a', "'a'")
-    def _matcher_566(self, stream):
-        return stream.match(lambda item: item == 'm', "'m'")
-    def _matcher_567(self, stream):
-        return stream.match(lambda item: item == 'p', "'p'")
-    def _matcher_568(self, stream):
-        return stream.match(lambda item: item == 'l', "'l'")
-    def _matcher_569(self, stream):
-        return stream.match(lambda item: item == 'e', "'e'")
-    def _matcher_570(self, stream):
-        return stream.match(lambda item: item == 's', "'s'")
-    def _matcher_571(self, stream):
-        return self._rules['nameChar'](stream)
-    def _matcher_572(self, stream):
-        return stream.operator_not(self._matcher_571)
-    def _matcher_573(self, stream):
+    def _matcher_419(self, stream):
+        return stream.match_list(self._matcher_418)
+    def _matcher_420(self, stream):
         return stream.operator_and([
-            self._matcher_563,
-            self._matcher_564,
-            self._matcher_565,
-            self._matcher_566,
-            self._matcher_567,
-            self._matcher_568,
-            self._matcher_569,
-            self._matcher_570,
-            self._matcher_572
+            self._matcher_419,
+            self._matcher_20
         ])
-    def _matcher_574(self, stream):
-        return stream.with_scope(self._matcher_573)
-    def _matcher_575(self, stream):
-        return stream.match(lambda item: 'a' <= item <= 'z', "'a'-'z'")
-    def _matcher_576(self, stream):
-        return stream.with_scope(self._matcher_575)
-    def _matcher_577(self, stream):
-        return stream.match(lambda item: 'A' <= item <= 'Z', "'A'-'Z'")
-    def _matcher_578(self, stream):
-        return stream.with_scope(self._matcher_577)
-    def _matcher_579(self, stream):
-        return stream.operator_or([
-            self._matcher_576,
-            self._matcher_578
+    def _matcher_421(self, stream):
+        return stream.with_scope(self._matcher_420)
+    def _matcher_422(self, stream):
+        return stream.match(lambda item: item == 'MatchLiteral', "'MatchLiteral'")
+    def _matcher_423(self, stream):
+        return stream.operator_and([
+            self._matcher_422,
+            self._matcher_102
         ])
-    def _matcher_580(self, stream):
-        return stream.match(lambda item: 'a' <= item <= 'z', "'a'-'z'")
-    def _matcher_581(self, stream):
-        return stream.with_scope(self._matcher_580)
-    def _matcher_582(self, stream):
-        return stream.match(lambda item: 'A' <= item <= 'Z', "'A'-'Z'")
-    def _matcher_583(self, stream):
-        return stream.with_scope(self._matcher_582)
-    def _matcher_584(self, stream):
-        return stream.match(lambda item: '0' <= item <= '9', "'0'-'9'")
-    def _matcher_585(self, stream):
-        return stream.with_scope(self._matcher_584)
-    def _matcher_586(self, stream):
-        return stream.operator_or([
-            self._matcher_581,
-            self._matcher_583,
-            self._matcher_585
+    def _matcher_424(self, stream):
+        return stream.match_list(self._matcher_423)
+    def _matcher_425(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            '_i',
+            self.runtime.lookup('n'),
+            ' = literal_end(stream, items, index, ',
+            self.lookup('x'),
+            ')\n',
+            'if _i',
+            self.runtime.lookup('n'),
+            ' is FAIL:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'result = FAIL\n'
+                ])
+            ),
+            'else:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'index = _i',
+                    self.runtime.lookup('n'),
+                    '\n',
+                    'result = items[index-1]\n'
+                ])
+            )
+        ])))
+    def _matcher_426(self, stream):
+        return stream.operator_and([
+            self._matcher_424,
+            self._matcher_425
         ])
-    def _matcher_587(self, stream):
-        return stream.match(lambda item: item == ' ', "' '")
-    def _matcher_588(self, stream):
-        return stream.with_scope(self._matcher_587)
-    def _matcher_589(self, stream):
-        return stream.match(lambda item: item == '\n', "'\\n'")
-    def _matcher_590(self, stream):
-        return stream.with_scope(self._matcher_589)
-    def _matcher_591(self, stream):
-        return self._rules['comment'](stream)
-    def _matcher_592(self, stream):
-        return stream.with_scope(self._matcher_591)
-    def _matcher_593(self, stream):
-        return stream.operator_or([
-            self._matcher_588,
-            self._matcher_590,
-            self._matcher_592
+    def _matcher_427(self, stream):
+        return stream.with_scope(self._matcher_426)
+    def _matcher_428(self, stream):
+        return stream.match(lambda item: item == 'MatchList', "'MatchList'")
+    def _matcher_429(self, stream):
+        return stream.operator_and([
+            self._matcher_428,
+            self._matcher_319
         ])
-    def _matcher_594(self, stream):
-        return stream.operator_star(self._matcher_593)
-    def _matcher_595(self, stream):
-        return stream.with_scope(self._matcher_594)
-    def _matcher_596(self, stream):
-        return stream.match(lambda item: item == '/', "'/'")
-    def _matcher_597(self, stream):
-        return stream.match(lambda item: item == '/', "'/'")
-    def _matcher_598(self, stream):
-        return stream.match(lambda item: item == '\n', "'\\n'")
-    def _matcher_599(self, stream):
+    def _matcher_430(self, stream):
+        return stream.match_list(self._matcher_429)
+    def _matcher_431(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            'if index < len(items):\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    '_items',
+                    self.runtime.lookup('n'),
+                    ' = items\n',
+                    '_i',
+                    self.runtime.lookup('n'),
+                    ' = index\n',
+                    'items = stream.items = items[index]\n',
+                    'index = 0\n',
+                    self.lookup('x'),
+                    'items = stream.items = _items',
+                    self.runtime.lookup('n'),
+                    '\n',
+                    'index = _i',
+                    self.runtime.lookup('n'),
+                    '\n',
+                    'if result is not FAIL:\n',
+                    self.runtime.extra.get('indent', self.runtime.indent)(
+                        self.runtime.join([
+                            'index += 1\n'
+                        ])
+                    )
+                ])
+            ),
+            'else:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    "result = stream.fail_at(items, index, 'no list found')\n"
+                ])
+            )
+        ])))
+    def _matcher_432(self, stream):
         return stream.operator_and([
-            self._matcher_598
+            self._matcher_430,
+            self._matcher_431
         ])
-    def _matcher_600(self, stream):
-        return stream.operator_not(self._matcher_599)
-    def _matcher_601(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_602(self, stream):
+    def _matcher_433(self, stream):
+        return stream.with_scope(self._matcher_432)
+    def _matcher_434(self, stream):
+        return stream.match(lambda item: item == 'MatchRegex', "'MatchRegex'")
+    def _matcher_435(self, stream):
         return stream.operator_and([
-            self._matcher_600,
-            self._matcher_601
+            self._matcher_434,
+            self._matcher_145,
+            self._matcher_66
         ])
-    def _matcher_603(self, stream):
-        return stream.with_scope(self._matcher_602)
-    def _matcher_604(self, stream):
-        return stream.operator_star(self._matcher_603)
-    def _matcher_605(self, stream):
-        return stream.match(lambda item: item == '\n', "'\\n'")
-    def _matcher_606(self, stream):
+    def _matcher_436(self, stream):
+        return stream.match_list(self._matcher_435)
+    def _matcher_437(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            'if stream.exact or not ATOMIC_REGEX or not isinstance(items, str):\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.lookup('y')
+            ),
+            'else:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'stream.shortcut = True\n',
+                    '_m',
+                    self.runtime.lookup('n'),
+                    ' = ',
+                    self.lookup('x'),
+                    '.match(items, index)\n',
+                    'if _m',
+                    self.runtime.lookup('n'),
+                    ' is None:\n',
+                    self.runtime.extra.get('indent', self.runtime.indent)(
+                        self.runtime.join([
+                            'result = FAIL\n'
+                        ])
+                    ),
+                    'else:\n',
+                    self.runtime.extra.get('indent', self.runtime.indent)(
+                        self.runtime.join([
+                            'index = _m',
+                            self.runtime.lookup('n'),
+                            '.end()\n',
+                            'result = ',
+                            self.lookup('x'),
+                            '.value(_m',
+                            self.runtime.lookup('n'),
+                            ')\n'
+                        ])
+                    )
+                ])
+            )
+        ])))
+    def _matcher_438(self, stream):
         return stream.operator_and([
-            self._matcher_596,
-            self._matcher_597,
-            self._matcher_604,
-            self._matcher_605
+            self._matcher_436,
+            self._matcher_437
         ])
-    def _matcher_607(self, stream):
-        return stream.with_scope(self._matcher_606)
-natives['Parser'] = Parser
-class Optimizer:
-    def __init__(self):
-        self._state = {}
-        self._rules = {
-            '_main': self._matcher_9,
-            'opts': self._matcher_17,
-            'opt': self._matcher_27,
-            'Actor': self._matcher_36,
-            'Rule': self._matcher_43,
-            'Or': self._matcher_56,
-            'Scope': self._matcher_61,
-            'Star': self._matcher_66,
-            'And': self._matcher_80,
-            'andInner': self._matcher_94,
-        }
-        self._main = self._rules.pop('_main')
-    def run(self, stream):
-        return self._main(stream)
-    def _matcher_0(self, stream):
-        return stream.match(lambda item: item == 'Ast', "'Ast'")
-    def _matcher_1(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_2(self, stream):
-        return stream.bind('p', self._matcher_1(stream))
-    def _matcher_3(self, stream):
-        return self._rules['opts'](stream)
-    def _matcher_4(self, stream):
-        return stream.bind('xs', self._matcher_3(stream))
-    def _matcher_5(self, stream):
+    def _matcher_439(self, stream):
+        return stream.with_scope(self._matcher_438)
+    def _matcher_440(self, stream):
+        return stream.match(lambda item: item == 'Action', "'Action'")
+    def _matcher_441(self, stream):
         return stream.operator_and([
-            self._matcher_4
+            self._matcher_440,
+            self._matcher_151
         ])
-    def _matcher_6(self, stream):
-        return stream.match_list(self._matcher_5)
-    def _matcher_7(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(0, 'Optimized'),
-                self.lookup('splice')(0, self.lookup('p')),
-                self.lookup('splice')(0, self.lookup('xs'))
-            ])
-        ))
-    def _matcher_8(self, stream):
+    def _matcher_442(self, stream):
+        return stream.match_list(self._matcher_441)
+    def _matcher_443(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'result = lookup_action(',
+            self.runtime.lookup('scope'),
+            ', ',
+            self.lookup('x'),
+            ')\n'
+        ]))
+    def _matcher_444(self, stream):
         return stream.operator_and([
-            self._matcher_0,
-            self._matcher_2,
-            self._matcher_6,
-            self._matcher_7
+            self._matcher_442,
+            self._matcher_443
         ])
-    def _matcher_9(self, stream):
-        return stream.with_scope(self._matcher_8)
-    def _matcher_10(self, stream):
-        return self._rules['opt'](stream)
-    def _matcher_11(self, stream):
-        return stream.operator_star(self._matcher_10)
-    def _matcher_12(self, stream):
-        return stream.bind('xs', self._matcher_11(stream))
-    def _matcher_13(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_14(self, stream):
-        return stream.operator_not(self._matcher_13)
-    def _matcher_15(self, stream):
-        return stream.action(lambda self: self.lookup('xs'))
-    def _matcher_16(self, stream):
+    def _matcher_445(self, stream):
+        return stream.with_scope(self._matcher_444)
+    def _matcher_446(self, stream):
         return stream.operator_and([
-            self._matcher_12,
-            self._matcher_14,
-            self._matcher_15
+            self._matcher_440,
+            self._matcher_156
         ])
-    def _matcher_17(self, stream):
-        return stream.with_scope(self._matcher_16)
-    def _matcher_18(self, stream):
-        return stream.match_call_rule(self._rules)
-    def _matcher_19(self, stream):
-        return stream.bind('x', self._matcher_18(stream))
-    def _matcher_20(self, stream):
+    def _matcher_447(self, stream):
+        return stream.match_list(self._matcher_446)
+    def _matcher_448(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'result = ',
+            self.lookup('x'),
+            '\n'
+        ]))
+    def _matcher_449(self, stream):
         return stream.operator_and([
-            self._matcher_19
+            self._matcher_447,
+            self._matcher_448
         ])
-    def _matcher_21(self, stream):
-        return stream.match_list(self._matcher_20)
-    def _matcher_22(self, stream):
-        return stream.action(lambda self: self.lookup('x'))
-    def _matcher_23(self, stream):
+    def _matcher_450(self, stream):
+        return stream.with_scope(self._matcher_449)
+    def _matcher_451(self, stream):
         return stream.operator_and([
-            self._matcher_21,
-            self._matcher_22
+            self._matcher_440,
+            self._matcher_36
         ])
-    def _matcher_24(self, stream):
-        return stream.with_scope(self._matcher_23)
-    def _matcher_25(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_26(self, stream):
-        return stream.with_scope(self._matcher_25)
-    def _matcher_27(self, stream):
-        return stream.operator_or([
-            self._matcher_24,
-            self._matcher_26
+    def _matcher_452(self, stream):
+        return stream.match_list(self._matcher_451)
+    def _matcher_453(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'result = SemanticAction(',
+            self.runtime.lookup('scope'),
+            ', lambda self: ',
+            self.lookup('x'),
+            ')\n'
+        ]))
+    def _matcher_454(self, stream):
+        return stream.operator_and([
+            self._matcher_452,
+            self._matcher_453
         ])
-    def _matcher_28(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_29(self, stream):
-        return stream.bind('x', self._matcher_28(stream))
-    def _matcher_30(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_31(self, stream):
-        return stream.bind('y', self._matcher_30(stream))
-    def _matcher_32(self, stream):
-        return self._rules['opts'](stream)
-    def _matcher_33(self, stream):
-        return stream.bind('zs', self._matcher_32(stream))
-    def _matcher_34(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Actor'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('y')),
-            self.lookup('splice')(1, self.lookup('zs'))
+    def _matcher_455(self, stream):
+        return stream.with_scope(self._matcher_454)
+    def _matcher_456(self, stream):
+        return stream.operator_dispatch(self._dispatch_318, [
+            self._matcher_327,
+            self._matcher_339,
+            self._matcher_345,
+            self._matcher_350,
+            self._matcher_359,
+            self._matcher_362,
+            self._matcher_368,
+            self._matcher_374,
+            self._matcher_380,
+            self._matcher_386,
+            self._matcher_392,
+            self._matcher_398,
+            self._matcher_404,
+            self._matcher_408,
+            self._matcher_414,
+            self._matcher_421,
+            self._matcher_427,
+            self._matcher_433,
+            self._matcher_439,
+            self._matcher_445,
+            self._matcher_450,
+            self._matcher_455
+        ])
+    def _matcher_457(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'if result is FAIL:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'index = _i',
+                    self.runtime.lookup('n'),
+                    '\n',
+                    self.lookup('x')
+                ])
+            )
         ]))
-    def _matcher_35(self, stream):
+    def _matcher_458(self, stream):
         return stream.operator_and([
-            self._matcher_29,
-            self._matcher_31,
-            self._matcher_33,
-            self._matcher_34
+            self._matcher_319,
+            self._matcher_457
         ])
-    def _matcher_36(self, stream):
-        return stream.with_scope(self._matcher_35)
-    def _matcher_37(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_38(self, stream):
-        return stream.bind('x', self._matcher_37(stream))
-    def _matcher_39(self, stream):
-        return self._rules['opt'](stream)
-    def _matcher_40(self, stream):
-        return stream.bind('y', self._matcher_39(stream))
-    def _matcher_41(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Rule'),
-            self.lookup('splice')(0, self.lookup('x')),
-            self.lookup('splice')(0, self.lookup('y'))
+    def _matcher_459(self, stream):
+        return stream.with_scope(self._matcher_458)
+    def _matcher_460(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'if result is FAIL and ',
+            self.runtime.lookup('alt')(
+            
+            ),
+            ' in _d',
+            self.runtime.lookup('n'),
+            ':\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'index = _i',
+                    self.runtime.lookup('n'),
+                    '\n',
+                    self.lookup('x')
+                ])
+            )
         ]))
-    def _matcher_42(self, stream):
+    def _matcher_461(self, stream):
         return stream.operator_and([
-            self._matcher_38,
-            self._matcher_40,
-            self._matcher_41
+            self._matcher_319,
+            self._matcher_460
         ])
-    def _matcher_43(self, stream):
-        return stream.with_scope(self._matcher_42)
-    def _matcher_44(self, stream):
-        return self._rules['opt'](stream)
-    def _matcher_45(self, stream):
-        return stream.bind('y', self._matcher_44(stream))
-    def _matcher_46(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_47(self, stream):
-        return stream.operator_not(self._matcher_46)
-    def _matcher_48(self, stream):
-        return stream.action(lambda self: self.lookup('y'))
-    def _matcher_49(self, stream):
+    def _matcher_462(self, stream):
+        return stream.with_scope(self._matcher_461)
+    def _matcher_463(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'if result is not FAIL:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.lookup('x')
+            )
+        ]))
+    def _matcher_464(self, stream):
         return stream.operator_and([
-            self._matcher_45,
-            self._matcher_47,
-            self._matcher_48
+            self._matcher_319,
+            self._matcher_463
         ])
-    def _matcher_50(self, stream):
-        return stream.with_scope(self._matcher_49)
-    def _matcher_51(self, stream):
-        return self._rules['opts'](stream)
-    def _matcher_52(self, stream):
-        return stream.bind('xs', self._matcher_51(stream))
-    def _matcher_53(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Or'),
-            self.lookup('splice')(1, self.lookup('xs'))
-        ]))
-    def _matcher_54(self, stream):
+    def _matcher_465(self, stream):
+        return stream.with_scope(self._matcher_464)
+    _dispatch_466 = Dispatch(True, {'Any': [0], 'State': [1], 'Eq': [2], 'Range': [3], 'Class': [4]}, [])
+    def _matcher_467(self, stream):
+        return stream.match(lambda item: item == 'Any', "'Any'")
+    def _matcher_468(self, stream):
+        return stream.match_list(self._matcher_467)
+    def _matcher_469(self, stream):
+        return self._rule_inlineMatch(stream) if stream.memo is None else stream.match_rule(self._rule_inlineMatch, 'inlineMatch')
+    def _matcher_470(self, stream):
+        return stream.bind('m', self._matcher_469(stream))
+    def _matcher_471(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('test', 'True', lambda: self.bind('description', "'any'", lambda: self.lookup('m'))))
+    def _matcher_472(self, stream):
         return stream.operator_and([
-            self._matcher_52,
-            self._matcher_53
+            self._matcher_468,
+            self._matcher_470,
+            self._matcher_471
         ])
-    def _matcher_55(self, stream):
-        return stream.with_scope(self._matcher_54)
-    def _matcher_56(self, stream):
-        return stream.operator_or([
-            self._matcher_50,
-            self._matcher_55
+    def _matcher_473(self, stream):
+        return stream.with_scope(self._matcher_472)
+    def _matcher_474(self, stream):
+        return stream.match(lambda item: item == 'State', "'State'")
+    def _matcher_475(self, stream):
+        return stream.operator_and([
+            self._matcher_474,
+            self._matcher_102
         ])
-    def _matcher_57(self, stream):
-        return self._rules['opt'](stream)
-    def _matcher_58(self, stream):
-        return stream.bind('x', self._matcher_57(stream))
-    def _matcher_59(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Scope'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
-    def _matcher_60(self, stream):
+    def _matcher_476(self, stream):
+        return stream.match_list(self._matcher_475)
+    def _matcher_477(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('test', self.runtime.join([
+            'items[index] == self._state[',
+            self.lookup('x'),
+            ']'
+        ]), lambda: self.bind('description', "'state'", lambda: self.lookup('m'))))
+    def _matcher_478(self, stream):
         return stream.operator_and([
-            self._matcher_58,
-            self._matcher_59
+            self._matcher_476,
+            self._matcher_470,
+            self._matcher_477
         ])
-    def _matcher_61(self, stream):
-        return stream.with_scope(self._matcher_60)
-    def _matcher_62(self, stream):
-        return self._rules['opt'](stream)
-    def _matcher_63(self, stream):
-        return stream.bind('x', self._matcher_62(stream))
-    def _matcher_64(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'Star'),
-            self.lookup('splice')(0, self.lookup('x'))
-        ]))
-    def _matcher_65(self, stream):
+    def _matcher_479(self, stream):
+        return stream.with_scope(self._matcher_478)
+    def _matcher_480(self, stream):
+        return stream.match(lambda item: item == 'Eq', "'Eq'")
+    def _matcher_481(self, stream):
         return stream.operator_and([
-            self._matcher_63,
-            self._matcher_64
+            self._matcher_480,
+            self._matcher_102
         ])
-    def _matcher_66(self, stream):
-        return stream.with_scope(self._matcher_65)
-    def _matcher_67(self, stream):
-        return self._rules['opt'](stream)
-    def _matcher_68(self, stream):
-        return stream.bind('x', self._matcher_67(stream))
-    def _matcher_69(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_70(self, stream):
-        return stream.operator_not(self._matcher_69)
-    def _matcher_71(self, stream):
-        return stream.action(lambda self: self.lookup('x'))
-    def _matcher_72(self, stream):
+    def _matcher_482(self, stream):
+        return stream.match_list(self._matcher_481)
+    def _matcher_483(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('test', self.runtime.join([
+            'items[index] == ',
+            self.lookup('x')
+        ]), lambda: self.bind('description', self.runtime.lookup('repr')(
+            materialize(self.lookup('x'))
+        ), lambda: self.lookup('m'))))
+    def _matcher_484(self, stream):
         return stream.operator_and([
-            self._matcher_68,
-            self._matcher_70,
-            self._matcher_71
+            self._matcher_482,
+            self._matcher_470,
+            self._matcher_483
         ])
-    def _matcher_73(self, stream):
-        return stream.with_scope(self._matcher_72)
-    def _matcher_74(self, stream):
-        return self._rules['andInner'](stream)
-    def _matcher_75(self, stream):
-        return stream.operator_star(self._matcher_74)
-    def _matcher_76(self, stream):
-        return stream.bind('xs', self._matcher_75(stream))
-    def _matcher_77(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, 'And'),
-            self.lookup('splice')(2, self.lookup('xs'))
-        ]))
-    def _matcher_78(self, stream):
+    def _matcher_485(self, stream):
+        return stream.with_scope(self._matcher_484)
+    def _matcher_486(self, stream):
+        return stream.match(lambda item: item == 'Range', "'Range'")
+    def _matcher_487(self, stream):
         return stream.operator_and([
-            self._matcher_76,
-            self._matcher_77
+            self._matcher_486,
+            self._matcher_102,
+            self._matcher_170
         ])
-    def _matcher_79(self, stream):
-        return stream.with_scope(self._matcher_78)
-    def _matcher_80(self, stream):
-        return stream.operator_or([
-            self._matcher_73,
-            self._matcher_79
+    def _matcher_488(self, stream):
+        return stream.match_list(self._matcher_487)
+    def _matcher_489(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('test', self.runtime.join([
+            self.lookup('x'),
+            ' <= items[index] <= ',
+            self.lookup('y')
+        ]), lambda: self.bind('description', self.runtime.lookup('repr')(
+            materialize(self.runtime.join([
+                self.lookup('x'),
+                '-',
+                self.lookup('y')
+            ]))
+        ), lambda: self.lookup('m'))))
+    def _matcher_490(self, stream):
+        return stream.operator_and([
+            self._matcher_488,
+            self._matcher_470,
+            self._matcher_489
         ])
-    def _matcher_81(self, stream):
-        return stream.match(lambda item: item == 'And', "'And'")
-    def _matcher_82(self, stream):
-        return self._rules['opts'](stream)
-    def _matcher_83(self, stream):
-        return stream.bind('xs', self._matcher_82(stream))
-    def _matcher_84(self, stream):
+    def _matcher_491(self, stream):
+        return stream.with_scope(self._matcher_490)
+    def _matcher_492(self, stream):
+        return stream.match(lambda item: item == 'Class', "'Class'")
+    def _matcher_493(self, stream):
         return stream.operator_and([
-            self._matcher_81,
-            self._matcher_83
+            self._matcher_492,
+            self._matcher_59,
+            self._matcher_170,
+            self._matcher_177,
+            self._matcher_181
         ])
-    def _matcher_85(self, stream):
-        return stream.match_list(self._matcher_84)
-    def _matcher_86(self, stream):
-        return stream.action(lambda self: self.lookup('xs'))
-    def _matcher_87(self, stream):
+    def _matcher_494(self, stream):
+        return stream.match_list(self._matcher_493)
+    def _matcher_495(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('test', self.runtime.join([
+            '(items[index] in {',
+            self.runtime.extra.get('join', self.runtime.join)(
+                self.lookup('xs'),
+                ', '
+            ),
+            '} ',
+            'if isinstance(items[index], str) and len(items[index]) == 1 ',
+            'else in_ranges(items[index], [',
+            self.runtime.extra.get('join', self.runtime.join)(
+                self.lookup('zs'),
+                ', '
+            ),
+            '])) and ',
+            '(',
+            self.lookup('v'),
+            ' <= items[index] <= ',
+            self.lookup('w'),
+            ' or expect_first(stream, items, index, ',
+            self.lookup('y'),
+            '))'
+        ]), lambda: self.bind('description', self.lookup('y'), lambda: self.lookup('m'))))
+    def _matcher_496(self, stream):
         return stream.operator_and([
-            self._matcher_85,
-            self._matcher_86
+            self._matcher_494,
+            self._matcher_470,
+            self._matcher_495
         ])
-    def _matcher_88(self, stream):
-        return stream.with_scope(self._matcher_87)
-    def _matcher_89(self, stream):
-        return self._rules['opt'](stream)
-    def _matcher_90(self, stream):
-        return stream.bind('x', self._matcher_89(stream))
-    def _matcher_91(self, stream):
-        return stream.action(lambda self: self.lookup('concat')([
-            self.lookup('splice')(0, self.lookup('x'))
+    def _matcher_497(self, stream):
+        return stream.with_scope(self._matcher_496)
+    def _matcher_498(self, stream):
+        return stream.operator_dispatch(self._dispatch_466, [
+            self._matcher_473,
+            self._matcher_479,
+            self._matcher_485,
+            self._matcher_491,
+            self._matcher_497
+        ])
+    def _matcher_499(self, stream):
+        return SemanticAction(EMPTY_SCOPE, lambda self: self.runtime.join([
+            'if index < len(items) and ',
+            self.runtime.lookup('test'),
+            ':\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    'result = items[index]\n',
+                    'index += 1\n'
+                ])
+            ),
+            'else:\n',
+            self.runtime.extra.get('indent', self.runtime.indent)(
+                self.runtime.join([
+                    "result = stream.fail_at(items, index, 'expected {}', ",
+                    self.runtime.lookup('description'),
+                    ')\n'
+                ])
+            )
         ]))
-    def _matcher_92(self, stream):
+    _dispatch_500 = Dispatch(True, {'Or': [0], 'Dispatch': [1], 'Scope': [2], 'Unscoped': [3], 'And': [4, 5], 'Bind': [6], 'Star': [7], 'Skip': [8], 'Span': [9], 'StarUntil': [10], 'SkipUntil': [11], 'Not': [12], 'MatchCallRule': [13], 'MatchRule': [14], 'MatchObject': [15], 'MatchLiteral': [16], 'MatchList': [17], 'MatchRegex': [18], 'Action': [19, 20, 21]}, [])
+    def _matcher_501(self, stream):
+        return self._rule_vmOr(stream) if stream.memo is None else stream.match_rule(self._rule_vmOr, 'vmOr')
+    def _matcher_502(self, stream):
+        return stream.operator_star(self._matcher_501)
+    def _matcher_503(self, stream):
+        return stream.bind('xs', self._matcher_502(stream))
+    def _matcher_504(self, stream):
         return stream.operator_and([
-            self._matcher_90,
-            self._matcher_91
+            self._matcher_84,
+            self._matcher_503
         ])
-    def _matcher_93(self, stream):
-        return stream.with_scope(self._matcher_92)
-    def _matcher_94(self, stream):
-        return stream.operator_or([
-            self._matcher_88,
-            self._matcher_93
+    def _matcher_505(self, stream):
+        return stream.match_list(self._matcher_504)
+    def _matcher_506(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('end', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            self.lookup('xs'),
+            "('FAIL', 'no or match'),\n",
+            "('LABEL', ",
+            self.runtime.lookup('end'),
+            '),\n'
+        ])))
+    def _matcher_507(self, stream):
+        return stream.operator_and([
+            self._matcher_505,
+            self._matcher_506
         ])
-natives['Optimizer'] = Optimizer
-class CodeGenerator:
-    def __init__(self):
-        self._state = {}
-        self._rules = {
-            '_main': self._matcher_9,
-            'asts': self._matcher_17,
-            'ast': self._matcher_26,
-            'Native': self._matcher_33,
-            'Universe': self._matcher_47,
-            'Example': self._matcher_54,
-            'GlobalExpr': self._matcher_59,
-            'Actor': self._matcher_71,
-            'Field': self._matcher_76,
-            'Rule': self._matcher_83,
-            'Or': self._matcher_90,
-            'Scope': self._matcher_97,
-            'And': self._matcher_104,
-            'Bind': self._matcher_113,
-            'Star': self._matcher_120,
-            'Not': self._matcher_127,
-            'MatchCallRule': self._matcher_132,
-            'MatchRule': self._matcher_139,
-            'MatchObject': self._matcher_146,
-            'MatchList': self._matcher_153,
-            'Action': self._matcher_160,
-            'Any': self._matcher_162,
-            'State': self._matcher_167,
-            'Eq': self._matcher_172,
-            'Range': self._matcher_179,
-            'Set': self._matcher_188,
-            'String': self._matcher_190,
-            'Number': self._matcher_192,
-            'List': self._matcher_197,
-            'ListItem': self._matcher_204,
-            'Format': self._matcher_209,
-            'Call': self._matcher_216,
-            'Get': self._matcher_223,
-            'Lookup': self._matcher_228,
-            'astList': self._matcher_234,
-            'matcher': self._matcher_236,
-            'repr': self._matcher_241,
-        }
-        self._main = self._rules.pop('_main')
-    def run(self, stream):
-        return self._main(stream)
-    def _matcher_0(self, stream):
-        return stream.match(lambda item: item == 'Optimized', "'Optimized'")
-    def _matcher_1(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_2(self, stream):
-        return stream.bind('p', self._matcher_1(stream))
-    def _matcher_3(self, stream):
-        return self._rules['asts'](stream)
-    def _matcher_4(self, stream):
-        return stream.bind('x', self._matcher_3(stream))
-    def _matcher_5(self, stream):
+    def _matcher_508(self, stream):
+        return stream.with_scope(self._matcher_507)
+    def _matcher_509(self, stream):
+        return self._rule_vmDispatch(stream) if stream.memo is None else stream.match_rule(self._rule_vmDispatch, 'vmDispatch')
+    def _matcher_510(self, stream):
+        return stream.bind('x', self._matcher_509(stream))
+    def _matcher_511(self, stream):
+        return self._rule_vmCase(stream) if stream.memo is None else stream.match_rule(self._rule_vmCase, 'vmCase')
+    def _matcher_512(self, stream):
+        return stream.operator_star(self._matcher_511)
+    def _matcher_513(self, stream):
+        return stream.bind('xs', self._matcher_512(stream))
+    def _matcher_514(self, stream):
         return stream.operator_and([
-            self._matcher_4
+            self._matcher_84,
+            self._matcher_513
         ])
-    def _matcher_6(self, stream):
-        return stream.match_list(self._matcher_5)
-    def _matcher_7(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(0, 'Part'),
-                self.lookup('splice')(0, self.lookup('p')),
-                self.lookup('splice')(0, self.lookup('x'))
-            ])
-        ))
-    def _matcher_8(self, stream):
+    def _matcher_515(self, stream):
+        return stream.match_list(self._matcher_514)
+    def _matcher_516(self, stream):
         return stream.operator_and([
-            self._matcher_0,
-            self._matcher_2,
-            self._matcher_6,
-            self._matcher_7
+            self._matcher_328,
+            self._matcher_510,
+            self._matcher_515
         ])
-    def _matcher_9(self, stream):
-        return stream.with_scope(self._matcher_8)
-    def _matcher_10(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_11(self, stream):
-        return stream.operator_star(self._matcher_10)
-    def _matcher_12(self, stream):
-        return stream.bind('xs', self._matcher_11(stream))
-    def _matcher_13(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_14(self, stream):
-        return stream.operator_not(self._matcher_13)
-    def _matcher_15(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
+    def _matcher_517(self, stream):
+        return stream.match_list(self._matcher_516)
+    def _matcher_518(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('end', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.bind('none', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.bind('targets', self.runtime.extra.get('collector', self.runtime.collector)(
+        
+        ), lambda: self.bind('cases', self.runtime.join([
             self.lookup('xs')
-        ]))
-    def _matcher_16(self, stream):
+        ]), lambda: self.runtime.join([
+            "('DISPATCH', ",
+            self.lookup('x'),
+            ', [',
+            self.runtime.extra.get('join', self.runtime.join)(
+                self.runtime.lookup('targets'),
+                ', '
+            ),
+            ', ',
+            self.runtime.lookup('none'),
+            ']),\n',
+            self.runtime.lookup('cases'),
+            "('LABEL', ",
+            self.runtime.lookup('none'),
+            '),\n',
+            "('FAIL', 'no or match'),\n",
+            "('LABEL', ",
+            self.runtime.lookup('end'),
+            '),\n'
+        ]))))))
+    def _matcher_519(self, stream):
+        return stream.operator_and([
+            self._matcher_517,
+            self._matcher_518
+        ])
+    def _matcher_520(self, stream):
+        return stream.with_scope(self._matcher_519)
+    def _matcher_521(self, stream):
+        return stream.bind('x', self._matcher_70(stream))
+    def _matcher_522(self, stream):
+        return stream.operator_and([
+            self._matcher_340,
+            self._matcher_521
+        ])
+    def _matcher_523(self, stream):
+        return stream.match_list(self._matcher_522)
+    def _matcher_524(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('scope', 'None', lambda: self.runtime.join([
+            "('PUSH_SCOPE',),\n",
+            self.lookup('x'),
+            "('POP_SCOPE',),\n"
+        ])))
+    def _matcher_525(self, stream):
         return stream.operator_and([
-            self._matcher_12,
-            self._matcher_14,
-            self._matcher_15
+            self._matcher_523,
+            self._matcher_524
         ])
-    def _matcher_17(self, stream):
-        return stream.with_scope(self._matcher_16)
-    def _matcher_18(self, stream):
-        return stream.match_call_rule(self._rules)
-    def _matcher_19(self, stream):
-        return stream.bind('x', self._matcher_18(stream))
-    def _matcher_20(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_21(self, stream):
-        return stream.operator_not(self._matcher_20)
-    def _matcher_22(self, stream):
+    def _matcher_526(self, stream):
+        return stream.with_scope(self._matcher_525)
+    def _matcher_527(self, stream):
         return stream.operator_and([
-            self._matcher_19,
-            self._matcher_21
+            self._matcher_346,
+            self._matcher_521
         ])
-    def _matcher_23(self, stream):
-        return stream.match_list(self._matcher_22)
-    def _matcher_24(self, stream):
-        return stream.action(lambda self: self.lookup('x'))
-    def _matcher_25(self, stream):
+    def _matcher_528(self, stream):
+        return stream.match_list(self._matcher_527)
+    def _matcher_529(self, stream):
         return stream.operator_and([
-            self._matcher_23,
-            self._matcher_24
+            self._matcher_528,
+            self._matcher_96
         ])
-    def _matcher_26(self, stream):
-        return stream.with_scope(self._matcher_25)
-    def _matcher_27(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_28(self, stream):
-        return stream.bind('x', self._matcher_27(stream))
-    def _matcher_29(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_30(self, stream):
-        return stream.bind('y', self._matcher_29(stream))
-    def _matcher_31(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            self.lookup('y'),
-            'natives[',
-            self.lookup('repr')(
-                self.lookup('x')
-            ),
-            '] = ',
-            self.lookup('x'),
-            '\n'
-        ]))
-    def _matcher_32(self, stream):
+    def _matcher_530(self, stream):
+        return stream.with_scope(self._matcher_529)
+    def _matcher_531(self, stream):
         return stream.operator_and([
-            self._matcher_28,
-            self._matcher_30,
-            self._matcher_31
+            self._matcher_351,
+            self._matcher_12
         ])
-    def _matcher_33(self, stream):
-        return stream.with_scope(self._matcher_32)
-    def _matcher_34(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_35(self, stream):
-        return stream.bind('x', self._matcher_34(stream))
-    def _matcher_36(self, stream):
-        return self._rules['astList'](stream)
-    def _matcher_37(self, stream):
-        return stream.bind('xs', self._matcher_36(stream))
-    def _matcher_38(self, stream):
+    def _matcher_532(self, stream):
+        return stream.match_list(self._matcher_531)
+    def _matcher_533(self, stream):
+        return "('NONE',),\n"
+    def _matcher_534(self, stream):
         return stream.operator_and([
-            self._matcher_37
+            self._matcher_532,
+            self._matcher_533
         ])
-    def _matcher_39(self, stream):
-        return stream.match_list(self._matcher_38)
-    def _matcher_40(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_41(self, stream):
-        return stream.operator_star(self._matcher_40)
-    def _matcher_42(self, stream):
-        return stream.bind('ys', self._matcher_41(stream))
-    def _matcher_43(self, stream):
+    def _matcher_535(self, stream):
+        return stream.operator_star(self._matcher_70)
+    def _matcher_536(self, stream):
+        return stream.bind('xs', self._matcher_535(stream))
+    def _matcher_537(self, stream):
         return stream.operator_and([
-            self._matcher_42
+            self._matcher_351,
+            self._matcher_536
         ])
-    def _matcher_44(self, stream):
-        return stream.match_list(self._matcher_43)
-    def _matcher_45(self, stream):
-        return stream.action(lambda self: self.bind('nextid', self.lookup('Counter')(
-        
-        ), lambda: self.bind('name', self.lookup('x'), lambda: self.lookup('join')([
-            self.lookup('ys'),
-            'natives[',
-            self.lookup('repr')(
-                self.lookup('name')
-            ),
-            '] = lambda: [',
-            self.lookup('xs'),
-            ']\n'
-        ]))))
-    def _matcher_46(self, stream):
+    def _matcher_538(self, stream):
+        return stream.match_list(self._matcher_537)
+    def _matcher_539(self, stream):
         return stream.operator_and([
-            self._matcher_35,
-            self._matcher_39,
-            self._matcher_44,
-            self._matcher_45
+            self._matcher_538,
+            self._matcher_13
         ])
-    def _matcher_47(self, stream):
-        return stream.with_scope(self._matcher_46)
-    def _matcher_48(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_49(self, stream):
-        return stream.bind('x', self._matcher_48(stream))
-    def _matcher_50(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_51(self, stream):
-        return stream.bind('y', self._matcher_50(stream))
-    def _matcher_52(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            'class ',
-            self.lookup('name'),
-            '_Example_',
-            self.lookup('nextid')(
-            
-            ),
-            '(Example):\n',
-            self.lookup('indent')(
-                self.lookup('join')([
-                    'def test_example(self):\n',
-                    self.lookup('indent')(
-                        self.lookup('join')([
-                            'self.check_example(natives[',
-                            self.lookup('repr')(
-                                self.lookup('name')
-                            ),
-                            '](), ',
-                            self.lookup('x'),
-                            ', ',
-                            self.lookup('y'),
-                            ')\n'
-                        ])
-                    )
-                ])
-            )
-        ]))
-    def _matcher_53(self, stream):
+    def _matcher_540(self, stream):
+        return stream.with_scope(self._matcher_539)
+    def _matcher_541(self, stream):
         return stream.operator_and([
-            self._matcher_49,
-            self._matcher_51,
-            self._matcher_52
+            self._matcher_363,
+            self._matcher_102,
+            self._matcher_71
         ])
-    def _matcher_54(self, stream):
-        return stream.with_scope(self._matcher_53)
-    def _matcher_55(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_56(self, stream):
-        return stream.bind('x', self._matcher_55(stream))
-    def _matcher_57(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            'SemanticAction({}, lambda self: ',
+    def _matcher_542(self, stream):
+        return stream.match_list(self._matcher_541)
+    def _matcher_543(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            self.lookup('y'),
+            "('BIND', ",
             self.lookup('x'),
-            ').eval(Runtime(None, natives))'
+            '),\n'
         ]))
-    def _matcher_58(self, stream):
+    def _matcher_544(self, stream):
         return stream.operator_and([
-            self._matcher_56,
-            self._matcher_57
+            self._matcher_542,
+            self._matcher_543
         ])
-    def _matcher_59(self, stream):
-        return stream.with_scope(self._matcher_58)
-    def _matcher_60(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_61(self, stream):
-        return stream.bind('x', self._matcher_60(stream))
-    def _matcher_62(self, stream):
-        return self._rules['asts'](stream)
-    def _matcher_63(self, stream):
-        return stream.bind('ys', self._matcher_62(stream))
-    def _matcher_64(self, stream):
+    def _matcher_545(self, stream):
+        return stream.with_scope(self._matcher_544)
+    def _matcher_546(self, stream):
         return stream.operator_and([
-            self._matcher_63
+            self._matcher_369,
+            self._matcher_521
         ])
-    def _matcher_65(self, stream):
-        return stream.match_list(self._matcher_64)
-    def _matcher_66(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_67(self, stream):
-        return stream.operator_star(self._matcher_66)
-    def _matcher_68(self, stream):
-        return stream.bind('zs', self._matcher_67(stream))
-    def _matcher_69(self, stream):
-        return stream.action(lambda self: self.bind('nextid', self.lookup('Counter')(
-        
-        ), lambda: self.bind('matchers', self.lookup('collector')(
-        
-        ), lambda: self.bind('rules', self.lookup('collector')(
-        
-        ), lambda: self.bind('param', self.lookup('collector')(
+    def _matcher_547(self, stream):
+        return stream.match_list(self._matcher_546)
+    def _matcher_548(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
         
-        ), lambda: self.bind('init', self.lookup('collector')(
+        ), lambda: self.bind('m', self.runtime.lookup('nextid')(
         
-        ), lambda: self.bind('name', self.lookup('x'), lambda: self.lookup('join')([
-            self.lookup('ys'),
-            self.lookup('zs'),
-            'class ',
-            self.lookup('x'),
-            ':\n',
-            self.lookup('indent')(
-                self.lookup('join')([
-                    'def __init__(self',
-                    self.lookup('join')([
-                        self.lookup('param')
-                    ]),
-                    '):\n',
-                    self.lookup('indent')(
-                        self.lookup('join')([
-                            'self._state = {',
-                            self.lookup('init'),
-                            '}\n',
-                            'self._rules = {\n',
-                            self.lookup('indent')(
-                                self.lookup('join')([
-                                    self.lookup('rules')
-                                ])
-                            ),
-                            '}\n',
-                            "self._main = self._rules.pop('_main')\n"
-                        ])
-                    ),
-                    'def run(self, stream):\n',
-                    self.lookup('indent')(
-                        self.lookup('join')([
-                            'return self._main(stream)\n'
-                        ])
-                    ),
-                    self.lookup('matchers')
-                ])
-            ),
-            'natives[',
-            self.lookup('repr')(
-                self.lookup('x')
-            ),
-            '] = ',
+        ), lambda: self.runtime.join([
+            "('LIST_START',),\n",
+            "('LABEL', ",
+            self.runtime.lookup('n'),
+            '),\n',
+            "('BACKTRACK', ",
+            self.runtime.lookup('m'),
+            '),\n',
             self.lookup('x'),
-            '\n'
-        ]))))))))
-    def _matcher_70(self, stream):
-        return stream.operator_and([
-            self._matcher_61,
-            self._matcher_65,
-            self._matcher_68,
-            self._matcher_69
-        ])
-    def _matcher_71(self, stream):
-        return stream.with_scope(self._matcher_70)
-    def _matcher_72(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_73(self, stream):
-        return stream.bind('x', self._matcher_72(stream))
-    def _matcher_74(self, stream):
-        return stream.action(lambda self: self.bind('', self.lookup('param')(
-            self.lookup('join')([
-                ', ',
-                self.lookup('x')
-            ])
-        ), lambda: self.bind('', self.lookup('init')(
-            self.lookup('join')([
-                self.lookup('repr')(
-                    self.lookup('x')
-                ),
-                ': ',
-                self.lookup('x'),
-                ',\n'
-            ])
-        ), lambda: '')))
-    def _matcher_75(self, stream):
-        return stream.operator_and([
-            self._matcher_73,
-            self._matcher_74
-        ])
-    def _matcher_76(self, stream):
-        return stream.with_scope(self._matcher_75)
-    def _matcher_77(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_78(self, stream):
-        return stream.bind('x', self._matcher_77(stream))
-    def _matcher_79(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_80(self, stream):
-        return stream.bind('y', self._matcher_79(stream))
-    def _matcher_81(self, stream):
-        return stream.action(lambda self: self.bind('', self.lookup('rules')(
-            self.lookup('join')([
-                self.lookup('repr')(
-                    self.lookup('x')
-                ),
-                ': ',
-                self.lookup('y'),
-                ',\n'
-            ])
-        ), lambda: ''))
-    def _matcher_82(self, stream):
+            "('LIST_APPEND',),\n",
+            "('COMMIT', ",
+            self.runtime.lookup('n'),
+            '),\n',
+            "('LABEL', ",
+            self.runtime.lookup('m'),
+            '),\n',
+            "('LIST_END',),\n"
+        ]))))
+    def _matcher_549(self, stream):
         return stream.operator_and([
-            self._matcher_78,
-            self._matcher_80,
-            self._matcher_81
+            self._matcher_547,
+            self._matcher_548
         ])
-    def _matcher_83(self, stream):
-        return stream.with_scope(self._matcher_82)
-    def _matcher_84(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_85(self, stream):
-        return stream.bind('m', self._matcher_84(stream))
-    def _matcher_86(self, stream):
-        return self._rules['astList'](stream)
-    def _matcher_87(self, stream):
-        return stream.bind('x', self._matcher_86(stream))
-    def _matcher_88(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.operator_or([',
-            self.lookup('x'),
-            '])'
-        ]), lambda: self.lookup('m')))
-    def _matcher_89(self, stream):
+    def _matcher_550(self, stream):
+        return stream.with_scope(self._matcher_549)
+    def _matcher_551(self, stream):
         return stream.operator_and([
-            self._matcher_85,
-            self._matcher_87,
-            self._matcher_88
+            self._matcher_375,
+            self._matcher_521
         ])
-    def _matcher_90(self, stream):
-        return stream.with_scope(self._matcher_89)
-    def _matcher_91(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_92(self, stream):
-        return stream.bind('m', self._matcher_91(stream))
-    def _matcher_93(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_94(self, stream):
-        return stream.bind('x', self._matcher_93(stream))
-    def _matcher_95(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.with_scope(',
+    def _matcher_552(self, stream):
+        return stream.match_list(self._matcher_551)
+    def _matcher_553(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.bind('m', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            "('LABEL', ",
+            self.runtime.lookup('n'),
+            '),\n',
+            "('BACKTRACK', ",
+            self.runtime.lookup('m'),
+            '),\n',
             self.lookup('x'),
-            ')'
-        ]), lambda: self.lookup('m')))
-    def _matcher_96(self, stream):
+            "('COMMIT', ",
+            self.runtime.lookup('n'),
+            '),\n',
+            "('LABEL', ",
+            self.runtime.lookup('m'),
+            '),\n',
+            "('NONE',),\n"
+        ]))))
+    def _matcher_554(self, stream):
         return stream.operator_and([
-            self._matcher_92,
-            self._matcher_94,
-            self._matcher_95
+            self._matcher_552,
+            self._matcher_553
         ])
-    def _matcher_97(self, stream):
-        return stream.with_scope(self._matcher_96)
-    def _matcher_98(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_99(self, stream):
-        return stream.bind('m', self._matcher_98(stream))
-    def _matcher_100(self, stream):
-        return self._rules['astList'](stream)
-    def _matcher_101(self, stream):
-        return stream.bind('x', self._matcher_100(stream))
-    def _matcher_102(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.operator_and([',
-            self.lookup('x'),
-            '])'
-        ]), lambda: self.lookup('m')))
-    def _matcher_103(self, stream):
+    def _matcher_555(self, stream):
+        return stream.with_scope(self._matcher_554)
+    def _matcher_556(self, stream):
         return stream.operator_and([
-            self._matcher_99,
-            self._matcher_101,
-            self._matcher_102
+            self._matcher_393,
+            self._matcher_521
         ])
-    def _matcher_104(self, stream):
-        return stream.with_scope(self._matcher_103)
-    def _matcher_105(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_106(self, stream):
-        return stream.bind('m', self._matcher_105(stream))
-    def _matcher_107(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_108(self, stream):
-        return stream.bind('x', self._matcher_107(stream))
-    def _matcher_109(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_110(self, stream):
-        return stream.bind('y', self._matcher_109(stream))
-    def _matcher_111(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.bind(',
+    def _matcher_557(self, stream):
+        return stream.match_list(self._matcher_556)
+    def _matcher_558(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('SPAN_START',),\n",
             self.lookup('x'),
-            ', ',
-            self.lookup('y'),
-            '(stream))'
-        ]), lambda: self.lookup('m')))
-    def _matcher_112(self, stream):
+            "('SPAN_END',),\n"
+        ]))
+    def _matcher_559(self, stream):
         return stream.operator_and([
-            self._matcher_106,
-            self._matcher_108,
-            self._matcher_110,
-            self._matcher_111
+            self._matcher_557,
+            self._matcher_558
         ])
-    def _matcher_113(self, stream):
-        return stream.with_scope(self._matcher_112)
-    def _matcher_114(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_115(self, stream):
-        return stream.bind('m', self._matcher_114(stream))
-    def _matcher_116(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_117(self, stream):
-        return stream.bind('x', self._matcher_116(stream))
-    def _matcher_118(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.operator_star(',
-            self.lookup('x'),
-            ')'
-        ]), lambda: self.lookup('m')))
-    def _matcher_119(self, stream):
+    def _matcher_560(self, stream):
+        return stream.with_scope(self._matcher_559)
+    def _matcher_561(self, stream):
+        return self._rule_vmUntil(stream) if stream.memo is None else stream.match_rule(self._rule_vmUntil, 'vmUntil')
+    def _matcher_562(self, stream):
+        return stream.bind('x', self._matcher_561(stream))
+    def _matcher_563(self, stream):
         return stream.operator_and([
-            self._matcher_115,
-            self._matcher_117,
-            self._matcher_118
+            self._matcher_381,
+            self._matcher_562
         ])
-    def _matcher_120(self, stream):
-        return stream.with_scope(self._matcher_119)
-    def _matcher_121(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_122(self, stream):
-        return stream.bind('m', self._matcher_121(stream))
-    def _matcher_123(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_124(self, stream):
-        return stream.bind('x', self._matcher_123(stream))
-    def _matcher_125(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.operator_not(',
+    def _matcher_564(self, stream):
+        return stream.match_list(self._matcher_563)
+    def _matcher_565(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('STAR_UNTIL', ",
             self.lookup('x'),
-            ')'
-        ]), lambda: self.lookup('m')))
-    def _matcher_126(self, stream):
+            '),\n'
+        ]))
+    def _matcher_566(self, stream):
         return stream.operator_and([
-            self._matcher_122,
-            self._matcher_124,
-            self._matcher_125
+            self._matcher_564,
+            self._matcher_565
         ])
-    def _matcher_127(self, stream):
-        return stream.with_scope(self._matcher_126)
-    def _matcher_128(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_129(self, stream):
-        return stream.bind('m', self._matcher_128(stream))
-    def _matcher_130(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.match_call_rule(self._rules)'
-        ]), lambda: self.lookup('m')))
-    def _matcher_131(self, stream):
+    def _matcher_567(self, stream):
+        return stream.with_scope(self._matcher_566)
+    def _matcher_568(self, stream):
         return stream.operator_and([
-            self._matcher_129,
-            self._matcher_130
+            self._matcher_387,
+            self._matcher_562
         ])
-    def _matcher_132(self, stream):
-        return stream.with_scope(self._matcher_131)
-    def _matcher_133(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_134(self, stream):
-        return stream.bind('m', self._matcher_133(stream))
-    def _matcher_135(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_136(self, stream):
-        return stream.bind('x', self._matcher_135(stream))
-    def _matcher_137(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            "self._rules['",
+    def _matcher_569(self, stream):
+        return stream.match_list(self._matcher_568)
+    def _matcher_570(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('SKIP_UNTIL', ",
             self.lookup('x'),
-            "'](stream)"
-        ]), lambda: self.lookup('m')))
-    def _matcher_138(self, stream):
+            '),\n'
+        ]))
+    def _matcher_571(self, stream):
         return stream.operator_and([
-            self._matcher_134,
-            self._matcher_136,
-            self._matcher_137
+            self._matcher_569,
+            self._matcher_570
         ])
-    def _matcher_139(self, stream):
-        return stream.with_scope(self._matcher_138)
-    def _matcher_140(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_141(self, stream):
-        return stream.bind('m', self._matcher_140(stream))
-    def _matcher_142(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_143(self, stream):
-        return stream.bind('x', self._matcher_142(stream))
-    def _matcher_144(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.match(lambda item: ',
-            self.lookup('x'),
-            ')'
-        ]), lambda: self.lookup('m')))
-    def _matcher_145(self, stream):
+    def _matcher_572(self, stream):
+        return stream.with_scope(self._matcher_571)
+    def _matcher_573(self, stream):
         return stream.operator_and([
-            self._matcher_141,
-            self._matcher_143,
-            self._matcher_144
+            self._matcher_399,
+            self._matcher_521
         ])
-    def _matcher_146(self, stream):
-        return stream.with_scope(self._matcher_145)
-    def _matcher_147(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_148(self, stream):
-        return stream.bind('m', self._matcher_147(stream))
-    def _matcher_149(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_150(self, stream):
-        return stream.bind('x', self._matcher_149(stream))
-    def _matcher_151(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.match_list(',
+    def _matcher_574(self, stream):
+        return stream.match_list(self._matcher_573)
+    def _matcher_575(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            "('BACKTRACK', ",
+            self.runtime.lookup('n'),
+            '),\n',
             self.lookup('x'),
-            ')'
-        ]), lambda: self.lookup('m')))
-    def _matcher_152(self, stream):
+            "('COMMIT_FAIL', 'not matched'),\n",
+            "('LABEL', ",
+            self.runtime.lookup('n'),
+            '),\n',
+            "('NONE',),\n"
+        ])))
+    def _matcher_576(self, stream):
         return stream.operator_and([
-            self._matcher_148,
-            self._matcher_150,
-            self._matcher_151
+            self._matcher_574,
+            self._matcher_575
         ])
-    def _matcher_153(self, stream):
-        return stream.with_scope(self._matcher_152)
-    def _matcher_154(self, stream):
-        return self._rules['matcher'](stream)
-    def _matcher_155(self, stream):
-        return stream.bind('m', self._matcher_154(stream))
-    def _matcher_156(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_157(self, stream):
-        return stream.bind('x', self._matcher_156(stream))
-    def _matcher_158(self, stream):
-        return stream.action(lambda self: self.bind('body', self.lookup('join')([
-            'stream.action(lambda self: ',
-            self.lookup('x'),
-            ')'
-        ]), lambda: self.lookup('m')))
-    def _matcher_159(self, stream):
+    def _matcher_577(self, stream):
+        return stream.with_scope(self._matcher_576)
+    def _matcher_578(self, stream):
+        return "('CALL_ITEM',),\n"
+    def _matcher_579(self, stream):
         return stream.operator_and([
-            self._matcher_155,
-            self._matcher_157,
-            self._matcher_158
+            self._matcher_406,
+            self._matcher_578
         ])
-    def _matcher_160(self, stream):
-        return stream.with_scope(self._matcher_159)
-    def _matcher_161(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            'True',
-            ", 'any'"
-        ]))
-    def _matcher_162(self, stream):
-        return stream.with_scope(self._matcher_161)
-    def _matcher_163(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_164(self, stream):
-        return stream.bind('x', self._matcher_163(stream))
-    def _matcher_165(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            'item == self._state[',
+    def _matcher_580(self, stream):
+        return stream.operator_and([
+            self._matcher_409,
+            self._matcher_102
+        ])
+    def _matcher_581(self, stream):
+        return stream.match_list(self._matcher_580)
+    def _matcher_582(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('CALL', ",
             self.lookup('x'),
-            "], 'state'"
+            '),\n'
         ]))
-    def _matcher_166(self, stream):
+    def _matcher_583(self, stream):
         return stream.operator_and([
-            self._matcher_164,
-            self._matcher_165
+            self._matcher_581,
+            self._matcher_582
         ])
-    def _matcher_167(self, stream):
-        return stream.with_scope(self._matcher_166)
-    def _matcher_168(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_169(self, stream):
-        return stream.bind('x', self._matcher_168(stream))
-    def _matcher_170(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            'item == ',
+    def _matcher_584(self, stream):
+        return stream.with_scope(self._matcher_583)
+    def _matcher_585(self, stream):
+        return self._rule_vmTest(stream) if stream.memo is None else stream.match_rule(self._rule_vmTest, 'vmTest')
+    def _matcher_586(self, stream):
+        return stream.bind('x', self._matcher_585(stream))
+    def _matcher_587(self, stream):
+        return stream.operator_and([
+            self._matcher_415,
+            self._matcher_586
+        ])
+    def _matcher_588(self, stream):
+        return stream.match_list(self._matcher_587)
+    def _matcher_589(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
             self.lookup('x'),
-            ', ',
-            self.lookup('repr')(
-                self.lookup('x')
-            )
+            ',\n'
         ]))
-    def _matcher_171(self, stream):
+    def _matcher_590(self, stream):
         return stream.operator_and([
-            self._matcher_169,
-            self._matcher_170
+            self._matcher_588,
+            self._matcher_589
         ])
-    def _matcher_172(self, stream):
-        return stream.with_scope(self._matcher_171)
-    def _matcher_173(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_174(self, stream):
-        return stream.bind('x', self._matcher_173(stream))
-    def _matcher_175(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_176(self, stream):
-        return stream.bind('y', self._matcher_175(stream))
-    def _matcher_177(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            self.lookup('x'),
-            ' <= item <= ',
-            self.lookup('y'),
-            ', "',
+    def _matcher_591(self, stream):
+        return stream.with_scope(self._matcher_590)
+    def _matcher_592(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('MATCH_LITERAL', ",
             self.lookup('x'),
-            '-',
-            self.lookup('y'),
-            '"'
+            '),\n'
         ]))
-    def _matcher_178(self, stream):
+    def _matcher_593(self, stream):
         return stream.operator_and([
-            self._matcher_174,
-            self._matcher_176,
-            self._matcher_177
+            self._matcher_424,
+            self._matcher_592
         ])
-    def _matcher_179(self, stream):
-        return stream.with_scope(self._matcher_178)
-    def _matcher_180(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_181(self, stream):
-        return stream.bind('x', self._matcher_180(stream))
-    def _matcher_182(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_183(self, stream):
-        return stream.bind('y', self._matcher_182(stream))
-    def _matcher_184(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_185(self, stream):
-        return stream.bind('z', self._matcher_184(stream))
-    def _matcher_186(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            'self.bind(',
+    def _matcher_594(self, stream):
+        return stream.with_scope(self._matcher_593)
+    def _matcher_595(self, stream):
+        return stream.operator_and([
+            self._matcher_428,
+            self._matcher_521
+        ])
+    def _matcher_596(self, stream):
+        return stream.match_list(self._matcher_595)
+    def _matcher_597(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('PUSH_ITEMS',),\n",
             self.lookup('x'),
-            ', ',
-            self.lookup('y'),
-            ', lambda: ',
-            self.lookup('z'),
-            ')'
+            "('POP_ITEMS',),\n"
         ]))
-    def _matcher_187(self, stream):
+    def _matcher_598(self, stream):
         return stream.operator_and([
-            self._matcher_181,
-            self._matcher_183,
-            self._matcher_185,
-            self._matcher_186
+            self._matcher_596,
+            self._matcher_597
         ])
-    def _matcher_188(self, stream):
-        return stream.with_scope(self._matcher_187)
-    def _matcher_189(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_190(self, stream):
-        return stream.with_scope(self._matcher_189)
-    def _matcher_191(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_192(self, stream):
-        return stream.with_scope(self._matcher_191)
-    def _matcher_193(self, stream):
-        return self._rules['astList'](stream)
-    def _matcher_194(self, stream):
-        return stream.bind('x', self._matcher_193(stream))
-    def _matcher_195(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            "self.lookup('concat')([",
+    def _matcher_599(self, stream):
+        return stream.with_scope(self._matcher_598)
+    def _matcher_600(self, stream):
+        return stream.bind('z', self._matcher_70(stream))
+    def _matcher_601(self, stream):
+        return stream.operator_and([
+            self._matcher_434,
+            self._matcher_102,
+            self._matcher_170,
+            self._matcher_600
+        ])
+    def _matcher_602(self, stream):
+        return stream.match_list(self._matcher_601)
+    def _matcher_603(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            "('REGEX', ",
+            self.runtime.lookup('n'),
+            ', Regex(',
             self.lookup('x'),
-            '])'
-        ]))
-    def _matcher_196(self, stream):
+            ', ',
+            self.lookup('y'),
+            ')),\n',
+            self.lookup('z'),
+            "('LABEL', ",
+            self.runtime.lookup('n'),
+            '),\n'
+        ])))
+    def _matcher_604(self, stream):
         return stream.operator_and([
-            self._matcher_194,
-            self._matcher_195
+            self._matcher_602,
+            self._matcher_603
         ])
-    def _matcher_197(self, stream):
-        return stream.with_scope(self._matcher_196)
-    def _matcher_198(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_199(self, stream):
-        return stream.bind('x', self._matcher_198(stream))
-    def _matcher_200(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_201(self, stream):
-        return stream.bind('y', self._matcher_200(stream))
-    def _matcher_202(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            "self.lookup('splice')(",
+    def _matcher_605(self, stream):
+        return stream.with_scope(self._matcher_604)
+    def _matcher_606(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('ACTION_LOOKUP', ",
             self.lookup('x'),
             ', ',
-            self.lookup('y'),
-            ')'
+            self.runtime.lookup('scope'),
+            '),\n'
         ]))
-    def _matcher_203(self, stream):
+    def _matcher_607(self, stream):
         return stream.operator_and([
-            self._matcher_199,
-            self._matcher_201,
-            self._matcher_202
+            self._matcher_442,
+            self._matcher_606
         ])
-    def _matcher_204(self, stream):
-        return stream.with_scope(self._matcher_203)
-    def _matcher_205(self, stream):
-        return self._rules['astList'](stream)
-    def _matcher_206(self, stream):
-        return stream.bind('x', self._matcher_205(stream))
-    def _matcher_207(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            "self.lookup('join')([",
+    def _matcher_608(self, stream):
+        return stream.with_scope(self._matcher_607)
+    def _matcher_609(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('VALUE', ",
             self.lookup('x'),
-            '])'
+            '),\n'
         ]))
-    def _matcher_208(self, stream):
+    def _matcher_610(self, stream):
         return stream.operator_and([
-            self._matcher_206,
-            self._matcher_207
+            self._matcher_447,
+            self._matcher_609
         ])
-    def _matcher_209(self, stream):
-        return stream.with_scope(self._matcher_208)
-    def _matcher_210(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_211(self, stream):
-        return stream.bind('x', self._matcher_210(stream))
-    def _matcher_212(self, stream):
-        return self._rules['astList'](stream)
-    def _matcher_213(self, stream):
-        return stream.bind('y', self._matcher_212(stream))
-    def _matcher_214(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
+    def _matcher_611(self, stream):
+        return stream.with_scope(self._matcher_610)
+    def _matcher_612(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('ACTION', lambda self: ",
             self.lookup('x'),
-            '(',
-            self.lookup('y'),
-            ')'
+            ', ',
+            self.runtime.lookup('scope'),
+            '),\n'
         ]))
-    def _matcher_215(self, stream):
+    def _matcher_613(self, stream):
         return stream.operator_and([
-            self._matcher_211,
-            self._matcher_213,
-            self._matcher_214
+            self._matcher_452,
+            self._matcher_612
         ])
-    def _matcher_216(self, stream):
-        return stream.with_scope(self._matcher_215)
-    def _matcher_217(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_218(self, stream):
-        return stream.bind('x', self._matcher_217(stream))
-    def _matcher_219(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_220(self, stream):
-        return stream.bind('y', self._matcher_219(stream))
-    def _matcher_221(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
+    def _matcher_614(self, stream):
+        return stream.with_scope(self._matcher_613)
+    def _matcher_615(self, stream):
+        return stream.operator_dispatch(self._dispatch_500, [
+            self._matcher_508,
+            self._matcher_520,
+            self._matcher_526,
+            self._matcher_530,
+            self._matcher_534,
+            self._matcher_540,
+            self._matcher_545,
+            self._matcher_550,
+            self._matcher_555,
+            self._matcher_560,
+            self._matcher_567,
+            self._matcher_572,
+            self._matcher_577,
+            self._matcher_579,
+            self._matcher_584,
+            self._matcher_591,
+            self._matcher_594,
+            self._matcher_599,
+            self._matcher_605,
+            self._matcher_608,
+            self._matcher_611,
+            self._matcher_614
+        ])
+    def _matcher_616(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.runtime.join([
+            "('BACKTRACK', ",
+            self.runtime.lookup('n'),
+            '),\n',
             self.lookup('x'),
-            '[',
+            "('COMMIT', ",
+            self.runtime.lookup('end'),
+            '),\n',
+            "('LABEL', ",
+            self.runtime.lookup('n'),
+            '),\n'
+        ])))
+    def _matcher_617(self, stream):
+        return stream.operator_and([
+            self._matcher_521,
+            self._matcher_616
+        ])
+    def _matcher_618(self, stream):
+        return stream.with_scope(self._matcher_617)
+    def _matcher_619(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('n', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.bind('start', self.runtime.lookup('nextid')(
+        
+        ), lambda: self.bind('', self.runtime.lookup('targets')(
+            materialize(self.runtime.lookup('start'))
+        ), lambda: self.runtime.join([
+            "('LABEL', ",
+            self.runtime.lookup('start'),
+            '),\n',
+            "('BACKTRACK', ",
+            self.runtime.lookup('n'),
+            '),\n',
+            self.lookup('x'),
+            "('COMMIT', ",
+            self.runtime.lookup('end'),
+            '),\n',
+            "('LABEL', ",
+            self.runtime.lookup('n'),
+            '),\n'
+        ])))))
+    def _matcher_620(self, stream):
+        return stream.operator_and([
+            self._matcher_521,
+            self._matcher_619
+        ])
+    def _matcher_621(self, stream):
+        return stream.with_scope(self._matcher_620)
+    def _matcher_622(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'Dispatch(',
+            self.lookup('x'),
+            ', {',
+            self.runtime.extra.get('join', self.runtime.join)(
+                self.lookup('ys'),
+                ', '
+            ),
+            '}, ',
+            self.lookup('z'),
+            ')'
+        ]))
+    def _matcher_623(self, stream):
+        return stream.operator_and([
+            self._matcher_102,
+            self._matcher_286,
+            self._matcher_276,
+            self._matcher_622
+        ])
+    def _matcher_624(self, stream):
+        return stream.with_scope(self._matcher_623)
+    def _matcher_625(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            'Until([',
+            self.runtime.extra.get('join', self.runtime.join)(
+                self.lookup('xs'),
+                ', '
+            ),
+            '], ',
             self.lookup('y'),
-            ']'
+            ', ',
+            self.lookup('z'),
+            ')'
         ]))
-    def _matcher_222(self, stream):
+    def _matcher_626(self, stream):
         return stream.operator_and([
-            self._matcher_218,
-            self._matcher_220,
-            self._matcher_221
+            self._matcher_59,
+            self._matcher_170,
+            self._matcher_276,
+            self._matcher_625
         ])
-    def _matcher_223(self, stream):
-        return stream.with_scope(self._matcher_222)
-    def _matcher_224(self, stream):
-        return self._rules['repr'](stream)
-    def _matcher_225(self, stream):
-        return stream.bind('x', self._matcher_224(stream))
-    def _matcher_226(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            'self.lookup(',
+    def _matcher_627(self, stream):
+        return stream.with_scope(self._matcher_626)
+    def _matcher_628(self, stream):
+        return "('MATCH_ANY',)"
+    def _matcher_629(self, stream):
+        return stream.operator_and([
+            self._matcher_468,
+            self._matcher_628
+        ])
+    def _matcher_630(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('MATCH_STATE', ",
             self.lookup('x'),
             ')'
         ]))
-    def _matcher_227(self, stream):
+    def _matcher_631(self, stream):
         return stream.operator_and([
-            self._matcher_225,
-            self._matcher_226
+            self._matcher_476,
+            self._matcher_630
         ])
-    def _matcher_228(self, stream):
-        return stream.with_scope(self._matcher_227)
-    def _matcher_229(self, stream):
-        return self._rules['ast'](stream)
-    def _matcher_230(self, stream):
-        return stream.operator_star(self._matcher_229)
-    def _matcher_231(self, stream):
-        return stream.bind('xs', self._matcher_230(stream))
-    def _matcher_232(self, stream):
-        return stream.action(lambda self: self.lookup('join')([
-            '\n',
-            self.lookup('indent')(
-                self.lookup('join')(
-                    self.lookup('xs'),
-                    ',\n'
-                )
-            ),
-            '\n'
+    def _matcher_632(self, stream):
+        return stream.with_scope(self._matcher_631)
+    def _matcher_633(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('MATCH_EQ', ",
+            self.lookup('x'),
+            ')'
         ]))
-    def _matcher_233(self, stream):
+    def _matcher_634(self, stream):
         return stream.operator_and([
-            self._matcher_231,
-            self._matcher_232
+            self._matcher_482,
+            self._matcher_633
         ])
-    def _matcher_234(self, stream):
-        return stream.with_scope(self._matcher_233)
-    def _matcher_235(self, stream):
-        return stream.action(lambda self: self.bind('id', self.lookup('join')([
-            '_matcher_',
-            self.lookup('nextid')(
-            
-            )
-        ]), lambda: self.bind('', self.lookup('matchers')(
-            self.lookup('join')([
-                'def ',
-                self.lookup('id'),
-                '(self, stream):\n',
-                self.lookup('indent')(
-                    self.lookup('join')([
-                        'return ',
-                        self.lookup('body'),
-                        '\n'
-                    ])
-                )
-            ])
-        ), lambda: self.lookup('join')([
-            'self.',
-            self.lookup('id')
-        ]))))
-    def _matcher_236(self, stream):
-        return stream.with_scope(self._matcher_235)
-    def _matcher_237(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_238(self, stream):
-        return stream.bind('x', self._matcher_237(stream))
-    def _matcher_239(self, stream):
-        return stream.action(lambda self: self.lookup('repr')(
-            self.lookup('x')
-        ))
-    def _matcher_240(self, stream):
+    def _matcher_635(self, stream):
+        return stream.with_scope(self._matcher_634)
+    def _matcher_636(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('MATCH_RANGE', ",
+            self.lookup('x'),
+            ', ',
+            self.lookup('y'),
+            ')'
+        ]))
+    def _matcher_637(self, stream):
         return stream.operator_and([
-            self._matcher_238,
-            self._matcher_239
-        ])
-    def _matcher_241(self, stream):
-        return stream.with_scope(self._matcher_240)
+            self._matcher_488,
+            self._matcher_636
+        ])
+    def _matcher_638(self, stream):
+        return stream.with_scope(self._matcher_637)
+    def _matcher_639(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.join([
+            "('MATCH_CLASS', ({",
+            self.runtime.extra.get('join', self.runtime.join)(
+                self.lookup('xs'),
+                ', '
+            ),
+            '}, [',
+            self.runtime.extra.get('join', self.runtime.join)(
+                self.lookup('zs'),
+                ', '
+            ),
+            '], (',
+            self.lookup('v'),
+            ', ',
+            self.lookup('w'),
+            ')), ',
+            self.lookup('y'),
+            ')'
+        ]))
+    def _matcher_640(self, stream):
+        return stream.operator_and([
+            self._matcher_494,
+            self._matcher_639
+        ])
+    def _matcher_641(self, stream):
+        return stream.with_scope(self._matcher_640)
+    def _matcher_642(self, stream):
+        return stream.operator_dispatch(self._dispatch_466, [
+            self._matcher_629,
+            self._matcher_632,
+            self._matcher_635,
+            self._matcher_638,
+            self._matcher_641
+        ])
+    _rule__main = _matcher_8
+    _rule_asts = _matcher_15
+    _rule_ast = _matcher_22
+    _rule_Native = _matcher_27
+    _rule_Universe = _matcher_35
+    _rule_Example = _matcher_40
+    _rule_GlobalExpr = _matcher_43
+    _rule_Actor = _matcher_49
+    _rule_Field = _matcher_52
+    _rule_Rule = _matcher_55
+    _rule_Accepts = _matcher_62
+    _rule_Parks = _matcher_63
+    _rule_Replicable = _matcher_64
+    _rule_InlineRule = _matcher_69
+    _rule_VmRule = _matcher_74
+    _rule_Or = _matcher_81
+    _rule_Dispatch = _matcher_90
+    _rule_Scope = _matcher_95
+    _rule_Unscoped = _matcher_98
+    _rule_And = _matcher_101
+    _rule_Bind = _matcher_106
+    _rule_Star = _matcher_109
+    _rule_Skip = _matcher_112
+    _rule_Span = _matcher_115
+    _rule_StarUntil = _matcher_120
+    _rule_SkipUntil = _matcher_123
+    _rule_Not = _matcher_126
+    _rule_MatchCallRule = _matcher_129
+    _rule_MatchRule = _matcher_134
+    _rule_MatchObject = _matcher_137
+    _rule_MatchLiteral = _matcher_140
+    _rule_MatchList = _matcher_143
+    _rule_MatchRegex = _matcher_148
+    _rule_Action = _matcher_162
+    _rule_Any = _matcher_163
+    _rule_State = _matcher_166
+    _rule_Eq = _matcher_169
+    _rule_Range = _matcher_173
+    _rule_Class = _matcher_184
+    _rule_Set = _matcher_188
+    _rule_String = _matcher_56
+    _rule_Number = _matcher_56
+    _rule_List = _matcher_194
+    _rule_Format = _matcher_198
+    _rule_Call = _matcher_210
+    _rule_Get = _matcher_213
+    _rule_Lookup = _matcher_216
+    _rule_RuntimeLookup = _matcher_219
+    _rule_FieldLookup = _matcher_222
+    _rule_HelperLookup = _matcher_225
+    _rule_listItem = _matcher_245
+    _rule_astList = _matcher_248
+    _rule_textList = _matcher_252
+    _rule_helper = _matcher_259
+    _rule_text = _matcher_267
+    _rule_method = _matcher_270
+    _rule_methodList = _matcher_274
+    _rule_matcher = _matcher_275
+    _rule_until = _matcher_279
+    _rule_regex = _matcher_282
+    _rule_dispatch = _matcher_289
+    _rule_dispatchKey = _matcher_294
+    _rule_classRange = _matcher_297
+    _rule_rule = _matcher_300
+    _rule_list = _matcher_306
+    _rule_constant = _matcher_314
+    _rule_repr = _matcher_317
+    _rule_inline = _matcher_456
+    _rule_inlineOr = _matcher_459
+    _rule_inlineCase = _matcher_462
+    _rule_inlineAnd = _matcher_465
+    _rule_inlineTest = _matcher_498
+    _rule_inlineMatch = _matcher_499
+    _rule_vm = _matcher_615
+    _rule_vmOr = _matcher_618
+    _rule_vmCase = _matcher_621
+    _rule_vmDispatch = _matcher_624
+    _rule_vmUntil = _matcher_627
+    _rule_vmTest = _matcher_642
+    _accepts = {'Optimized'}
+    _parks = True
+    _replicable = True
+    _rules = {
+        '_main': _rule__main,
+        'asts': _rule_asts,
+        'ast': _rule_ast,
+        'Native': _rule_Native,
+        'Universe': _rule_Universe,
+        'Example': _rule_Example,
+        'GlobalExpr': _rule_GlobalExpr,
+        'Actor': _rule_Actor,
+        'Field': _rule_Field,
+        'Rule': _rule_Rule,
+        'Accepts': _rule_Accepts,
+        'Parks': _rule_Parks,
+        'Replicable': _rule_Replicable,
+        'InlineRule': _rule_InlineRule,
+        'VmRule': _rule_VmRule,
+        'Or': _rule_Or,
+        'Dispatch': _rule_Dispatch,
+        'Scope': _rule_Scope,
+        'Unscoped': _rule_Unscoped,
+        'And': _rule_And,
+        'Bind': _rule_Bind,
+        'Star': _rule_Star,
+        'Skip': _rule_Skip,
+        'Span': _rule_Span,
+        'StarUntil': _rule_StarUntil,
+        'SkipUntil': _rule_SkipUntil,
+        'Not': _rule_Not,
+        'MatchCallRule': _rule_MatchCallRule,
+        'MatchRule': _rule_MatchRule,
+        'MatchObject': _rule_MatchObject,
+        'MatchLiteral': _rule_MatchLiteral,
+        'MatchList': _rule_MatchList,
+        'MatchRegex': _rule_MatchRegex,
+        'Action': _rule_Action,
+        'Any': _rule_Any,
+        'State': _rule_State,
+        'Eq': _rule_Eq,
+        'Range': _rule_Range,
+        'Class': _rule_Class,
+        'Set': _rule_Set,
+        'String': _rule_String,
+        'Number': _rule_Number,
+        'List': _rule_List,
+        'Format': _rule_Format,
+        'Call': _rule_Call,
+        'Get': _rule_Get,
+        'Lookup': _rule_Lookup,
+        'RuntimeLookup': _rule_RuntimeLookup,
+        'FieldLookup': _rule_FieldLookup,
+        'HelperLookup': _rule_HelperLookup,
+        'listItem': _rule_listItem,
+        'astList': _rule_astList,
+        'textList': _rule_textList,
+        'helper': _rule_helper,
+        'text': _rule_text,
+        'method': _rule_method,
+        'methodList': _rule_methodList,
+        'matcher': _rule_matcher,
+        'until': _rule_until,
+        'regex': _rule_regex,
+        'dispatch': _rule_dispatch,
+        'dispatchKey': _rule_dispatchKey,
+        'classRange': _rule_classRange,
+        'rule': _rule_rule,
+        'list': _rule_list,
+        'constant': _rule_constant,
+        'repr': _rule_repr,
+        'inline': _rule_inline,
+        'inlineOr': _rule_inlineOr,
+        'inlineCase': _rule_inlineCase,
+        'inlineAnd': _rule_inlineAnd,
+        'inlineTest': _rule_inlineTest,
+        'inlineMatch': _rule_inlineMatch,
+        'vm': _rule_vm,
+        'vmOr': _rule_vmOr,
+        'vmCase': _rule_vmCase,
+        'vmDispatch': _rule_vmDispatch,
+        'vmUntil': _rule_vmUntil,
+        'vmTest': _rule_vmTest,
+    }
+    _main = _rules.pop('_main')
 natives['CodeGenerator'] = CodeGenerator
+def define(defined, collect, nextid, prefix, before, after):
+    key = (prefix, before, after)
+    if key not in defined:
+        defined[key] = f"{prefix}{nextid()}"
+        collect(f"{before}{defined[key]}{after}")
+    return defined[key]
+natives['define'] = define
 class PartCollector:
+    __slots__ = ('_state',)
     def __init__(self, n, last, parts, doneMsg):
         self._state = {'n': n,
         'last': last,
         'parts': parts,
         'doneMsg': doneMsg,
         }
-        self._rules = {
-            '_main': self._matcher_13,
-            'process': self._matcher_26,
-        }
-        self._main = self._rules.pop('_main')
     def run(self, stream):
-        return self._main(stream)
+        return stream.run(self._main)
     def _matcher_0(self, stream):
         return stream.match(lambda item: item == 'Part', "'Part'")
     def _matcher_1(self, stream):
@@ -3773,106 +9140,180 @@ class PartCollector:
     def _matcher_2(self, stream):
         return stream.operator_not(self._matcher_1)
     def _matcher_3(self, stream):
-        return stream.operator_and([
-            self._matcher_2
-        ])
+        return stream.operator_not(self._matcher_2)
     def _matcher_4(self, stream):
-        return stream.with_scope(self._matcher_3)
+        return self._rule_process(stream) if stream.memo is None else stream.match_rule(self._rule_process, 'process')
     def _matcher_5(self, stream):
-        return stream.operator_or([
-            self._matcher_4
-        ])
+        return stream.bind('x', self._matcher_4(stream))
     def _matcher_6(self, stream):
-        return stream.operator_not(self._matcher_5)
+        return stream.match(lambda item: True, 'any')
     def _matcher_7(self, stream):
-        return self._rules['process'](stream)
+        return stream.operator_not(self._matcher_6)
     def _matcher_8(self, stream):
-        return stream.bind('x', self._matcher_7(stream))
-    def _matcher_9(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_10(self, stream):
-        return stream.operator_not(self._matcher_9)
-    def _matcher_11(self, stream):
-        return stream.action(lambda self: self.bind('', self.lookup('x'), lambda: self.lookup('kill')(
+        return SemanticAction(stream.scope, lambda self: self.bind('', self.lookup('x'), lambda: self.runtime.lookup('kill')(
         
         )))
-    def _matcher_12(self, stream):
+    def _matcher_9(self, stream):
         return stream.operator_and([
             self._matcher_0,
-            self._matcher_6,
-            self._matcher_8,
-            self._matcher_10,
-            self._matcher_11
+            self._matcher_3,
+            self._matcher_5,
+            self._matcher_7,
+            self._matcher_8
         ])
+    def _matcher_10(self, stream):
+        return stream.with_scope(self._matcher_9)
+    def _matcher_11(self, stream):
+        return stream.match(lambda item: item == self._state['last'], 'state')
+    def _matcher_12(self, stream):
+        return stream.bind('x', self._matcher_6(stream))
     def _matcher_13(self, stream):
-        return stream.with_scope(self._matcher_12)
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('put')(
+            [
+                *materialize(self.runtime.actor._state['doneMsg']),
+                [
+                    *materialize(self.runtime.actor._state['parts']),
+                    materialize(self.lookup('x'))
+                ]
+            ]
+        ))
     def _matcher_14(self, stream):
-        return stream.match(lambda item: item == self._state['last'], 'state')
+        return stream.operator_and([
+            self._matcher_11,
+            self._matcher_12,
+            self._matcher_13
+        ])
     def _matcher_15(self, stream):
-        return stream.match(lambda item: True, 'any')
+        return stream.with_scope(self._matcher_14)
     def _matcher_16(self, stream):
-        return stream.bind('x', self._matcher_15(stream))
-    def _matcher_17(self, stream):
-        return stream.action(lambda self: self.lookup('put')(
-            self.lookup('concat')([
-                self.lookup('splice')(1, self.lookup('doneMsg')),
-                self.lookup('splice')(0, self.lookup('concat')([
-                    self.lookup('splice')(1, self.lookup('parts')),
-                    self.lookup('splice')(0, self.lookup('x'))
-                ]))
-            ])
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('spawn')(
+            materialize(self.runtime.lookup('PartCollector')(
+                materialize(self.runtime.extra.get('increment', self.runtime.increment)(
+                    materialize(self.runtime.actor._state['n'])
+                )),
+                materialize(self.runtime.actor._state['last']),
+                [
+                    *materialize(self.runtime.actor._state['parts']),
+                    materialize(self.lookup('x'))
+                ],
+                materialize(self.runtime.actor._state['doneMsg'])
+            ))
         ))
-    def _matcher_18(self, stream):
+    def _matcher_17(self, stream):
         return stream.operator_and([
-            self._matcher_14,
-            self._matcher_16,
-            self._matcher_17
+            self._matcher_6,
+            self._matcher_12,
+            self._matcher_16
         ])
+    def _matcher_18(self, stream):
+        return stream.with_scope(self._matcher_17)
     def _matcher_19(self, stream):
-        return stream.with_scope(self._matcher_18)
-    def _matcher_20(self, stream):
-        return stream.match(lambda item: True, 'any')
-    def _matcher_21(self, stream):
+        return stream.operator_or([
+            self._matcher_15,
+            self._matcher_18
+        ])
+    _rule__main = _matcher_10
+    _rule_process = _matcher_19
+    _accepts = {'Part'}
+    _rules = {
+        '_main': _rule__main,
+        'process': _rule_process,
+    }
+    _main = _rules.pop('_main')
+natives['PartCollector'] = PartCollector
+class PartWriter:
+    __slots__ = ('_state',)
+    def __init__(self, n, last):
+        self._state = {'n': n,
+        'last': last,
+        }
+    def run(self, stream):
+        return stream.run(self._main)
+    def _matcher_0(self, stream):
+        return stream.match(lambda item: item == 'Part', "'Part'")
+    def _matcher_1(self, stream):
+        return stream.match(lambda item: item == self._state['n'], 'state')
+    def _matcher_2(self, stream):
+        return stream.operator_not(self._matcher_1)
+    def _matcher_3(self, stream):
+        return stream.operator_not(self._matcher_2)
+    def _matcher_4(self, stream):
+        return self._rule_process(stream) if stream.memo is None else stream.match_rule(self._rule_process, 'process')
+    def _matcher_5(self, stream):
+        return stream.bind('x', self._matcher_4(stream))
+    def _matcher_6(self, stream):
         return stream.match(lambda item: True, 'any')
-    def _matcher_22(self, stream):
-        return stream.bind('x', self._matcher_21(stream))
-    def _matcher_23(self, stream):
-        return stream.action(lambda self: self.lookup('spawn')(
-            self.lookup('PartCollector')(
-                self.lookup('increment')(
-                    self.lookup('n')
-                ),
-                self.lookup('last'),
-                self.lookup('concat')([
-                    self.lookup('splice')(1, self.lookup('parts')),
-                    self.lookup('splice')(0, self.lookup('x'))
-                ]),
-                self.lookup('doneMsg')
-            )
+    def _matcher_7(self, stream):
+        return stream.operator_not(self._matcher_6)
+    def _matcher_8(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('', self.lookup('x'), lambda: self.runtime.lookup('kill')(
+        
+        )))
+    def _matcher_9(self, stream):
+        return stream.operator_and([
+            self._matcher_0,
+            self._matcher_3,
+            self._matcher_5,
+            self._matcher_7,
+            self._matcher_8
+        ])
+    def _matcher_10(self, stream):
+        return stream.with_scope(self._matcher_9)
+    def _matcher_11(self, stream):
+        return stream.match(lambda item: item == self._state['last'], 'state')
+    def _matcher_12(self, stream):
+        return stream.bind('x', self._matcher_6(stream))
+    def _matcher_13(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('write')(
+            materialize(self.lookup('x'))
         ))
-    def _matcher_24(self, stream):
+    def _matcher_14(self, stream):
         return stream.operator_and([
-            self._matcher_20,
-            self._matcher_22,
-            self._matcher_23
+            self._matcher_11,
+            self._matcher_12,
+            self._matcher_13
         ])
-    def _matcher_25(self, stream):
-        return stream.with_scope(self._matcher_24)
-    def _matcher_26(self, stream):
+    def _matcher_15(self, stream):
+        return stream.with_scope(self._matcher_14)
+    def _matcher_16(self, stream):
+        return SemanticAction(stream.scope, lambda self: self.bind('', self.runtime.lookup('write')(
+            materialize(self.lookup('x'))
+        ), lambda: self.runtime.lookup('spawn')(
+            materialize(self.runtime.lookup('PartWriter')(
+                materialize(self.runtime.extra.get('increment', self.runtime.increment)(
+                    materialize(self.runtime.actor._state['n'])
+                )),
+                materialize(self.runtime.actor._state['last'])
+            ))
+        )))
+    def _matcher_17(self, stream):
+        return stream.operator_and([
+            self._matcher_6,
+            self._matcher_12,
+            self._matcher_16
+        ])
+    def _matcher_18(self, stream):
+        return stream.with_scope(self._matcher_17)
+    def _matcher_19(self, stream):
         return stream.operator_or([
-            self._matcher_19,
-            self._matcher_25
+            self._matcher_15,
+            self._matcher_18
         ])
-natives['PartCollector'] = PartCollector
+    _rule__main = _matcher_10
+    _rule_process = _matcher_19
+    _accepts = {'Part'}
+    _rules = {
+        '_main': _rule__main,
+        'process': _rule_process,
+    }
+    _main = _rules.pop('_main')
+natives['PartWriter'] = PartWriter
 class StdoutWriter:
+    __slots__ = ('_state',)
     def __init__(self):
         self._state = {}
-        self._rules = {
-            '_main': self._matcher_7,
-        }
-        self._main = self._rules.pop('_main')
     def run(self, stream):
-        return self._main(stream)
+        return stream.run(self._main)
     def _matcher_0(self, stream):
         return stream.match(lambda item: item == 'Write', "'Write'")
     def _matcher_1(self, stream):
@@ -3880,24 +9321,30 @@ class StdoutWriter:
     def _matcher_2(self, stream):
         return stream.bind('x', self._matcher_1(stream))
     def _matcher_3(self, stream):
-        return stream.match(lambda item: True, 'any')
+        return stream.operator_not(self._matcher_1)
     def _matcher_4(self, stream):
-        return stream.operator_not(self._matcher_3)
-    def _matcher_5(self, stream):
-        return stream.action(lambda self: self.lookup('write')(
-            self.lookup('join')([
+        return SemanticAction(stream.scope, lambda self: self.runtime.lookup('write')(
+            materialize(self.runtime.join([
                 self.lookup('x')
-            ])
+            ]))
         ))
-    def _matcher_6(self, stream):
+    def _matcher_5(self, stream):
         return stream.operator_and([
             self._matcher_0,
             self._matcher_2,
-            self._matcher_4,
-            self._matcher_5
+            self._matcher_3,
+            self._matcher_4
         ])
-    def _matcher_7(self, stream):
-        return stream.with_scope(self._matcher_6)
+    def _matcher_6(self, stream):
+        return stream.with_scope(self._matcher_5)
+    _rule__main = _matcher_6
+    _accepts = {'Write'}
+    _parks = True
+    _replicable = True
+    _rules = {
+        '_main': _rule__main,
+    }
+    _main = _rules.pop('_main')
 natives['StdoutWriter'] = StdoutWriter
 if __name__ == "__main__":
     run_simulation(natives["Main"]())
@@ -1,99 +1,224 @@
+import io
+import re
 import sys
 import unittest
-from collections import defaultdict
+from bisect import bisect_left
+from collections import defaultdict, deque
+from heapq import merge
+from itertools import islice, takewhile
+from types import MethodType
 
 class Stream:
 
-    def __init__(self, items):
+    def __init__(self, items, memo_size=0):
         self.items = items
         self.index = 0
         self.latest_error = None
         self.scope = None
+        self.exact = False
+        self.shortcut = False
+        self.memo = {} if memo_size else None
+        self.memo_size = memo_size
+        if memo_size:
+            self.memo_hits = defaultdict(int)
+            self.memo_misses = defaultdict(int)
 
     def operator_or(self, matchers):
         for matcher in matchers:
             backtrack_index = self.index
-            try:
-                return matcher(self)
-            except MatchError:
-                self.index = backtrack_index
-        self.error("no or match")
+            result = matcher(self)
+            if result is not FAIL:
+                return result
+            self.index = backtrack_index
+        return self.fail("no or match")
+
+    def operator_dispatch(self, dispatch, matchers):
+        return self.operator_or([
+            matchers[i] for i in dispatch.select(self, self.items, self.index)
+        ])
 
     def operator_and(self, matchers):
-        result = self.action()
+        result = None
         for matcher in matchers:
             result = matcher(self)
+            if result is FAIL:
+                break
         return result
 
     def operator_star(self, matcher):
         results = []
         while True:
             backtrack_index = self.index
-            try:
-                results.append(matcher(self))
-            except MatchError:
+            result = matcher(self)
+            if result is FAIL:
+                self.index = backtrack_index
+                return self.action_list(results)
+            results.append(result)
+
+    def operator_skip(self, matcher):
+        while True:
+            backtrack_index = self.index
+            if matcher(self) is FAIL:
                 self.index = backtrack_index
-                return self.action(lambda self: [x.eval(self.runtime) for x in results])
+                return None
+
+    def operator_span(self, matcher):
+        start_index = self.index
+        result = matcher(self)
+        if result is FAIL:
+            return result
+        return self.items[start_index:self.index]
+
+    def operator_star_until(self, until):
+        start_index = self.index
+        self.index = until.scan(self, self.items, self.index)
+        return list(self.items[start_index:self.index])
+
+    def operator_skip_until(self, until):
+        self.index = until.scan(self, self.items, self.index)
+        return None
 
     def operator_not(self, matcher):
         backtrack_index = self.index
-        try:
-            matcher(self)
-        except MatchError:
-            return self.action()
-        finally:
-            self.index = backtrack_index
-        self.error("not matched")
+        result = matcher(self)
+        self.index = backtrack_index
+        if result is FAIL:
+            return None
+        return self.fail("not matched")
 
-    def action(self, fn=lambda self: None):
+    def action(self, fn):
         return SemanticAction(self.scope, fn)
 
+    def action_list(self, results):
+        for result in results:
+            if isinstance(result, SemanticAction):
+                return self.action(lambda self: [
+                    x.eval(self.runtime) if isinstance(x, SemanticAction) else x
+                    for x in results
+                ])
+        return results
+
     def with_scope(self, matcher):
         current_scope = self.scope
         self.scope = {}
-        try:
-            return matcher(self)
-        finally:
-            self.scope = current_scope
+        result = matcher(self)
+        self.scope = current_scope
+        return result
 
-    def bind(self, name, semantic_action):
-        self.scope[name] = semantic_action
-        return semantic_action
+    def bind(self, name, result):
+        if result is not FAIL:
+            self.scope[name] = result
+        return result
 
     def match_list(self, matcher):
         if self.index < len(self.items):
             items, index = self.items, self.index
-            try:
-                self.items = self.items[self.index]
-                self.index = 0
-                result = matcher(self)
+            self.items = self.items[self.index]
+            self.index = 0
+            result = matcher(self)
+            if result is not FAIL:
                 index += 1
-            finally:
-                self.items, self.index = items, index
+            self.items, self.index = items, index
             return result
-        self.error("no list found")
+        return self.fail("no list found")
 
-    def match_call_rule(self, rules):
-        name = str(self.items[self.index])
-        if name in rules:
-            matcher = rules[name]
-            self.index += 1
+    def match_rule(self, matcher, name):
+        if self.memo is None:
             return matcher(self)
-        else:
-            self.error(f"Unknown rule {name}.")
+        key = (name, id(self.items), self.index)
+        if key in self.memo:
+            self.memo_hits[name] += 1
+            result, self.index = self.memo[key]
+            return result
+        self.memo_misses[name] += 1
+        if len(self.memo) >= self.memo_size:
+            del self.memo[next(iter(self.memo))]
+        result = matcher(self)
+        self.memo[key] = (result, self.index)
+        return result
+
+    def match_call_rule(self, rules, actor):
+        item = self.items[self.index]
+        try:
+            matcher = rules[item]
+        except (KeyError, TypeError):
+            return self.fail("Unknown rule {}.", item)
+        self.index += 1
+        return matcher(actor, self)
+
+    def match_literal(self, literal):
+        index = literal_end(self, self.items, self.index, literal)
+        if index is FAIL:
+            return FAIL
+        self.index = index
+        return self.items[index-1]
+
+    def match_regex(self, regex, matcher):
+        if self.exact or not ATOMIC_REGEX or not isinstance(self.items, str):
+            return matcher(self)
+        self.shortcut = True
+        match = regex.match(self.items, self.index)
+        if match is None:
+            return FAIL
+        self.index = match.end()
+        return regex.value(match)
 
     def match(self, fn, description):
         if self.index < len(self.items):
             item = self.items[self.index]
             if fn(item):
                 self.index += 1
-                return self.action(lambda self: item)
-        self.error(f"expected {description}")
+                return item
+        return self.fail("expected {}", description)
+
+    def fail(self, message, *args):
+        return self.fail_at(self.items, self.index, message, *args)
 
-    def error(self, name):
-        if not self.latest_error or self.index > self.latest_error[2]:
-            self.latest_error = (name, self.items, self.index)
-        raise MatchError(*self.latest_error)
+    def fail_at(self, items, index, message, *args):
+        if not self.latest_error or index > self.latest_error[2]:
+            self.latest_error = (message.format(*args), items, index)
+        return FAIL
+
+    def run(self, matcher):
+        items, index = self.items, self.index
+        result = matcher(self)
+        if result is FAIL and self.shortcut and not self.exact:
+            raise ShortcutMatchError(self, matcher, items, index)
+        if result is FAIL:
+            raise MatchError(*self.latest_error)
+        return result
+
+    def rerun_exact(self, matcher, items, index):
+        self.items, self.index = items, index
+        self.latest_error = None
+        self.exact = True
+        if self.memo is not None:
+            self.memo.clear()
+        matcher(self)
+        return MatchError(*self.latest_error)
+
+FAIL = object()
+
+ATOMIC_REGEX = sys.version_info >= (3, 11)
+
+EMPTY_SCOPE = {}
+
+def in_ranges(item, ranges):
+    return isinstance(item, str) and any(lo <= item <= hi for lo, hi in ranges)
+
+def expect_first(stream, items, index, description):
+    stream.fail_at(items, index, "expected {}", description)
+    return True
+
+def literal_end(stream, items, index, literal):
+    end = index+len(literal)
+    if items[index:end] == literal:
+        return end
+    for char in literal:
+        if index >= len(items) or items[index] != char:
+            return stream.fail_at(items, index, "expected {!r}", char)
+        index += 1
+    return index
 
 class MatchError(Exception):
 
@@ -102,6 +227,340 @@ class MatchError(Exception):
         self.items = items
         self.index = index
 
+class ShortcutMatchError(MatchError):
+
+    def __init__(self, stream, matcher, items, index):
+        Exception.__init__(self)
+        self.rerun = (stream, matcher, items, index)
+        self.error = None
+
+    def exact(self):
+        if self.error is None:
+            stream, matcher, items, index = self.rerun
+            self.error = stream.rerun_exact(matcher, items, index)
+        return self.error
+
+    @property
+    def items(self):
+        return self.exact().items
+
+    @property
+    def index(self):
+        return self.exact().index
+
+    def __str__(self):
+        return str(self.exact())
+
+class Until:
+
+    def __init__(self, stops, description, first):
+        self.stops = [list(stop) for stop in stops]
+        self.pattern = None
+        self.description = description
+        self.first = first
+
+    def scan(self, stream, items, index):
+        begin = index
+        if isinstance(items, str):
+            if self.pattern is None:
+                self.pattern = re.compile("|".join(
+                    re.escape("".join(stop)) for stop in self.stops
+                    if all(isinstance(x, str) and len(x) == 1 for x in stop)
+                ) or "(?!)")
+            match = self.pattern.search(items, index)
+            index = match.start() if match else len(items)
+        else:
+            while index < len(items) and not any(
+                items[index:index+len(stop)] == stop
+                for stop in self.stops
+            ):
+                index += 1
+        for start in range(max(begin, index-len(max(self.stops, key=len))+1), index):
+            for stop in self.stops:
+                end = start
+                while end < len(items) and items[end] == stop[end-start]:
+                    end += 1
+                stream.fail_at(items, end, "expected {!r}", stop[end-start])
+        if index < len(items):
+            if self.first and not self.first[0] <= items[index] <= self.first[1]:
+                stream.fail_at(items, index, "expected {}", self.description)
+            stream.fail_at(items, index, "not matched")
+        else:
+            stream.fail_at(items, index, "expected {}", self.description)
+        return index
+
+class Dispatch:
+
+    def __init__(self, head, table, default):
+        self.head = head
+        self.table = table
+        self.default = default
+        self.all = sorted(set(default).union(*table.values()))
+
+    def select(self, stream, items, index):
+        if stream.exact:
+            return self.all
+        stream.shortcut = True
+        try:
+            item = items[index]
+            if self.head:
+                item = item[0]
+            return self.table.get(item, self.default)
+        except (IndexError, KeyError, TypeError):
+            return self.default
+
+class Regex:
+
+    def __init__(self, pattern, kind):
+        self.pattern = pattern
+        self.kind = kind
+        self.compiled = None
+
+    def match(self, items, index):
+        if self.compiled is None:
+            self.compiled = re.compile(self.pattern, re.DOTALL)
+            self.group = min(self.compiled.groups, 1)
+        return self.compiled.match(items, index)
+
+    def value(self, match):
+        text = match.group(self.group)
+        if self.kind == "text":
+            return text
+        elif self.kind == "last":
+            return text[-1]
+        elif self.kind == "chars":
+            return list(text)
+        else:
+            return None
+
+class VmRule:
+
+    def __init__(self, program):
+        self.program = program
+
+    def __get__(self, actor, owner=None):
+        if actor is None:
+            return self
+        return MethodType(self, actor)
+
+    def __call__(self, actor, stream):
+        return vm(actor, self.program, stream)
+
+def assemble(instructions):
+    labels = {}
+    program = []
+    for instruction in instructions:
+        if instruction[0] == "LABEL":
+            labels[instruction[1]] = len(program)
+        else:
+            program.append((instruction+(None, None))[:3])
+    return [
+        (op, labels[arg1], arg2) if op in ("BACKTRACK", "COMMIT", "REGEX") else
+        (op, arg1, [labels[x] for x in arg2]) if op == "DISPATCH" else
+        (op, arg1, arg2)
+        for op, arg1, arg2 in program
+    ]
+
+def vm(actor, program, stream):
+    rules = actor._rules
+    memo = stream.memo
+    items = stream.items
+    index = stream.index
+    items_stack = []
+    scopes = [stream.scope]
+    pending = []
+    stack = []
+    result = None
+    pc = 0
+    while True:
+        op, arg1, arg2 = program[pc]
+        pc += 1
+        if op == "MATCH_EQ":
+            if index < len(items) and items[index] == arg1:
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected {!r}", arg1)
+        elif op == "MATCH_LITERAL":
+            end = literal_end(stream, items, index, arg1)
+            if end is not FAIL:
+                index = end
+                result = items[index-1]
+                continue
+            message = None
+        elif op == "BACKTRACK":
+            stack.append((program, arg1, index, items, len(items_stack), len(scopes), len(pending)))
+            continue
+        elif op == "COMMIT":
+            stack.pop()
+            pc = arg1
+            continue
+        elif op == "CALL":
+            if arg2 is None:
+                arg2 = rules[arg1].program
+                program[pc-1] = (op, arg1, arg2)
+            if memo is None:
+                stack.append((program, pc, None))
+                program = arg2
+                pc = 0
+                continue
+            key = (arg1, id(items), index)
+            if key not in memo:
+                stream.memo_misses[arg1] += 1
+                if len(memo) >= stream.memo_size:
+                    del memo[next(iter(memo))]
+                stack.append((program, pc, key))
+                program = arg2
+                pc = 0
+                continue
+            stream.memo_hits[arg1] += 1
+            result, index = memo[key]
+            if result is not FAIL:
+                continue
+            message = None
+        elif op == "RETURN":
+            if not stack:
+                stream.index = index
+                return result
+            program, pc, key = stack.pop()
+            if key is not None:
+                memo[key] = (result, index)
+            continue
+        elif op == "PUSH_SCOPE":
+            scopes.append({})
+            continue
+        elif op == "POP_SCOPE":
+            scopes.pop()
+            continue
+        elif op == "BIND":
+            scopes[-1][arg1] = result
+            continue
+        elif op == "ACTION":
+            result = SemanticAction(scopes[-1] if arg2 is None else arg2, arg1)
+            continue
+        elif op == "ACTION_LOOKUP":
+            result = lookup_action(scopes[-1] if arg2 is None else arg2, arg1)
+            continue
+        elif op == "VALUE":
+            result = arg1
+            continue
+        elif op == "MATCH_RANGE":
+            if index < len(items) and arg1 <= items[index] <= arg2:
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected {!r}-{!r}", arg1, arg2)
+        elif op == "MATCH_CLASS":
+            if index < len(items) and (
+                items[index] in arg1[0]
+                if isinstance(items[index], str) and len(items[index]) == 1
+                else in_ranges(items[index], arg1[1])
+            ):
+                if not arg1[2][0] <= items[index] <= arg1[2][1]:
+                    stream.fail_at(items, index, "expected {}", arg2)
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected {}", arg2)
+        elif op == "REGEX":
+            if stream.exact or not ATOMIC_REGEX or not isinstance(items, str):
+                continue
+            stream.shortcut = True
+            match = arg2.match(items, index)
+            if match is not None:
+                index = match.end()
+                result = arg2.value(match)
+                pc = arg1
+                continue
+            message = None
+        elif op == "DISPATCH":
+            selected = arg1.select(stream, items, index)
+            pc = arg2[selected[0] if selected else -1]
+            continue
+        elif op == "STAR_UNTIL":
+            start = index
+            index = arg1.scan(stream, items, index)
+            result = list(items[start:index])
+            continue
+        elif op == "SKIP_UNTIL":
+            index = arg1.scan(stream, items, index)
+            result = None
+            continue
+        elif op == "MATCH_ANY":
+            if index < len(items):
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected any",)
+        elif op == "MATCH_STATE":
+            if index < len(items) and items[index] == actor._state[arg1]:
+                result = items[index]
+                index += 1
+                continue
+            message = ("expected state",)
+        elif op == "LIST_START":
+            pending.append([])
+            continue
+        elif op == "LIST_APPEND":
+            pending[-1].append(result)
+            continue
+        elif op == "LIST_END":
+            result = stream.action_list(pending.pop())
+            continue
+        elif op == "SPAN_START":
+            pending.append(index)
+            continue
+        elif op == "SPAN_END":
+            result = items[pending.pop():index]
+            continue
+        elif op == "PUSH_ITEMS":
+            if index < len(items):
+                items_stack.append((items, index))
+                items = items[index]
+                index = 0
+                continue
+            message = ("no list found",)
+        elif op == "POP_ITEMS":
+            items, index = items_stack.pop()
+            index += 1
+            continue
+        elif op == "CALL_ITEM":
+            try:
+                target = rules[items[index]]
+            except (KeyError, TypeError):
+                message = ("Unknown rule {}.", items[index])
+            else:
+                index += 1
+                stack.append((program, pc, None))
+                program = target.program
+                pc = 0
+                continue
+        elif op == "NONE":
+            result = None
+            continue
+        elif op == "COMMIT_FAIL":
+            index = stack.pop()[2]
+            message = (arg1,)
+        elif op == "FAIL":
+            message = (arg1,)
+        else:
+            raise ValueError(f"Unknown instruction {op}.")
+        if message is not None:
+            stream.fail_at(items, index, *message)
+        while stack:
+            entry = stack.pop()
+            if len(entry) == 3:
+                if entry[2] is not None:
+                    memo[entry[2]] = (FAIL, index)
+            else:
+                program, pc, index, items, items_depth, scopes_depth, pending_depth = entry
+                del items_stack[items_depth:]
+                del scopes[scopes_depth:]
+                del pending[pending_depth:]
+                break
+        else:
+            return FAIL
+
 class SemanticAction:
 
     def __init__(self, scope, fn):
@@ -118,22 +577,33 @@ class SemanticAction:
 
     def lookup(self, name):
         if name in self.scope:
-            return self.scope[name].eval(self.runtime)
+            value = self.scope[name]
+            if isinstance(value, SemanticAction):
+                return value.eval(self.runtime)
+            return value
         else:
             return self.runtime.lookup(name)
 
+def lookup_action(scope, name):
+    if name in scope:
+        return scope[name]
+    return SemanticAction(scope, lambda self: self.lookup(name))
+
 class Runtime:
 
-    def __init__(self, actor, extra={}):
-        self.vars = extra
+    def __init__(self, actor, extra={}, bound={}):
+        self.extra = extra
+        self.bound = bound
         self.actor = actor
 
     def bind(self, name, value):
-        return Runtime(self.actor, dict(self.vars, **{name: value}))
+        return Runtime(self.actor, self.extra, {**self.bound, name: value})
 
     def lookup(self, name):
-        if name in self.vars:
-            return self.vars[name]
+        if name in self.bound:
+            return self.bound[name]
+        elif name in self.extra:
+            return self.extra[name]
         elif self.actor and name in self.actor._state:
             return self.actor._state[name]
         else:
@@ -152,19 +622,13 @@ class Runtime:
         return collector()
 
     def join(self, items, delimiter=""):
-        return delimiter.join(
-            self.join(item, delimiter) if isinstance(item, list) else str(item)
-            for item in items
-        )
+        return Text(items, delimiter)
 
     def indent(self, text, prefix="    "):
-        return "".join(prefix+line for line in text.splitlines(True))
+        return Text([text], "", prefix)
 
     def splice(self, depth, item):
-        if depth == 0:
-            return [item]
-        else:
-            return self.concat([self.splice(depth-1, subitem) for subitem in item])
+        return list(splice_items(depth, item))
 
     def concat(self, lists):
         return [x for xs in lists for x in xs]
@@ -175,6 +639,93 @@ class Runtime:
             result[key].append(value)
         return result
 
+    def match(self, rule, items):
+        result = Stream(items).run(
+            lambda stream: self.actor._rules[rule](self.actor, stream)
+        )
+        if isinstance(result, SemanticAction):
+            return result.eval(self)
+        return result
+
+class Text:
+
+    LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+    def __init__(self, items, delimiter="", prefix=None):
+        self.items = items
+        self.delimiter = delimiter
+        self.prefix = prefix
+        self.text = None
+
+    def __str__(self):
+        if self.text is None:
+            output = io.StringIO()
+            self.write(output.write)
+            self.text = output.getvalue()
+        return self.text
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __eq__(self, other):
+        return str(self) == other
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def write(self, write):
+        levels = []
+        owed = 0
+        def emit(text):
+            nonlocal owed
+            if not levels:
+                write(text)
+                return
+            for line in text.splitlines(True):
+                if owed < len(levels):
+                    write("".join(levels[owed:]))
+                    owed = len(levels)
+                write(line)
+                if line[-1] in self.LINE_BREAKS:
+                    owed = 0
+        frames = []
+        def enter(text):
+            if text.prefix is not None:
+                levels.append(text.prefix)
+            frames.append((text, iter(text.items), [False], text.prefix is not None))
+        enter(self)
+        while frames:
+            text, items, started, indented = frames[-1]
+            for item in items:
+                if isinstance(item, list) and item:
+                    frames.append((text, iter(item), started, False))
+                    break
+                if started[0]:
+                    emit(text.delimiter)
+                started[0] = True
+                if isinstance(item, Text) and item.text is None:
+                    enter(item)
+                    break
+                if not isinstance(item, list):
+                    emit(str(item))
+            else:
+                frames.pop()
+                if indented:
+                    levels.pop()
+                    owed = min(owed, len(levels))
+
+def materialize(value):
+    if isinstance(value, Text):
+        return str(value)
+    return value
+
+def splice_items(depth, item):
+    if depth == 0:
+        yield item
+    else:
+        for subitem in item:
+            yield from splice_items(depth-1, subitem)
+
 class Counter:
 
     def __init__(self):
@@ -185,82 +736,375 @@ class Counter:
         self.number += 1
         return result
 
-def run_simulation(actors, extra={}, messages=[], debug=False, fail=True):
+def run_simulation(actors, extra={}, messages=[], debug=False, fail=True, packrat=0, processes=0, mailboxes=False):
     def debug_log(text):
         if callable(debug):
             debug(text)
         elif debug:
             sys.stderr.write(f"{text}\n")
-    def read(path):
-        if path == "-":
-            return sys.stdin.read()
-        with open(path) as f:
-            return f.read()
     def trunc(thing, n):
         x = repr(thing)
         if len(x) > n:
             return f"{x[:n]} ..."
         else:
             return x
+    def register(actor, serial):
+        heads = getattr(actor, "_accepts", None)
+        if heads is None:
+            anyone.append((serial, actor))
+        else:
+            for head in heads:
+                index.setdefault(head, []).append((serial, actor))
+        boxes[serial] = deque()
+        addresses[id(actor)] = serial
+    def unregister(actor, serial):
+        heads = getattr(actor, "_accepts", None)
+        for members in [anyone] if heads is None else [index[head] for head in heads]:
+            del members[bisect_left(members, (serial,))]
+        del addresses[id(actor)]
+        for message, since, address in boxes.pop(serial):
+            route(message, since, serial+1, address)
+    def spawn(actor):
+        nonlocal spawned
+        actors.append(actor)
+        serials.append(spawned)
+        if not parks(actor):
+            restless.append((spawned, actor))
+        if mailboxes:
+            register(actor, spawned)
+        if pool is not None:
+            born.append((spawned, replica(actor)))
+        spawned += 1
+    def kill(actor):
+        index = actors.index(actor)
+        serial = serials[index]
+        del actors[index]
+        del serials[index]
+        if not parks(actor):
+            del restless[bisect_left(restless, (serial,))]
+        if mailboxes:
+            unregister(actor, serial)
+        if pool is not None:
+            killed.add(serial)
+    def put(message):
+        if mailboxes:
+            route(message, 0, 0, None)
+        else:
+            queue.append((message, 0))
+    def send(actor, message):
+        route(message, 0, 0, addresses.get(id(actor), -1))
+    def retries(since, after):
+        return takewhile(
+            lambda member: member[0] < since,
+            islice(restless, bisect_left(restless, (after,)), None)
+        )
+    def deliver(message, since, after=0):
+        start = bisect_left(serials, max(since, after))
+        for _, actor in merge(
+            retries(since, after),
+            ((serials[index], actors[index]) for index in range(start, len(actors)))
+        ):
+            if accepts(actor, message) and run_actor(actor, message, x, lambda: kill(actor), packrat, memo_hits, memo_misses):
+                return True
+        return False
+    def commit(effects):
+        for effect, value in effects:
+            if effect == "put":
+                put(value)
+            elif effect == "spawn":
+                spawn(value)
+            elif effect == "write":
+                sys.stdout.write(value)
+            else:
+                kill(actors[bisect_left(serials, value)])
+    def deliver_generation(generation):
+        first = spawned
+        size = -(-len(generation)//processes)
+        for start, (connection, _) in zip(range(0, size*processes, size), pool):
+            connection.send((born, sorted(killed), generation[start:start+size]))
+        born.clear()
+        killed.clear()
+        results = []
+        for connection, _ in pool:
+            kind, result = connection.recv()
+            while kind == "read":
+                connection.send(x["read"](result))
+                kind, result = connection.recv()
+            if kind == "error":
+                raise result
+            evaluated, hits, misses = result
+            results.extend(evaluated)
+            for key, count in hits.items():
+                memo_hits[key] += count
+            for key, count in misses.items():
+                memo_misses[key] += count
+        processed = False
+        for (message, since), (serial, resume, touched, effects) in zip(generation, results):
+            if killed.isdisjoint(touched):
+                commit(effects)
+                done = serial is not None or deliver(message, since, first if resume is None else resume)
+            else:
+                done = deliver(message, since)
+            if done:
+                processed = True
+            else:
+                queue.append((message, spawned))
+        return processed
+    def candidates(message, since, after, address):
+        if address is not None:
+            if address >= after and address in boxes:
+                if address >= since or not parks(actors[bisect_left(serials, address)]):
+                    yield address
+            return
+        start = max(since, after)
+        try:
+            members = index.get(message[0], [])
+        except (IndexError, KeyError, TypeError):
+            members = []
+        for serial, _ in merge(
+            members[bisect_left(members, (start,)):],
+            anyone[bisect_left(anyone, (start,)):],
+            (member for member in retries(since, after) if accepts(member[1], message))
+        ):
+            yield serial
+    def route(message, since, after, address):
+        for serial in candidates(message, since, after, address):
+            box = boxes[serial]
+            if not box:
+                ready.append(serial)
+            box.append((message, since, address))
+            return
+        queue.append((message, spawned, address))
+    def run_mailboxes():
+        processed = True
+        while ready or (queue and processed):
+            if not ready:
+                processed = False
+                for _ in range(len(queue)):
+                    message, since, address = queue.popleft()
+                    route(message, since, 0, address)
+                continue
+            serial = ready.popleft()
+            box = boxes.get(serial)
+            if not box:
+                continue
+            message, since, address = box.popleft()
+            actor = actors[bisect_left(serials, serial)]
+            if run_actor(actor, message, x, lambda: kill(actor), packrat, memo_hits, memo_misses):
+                processed = True
+            else:
+                route(message, since, serial+1, address)
+            if box and serial in boxes:
+                ready.append(serial)
+    def run_generations():
+        iteration = 0
+        while queue:
+            if debug:
+                debug_log(f"Iteration {iteration}")
+                for actor in actors:
+                    debug_log(f"  Actor   {actor.__class__.__name__} {trunc(actor._state, 60)}")
+                for message, _ in queue:
+                    debug_log(f"  Message {trunc(message, 60)}")
+                debug_log("")
+            processed = False
+            if pool is not None:
+                processed = deliver_generation([queue.popleft() for _ in range(len(queue))])
+            else:
+                for _ in range(len(queue)):
+                    message, since = queue.popleft()
+                    if deliver(message, since):
+                        processed = True
+                    else:
+                        queue.append((message, spawned))
+            if not processed:
+                break
+            iteration += 1
+    if mailboxes and processes:
+        raise ValueError("Mailboxes can not be combined with processes.")
     if not isinstance(actors, list):
         actors = [actors]
     if not messages:
         messages.append(["Args"]+sys.argv[1:])
-    iteration = 0
-    while messages:
-        debug_log(f"Iteration {iteration}")
-        for index, actor in enumerate(actors):
-            debug_log(f"  Actor   {actor.__class__.__name__} {trunc(actor._state, 60)}")
-        for index, message in enumerate(messages):
-            debug_log(f"  Message {trunc(message, 60)}")
-        debug_log("")
-        next_messages = []
-        x = {
-            "put": next_messages.append,
-            "spawn": actors.append,
-            "write": sys.stdout.write,
-            "repr": repr,
-            "read": read,
-            "len": len,
-            "repr": repr,
-            "int": int,
-            "sum": sum,
-            "Counter": Counter,
-        }
-        for name, native in natives.items():
-            x[name] = native
-        for key, value in extra.items():
-            x[key] = value
-        processed = False
-        errors = []
+    queue = deque()
+    spawned = len(actors)
+    serials = list(range(spawned))
+    restless = [(serial, actor) for serial, actor in enumerate(actors) if not parks(actor)]
+    index = {}
+    anyone = []
+    boxes = {}
+    addresses = {}
+    ready = deque()
+    killed = set()
+    born = []
+    memo_hits = defaultdict(int)
+    memo_misses = defaultdict(int)
+    x = simulation_natives(put, spawn, sys.stdout.write, {"send": send, **extra} if mailboxes else extra)
+    pool = None
+    if mailboxes:
+        for serial, actor in enumerate(actors):
+            register(actor, serial)
         for message in messages:
-            for actor in list(actors):
+            put(message)
+        run_mailboxes()
+    elif processes:
+        import multiprocessing
+        context = multiprocessing.get_context("fork")
+        queue.extend((message, 0) for message in messages)
+        pool = []
+        try:
+            for _ in range(processes):
+                connection, remote = context.Pipe()
+                worker = context.Process(
+                    target=serve_actors,
+                    args=(remote, [(serial, replica(actor)) for serial, actor in zip(serials, actors)], extra, packrat),
+                    daemon=True
+                )
+                worker.start()
+                pool.append((connection, worker))
+            run_generations()
+        finally:
+            for connection, worker in pool:
+                connection.send(None)
+                worker.join()
+    else:
+        queue.extend((message, 0) for message in messages)
+        run_generations()
+    if queue and fail:
+        errors = []
+        for message, *_ in queue:
+            for actor in actors:
                 try:
-                    actor.run(Stream(message)).eval(Runtime(actor, x).bind(
-                        "kill",
-                        lambda: actors.remove(actor)
-                    ))
+                    actor.run(Stream(message, packrat))
                 except MatchError as e:
                     errors.append((actor, e))
-                else:
-                    processed = True
-                    break
-            else:
-                next_messages.append(message)
-        if not processed:
-            if fail:
-                for actor, error in sorted(errors, key=lambda x: x[1].index):
-                    sys.stderr.write(f"{actor.__class__.__name__} {trunc(actor._state, 60)}\n")
-                    sys.stderr.write(f"  {error} at {error.index}\n")
-                    sys.stderr.write(f"  {trunc(error.items, 60)}\n")
-                    sys.stderr.write("\n")
-                sys.exit("No message processed.")
-            else:
-                break
-        messages = next_messages
-        iteration += 1
+        for actor, error in sorted(errors, key=lambda x: x[1].index):
+            sys.stderr.write(f"{actor.__class__.__name__} {trunc(actor._state, 60)}\n")
+            sys.stderr.write(f"  {error} at {error.index}\n")
+            sys.stderr.write(f"  {trunc(error.items, 60)}\n")
+            sys.stderr.write("\n")
+        sys.exit("No message processed.")
+    for key in sorted(memo_misses, key=lambda key: -memo_hits[key]):
+        debug_log(f"Packrat {'.'.join(key)} hits={memo_hits[key]} misses={memo_misses[key]}")
     debug_log("Simulation done!")
-    return messages
+    return [message for message, *_ in queue]
+
+def accepts(actor, message):
+    heads = getattr(actor, "_accepts", None)
+    if heads is None:
+        return True
+    try:
+        return message[0] in heads
+    except (IndexError, KeyError, TypeError):
+        return False
+
+def parks(actor):
+    return getattr(actor, "_parks", False)
+
+def simulation_natives(put, spawn, write, extra):
+    def read(path):
+        if path == "-":
+            return sys.stdin.read()
+        with open(path) as f:
+            return f.read()
+    x = {
+        "put": put,
+        "spawn": spawn,
+        "write": write,
+        "repr": repr,
+        "read": read,
+        "len": len,
+        "repr": repr,
+        "int": int,
+        "sum": sum,
+        "Counter": Counter,
+    }
+    for name, native in natives.items():
+        x[name] = native
+    for key, value in extra.items():
+        x[key] = value
+    return x
+
+def run_actor(actor, message, x, kill, packrat, memo_hits, memo_misses):
+    stream = Stream(message, packrat)
+    try:
+        result = actor.run(stream)
+        if isinstance(result, SemanticAction):
+            result.eval(Runtime(actor, x).bind("kill", kill))
+    except MatchError:
+        return False
+    else:
+        return True
+    finally:
+        count_memo(actor, stream, memo_hits, memo_misses)
+
+class LocalActor:
+
+    def __init__(self, actor):
+        self._accepts = getattr(actor, "_accepts", None)
+        self._parks = parks(actor)
+
+def replica(actor):
+    if getattr(actor, "_replicable", False):
+        return actor
+    return LocalActor(actor)
+
+def serve_actors(connection, members, extra, packrat):
+    def read(path):
+        connection.send(("read", path))
+        return connection.recv()
+    extra = {"read": read, **extra}
+    alive = dict(members)
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        born, killed, generation = task
+        alive.update(born)
+        for serial in killed:
+            del alive[serial]
+        try:
+            connection.send(("done", evaluate_remote(list(alive.items()), generation, extra, packrat)))
+        except Exception as e:
+            connection.send(("error", e))
+
+def evaluate_remote(members, generation, extra, packrat):
+    evaluated = []
+    memo_hits = defaultdict(int)
+    memo_misses = defaultdict(int)
+    for message, since in generation:
+        matched = None
+        resume = None
+        touched = []
+        effects = []
+        x = simulation_natives(
+            lambda message: effects.append(("put", message)),
+            lambda actor: effects.append(("spawn", actor)),
+            lambda text: effects.append(("write", text)),
+            extra
+        )
+        for serial, actor in members:
+            if (serial < since and parks(actor)) or not accepts(actor, message):
+                continue
+            if isinstance(actor, LocalActor):
+                resume = serial
+                break
+            count = len(effects)
+            kill = lambda serial=serial: effects.append(("kill", serial))
+            if run_actor(actor, message, x, kill, packrat, memo_hits, memo_misses):
+                matched = serial
+            if matched is not None or len(effects) > count:
+                touched.append(serial)
+            if matched is not None:
+                break
+        evaluated.append((matched, resume, touched, effects))
+    return evaluated, memo_hits, memo_misses
+
+def count_memo(actor, stream, memo_hits, memo_misses):
+    if stream.memo is not None:
+        for name, count in stream.memo_hits.items():
+            memo_hits[(actor.__class__.__name__, name)] += count
+        for name, count in stream.memo_misses.items():
+            memo_misses[(actor.__class__.__name__, name)] += count
 
 class Example(unittest.TestCase):
 